@@ -27,6 +27,9 @@ KIS_HTS_ID=your_hts_id_here
 TELEGRAM_BOT_TOKEN=your_telegram_bot_token_here
 TELEGRAM_CHAT_ID=your_telegram_chat_id_here
 
+# 머신러닝 테이블(signal_analysis/buy_attempts/market_snapshots) Parquet 추가 저장 경로 (비워두면 SQLite만 사용, pyarrow 필요)
+ML_PARQUET_DIR = os.getenv('ML_PARQUET_DIR', '')
+
 # 기타 설정
 IS_DEMO=false
 LOG_LEVEL=INFO"""
@@ -56,6 +59,32 @@ HTS_ID = os.getenv('KIS_HTS_ID', '')
 TELEGRAM_BOT_TOKEN = os.getenv('TELEGRAM_BOT_TOKEN', '')
 TELEGRAM_CHAT_ID = os.getenv('TELEGRAM_CHAT_ID', '')
 
+# REST API HTTP 연결 풀 설정 (keep-alive 세션 재사용)
+KIS_HTTP_POOL_MAXSIZE = int(os.getenv('KIS_HTTP_POOL_MAXSIZE', '20'))
+KIS_HTTP_TIMEOUT = float(os.getenv('KIS_HTTP_TIMEOUT', '10'))
+
+# REST API 속도 제한 (계좌 한도 초당 20건 - 주문 레인 4건 별도, 시세 + 주문의 1초 창 합계가 20 이하가 되도록)
+KIS_QUOTE_RATE = float(os.getenv('KIS_QUOTE_RATE', '13'))     # 시세 TR 초당 호출수
+KIS_SCAN_BORROW = os.getenv('KIS_SCAN_BORROW', 'true').lower() == 'true'  # 스캔은 재평가가 예약하지 않은 남는 시세 토큰만 사용
+KIS_SCAN_RATE = float(os.getenv('KIS_SCAN_RATE', '10'))       # KIS_SCAN_BORROW=false일 때 전체 시장 스캔 초당 상한
+
+# 웹소켓 원본 프레임 기록 (장 재현/재생 벤치마크용, data/ws_frames/YYYYMMDD.wsf)
+WS_RECORD_FRAMES = os.getenv('WS_RECORD_FRAMES', 'false').lower() == 'true'
+WS_RECORD_DIR = os.getenv('WS_RECORD_DIR', 'data/ws_frames')
+
+# 웹소켓 접속 주소 (로컬 스텁 서버 테스트 시 ws://127.0.0.1:PORT 로 변경)
+KIS_WS_URL = os.getenv('KIS_WS_URL', 'ws://ops.koreainvestment.com:21000')
+
+# 웹소켓 연결 풀 추가 앱키 (연결당 19종목 한도 확장, "앱키:시크릿" 쉼표 구분 - 비워두면 단일 연결)
+WS_EXTRA_APP_KEYS = [tuple(pair.strip().split(':', 1)) for pair in os.getenv('KIS_WS_EXTRA_APP_KEYS', '').split(',')
+                     if ':' in pair]
+
+# 장전 전체 스캔의 CPU 단계(가격 위치 필터/패턴 점수)를 나눠 처리할 워커 프로세스 수 (0 또는 1이면 단일 프로세스)
+SCAN_PROCESS_WORKERS = int(os.getenv('SCAN_PROCESS_WORKERS', '0'))
+
+# 머신러닝 테이블(signal_analysis/buy_attempts/market_snapshots) Parquet 추가 저장 경로 (비워두면 SQLite만 사용, pyarrow 필요)
+ML_PARQUET_DIR = os.getenv('ML_PARQUET_DIR', '')
+
 # 기타 설정
 IS_DEMO = os.getenv('IS_DEMO', 'false').lower() == 'true'
 LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
@@ -0,0 +1,227 @@
+"""
+기술적 지표 NumPy 커널 (O(n), 1-D 또는 2-D 입력)
+
+- 입력은 마지막 축이 시간(오래된 값 → 최신 값)인 배열, 2-D면 (종목 × 시점)으로 여러 종목을 한 번에 계산
+- Wilder/EMA 평활은 1차 재귀 필터(y[t] = a·y[t-1] + b·x[t])로 시간 축을 한 번만 순회
+- 이동합/이동최대·최소는 누적합과 블록 prefix/suffix(van Herk/Gil-Werman) 방식으로 창 크기와 무관하게 O(n)
+- 결과는 TechnicalIndicators의 기존 pandas 구현과 같은 값(부동소수 오차 범위)을 반환
+"""
+from typing import Dict, Optional
+
+import numpy as np
+
+
+def _as_2d(values) -> np.ndarray:
+    """(종목 × 시점) float64 배열로 변환"""
+    arr = np.asarray(values, dtype=np.float64)
+    return arr[None, :] if arr.ndim == 1 else arr
+
+
+def _restore_shape(result: np.ndarray, like) -> np.ndarray:
+    return result[0] if np.ndim(like) == 1 else result
+
+
+def recursive_filter(values: np.ndarray, decay: float, gain: float,
+                     init: Optional[np.ndarray] = None) -> np.ndarray:
+    """1차 재귀 필터 y[t] = decay·y[t-1] + gain·x[t] (2-D 입력, 시간 축 1회 순회)
+
+    init이 주어지면 y[-1] = init으로 시작, 없으면 y[0] = gain·x[0]
+    """
+    out = np.empty_like(values)
+    prev = np.zeros(values.shape[0]) if init is None else init
+    for t in range(values.shape[1]):
+        prev = decay * prev + gain * values[:, t]
+        out[:, t] = prev
+    return out
+
+
+def rolling_sum(values: np.ndarray, window: int) -> np.ndarray:
+    """이동합 (앞쪽 window-1개는 NaN, 창 안에 NaN이 있으면 NaN)"""
+    n = values.shape[1]
+    out = np.full_like(values, np.nan)
+    if window <= 0 or n < window:
+        return out
+
+    nan_mask = np.isnan(values)
+    # 행별 기준값을 빼고 누적해 큰 가격대에서의 자릿수 손실을 줄임
+    base = np.nanmean(values, axis=1, keepdims=True) if nan_mask.any() else values.mean(axis=1, keepdims=True)
+    base = np.where(np.isnan(base), 0.0, base)
+    centered = np.where(nan_mask, 0.0, values - base)
+
+    csum = np.concatenate([np.zeros((values.shape[0], 1)), np.cumsum(centered, axis=1)], axis=1)
+    window_sum = csum[:, window:] - csum[:, :-window] + base * window
+
+    if nan_mask.any():
+        ccount = np.concatenate([np.zeros((values.shape[0], 1)), np.cumsum(nan_mask, axis=1)], axis=1)
+        window_sum = np.where(ccount[:, window:] - ccount[:, :-window] > 0, np.nan, window_sum)
+
+    out[:, window - 1:] = window_sum
+    return out
+
+
+def _flat_windows(values: np.ndarray, window: int) -> np.ndarray:
+    """창 안의 값이 모두 같은 위치 (창의 마지막 시점 기준)"""
+    return rolling_max(values, window) == rolling_min(values, window)
+
+
+def rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """단순 이동평균 (pandas rolling(window).mean()과 동일)"""
+    mean = rolling_sum(values, window) / window
+    # 값이 모두 같은 창은 pandas처럼 누적 오차 없이 그 값 그대로
+    return np.where(_flat_windows(values, window), values, mean)
+
+
+def rolling_std(values: np.ndarray, window: int, ddof: int = 1) -> np.ndarray:
+    """이동 표준편차 (pandas rolling(window).std()와 동일, 표본 표준편차)"""
+    # 행 평균으로 중심화한 뒤 Σx² - w·mean² 로 계산 (가격 단위가 커도 자릿수 손실이 작음)
+    centered = values - np.nanmean(values, axis=1, keepdims=True)
+    mean = rolling_mean(centered, window)
+    sq_sum = rolling_sum(centered * centered, window)
+    var = (sq_sum - window * mean * mean) / (window - ddof)
+    std = np.sqrt(np.maximum(var, 0.0))
+
+    # 창 안의 값이 모두 같으면 pandas처럼 정확히 0
+    return np.where(_flat_windows(values, window), 0.0, std)
+
+
+def _rolling_extreme(values: np.ndarray, window: int, accumulate, pad_value: float) -> np.ndarray:
+    """블록 prefix/suffix 누적으로 창 크기와 무관한 O(n) 이동 최대/최소"""
+    rows, n = values.shape
+    out = np.full_like(values, np.nan)
+    if window <= 0 or n < window:
+        return out
+
+    blocks = -(-n // window)
+    padded = np.full((rows, blocks * window), pad_value)
+    padded[:, :n] = values
+    shaped = padded.reshape(rows, blocks, window)
+
+    prefix = accumulate(shaped, axis=2).reshape(rows, -1)
+    suffix = accumulate(shaped[:, :, ::-1], axis=2)[:, :, ::-1].reshape(rows, -1)
+
+    # 창 [i, i+window-1] = suffix[i] (블록 끝까지) ⊕ prefix[i+window-1] (다음 블록 시작부터)
+    starts = np.arange(n - window + 1)
+    combined = np.stack([suffix[:, starts], prefix[:, starts + window - 1]])
+    out[:, window - 1:] = accumulate(combined, axis=0)[-1]
+    return out
+
+
+def rolling_max(values: np.ndarray, window: int) -> np.ndarray:
+    return _rolling_extreme(values, window, np.maximum.accumulate, -np.inf)
+
+
+def rolling_min(values: np.ndarray, window: int) -> np.ndarray:
+    return _rolling_extreme(values, window, np.minimum.accumulate, np.inf)
+
+
+def backfill_leading(values: np.ndarray) -> np.ndarray:
+    """앞쪽 NaN을 첫 유효값으로 채움 (이동평균 초기 구간용 bfill)"""
+    valid = ~np.isnan(values)
+    if valid.all():
+        return values
+    first = np.where(valid.any(axis=1), valid.argmax(axis=1), 0)
+    fill = values[np.arange(values.shape[0]), first]
+    leading = np.arange(values.shape[1])[None, :] < first[:, None]
+    return np.where(leading, fill[:, None], values)
+
+
+# ========== 지표 커널 ==========
+
+def ema(values, span: int) -> np.ndarray:
+    """지수이동평균 (pandas ewm(span=span).mean(), adjust=True와 동일)
+
+    adjust=True 가중평균 = 분자/분모 두 재귀 필터의 비율이며 분모는 등비급수 닫힌 식으로 계산
+    """
+    x = _as_2d(values)
+    decay = 1.0 - 2.0 / (span + 1.0)
+    numerator = recursive_filter(x, decay, 1.0)
+    denominator = (1.0 - decay ** np.arange(1, x.shape[1] + 1)) / (1.0 - decay)
+    return _restore_shape(numerator / denominator, values)
+
+
+def rsi(values, period: int = 14) -> np.ndarray:
+    """RSI (Wilder 평활, 값이 없는 초기 구간은 50)
+
+    기존 구현과 같은 시드 규칙: period-1, period 시점은 단순평균, 이후부터 Wilder 재귀
+    """
+    x = _as_2d(values)
+    rows, n = x.shape
+    result = np.full((rows, n), 50.0)
+    if n < period + 1:
+        return _restore_shape(result, values)
+
+    change = np.diff(x, axis=1, prepend=np.nan)
+    gain = np.where(change > 0, change, 0.0)
+    loss = np.where(change < 0, -change, 0.0)
+
+    avg_gain = np.full((rows, n), np.nan)
+    avg_loss = np.full((rows, n), np.nan)
+    avg_gain[:, period - 1:period + 1] = rolling_mean(gain[:, :period + 1], period)[:, period - 1:]
+    avg_loss[:, period - 1:period + 1] = rolling_mean(loss[:, :period + 1], period)[:, period - 1:]
+
+    if n > period + 1:
+        decay = (period - 1) / period
+        avg_gain[:, period + 1:] = recursive_filter(gain[:, period + 1:], decay, 1.0 / period, avg_gain[:, period])
+        avg_loss[:, period + 1:] = recursive_filter(loss[:, period + 1:], decay, 1.0 / period, avg_loss[:, period])
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rs = avg_gain / avg_loss
+        values_rsi = 100.0 - (100.0 / (1.0 + rs))
+
+    result = np.where(np.isnan(values_rsi), 50.0, values_rsi)
+    return _restore_shape(result, values)
+
+
+def macd(values, fast: int = 12, slow: int = 26, signal: int = 9) -> Dict[str, np.ndarray]:
+    """MACD 라인 / 시그널 / 히스토그램"""
+    x = _as_2d(values)
+    macd_line = ema(x, fast) - ema(x, slow)
+    signal_line = ema(macd_line, signal)
+    return {
+        'macd': _restore_shape(macd_line, values),
+        'signal': _restore_shape(signal_line, values),
+        'histogram': _restore_shape(macd_line - signal_line, values)
+    }
+
+
+def bollinger_bands(values, period: int = 20, std_dev: float = 2.0) -> Dict[str, np.ndarray]:
+    """볼린저 밴드 (upper/middle/lower는 초기 구간 bfill, bandwidth는 %B로 초기 구간 50)"""
+    x = _as_2d(values)
+    middle = rolling_mean(x, period)
+    std = rolling_std(x, period)
+    upper = middle + std * std_dev
+    lower = middle - std * std_dev
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        bandwidth = (x - lower) / (upper - lower) * 100
+
+    return {
+        'upper': _restore_shape(backfill_leading(upper), values),
+        'middle': _restore_shape(backfill_leading(middle), values),
+        'lower': _restore_shape(backfill_leading(lower), values),
+        'bandwidth': _restore_shape(np.where(np.isnan(bandwidth), 50.0, bandwidth), values)
+    }
+
+
+def stochastic(highs, lows, closes, k_period: int = 14, d_period: int = 3) -> Dict[str, np.ndarray]:
+    """스토캐스틱 %K / %D (값이 없는 구간은 50)"""
+    high, low, close = _as_2d(highs), _as_2d(lows), _as_2d(closes)
+    highest = rolling_max(high, k_period)
+    lowest = rolling_min(low, k_period)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        k = (close - lowest) / (highest - lowest) * 100
+    d = rolling_mean(k, d_period)
+
+    return {
+        'k': _restore_shape(np.where(np.isnan(k), 50.0, k), closes),
+        'd': _restore_shape(np.where(np.isnan(d), 50.0, d), closes)
+    }
+
+
+def moving_average(values, period: int) -> np.ndarray:
+    """단순 이동평균 (초기 구간 bfill, 데이터가 period보다 짧으면 원본 값)"""
+    x = _as_2d(values)
+    if x.shape[1] < period:
+        return _restore_shape(x.copy(), values)
+    return _restore_shape(backfill_leading(rolling_mean(x, period)), values)
@@ -0,0 +1,357 @@
+"""
+종목별 스트리밍 지표 상태 (틱마다 O(1) 갱신)
+
+- 확정 일봉 종가로 상태를 한 번 시드한 뒤, 틱이 들어오면 현재가를 '오늘 종가'로 둔 잠정값만 O(1)로 계산
+- EMA(MACD)는 pandas ewm(adjust=True)와 같은 분자/분모 재귀, RSI는 Wilder 평활, 이동평균/분산은 링버퍼 누적합
+- 날짜가 바뀌면 직전 거래일 마지막 가격을 확정 종가로 반영(commit)
+- 시드 후 값은 TechnicalIndicators의 배치 계산(현재가를 마지막 종가로 붙인 시계열)과 같은 값
+"""
+import threading
+import time
+from typing import Dict, Iterable, Optional, Any
+
+import numpy as np
+
+from utils.logger import setup_logger
+from utils.korean_time import now_kst
+
+logger = setup_logger(__name__)
+
+SEED_DAYS = 120             # 시드에 사용할 확정 일봉 수 (EMA 가중치 수렴 충분)
+SEED_RETRY_SECONDS = 60     # 저장소에 일봉이 없을 때 재시도 간격
+
+
+class IncrementalEMA:
+    """지수이동평균 (pandas ewm(span).mean(), adjust=True와 동일한 가중평균)"""
+
+    def __init__(self, span: int):
+        self.decay = 1.0 - 2.0 / (span + 1.0)
+        self.numerator = 0.0
+        self.denominator = 0.0
+
+    def update(self, value: float) -> float:
+        self.numerator = value + self.decay * self.numerator
+        self.denominator = 1.0 + self.decay * self.denominator
+        return self.numerator / self.denominator
+
+    def peek(self, value: float) -> float:
+        """상태를 바꾸지 않고 value가 다음 값일 때의 EMA"""
+        return (value + self.decay * self.numerator) / (1.0 + self.decay * self.denominator)
+
+    @property
+    def value(self) -> Optional[float]:
+        return self.numerator / self.denominator if self.denominator else None
+
+
+class IncrementalRSI:
+    """Wilder RSI (처음 period개 변화량의 단순평균으로 시드, 이후 Wilder 재귀)"""
+
+    def __init__(self, period: int = 14):
+        self.period = period
+        self.prev_price: Optional[float] = None
+        self.avg_gain = 0.0
+        self.avg_loss = 0.0
+        self.count = 0  # 누적된 변화량 수
+
+    def _next_averages(self, price: float):
+        change = price - self.prev_price
+        gain, loss = max(change, 0.0), max(-change, 0.0)
+        if self.count < self.period:
+            # 시드 구간: 단순 누적 (period번째에 평균으로 확정)
+            avg_gain, avg_loss = self.avg_gain + gain, self.avg_loss + loss
+            if self.count + 1 == self.period:
+                avg_gain, avg_loss = avg_gain / self.period, avg_loss / self.period
+            return avg_gain, avg_loss
+        return ((self.avg_gain * (self.period - 1) + gain) / self.period,
+                (self.avg_loss * (self.period - 1) + loss) / self.period)
+
+    @staticmethod
+    def _rsi(avg_gain: float, avg_loss: float) -> float:
+        if avg_loss == 0:
+            # 손실 없음: 이익도 없으면 정의되지 않으므로 기존 규칙대로 50
+            return 100.0 if avg_gain > 0 else 50.0
+        return 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+    def update(self, price: float) -> float:
+        if self.prev_price is not None:
+            self.avg_gain, self.avg_loss = self._next_averages(price)
+            self.count += 1
+        self.prev_price = price
+        return self.value
+
+    def peek(self, price: float) -> float:
+        if self.prev_price is None or self.count + 1 < self.period:
+            return 50.0
+        return self._rsi(*self._next_averages(price))
+
+    @property
+    def value(self) -> float:
+        if self.count < self.period:
+            return 50.0
+        return self._rsi(self.avg_gain, self.avg_loss)
+
+
+class RollingWindow:
+    """링버퍼 기반 이동평균/표준편차 (누적합 O(1) 갱신, 한 바퀴마다 재계산해 오차 누적 방지)"""
+
+    def __init__(self, size: int):
+        self.size = size
+        self.buffer = np.zeros(size)
+        self.pos = 0
+        self.count = 0
+        self.offset = 0.0   # 가격대가 커도 제곱합 자릿수 손실이 없도록 첫 값 기준으로 이동
+        self.sum = 0.0
+        self.sq_sum = 0.0
+
+    def update(self, value: float) -> None:
+        if self.count == 0:
+            self.offset = value
+        x = value - self.offset
+        if self.count == self.size:
+            old = float(self.buffer[self.pos])
+            self.sum -= old
+            self.sq_sum -= old * old
+        else:
+            self.count += 1
+        self.buffer[self.pos] = x
+        self.sum += x
+        self.sq_sum += x * x
+        self.pos = (self.pos + 1) % self.size
+
+        if self.pos == 0:
+            window = self.buffer[:self.count]
+            self.sum = float(window.sum())
+            self.sq_sum = float((window * window).sum())
+
+    def _window_sums(self, value: Optional[float]):
+        """(합, 제곱합, 개수), value가 있으면 가장 오래된 값 대신 value를 넣은 창 기준"""
+        if value is None:
+            return self.sum, self.sq_sum, self.count
+        x = value - self.offset
+        if self.count < self.size:
+            return self.sum + x, self.sq_sum + x * x, self.count + 1
+        old = float(self.buffer[self.pos])
+        return self.sum - old + x, self.sq_sum - old * old + x * x, self.count
+
+    def mean(self, value: Optional[float] = None) -> Optional[float]:
+        total, _, count = self._window_sums(value)
+        if count < self.size:
+            return None
+        return total / count + self.offset
+
+    def std(self, value: Optional[float] = None) -> Optional[float]:
+        """표본 표준편차 (ddof=1)"""
+        total, sq_total, count = self._window_sums(value)
+        if count < self.size or count < 2:
+            return None
+        var = (sq_total - total * total / count) / (count - 1)
+        return float(np.sqrt(var)) if var > 1e-12 * max(sq_total, 1.0) else 0.0
+
+
+class SymbolIndicatorState:
+    """종목 하나의 스트리밍 지표 상태"""
+
+    def __init__(self, stock_code: str, rsi_period: int = 14, macd_fast: int = 12,
+                 macd_slow: int = 26, macd_signal: int = 9, bb_period: int = 20,
+                 bb_std: float = 2.0, ma_periods: Iterable[int] = (5, 20)):
+        self.stock_code = stock_code
+        self.bb_std = bb_std
+        self.rsi = IncrementalRSI(rsi_period)
+        self.ema_fast = IncrementalEMA(macd_fast)
+        self.ema_slow = IncrementalEMA(macd_slow)
+        self.macd_signal = IncrementalEMA(macd_signal)
+        self.macd_slow_period = macd_slow
+        self.bb_window = RollingWindow(bb_period)
+        self.ma_windows = {period: RollingWindow(period) for period in ma_periods}
+
+        self.closes_committed = 0
+        self.last_close_date: Optional[str] = None   # 마지막 확정 종가 날짜 (YYYYMMDD)
+        self.session_date: Optional[str] = None      # 잠정값이 가리키는 거래일
+        self.last_price: Optional[float] = None
+        self.last_update: float = 0.0
+        self.tick_count = 0
+
+    @property
+    def is_seeded(self) -> bool:
+        return self.closes_committed > 0
+
+    def commit_close(self, close: float, date: Optional[str] = None) -> None:
+        """확정 종가 1개 반영"""
+        self.rsi.update(close)
+        macd_line = self.ema_fast.update(close) - self.ema_slow.update(close)
+        self.macd_signal.update(macd_line)
+        self.bb_window.update(close)
+        for window in self.ma_windows.values():
+            window.update(close)
+        self.closes_committed += 1
+        if date:
+            self.last_close_date = date
+
+    def seed(self, closes: Iterable[float], last_date: Optional[str] = None) -> None:
+        """확정 종가들(오래된 값 → 최신 값)로 초기화"""
+        for close in closes:
+            self.commit_close(float(close))
+        self.last_close_date = last_date
+
+    def on_price(self, price: float, trade_date: str) -> None:
+        """틱 가격 반영 (O(1)), 거래일이 바뀌었으면 직전 거래일 마지막 가격을 확정 종가로 반영"""
+        if price <= 0:
+            return
+        if (self.session_date and self.last_price is not None and trade_date > self.session_date
+                and (self.last_close_date is None or self.session_date > self.last_close_date)):
+            self.commit_close(self.last_price, self.session_date)
+        self.session_date = trade_date
+        self.last_price = price
+        self.last_update = time.time()
+        self.tick_count += 1
+
+    def snapshot(self, price: Optional[float] = None) -> Dict[str, Any]:
+        """현재 지표값 (price 또는 마지막 틱 가격을 오늘 종가로 둔 잠정값)
+
+        오늘 봉이 이미 확정 종가로 반영된 경우(장 마감 후)에는 확정값 그대로 반환
+        """
+        price = price if price is not None else self.last_price
+        today_committed = (self.last_close_date is not None and self.session_date is not None
+                           and self.session_date <= self.last_close_date)
+        if price is None or today_committed:
+            price = None
+
+        if price is None:
+            rsi = self.rsi.value
+            fast, slow = self.ema_fast.value, self.ema_slow.value
+            macd_line = (fast - slow) if fast is not None and slow is not None else 0.0
+            signal = self.macd_signal.value or 0.0
+        else:
+            rsi = self.rsi.peek(price)
+            macd_line = self.ema_fast.peek(price) - self.ema_slow.peek(price)
+            signal = self.macd_signal.peek(macd_line)
+
+        result = {
+            'stock_code': self.stock_code,
+            'price': price if price is not None else self.last_price,
+            'rsi': rsi,
+            'macd': macd_line,
+            'macd_signal': signal,
+            'macd_histogram': macd_line - signal,
+            'bars': self.closes_committed + (1 if price is not None else 0),
+            'last_update': self.last_update,
+        }
+        if result['bars'] < self.macd_slow_period:
+            result['macd'] = result['macd_signal'] = result['macd_histogram'] = 0.0
+
+        middle, std = self.bb_window.mean(price), self.bb_window.std(price)
+        if middle is not None and std is not None:
+            upper, lower = middle + std * self.bb_std, middle - std * self.bb_std
+            result['bb_upper'], result['bb_middle'], result['bb_lower'] = upper, middle, lower
+            reference = price if price is not None else self.last_price
+            if upper > lower and reference is not None:
+                result['bb_percent'] = (reference - lower) / (upper - lower) * 100
+            else:
+                result['bb_percent'] = 50.0
+
+        for period, window in self.ma_windows.items():
+            result[f'ma_{period}'] = window.mean(price)
+
+        return result
+
+
+class StreamingIndicatorRegistry:
+    """구독 종목별 스트리밍 지표 상태 관리 (웹소켓/폴링 데이터 경로에서 갱신)"""
+
+    def __init__(self, seed_days: int = SEED_DAYS):
+        self.seed_days = seed_days
+        self._states: Dict[str, SymbolIndicatorState] = {}
+        self._seed_failed_at: Dict[str, float] = {}
+        self._lock = threading.RLock()
+        self.stats = {
+            'ticks': 0,
+            'seeded': 0,
+            'seed_failures': 0,
+        }
+
+    def _load_seed_closes(self, stock_code: str):
+        """로컬 일봉 저장소에서 확정 종가 조회 (오래된 값 → 최신 값)"""
+        from ..data.ohlcv_store import get_ohlcv_store
+
+        arrays = get_ohlcv_store().get_daily_arrays(stock_code, days=self.seed_days)
+        if arrays is None or len(arrays['close']) == 0:
+            return None, None
+        closes = arrays['close'][::-1]
+        return closes[closes > 0], str(arrays['date'][0])
+
+    def _get_or_seed(self, stock_code: str) -> Optional[SymbolIndicatorState]:
+        state = self._states.get(stock_code)
+        if state is not None:
+            return state
+
+        failed_at = self._seed_failed_at.get(stock_code)
+        if failed_at and time.time() - failed_at < SEED_RETRY_SECONDS:
+            return None
+
+        try:
+            closes, last_date = self._load_seed_closes(stock_code)
+        except Exception as e:
+            logger.debug(f"스트리밍 지표 시드 조회 오류 ({stock_code}): {e}")
+            closes, last_date = None, None
+
+        if closes is None or len(closes) == 0:
+            self._seed_failed_at[stock_code] = time.time()
+            self.stats['seed_failures'] += 1
+            return None
+
+        state = SymbolIndicatorState(stock_code)
+        state.seed(closes, last_date)
+        self._states[stock_code] = state
+        self._seed_failed_at.pop(stock_code, None)
+        self.stats['seeded'] += 1
+        logger.debug(f"📈 스트리밍 지표 시드: {stock_code} ({len(closes)}봉, 최종 {last_date})")
+        return state
+
+    def on_price_update(self, stock_code: str, data: Dict) -> None:
+        """가격 데이터 반영 (SimpleHybridDataManager._process_data_update에서 호출)"""
+        try:
+            price = float(data.get('current_price', 0) or 0)
+        except (TypeError, ValueError):
+            return
+        if price <= 0:
+            return
+
+        trade_date = now_kst().strftime('%Y%m%d')
+        with self._lock:
+            state = self._get_or_seed(stock_code)
+            if state is None:
+                return
+            state.on_price(price, trade_date)
+            self.stats['ticks'] += 1
+
+    def get_snapshot(self, stock_code: str, price: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """현재 지표값 (시드된 상태가 없으면 None → 호출측에서 기존 방식으로 계산)"""
+        with self._lock:
+            state = self._states.get(stock_code)
+            if state is None or not state.is_seeded:
+                return None
+            return state.snapshot(price if price and price > 0 else None)
+
+    def discard(self, stock_code: str) -> None:
+        with self._lock:
+            self._states.pop(stock_code, None)
+            self._seed_failed_at.pop(stock_code, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {**self.stats, 'symbols': len(self._states)}
+
+
+# 전역 인스턴스
+_streaming_indicators: Optional[StreamingIndicatorRegistry] = None
+_streaming_indicators_lock = threading.Lock()
+
+
+def get_streaming_indicators() -> StreamingIndicatorRegistry:
+    """전역 스트리밍 지표 레지스트리 반환"""
+    global _streaming_indicators
+    if _streaming_indicators is None:
+        with _streaming_indicators_lock:
+            if _streaming_indicators is None:
+                _streaming_indicators = StreamingIndicatorRegistry()
+    return _streaming_indicators
@@ -2,10 +2,10 @@
 기술적 지표 계산 모듈
 RSI, MACD, 볼린저 밴드, 스토캐스틱 등 단기거래에 필요한 지표들
 """
-import pandas as pd
 import numpy as np
 from typing import Dict, List, Tuple, Optional
 from utils.logger import setup_logger
+from . import indicator_kernels as kernels
 
 logger = setup_logger(__name__)
 
@@ -19,29 +19,7 @@ class TechnicalIndicators:
             if len(prices) < period + 1:
                 return [50.0] * len(prices)  # 기본값
 
-            df = pd.DataFrame({'price': prices})
-            df['change'] = df['price'].diff()
-            df['gain'] = df['change'].where(df['change'] > 0, 0)
-            df['loss'] = -df['change'].where(df['change'] < 0, 0)
-
-            # 초기 평균
-            df['avg_gain'] = df['gain'].rolling(window=period, min_periods=period).mean()
-            df['avg_loss'] = df['loss'].rolling(window=period, min_periods=period).mean()
-
-            # 이후 평균 (지수 이동 평균 방식)
-            for i in range(period, len(df)):
-                if i == period:
-                    continue
-                df.loc[i, 'avg_gain'] = (df.loc[i-1, 'avg_gain'] * (period-1) + df.loc[i, 'gain']) / period
-                df.loc[i, 'avg_loss'] = (df.loc[i-1, 'avg_loss'] * (period-1) + df.loc[i, 'loss']) / period
-
-            # RSI 계산
-            df['rs'] = df['avg_gain'] / df['avg_loss']
-            df['rsi'] = 100 - (100 / (1 + df['rs']))
-
-            # NaN 값을 50으로 대체
-            rsi_values = df['rsi'].fillna(50.0).tolist()
-            return rsi_values
+            return kernels.rsi(prices, period).tolist()
 
         except Exception as e:
             logger.error(f"RSI 계산 오류: {e}")
@@ -59,26 +37,8 @@ class TechnicalIndicators:
                     'histogram': null_values
                 }
 
-            df = pd.DataFrame({'price': prices})
-
-            # EMA 계산
-            df['ema_fast'] = df['price'].ewm(span=fast).mean()
-            df['ema_slow'] = df['price'].ewm(span=slow).mean()
-
-            # MACD 라인
-            df['macd'] = df['ema_fast'] - df['ema_slow']
-
-            # 시그널 라인
-            df['signal'] = df['macd'].ewm(span=signal).mean()
-
-            # 히스토그램
-            df['histogram'] = df['macd'] - df['signal']
-
-            return {
-                'macd': df['macd'].fillna(0.0).tolist(),
-                'signal': df['signal'].fillna(0.0).tolist(),
-                'histogram': df['histogram'].fillna(0.0).tolist()
-            }
+            result = kernels.macd(prices, fast, slow, signal)
+            return {key: values.tolist() for key, values in result.items()}
 
         except Exception as e:
             logger.error(f"MACD 계산 오류: {e}")
@@ -101,27 +61,8 @@ class TechnicalIndicators:
                     'bandwidth': [0.0] * len(prices)
                 }
 
-            df = pd.DataFrame({'price': prices})
-
-            # 중간선 (이동평균)
-            df['middle'] = df['price'].rolling(window=period).mean()
-
-            # 표준편차
-            df['std'] = df['price'].rolling(window=period).std()
-
-            # 상/하한선
-            df['upper'] = df['middle'] + (df['std'] * std_dev)
-            df['lower'] = df['middle'] - (df['std'] * std_dev)
-
-            # 밴드폭 (%B)
-            df['bandwidth'] = (df['price'] - df['lower']) / (df['upper'] - df['lower']) * 100
-
-            return {
-                'upper': df['upper'].bfill().tolist(),
-                'middle': df['middle'].bfill().tolist(),
-                'lower': df['lower'].bfill().tolist(),
-                'bandwidth': df['bandwidth'].fillna(50.0).tolist()
-            }
+            result = kernels.bollinger_bands(prices, period, std_dev)
+            return {key: values.tolist() for key, values in result.items()}
 
         except Exception as e:
             logger.error(f"볼린저 밴드 계산 오류: {e}")
@@ -144,27 +85,8 @@ class TechnicalIndicators:
                     'd': null_values
                 }
 
-            df = pd.DataFrame({
-                'high': highs,
-                'low': lows,
-                'close': closes
-            })
-
-            # 최고/최저가 (K 기간)
-            df['highest_high'] = df['high'].rolling(window=k_period).max()
-            df['lowest_low'] = df['low'].rolling(window=k_period).min()
-
-            # %K 계산
-            df['k'] = ((df['close'] - df['lowest_low']) /
-                      (df['highest_high'] - df['lowest_low'])) * 100
-
-            # %D 계산 (%K의 이동평균)
-            df['d'] = df['k'].rolling(window=d_period).mean()
-
-            return {
-                'k': df['k'].fillna(50.0).tolist(),
-                'd': df['d'].fillna(50.0).tolist()
-            }
+            result = kernels.stochastic(highs, lows, closes, k_period, d_period)
+            return {key: values.tolist() for key, values in result.items()}
 
         except Exception as e:
             logger.error(f"스토캐스틱 계산 오류: {e}")
@@ -178,15 +100,13 @@ class TechnicalIndicators:
     def calculate_moving_averages(prices: List[float], periods: List[int] = [5, 20, 60]) -> Dict[str, List[float]]:
         """이동평균선들 계산"""
         try:
-            df = pd.DataFrame({'price': prices})
             result = {}
 
             for period in periods:
                 if len(prices) >= period:
-                    ma = df['price'].rolling(window=period).mean()
-                    result[f'ma_{period}'] = ma.bfill().tolist()
+                    result[f'ma_{period}'] = kernels.moving_average(prices, period).tolist()
                 else:
-                    result[f'ma_{period}'] = prices.copy()
+                    result[f'ma_{period}'] = list(prices)
 
             return result
 
@@ -194,9 +114,48 @@ class TechnicalIndicators:
             logger.error(f"이동평균 계산 오류: {e}")
             result = {}
             for period in periods:
-                result[f'ma_{period}'] = prices.copy()
+                result[f'ma_{period}'] = list(prices)
             return result
 
+    @staticmethod
+    def calculate_batch(closes: np.ndarray, highs: Optional[np.ndarray] = None,
+                        lows: Optional[np.ndarray] = None, rsi_period: int = 14,
+                        ma_periods: Tuple[int, ...] = (5, 20, 60)) -> Dict[str, np.ndarray]:
+        """여러 종목 지표 일괄 계산 (입력은 (종목 × 시점) 배열, 시점은 오래된 값 → 최신 값)
+
+        모든 종목의 시점 수가 같아야 하며 결과도 같은 모양의 배열로 반환
+        (고가/저가가 없으면 스토캐스틱은 생략)
+        """
+        closes = np.asarray(closes, dtype=np.float64)
+        n = closes.shape[1]
+        result: Dict[str, np.ndarray] = {'rsi': kernels.rsi(closes, rsi_period)}
+
+        # 데이터가 짧을 때는 종목별 계산과 같은 기본값 사용
+        if n >= 26:
+            macd = kernels.macd(closes)
+        else:
+            macd = {key: np.zeros_like(closes) for key in ('macd', 'signal', 'histogram')}
+        result['macd'], result['macd_signal'], result['macd_histogram'] = macd['macd'], macd['signal'], macd['histogram']
+
+        if n >= 20:
+            bands = kernels.bollinger_bands(closes)
+        else:
+            bands = {'upper': closes.copy(), 'middle': closes.copy(), 'lower': closes.copy(),
+                     'bandwidth': np.zeros_like(closes)}
+        result.update({f'bb_{key}': values for key, values in bands.items()})
+
+        if highs is not None and lows is not None:
+            if n >= 14:
+                stoch = kernels.stochastic(highs, lows, closes)
+            else:
+                stoch = {'k': np.full_like(closes, 50.0), 'd': np.full_like(closes, 50.0)}
+            result['stoch_k'], result['stoch_d'] = stoch['k'], stoch['d']
+
+        for period in ma_periods:
+            result[f'ma_{period}'] = kernels.moving_average(closes, period)
+
+        return result
+
     @staticmethod
     def calculate_support_resistance(prices: List[float], window: int = 5) -> Dict[str, float]:
         """지지/저항선 계산 (최근 데이터 기반)"""
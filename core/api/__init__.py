@@ -3,14 +3,20 @@ API 관련 모듈들
 """
 
 # 기존 import 호환성을 위한 re-export
+from . import kis_http_pool
+from . import kis_rate_limiter
 from . import kis_auth
+from . import kis_async_client
 from . import kis_market_api
 from . import kis_order_api
 from . import kis_account_api
 from .rest_api_manager import KISRestAPIManager
 
 __all__ = [
+    'kis_http_pool',
+    'kis_rate_limiter',
     'kis_auth',
+    'kis_async_client',
     'kis_market_api',
     'kis_order_api',
     'kis_account_api',
@@ -0,0 +1,199 @@
+"""
+KIS REST API 비동기 클라이언트 (aiohttp 기반 _url_fetch 대응 버전)
+이벤트 루프를 막지 않고 여러 종목 시세를 동시에 조회하기 위해 사용
+"""
+import json
+import asyncio
+import threading
+from typing import Dict, Optional, Any
+
+import aiohttp
+
+from utils.logger import setup_logger
+from . import kis_auth as kis
+from .kis_rate_limiter import get_rate_limiter
+
+logger = setup_logger(__name__)
+
+
+class _AsyncHttpResponse:
+    """aiohttp 응답을 APIResp가 기대하는 requests.Response 형태로 감싼 객체"""
+
+    def __init__(self, status: int, headers: Dict[str, str], text: str):
+        self.status_code = status
+        self.headers = headers
+        self.text = text
+
+    def json(self) -> Any:
+        return json.loads(self.text)
+
+
+class KISAsyncClient:
+    """이벤트 루프별 aiohttp 세션을 관리하는 비동기 KIS 클라이언트"""
+
+    def __init__(self, pool_maxsize: Optional[int] = None, timeout: Optional[float] = None):
+        """
+        Args:
+            pool_maxsize: 동시 연결 수 (None이면 config.settings 값 사용)
+            timeout: 요청 타임아웃(초) (None이면 config.settings 값 사용)
+        """
+        if pool_maxsize is None or timeout is None:
+            from config.settings import KIS_HTTP_POOL_MAXSIZE, KIS_HTTP_TIMEOUT
+            pool_maxsize = pool_maxsize or KIS_HTTP_POOL_MAXSIZE
+            timeout = timeout or KIS_HTTP_TIMEOUT
+
+        self.pool_maxsize = pool_maxsize
+        self.timeout = timeout
+
+        # aiohttp 세션은 생성된 이벤트 루프에서만 사용 가능하므로 루프별로 보관
+        self._sessions: Dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
+        self._lock = threading.Lock()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            session = self._sessions.get(loop)
+            if session is None or session.closed:
+                connector = aiohttp.TCPConnector(limit=self.pool_maxsize, keepalive_timeout=30)
+                session = aiohttp.ClientSession(
+                    connector=connector,
+                    timeout=aiohttp.ClientTimeout(total=self.timeout)
+                )
+                self._sessions[loop] = session
+            return session
+
+    async def request(self, method: str, url: str, headers: Dict,
+                      params: Optional[Dict] = None, data: Optional[str] = None) -> _AsyncHttpResponse:
+        """HTTP 요청 실행 후 응답 본문까지 읽어서 반환"""
+        session = self._get_session()
+        async with session.request(method, url, headers=headers, params=params, data=data) as resp:
+            text = await resp.text()
+            return _AsyncHttpResponse(resp.status, dict(resp.headers), text)
+
+    async def close(self) -> None:
+        """현재 이벤트 루프의 세션 종료"""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            session = self._sessions.pop(loop, None)
+        if session and not session.closed:
+            await session.close()
+
+
+# 전역 비동기 클라이언트 (최초 사용 시 생성)
+_async_client: Optional[KISAsyncClient] = None
+_async_client_lock = threading.Lock()
+
+
+def get_async_client() -> KISAsyncClient:
+    """전역 비동기 클라이언트 반환"""
+    global _async_client
+    if _async_client is None:
+        with _async_client_lock:
+            if _async_client is None:
+                _async_client = KISAsyncClient()
+    return _async_client
+
+
+async def close_async_client() -> None:
+    """현재 이벤트 루프에 바인딩된 세션 종료 (루프 종료 전 호출)"""
+    if _async_client is not None:
+        await _async_client.close()
+
+
+async def _wait_for_api_limit_async(tr_id: str) -> None:
+    """API 호출 속도 제한 대기 (kis_auth의 동기 호출과 같은 토큰 버킷을 공유)"""
+    await get_rate_limiter().acquire_async(tr_id)
+
+
+async def _send(url: str, tr_id: str, tr_cont: str, params: Dict,
+                appendHeaders: Optional[Dict], postFlag: bool, hashFlag: bool) -> _AsyncHttpResponse:
+    headers = kis._build_request_headers(tr_id, tr_cont, appendHeaders)
+    client = get_async_client()
+
+    if postFlag:
+        if hashFlag:
+            # 해시키 발급은 주문 경로에서만 쓰이므로 스레드로 위임
+            await asyncio.to_thread(kis.set_order_hash_key, headers, params)
+        return await client.request('POST', url, headers, data=json.dumps(params))
+    return await client.request('GET', url, headers, params=params)
+
+
+async def _url_fetch_async(api_url: str, ptr_id: str, tr_cont: str, params: Dict,
+                           appendHeaders: Optional[Dict] = None, postFlag: bool = False,
+                           hashFlag: bool = True) -> Optional[kis.APIResp]:
+    """API 호출 공통 함수 (비동기, kis_auth._url_fetch와 동일한 재시도/토큰 재발급 규칙)"""
+    env = kis.getTREnv()
+    if not env:
+        logger.error("인증되지 않음. auth() 호출 필요")
+        return None
+
+    url = f"{env.my_url}{api_url}"
+    tr_id = ptr_id
+    max_retries = kis._max_retries
+    retry_delay_base = kis._retry_delay_base
+
+    for attempt in range(max_retries + 1):
+        try:
+            await _wait_for_api_limit_async(tr_id)
+
+            res = await _send(url, tr_id, tr_cont, params, appendHeaders, postFlag, hashFlag)
+
+            if res.status_code == 200:
+                ar = kis.APIResp(res)
+                if ar.isOK():
+                    return ar
+
+                if ar.getErrorCode() == 'EGW00201':  # 속도 제한 오류
+                    if attempt < max_retries:
+                        # 해당 레인 버킷을 비워 다음 루프의 토큰 획득에서 대기
+                        get_rate_limiter().on_throttled(tr_id)
+                        logger.warning(f"속도 제한 오류 발생. 재시도 ({attempt + 1}/{max_retries + 1})")
+                        continue
+                    logger.error(f"API 오류: {res.status_code} - {ar.getErrorMessage()}")
+                    return ar
+                elif ar.getErrorCode() == 'EGW00123':  # 토큰 만료 오류
+                    logger.warning("🔑 토큰이 만료되었습니다. 자동 재발급을 시도합니다...")
+                    if await asyncio.to_thread(kis._auto_reauth):
+                        logger.info("✅ 토큰 재발급 성공. API 호출을 재시도합니다.")
+                        continue
+                    logger.error("❌ 토큰 재발급 실패")
+                    return ar
+                else:
+                    logger.error(f"API 비즈니스 오류: {ar.getErrorCode()} - {ar.getErrorMessage()}")
+                    return ar
+
+            if res.status_code == 500:
+                try:
+                    response_data = json.loads(res.text)
+                except json.JSONDecodeError:
+                    logger.error(f"API 오류: {res.status_code} - {res.text}")
+                    return None
+
+                if (response_data.get('msg_cd') == 'EGW00123' or
+                        '기간이 만료된 token' in response_data.get('msg1', '')):
+                    logger.warning("🔑 HTTP 500 토큰 만료 오류 감지. 자동 재발급을 시도합니다...")
+                    if await asyncio.to_thread(kis._auto_reauth):
+                        continue
+                    logger.error("❌ 토큰 재발급 실패")
+                    return None
+                elif kis._is_rate_limit_error(res.text) and attempt < max_retries:
+                    get_rate_limiter().on_throttled(tr_id)
+                    logger.warning(f"HTTP 500 속도 제한 오류. 재시도 ({attempt + 1}/{max_retries + 1})")
+                    continue
+
+            logger.error(f"API 오류: {res.status_code} - {res.text}")
+            return None
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            if attempt < max_retries:
+                wait_time = retry_delay_base * (2 ** attempt)
+                logger.warning(f"API 호출 예외 발생. {wait_time}초 후 재시도 ({attempt + 1}/{max_retries + 1}): {e}")
+                await asyncio.sleep(wait_time)
+                continue
+            logger.error(f"API 호출 오류: {e}")
+            return None
+
+    logger.error(f"API 호출 최대 재시도 횟수 초과: {tr_id}")
+    return None
@@ -9,6 +9,9 @@ import requests
 from datetime import datetime
 from typing import Dict, Optional, NamedTuple
 from utils.logger import setup_logger
+from .kis_http_pool import get_http_pool
+from .kis_rate_limiter import get_rate_limiter
+from .kis_records import ResponseFields
 
 # 설정 import (settings.py에서 .env 파일을 읽어서 제공)
 from config.settings import (
@@ -37,9 +40,7 @@ _autoReAuth = True
 _DEBUG = False
 _isPaper = False
 
-# API 호출 속도 제어를 위한 전역 변수들 추가
-_last_api_call_time = None
-_min_api_interval = 0.06  # 최소 60ms 간격 (초당 16-17회로 안전하게 설정, KIS 제한: 1초당 20건)
+# API 재시도 설정 (호출 속도 제한은 kis_rate_limiter의 토큰 버킷이 담당)
 _max_retries = 3  # 최대 재시도 횟수
 _retry_delay_base = 1.0  # 기본 재시도 지연 시간(초) - 줄임
 
@@ -131,9 +132,7 @@ def changeTREnv(token_key: str, svr: str = 'prod', product: str = '01') -> None:
 
 def _getResultObject(json_data: Dict):
     """결과 객체 생성"""
-    from collections import namedtuple
-    _tc_ = namedtuple('res', json_data.keys())
-    return _tc_(**json_data)
+    return ResponseFields(json_data)
 
 
 def auth(svr: str = 'prod', product: str = '01') -> bool:
@@ -169,7 +168,7 @@ def auth(svr: str = 'prod', product: str = '01') -> bool:
         url += '/oauth2/tokenP'
 
         try:
-            res = requests.post(url, data=json.dumps(p), headers=_getBaseHeader())
+            res = get_http_pool().post(url, data=json.dumps(p), headers=_getBaseHeader())
 
             if res.status_code == 200:
                 result = _getResultObject(res.json())
@@ -234,7 +233,7 @@ def set_order_hash_key(headers: Dict, params: Dict) -> None:
     url = f"{_TRENV.my_url}/uapi/hashkey"
 
     try:
-        res = requests.post(url, data=json.dumps(params), headers=headers)
+        res = get_http_pool().post(url, data=json.dumps(params), headers=headers)
         if res.status_code == 200:
             headers['hashkey'] = _getResultObject(res.json()).HASH
     except Exception as e:
@@ -256,24 +255,18 @@ class APIResp:
         return self._rescode
 
     def _setHeader(self):
-        from collections import namedtuple
-        fld = {}
-        for x in self._resp.headers.keys():
-            if x.islower():
-                fld[x] = self._resp.headers.get(x)
-        _th_ = namedtuple('header', fld.keys())
-        return _th_(**fld)
+        # 응답마다 namedtuple 클래스를 만들지 않고 dict를 속성 뷰로 감쌈
+        return ResponseFields({x: v for x, v in self._resp.headers.items() if x.islower()})
 
     def _setBody(self):
-        from collections import namedtuple
         try:
             body_data = self._resp.json()
-            _tb_ = namedtuple('body', body_data.keys())
-            return _tb_(**body_data)
-        except:
+            if not isinstance(body_data, dict):
+                raise ValueError('JSON 객체가 아님')
+            return ResponseFields(body_data)
+        except Exception:
             # JSON 파싱 실패시 빈 객체 반환
-            _tb_ = namedtuple('body', ['rt_cd', 'msg_cd', 'msg1'])
-            return _tb_(rt_cd='1', msg_cd='ERROR', msg1='JSON 파싱 실패')
+            return ResponseFields({'rt_cd': '1', 'msg_cd': 'ERROR', 'msg1': 'JSON 파싱 실패'})
 
     def getHeader(self):
         return self._header
@@ -301,6 +294,19 @@ class APIResp:
         logger.error(f'rt_cd: {self.getBody().rt_cd}, msg_cd: {self.getErrorCode()}, msg1: {self.getErrorMessage()}')
 
 
+def _build_request_headers(tr_id: str, tr_cont: str, appendHeaders: Optional[Dict] = None) -> Dict:
+    """TR 호출용 요청 헤더 생성 (동기/비동기 공용)"""
+    headers = _getBaseHeader()
+    headers["tr_id"] = tr_id
+    headers["custtype"] = "P"  # 개인
+    headers["tr_cont"] = tr_cont
+
+    # 추가 헤더
+    if appendHeaders:
+        headers.update(appendHeaders)
+    return headers
+
+
 def _url_fetch(api_url: str, ptr_id: str, tr_cont: str, params: Dict,
                appendHeaders: Optional[Dict] = None, postFlag: bool = False,
                hashFlag: bool = True) -> Optional[APIResp]:
@@ -317,18 +323,11 @@ def _url_fetch(api_url: str, ptr_id: str, tr_cont: str, params: Dict,
     # 재시도 로직
     for attempt in range(_max_retries + 1):
         try:
-            # API 호출 속도 제한 적용
-            _wait_for_api_limit()
+            # API 호출 속도 제한 적용 (TR 종류별 토큰 버킷)
+            _wait_for_api_limit(tr_id)
 
             # 헤더 설정
-            headers = _getBaseHeader()
-            headers["tr_id"] = tr_id
-            headers["custtype"] = "P"  # 개인
-            headers["tr_cont"] = tr_cont
-
-            # 추가 헤더
-            if appendHeaders:
-                headers.update(appendHeaders)
+            headers = _build_request_headers(tr_id, tr_cont, appendHeaders)
 
             if _DEBUG:
                 logger.debug(f"API 호출 ({attempt + 1}/{_max_retries + 1}): {url}, TR: {tr_id}")
@@ -337,9 +336,9 @@ def _url_fetch(api_url: str, ptr_id: str, tr_cont: str, params: Dict,
             if postFlag:
                 if hashFlag:
                     set_order_hash_key(headers, params)
-                res = requests.post(url, headers=headers, data=json.dumps(params))
+                res = get_http_pool().post(url, headers=headers, data=json.dumps(params))
             else:
-                res = requests.get(url, headers=headers, params=params)
+                res = get_http_pool().get(url, headers=headers, params=params)
 
             # 응답 처리
             if res.status_code == 200:
@@ -352,9 +351,9 @@ def _url_fetch(api_url: str, ptr_id: str, tr_cont: str, params: Dict,
                     # API 응답은 200이지만 비즈니스 오류
                     if ar.getErrorCode() == 'EGW00201':  # 속도 제한 오류
                         if attempt < _max_retries:
-                            wait_time = _retry_delay_base * (2 ** attempt)  # 지수 백오프
-                            logger.warning(f"속도 제한 오류 발생. {wait_time}초 후 재시도 ({attempt + 1}/{_max_retries + 1})")
-                            time.sleep(wait_time)
+                            # 해당 레인 버킷을 비워 다음 루프의 토큰 획득에서 대기
+                            get_rate_limiter().on_throttled(tr_id)
+                            logger.warning(f"속도 제한 오류 발생. 재시도 ({attempt + 1}/{_max_retries + 1})")
                             continue
                         else:
                             logger.error(f"API 오류: {res.status_code} - {ar.getErrorMessage()}")
@@ -367,20 +366,15 @@ def _url_fetch(api_url: str, ptr_id: str, tr_cont: str, params: Dict,
                             if _auto_reauth():
                                 logger.info("✅ 토큰 재발급 성공. API 호출을 재시도합니다.")
                                 # 헤더 업데이트 (새로운 토큰 적용)
-                                headers = _getBaseHeader()
-                                headers["tr_id"] = tr_id
-                                headers["custtype"] = "P"
-                                headers["tr_cont"] = tr_cont
-                                if appendHeaders:
-                                    headers.update(appendHeaders)
+                                headers = _build_request_headers(tr_id, tr_cont, appendHeaders)
 
                                 # API 재호출
                                 if postFlag:
                                     if hashFlag:
                                         set_order_hash_key(headers, params)
-                                    res = requests.post(url, headers=headers, data=json.dumps(params))
+                                    res = get_http_pool().post(url, headers=headers, data=json.dumps(params))
                                 else:
-                                    res = requests.get(url, headers=headers, params=params)
+                                    res = get_http_pool().get(url, headers=headers, params=params)
 
                                 # 재호출 결과 처리
                                 if res.status_code == 200:
@@ -425,9 +419,8 @@ def _url_fetch(api_url: str, ptr_id: str, tr_cont: str, params: Dict,
                                 return None
                         elif _is_rate_limit_error(res.text):
                             if attempt < _max_retries:
-                                wait_time = _retry_delay_base * (2 ** attempt)  # 지수 백오프
-                                logger.warning(f"HTTP 500 속도 제한 오류. {wait_time}초 후 재시도 ({attempt + 1}/{_max_retries + 1})")
-                                time.sleep(wait_time)
+                                get_rate_limiter().on_throttled(tr_id)
+                                logger.warning(f"HTTP 500 속도 제한 오류. 재시도 ({attempt + 1}/{_max_retries + 1})")
                                 continue
                             else:
                                 logger.error(f"API 오류: {res.status_code} - {res.text}")
@@ -456,21 +449,11 @@ def _url_fetch(api_url: str, ptr_id: str, tr_cont: str, params: Dict,
     return None
 
 
-def _wait_for_api_limit():
-    """API 호출 속도 제한을 위한 대기"""
-    global _last_api_call_time
-
-    current_time = time.time()
-
-    if _last_api_call_time is not None:
-        elapsed = current_time - _last_api_call_time
-        if elapsed < _min_api_interval:
-            wait_time = _min_api_interval - elapsed
-            if _DEBUG:
-                logger.debug(f"API 속도 제한: {wait_time:.3f}초 대기 (이전 호출로부터 {elapsed:.3f}초 경과)")
-            time.sleep(wait_time)
-
-    _last_api_call_time = time.time()
+def _wait_for_api_limit(tr_id: str = ""):
+    """API 호출 속도 제한을 위한 대기 (TR 종류별 토큰 버킷)"""
+    wait_time = get_rate_limiter().acquire(tr_id)
+    if _DEBUG and wait_time > 0:
+        logger.debug(f"API 속도 제한: {wait_time:.3f}초 대기 ({tr_id})")
 
 
 def _is_rate_limit_error(response_text: str) -> bool:
@@ -483,23 +466,27 @@ def _is_rate_limit_error(response_text: str) -> bool:
         return False
 
 
-def set_api_rate_limit(interval_seconds: float = 0.35, max_retries: int = 3, retry_delay: float = 2.0):
-    """API 호출 속도 제한 설정을 동적으로 변경"""
-    global _min_api_interval, _max_retries, _retry_delay_base
+def set_api_rate_limit(quote_per_sec: Optional[float] = None, order_per_sec: Optional[float] = None,
+                       scan_per_sec: Optional[float] = None, max_retries: int = 3, retry_delay: float = 1.0,
+                       scan_borrow: Optional[bool] = None):
+    """API 호출 속도 제한 설정을 동적으로 변경 (레인별 초당 호출수 + 재시도, 스캔 빌려 쓰기 여부)"""
+    global _max_retries, _retry_delay_base
 
-    _min_api_interval = interval_seconds
+    get_rate_limiter().configure(quote_rate=quote_per_sec, order_rate=order_per_sec, scan_rate=scan_per_sec,
+                                 scan_borrow=scan_borrow)
     _max_retries = max_retries
     _retry_delay_base = retry_delay
 
-    logger.info(f"API 속도 제한 설정 변경: 간격={interval_seconds}초, 최대재시도={max_retries}회, 재시도지연={retry_delay}초")
+    logger.info(f"API 속도 제한 설정 변경: 시세={quote_per_sec}/s, 주문={order_per_sec}/s, 스캔={scan_per_sec}/s, "
+                f"최대재시도={max_retries}회, 재시도지연={retry_delay}초")
 
 
 def get_api_rate_limit_info():
-    """현재 API 속도 제한 설정 정보 반환"""
+    """현재 API 속도 제한 설정 및 레인별 실시간 통계 (잔여 토큰, 대기, 속도제한 응답 횟수)"""
     return {
-        'min_interval': _min_api_interval,
         'max_retries': _max_retries,
-        'retry_delay_base': _retry_delay_base
+        'retry_delay_base': _retry_delay_base,
+        'lanes': get_rate_limiter().get_stats()
     }
 
 
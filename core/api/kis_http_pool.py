@@ -0,0 +1,237 @@
+"""
+KIS REST API HTTP 연결 풀 (keep-alive 세션 공유)
+요청마다 새 TCP/TLS 핸드셰이크를 하지 않도록 requests.Session을 재사용
+"""
+import time
+import threading
+from typing import Dict, Optional, Any
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# 기본 풀 설정 (KIS 게이트웨이는 단일 호스트이므로 호스트 풀 수는 작게, 호스트당 연결 수는 스레드 수에 맞춤)
+DEFAULT_POOL_CONNECTIONS = 4      # 호스트별 연결 풀 개수
+DEFAULT_POOL_MAXSIZE = 20         # 호스트당 최대 유지 연결 수
+DEFAULT_TIMEOUT = 10.0            # 요청 타임아웃(초)
+
+
+class _HostMetrics:
+    """호스트별 연결 통계 (KISHttpSessionPool 내부용)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._hosts: Dict[str, Dict[str, float]] = {}
+
+    def _entry(self, host: str) -> Dict[str, float]:
+        entry = self._hosts.get(host)
+        if entry is None:
+            entry = {
+                'requests': 0,
+                'handshakes': 0,
+                'errors': 0,
+                'total_elapsed': 0.0
+            }
+            self._hosts[host] = entry
+        return entry
+
+    def record_handshake(self, host: str) -> None:
+        with self._lock:
+            self._entry(host)['handshakes'] += 1
+
+    def record_request(self, host: str, elapsed: float, error: bool = False) -> None:
+        with self._lock:
+            entry = self._entry(host)
+            entry['requests'] += 1
+            entry['total_elapsed'] += elapsed
+            if error:
+                entry['errors'] += 1
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            result = {}
+            for host, entry in self._hosts.items():
+                requests_count = int(entry['requests'])
+                handshakes = int(entry['handshakes'])
+                reused = max(0, requests_count - handshakes)
+                result[host] = {
+                    'requests': requests_count,
+                    'handshakes': handshakes,
+                    'reused': reused,
+                    'reuse_rate': round(reused / requests_count * 100, 2) if requests_count > 0 else 0.0,
+                    'errors': int(entry['errors']),
+                    'avg_elapsed_ms': round(entry['total_elapsed'] / requests_count * 1000, 2) if requests_count > 0 else 0.0
+                }
+            return result
+
+    def reset(self) -> None:
+        with self._lock:
+            self._hosts.clear()
+
+
+def _counting_pool_classes(metrics: _HostMetrics) -> Dict[str, type]:
+    """새 연결(=핸드셰이크) 생성 시점을 기록하는 urllib3 커넥션 풀 클래스 생성"""
+
+    class _CountingHTTPConnectionPool(HTTPConnectionPool):
+        def _new_conn(self):
+            metrics.record_handshake(self.host)
+            return super()._new_conn()
+
+    class _CountingHTTPSConnectionPool(HTTPSConnectionPool):
+        def _new_conn(self):
+            metrics.record_handshake(self.host)
+            return super()._new_conn()
+
+    return {'http': _CountingHTTPConnectionPool, 'https': _CountingHTTPSConnectionPool}
+
+
+class _CountingHTTPAdapter(HTTPAdapter):
+    """핸드셰이크 통계를 수집하는 HTTPAdapter"""
+
+    def __init__(self, metrics: _HostMetrics, **kwargs):
+        self._metrics = metrics
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = _counting_pool_classes(self._metrics)
+
+
+class KISHttpSessionPool:
+    """스레드 안전 keep-alive 세션 풀
+
+    urllib3 커넥션 풀은 스레드 안전하므로 하나의 Session/Adapter를 모든 스레드가 공유하고,
+    세션 교체(설정 변경)만 락으로 보호한다.
+    """
+
+    def __init__(self, pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+                 pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+                 timeout: Optional[float] = DEFAULT_TIMEOUT,
+                 verify: Any = True):
+        """
+        Args:
+            pool_connections: 호스트별 연결 풀 개수
+            pool_maxsize: 호스트당 최대 유지 연결 수 (동시 호출 스레드 수 이상 권장)
+            timeout: 요청 타임아웃(초), None이면 무제한
+            verify: TLS 인증서 검증 여부 또는 CA 번들 경로
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.timeout = timeout
+        self.verify = verify
+
+        self._lock = threading.Lock()
+        self._metrics = _HostMetrics()
+        self._session = self._create_session()
+
+        logger.debug(f"HTTP 연결 풀 초기화: pool_connections={pool_connections}, pool_maxsize={pool_maxsize}")
+
+    def _create_session(self) -> requests.Session:
+        """새 세션 생성 (재시도는 _url_fetch에서 처리하므로 어댑터 재시도는 비활성화)"""
+        session = requests.Session()
+        adapter = _CountingHTTPAdapter(
+            self._metrics,
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=0,
+            pool_block=False
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """공유 세션으로 요청 실행 (예외는 호출자에게 그대로 전달)"""
+        kwargs.setdefault('timeout', self.timeout)
+        kwargs.setdefault('verify', self.verify)
+        host = urlsplit(url).hostname or ''
+        session = self._session
+
+        start = time.perf_counter()
+        try:
+            res = session.request(method, url, **kwargs)
+        except Exception:
+            self._metrics.record_request(host, time.perf_counter() - start, error=True)
+            raise
+
+        self._metrics.record_request(host, time.perf_counter() - start)
+        return res
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request('POST', url, **kwargs)
+
+    def configure(self, pool_connections: Optional[int] = None, pool_maxsize: Optional[int] = None,
+                  timeout: Optional[float] = None) -> None:
+        """풀 크기/타임아웃 변경 (기존 세션은 닫고 새 세션으로 교체)"""
+        with self._lock:
+            if pool_connections is not None:
+                self.pool_connections = pool_connections
+            if pool_maxsize is not None:
+                self.pool_maxsize = pool_maxsize
+            if timeout is not None:
+                self.timeout = timeout
+
+            old_session = self._session
+            self._session = self._create_session()
+
+        old_session.close()
+        logger.info(f"HTTP 연결 풀 설정 변경: pool_connections={self.pool_connections}, "
+                    f"pool_maxsize={self.pool_maxsize}, timeout={self.timeout}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """호스트별 요청/핸드셰이크/재사용 통계"""
+        return {
+            'pool_connections': self.pool_connections,
+            'pool_maxsize': self.pool_maxsize,
+            'timeout': self.timeout,
+            'hosts': self._metrics.snapshot()
+        }
+
+    def reset_stats(self) -> None:
+        self._metrics.reset()
+
+    def close(self) -> None:
+        """세션 및 유지 중인 연결 종료"""
+        with self._lock:
+            self._session.close()
+
+
+# 전역 세션 풀 인스턴스 (kis_auth._url_fetch 및 모든 API 모듈이 공유, 최초 사용 시 생성)
+_http_pool: Optional[KISHttpSessionPool] = None
+_http_pool_lock = threading.Lock()
+
+
+def get_http_pool() -> KISHttpSessionPool:
+    """전역 HTTP 세션 풀 반환 (설정값은 config.settings에서 로드)"""
+    global _http_pool
+    if _http_pool is None:
+        with _http_pool_lock:
+            if _http_pool is None:
+                from config.settings import KIS_HTTP_POOL_MAXSIZE, KIS_HTTP_TIMEOUT
+                _http_pool = KISHttpSessionPool(pool_maxsize=KIS_HTTP_POOL_MAXSIZE, timeout=KIS_HTTP_TIMEOUT)
+    return _http_pool
+
+
+def set_http_pool_config(pool_connections: Optional[int] = None, pool_maxsize: Optional[int] = None,
+                         timeout: Optional[float] = None) -> None:
+    """전역 HTTP 세션 풀 설정 변경"""
+    get_http_pool().configure(pool_connections, pool_maxsize, timeout)
+
+
+def get_http_pool_stats() -> Dict[str, Any]:
+    """전역 HTTP 세션 풀 통계"""
+    return get_http_pool().get_stats()
+
+
+def close_http_pool() -> None:
+    """전역 HTTP 세션 풀 종료"""
+    if _http_pool is not None:
+        _http_pool.close()
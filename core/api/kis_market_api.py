@@ -8,12 +8,13 @@ from datetime import datetime, timedelta
 from typing import Optional, Dict, List, Tuple, Any
 from utils.logger import setup_logger
 from . import kis_auth as kis
+from .kis_async_client import _url_fetch_async
+from .kis_records import (StockQuote, OrderBook, DailyBar,
+                          decode_quote, decode_orderbook, decode_daily_bars)
 
 logger = setup_logger(__name__)
 
-def get_inquire_price(div_code: str = "J", itm_no: str = "", tr_cont: str = "",
-                      FK100: str = "", NK100: str = "") -> Optional[pd.DataFrame]:
-    """주식현재가 시세"""
+def _inquire_price_request(div_code: str, itm_no: str) -> Tuple[str, str, Dict]:
     url = '/uapi/domestic-stock/v1/quotations/inquire-price'
     tr_id = "FHKST01010100"  # 주식현재가 시세
 
@@ -21,18 +22,44 @@ def get_inquire_price(div_code: str = "J", itm_no: str = "", tr_cont: str = "",
         "FID_COND_MRKT_DIV_CODE": div_code,     # J:주식/ETF/ETN, W:ELW
         "FID_INPUT_ISCD": itm_no                # 종목번호(6자리)
     }
+    return url, tr_id, params
 
-    res = kis._url_fetch(url, tr_id, tr_cont, params)
 
+def _inquire_price_result(res, itm_no: str) -> Optional[StockQuote]:
     if res and res.isOK():
-        body = res.getBody()
-        current_data = pd.DataFrame(getattr(body, 'output', []), index=[0])
-        return current_data
+        return decode_quote(itm_no, getattr(res.getBody(), 'output', None))
     else:
         logger.error("주식현재가 조회 실패")
         return None
 
 
+def get_quote(div_code: str = "J", itm_no: str = "", tr_cont: str = "") -> Optional[StockQuote]:
+    """주식현재가 시세 (StockQuote)"""
+    url, tr_id, params = _inquire_price_request(div_code, itm_no)
+    res = kis._url_fetch(url, tr_id, tr_cont, params)
+    return _inquire_price_result(res, itm_no)
+
+
+async def get_quote_async(div_code: str = "J", itm_no: str = "", tr_cont: str = "") -> Optional[StockQuote]:
+    """주식현재가 시세 (StockQuote, 비동기)"""
+    url, tr_id, params = _inquire_price_request(div_code, itm_no)
+    res = await _url_fetch_async(url, tr_id, tr_cont, params)
+    return _inquire_price_result(res, itm_no)
+
+
+def get_inquire_price(div_code: str = "J", itm_no: str = "", tr_cont: str = "",
+                      FK100: str = "", NK100: str = "") -> Optional[pd.DataFrame]:
+    """주식현재가 시세 (한 행 DataFrame - DataFrame이 필요한 곳만 사용, 그 외는 get_quote)"""
+    quote = get_quote(div_code, itm_no, tr_cont)
+    return quote.to_frame() if quote is not None else None
+
+
+async def get_inquire_price_async(div_code: str = "J", itm_no: str = "", tr_cont: str = "") -> Optional[pd.DataFrame]:
+    """주식현재가 시세 (한 행 DataFrame, 비동기)"""
+    quote = await get_quote_async(div_code, itm_no, tr_cont)
+    return quote.to_frame() if quote is not None else None
+
+
 def get_inquire_ccnl(div_code: str = "J", itm_no: str = "", tr_cont: str = "",
                      FK100: str = "", NK100: str = "") -> Optional[pd.DataFrame]:
     """주식현재가 체결 (최근 30건)"""
@@ -80,9 +107,7 @@ def get_inquire_daily_price(div_code: str = "J", itm_no: str = "", period_code:
         return None
 
 
-def get_inquire_asking_price_exp_ccn(output_dv: str = '1', div_code: str = "J", itm_no: str = "",
-                                      tr_cont: str = "", FK100: str = "", NK100: str = "") -> Optional[pd.DataFrame]:
-    """주식현재가 호가/예상체결"""
+def _asking_price_request(div_code: str, itm_no: str) -> Tuple[str, str, Dict]:
     url = '/uapi/domestic-stock/v1/quotations/inquire-asking-price-exp-ccn'
     tr_id = "FHKST01010200"  # 주식현재가 호가 예상체결
 
@@ -90,7 +115,25 @@ def get_inquire_asking_price_exp_ccn(output_dv: str = '1', div_code: str = "J",
         "FID_COND_MRKT_DIV_CODE": div_code,     # J:주식/ETF/ETN, W:ELW
         "FID_INPUT_ISCD": itm_no                # 종목번호(6자리)
     }
+    return url, tr_id, params
+
+
+def get_orderbook(div_code: str = "J", itm_no: str = "", tr_cont: str = "") -> Optional[OrderBook]:
+    """주식현재가 호가 (OrderBook)"""
+    url, tr_id, params = _asking_price_request(div_code, itm_no)
+    res = kis._url_fetch(url, tr_id, tr_cont, params)
+
+    if res and res.isOK():
+        return decode_orderbook(itm_no, getattr(res.getBody(), 'output1', None))
+    else:
+        logger.error("주식현재가 호가 조회 실패")
+        return None
 
+
+def get_inquire_asking_price_exp_ccn(output_dv: str = '1', div_code: str = "J", itm_no: str = "",
+                                      tr_cont: str = "", FK100: str = "", NK100: str = "") -> Optional[pd.DataFrame]:
+    """주식현재가 호가/예상체결"""
+    url, tr_id, params = _asking_price_request(div_code, itm_no)
     res = kis._url_fetch(url, tr_id, tr_cont, params)
 
     if res and res.isOK():
@@ -105,11 +148,9 @@ def get_inquire_asking_price_exp_ccn(output_dv: str = '1', div_code: str = "J",
         return None
 
 
-def get_inquire_daily_itemchartprice(output_dv: str = "1", div_code: str = "J", itm_no: str = "",
-                                     inqr_strt_dt: Optional[str] = None, inqr_end_dt: Optional[str] = None,
-                                     period_code: str = "D", adj_prc: str = "1", tr_cont: str = "",
-                                     FK100: str = "", NK100: str = "") -> Optional[pd.DataFrame]:
-    """국내주식기간별시세(일/주/월/년)"""
+def _daily_itemchartprice_request(div_code: str, itm_no: str, inqr_strt_dt: Optional[str],
+                                  inqr_end_dt: Optional[str], period_code: str,
+                                  adj_prc: str) -> Tuple[str, str, Dict]:
     url = '/uapi/domestic-stock/v1/quotations/inquire-daily-itemchartprice'
     tr_id = "FHKST03010100"  # 국내주식기간별시세
 
@@ -126,9 +167,10 @@ def get_inquire_daily_itemchartprice(output_dv: str = "1", div_code: str = "J",
         "FID_PERIOD_DIV_CODE": period_code,     # D:일봉, W:주봉, M:월봉, Y:년봉
         "FID_ORG_ADJ_PRC": adj_prc              # 0:수정주가, 1:원주가
     }
+    return url, tr_id, params
 
-    res = kis._url_fetch(url, tr_id, tr_cont, params)
 
+def _daily_itemchartprice_result(res, output_dv: str) -> Optional[pd.DataFrame]:
     if res and res.isOK():
         body = res.getBody()
         if output_dv == "1":
@@ -141,6 +183,56 @@ def get_inquire_daily_itemchartprice(output_dv: str = "1", div_code: str = "J",
         return None
 
 
+def get_inquire_daily_itemchartprice(output_dv: str = "1", div_code: str = "J", itm_no: str = "",
+                                     inqr_strt_dt: Optional[str] = None, inqr_end_dt: Optional[str] = None,
+                                     period_code: str = "D", adj_prc: str = "1", tr_cont: str = "",
+                                     FK100: str = "", NK100: str = "") -> Optional[pd.DataFrame]:
+    """국내주식기간별시세(일/주/월/년)"""
+    url, tr_id, params = _daily_itemchartprice_request(div_code, itm_no, inqr_strt_dt, inqr_end_dt,
+                                                       period_code, adj_prc)
+    res = kis._url_fetch(url, tr_id, tr_cont, params)
+    return _daily_itemchartprice_result(res, output_dv)
+
+
+async def get_inquire_daily_itemchartprice_async(output_dv: str = "1", div_code: str = "J", itm_no: str = "",
+                                                 inqr_strt_dt: Optional[str] = None,
+                                                 inqr_end_dt: Optional[str] = None,
+                                                 period_code: str = "D", adj_prc: str = "1",
+                                                 tr_cont: str = "") -> Optional[pd.DataFrame]:
+    """국내주식기간별시세(일/주/월/년) (비동기)"""
+    url, tr_id, params = _daily_itemchartprice_request(div_code, itm_no, inqr_strt_dt, inqr_end_dt,
+                                                       period_code, adj_prc)
+    res = await _url_fetch_async(url, tr_id, tr_cont, params)
+    return _daily_itemchartprice_result(res, output_dv)
+
+
+def _daily_bars_result(res) -> Optional[List[DailyBar]]:
+    if res and res.isOK():
+        return decode_daily_bars(getattr(res.getBody(), 'output2', None))
+    else:
+        logger.error("국내주식기간별시세 조회 실패")
+        return None
+
+
+def get_daily_bars(itm_no: str, inqr_strt_dt: Optional[str] = None, inqr_end_dt: Optional[str] = None,
+                   period_code: str = "D", adj_prc: str = "1", div_code: str = "J") -> Optional[List[DailyBar]]:
+    """국내주식기간별시세 봉 목록 (DailyBar, 최신일이 앞)"""
+    url, tr_id, params = _daily_itemchartprice_request(div_code, itm_no, inqr_strt_dt, inqr_end_dt,
+                                                       period_code, adj_prc)
+    res = kis._url_fetch(url, tr_id, "", params)
+    return _daily_bars_result(res)
+
+
+async def get_daily_bars_async(itm_no: str, inqr_strt_dt: Optional[str] = None, inqr_end_dt: Optional[str] = None,
+                               period_code: str = "D", adj_prc: str = "1",
+                               div_code: str = "J") -> Optional[List[DailyBar]]:
+    """국내주식기간별시세 봉 목록 (DailyBar, 최신일이 앞, 비동기)"""
+    url, tr_id, params = _daily_itemchartprice_request(div_code, itm_no, inqr_strt_dt, inqr_end_dt,
+                                                       period_code, adj_prc)
+    res = await _url_fetch_async(url, tr_id, "", params)
+    return _daily_bars_result(res)
+
+
 def get_inquire_time_itemconclusion(output_dv: str = "1", div_code: str = "J", itm_no: str = "",
                                      inqr_hour: Optional[str] = None, tr_cont: str = "",
                                      FK100: str = "", NK100: str = "") -> Optional[pd.DataFrame]:
@@ -224,6 +316,34 @@ def get_inquire_time_itemchartprice(output_dv: str = "1", div_code: str = "J", i
         - 미래일시 입력 시에는 현재가로 조회됩니다
         - output2의 첫번째 배열의 체결량은 첫체결 전까지 이전 분봉의 체결량이 표시됩니다
     """
+    try:
+        url, tr_id, params, input_hour = _time_itemchartprice_request(div_code, itm_no, input_hour,
+                                                                      past_data_yn, etc_cls_code)
+        res = kis._url_fetch(url, tr_id, tr_cont, params)
+        return _time_itemchartprice_result(res, output_dv, itm_no, input_hour)
+
+    except Exception as e:
+        logger.error(f"📊 {itm_no} 주식당일분봉조회 오류: {e}")
+        return None
+
+
+async def get_inquire_time_itemchartprice_async(output_dv: str = "1", div_code: str = "J", itm_no: str = "",
+                                                input_hour: Optional[str] = None, past_data_yn: str = "N",
+                                                etc_cls_code: str = "", tr_cont: str = "") -> Optional[pd.DataFrame]:
+    """주식당일분봉조회 API (비동기, 인자/반환값은 get_inquire_time_itemchartprice와 동일)"""
+    try:
+        url, tr_id, params, input_hour = _time_itemchartprice_request(div_code, itm_no, input_hour,
+                                                                      past_data_yn, etc_cls_code)
+        res = await _url_fetch_async(url, tr_id, tr_cont, params)
+        return _time_itemchartprice_result(res, output_dv, itm_no, input_hour)
+
+    except Exception as e:
+        logger.error(f"📊 {itm_no} 주식당일분봉조회 오류: {e}")
+        return None
+
+
+def _time_itemchartprice_request(div_code: str, itm_no: str, input_hour: Optional[str],
+                                 past_data_yn: str, etc_cls_code: str) -> Tuple[str, str, Dict, str]:
     url = '/uapi/domestic-stock/v1/quotations/inquire-time-itemchartprice'
     tr_id = "FHKST03010200"  # 주식당일분봉조회
 
@@ -240,46 +360,42 @@ def get_inquire_time_itemchartprice(output_dv: str = "1", div_code: str = "J", i
         "FID_PW_DATA_INCU_YN": past_data_yn,         # 과거 데이터 포함 여부
         "FID_ETC_CLS_CODE": etc_cls_code             # 기타 구분 코드
     }
+    return url, tr_id, params, input_hour
 
-    try:
-        res = kis._url_fetch(url, tr_id, tr_cont, params)
 
-        if res and res.isOK():
-            body = res.getBody()
+def _time_itemchartprice_result(res, output_dv: str, itm_no: str, input_hour: str) -> Optional[pd.DataFrame]:
+    if res and res.isOK():
+        body = res.getBody()
 
-            if output_dv == "1":
-                # 종목 기본 정보 (output1)
-                output1_data = getattr(body, 'output1', {})
-                if output1_data:
-                    current_data = pd.DataFrame([output1_data])
-                    logger.info(f"📊 {itm_no} 분봉 기본정보 조회 성공")
-                    return current_data
-                else:
-                    logger.warning(f"📊 {itm_no} 분봉 기본정보 없음")
-                    return pd.DataFrame()
+        if output_dv == "1":
+            # 종목 기본 정보 (output1)
+            output1_data = getattr(body, 'output1', {})
+            if output1_data:
+                current_data = pd.DataFrame([output1_data])
+                logger.info(f"📊 {itm_no} 분봉 기본정보 조회 성공")
+                return current_data
             else:
-                # 분봉 데이터 배열 (output2)
-                output2_data = getattr(body, 'output2', [])
-                if output2_data:
-                    current_data = pd.DataFrame(output2_data)
-                    logger.debug(f"📊 {itm_no} 분봉 데이터 조회 성공: {len(current_data)}건 (시간: {input_hour})")
-
-                    # 분봉 데이터 정보 로깅
-                    if len(current_data) > 0:
-                        first_time = current_data.iloc[0].get('stck_cntg_hour', 'N/A')
-                        last_time = current_data.iloc[-1].get('stck_cntg_hour', 'N/A')
-                        logger.debug(f"📊 분봉 시간 범위: {first_time} ~ {last_time}")
-
-                    return current_data
-                else:
-                    logger.warning(f"📊 {itm_no} 분봉 데이터 없음 (시간: {input_hour})")
-                    return pd.DataFrame()
+                logger.warning(f"📊 {itm_no} 분봉 기본정보 없음")
+                return pd.DataFrame()
         else:
-            logger.error(f"📊 {itm_no} 주식당일분봉조회 실패")
-            return None
+            # 분봉 데이터 배열 (output2)
+            output2_data = getattr(body, 'output2', [])
+            if output2_data:
+                current_data = pd.DataFrame(output2_data)
+                logger.debug(f"📊 {itm_no} 분봉 데이터 조회 성공: {len(current_data)}건 (시간: {input_hour})")
 
-    except Exception as e:
-        logger.error(f"📊 {itm_no} 주식당일분봉조회 오류: {e}")
+                # 분봉 데이터 정보 로깅
+                if len(current_data) > 0:
+                    first_time = current_data.iloc[0].get('stck_cntg_hour', 'N/A')
+                    last_time = current_data.iloc[-1].get('stck_cntg_hour', 'N/A')
+                    logger.debug(f"📊 분봉 시간 범위: {first_time} ~ {last_time}")
+
+                return current_data
+            else:
+                logger.warning(f"📊 {itm_no} 분봉 데이터 없음 (시간: {input_hour})")
+                return pd.DataFrame()
+    else:
+        logger.error(f"📊 {itm_no} 주식당일분봉조회 실패")
         return None
 
 def get_volume_rank(fid_cond_mrkt_div_code: str = "J",
@@ -0,0 +1,276 @@
+"""
+KIS REST API 호출 속도 제한 (토큰 버킷 + TR 종류별 예산 + 우선순위 레인)
+
+KIS 제한: 계좌당 초당 20건 (README 참고)
+- 주문/계좌 TR(TTTC*, CTSC* 등)과 시세 TR(FH*)은 서로 다른 버킷을 사용하므로
+  대량 시세 스캔이 진행 중이어도 주문/취소 호출은 시세 대기열 뒤에 줄 서지 않는다.
+- 스캔(LOW 우선순위)은 기본적으로 시세 버킷에서 아무도 예약하지 않은 남는 토큰만 가져가므로
+  (빌려 쓰기) 관찰 종목 재평가(NORMAL) 호출이 항상 먼저 통과하고, 재평가가 없는 동안에는
+  시세 예산 전체를 스캔이 쓴다. 빌려 쓰기를 끄면(KIS_SCAN_BORROW=false) 스캔은 시세 버킷 앞에
+  스캔 전용 버킷(KIS_SCAN_RATE)을 한 번 더 거쳐 고정 상한으로 제한된다.
+- 두 버킷의 (버스트 + 초당 속도) 합은 1초 창 기준 계좌 한도를 넘지 않도록 설정한다.
+  주문 예산을 따로 떼어 두므로 시세·스캔 합계 상한은 시세 예산(KIS_QUOTE_RATE, 기본 초당 13건)이다.
+"""
+import time
+import asyncio
+import threading
+from enum import Enum
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Optional, Any
+from config.settings import KIS_QUOTE_RATE, KIS_SCAN_RATE, KIS_SCAN_BORROW
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# 기본 예산 (1초 창 최대 호출수 = burst + rate, 시세 14 + 주문 4 = 18 < 20)
+DEFAULT_QUOTE_RATE = KIS_QUOTE_RATE     # 시세 TR 초당 호출수 (기본 13)
+DEFAULT_QUOTE_BURST = 1.0
+DEFAULT_ORDER_RATE = 3.0        # 주문/계좌 TR 초당 호출수
+DEFAULT_ORDER_BURST = 1.0
+DEFAULT_SCAN_RATE = KIS_SCAN_RATE       # 빌려 쓰기를 끈 경우 스캔(LOW) 호출의 초당 상한 (기본 10)
+DEFAULT_SCAN_BURST = 1.0
+SCAN_POLL_MIN_SECONDS = 0.01    # 스캔이 남는 시세 토큰을 기다릴 때 최소 재시도 간격
+THROTTLE_PENALTY_SECONDS = 1.0  # EGW00201 발생 시 해당 레인을 비우는 시간 (KIS는 1초 창 기준)
+
+# 주문/계좌 TR ID 접두사 (그 외는 시세 TR로 취급)
+ORDER_TR_PREFIXES = ('TTTC', 'VTTC', 'CTSC', 'CTRP')
+
+
+class RateLimitPriority(Enum):
+    """API 호출 우선순위"""
+    HIGH = "high"       # 주문/취소 (주문 레인 사용)
+    NORMAL = "normal"   # 관찰/보유 종목 시세
+    LOW = "low"         # 전체 시장 스캔
+
+
+# 현재 스레드/태스크의 호출 우선순위 (asyncio.gather로 만든 태스크에도 전파됨)
+_current_priority: ContextVar[RateLimitPriority] = ContextVar('kis_api_priority', default=RateLimitPriority.NORMAL)
+
+
+class TokenBucket:
+    """예약 방식 토큰 버킷 (스레드 안전, 동기/비동기 공용)
+
+    토큰이 부족하면 음수로 차감해 다음 슬롯을 예약하고 대기 시간만 반환하므로,
+    락은 계산하는 동안만 잡고 실제 대기는 락 밖에서 한다.
+    """
+
+    def __init__(self, name: str, rate: float, capacity: float):
+        self.name = name
+        self.rate = rate
+        self.capacity = capacity
+
+        self._tokens = capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+        self.stats = {
+            'acquired': 0,
+            'waited': 0,
+            'total_wait': 0.0,
+            'max_wait': 0.0,
+            'throttle_hits': 0
+        }
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._last_refill
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._last_refill = now
+
+    def try_take(self) -> bool:
+        """지금 남는 토큰이 있으면 1개 가져가고 True (대기 예약 없음)"""
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens < 1.0:
+                return False
+            self._tokens -= 1.0
+            self.stats['acquired'] += 1
+        return True
+
+    def time_until_token(self) -> float:
+        """토큰 1개가 남게 될 때까지의 시간 (초, 예약된 대기 포함)"""
+        with self._lock:
+            self._refill(time.monotonic())
+            return max(0.0, (1.0 - self._tokens) / self.rate)
+
+    def reserve(self) -> float:
+        """토큰 1개 예약 후 대기해야 할 시간(초) 반환"""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= 1.0
+            wait_time = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+            self.stats['acquired'] += 1
+            if wait_time > 0:
+                self.stats['waited'] += 1
+                self.stats['total_wait'] += wait_time
+                self.stats['max_wait'] = max(self.stats['max_wait'], wait_time)
+
+        return wait_time
+
+    def acquire(self) -> float:
+        """토큰 획득 (필요 시 스레드 대기)"""
+        wait_time = self.reserve()
+        if wait_time > 0:
+            time.sleep(wait_time)
+        return wait_time
+
+    async def acquire_async(self) -> float:
+        """토큰 획득 (필요 시 코루틴 대기)"""
+        wait_time = self.reserve()
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
+        return wait_time
+
+    def penalize(self, seconds: float) -> None:
+        """서버 속도 제한 응답 시 버킷을 비워 seconds 동안 추가 호출을 막음"""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self._tokens, 0.0) - seconds * self.rate
+            self.stats['throttle_hits'] += 1
+
+    def configure(self, rate: Optional[float] = None, capacity: Optional[float] = None) -> None:
+        with self._lock:
+            self._refill(time.monotonic())
+            if rate is not None:
+                self.rate = rate
+            if capacity is not None:
+                self.capacity = capacity
+                self._tokens = min(self._tokens, capacity)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            self._refill(time.monotonic())
+            acquired = self.stats['acquired']
+            return {
+                'rate': self.rate,
+                'capacity': self.capacity,
+                'tokens': round(self._tokens, 3),
+                'acquired': acquired,
+                'waited': self.stats['waited'],
+                'avg_wait_ms': round(self.stats['total_wait'] / acquired * 1000, 2) if acquired > 0 else 0.0,
+                'max_wait_ms': round(self.stats['max_wait'] * 1000, 2),
+                'throttle_hits': self.stats['throttle_hits']
+            }
+
+
+class KISRateLimiter:
+    """TR 종류별 예산과 우선순위 레인을 가진 KIS API 속도 제한기"""
+
+    def __init__(self, quote_rate: float = DEFAULT_QUOTE_RATE, quote_burst: float = DEFAULT_QUOTE_BURST,
+                 order_rate: float = DEFAULT_ORDER_RATE, order_burst: float = DEFAULT_ORDER_BURST,
+                 scan_rate: float = DEFAULT_SCAN_RATE, scan_burst: float = DEFAULT_SCAN_BURST,
+                 scan_borrow: bool = KIS_SCAN_BORROW):
+        self.order_bucket = TokenBucket('order', order_rate, order_burst)
+        self.quote_bucket = TokenBucket('quote', quote_rate, quote_burst)
+        self.scan_bucket = TokenBucket('scan', scan_rate, scan_burst)
+        self.scan_borrow = scan_borrow
+        self.scan_borrowed = 0      # 스캔이 가져간 남는 시세 토큰 수
+
+    @staticmethod
+    def is_order_tr(tr_id: str) -> bool:
+        """주문/계좌 TR 여부"""
+        return bool(tr_id) and tr_id.startswith(ORDER_TR_PREFIXES)
+
+    def _lane_buckets(self, tr_id: str, priority: Optional[RateLimitPriority]):
+        """호출이 거쳐야 할 버킷 목록 (앞에서부터 순서대로 획득)"""
+        if self.is_order_tr(tr_id) or priority == RateLimitPriority.HIGH:
+            return (self.order_bucket,)
+
+        if priority is None:
+            priority = _current_priority.get()
+        if priority == RateLimitPriority.LOW:
+            return (self.scan_bucket, self.quote_bucket)
+        return (self.quote_bucket,)
+
+    def _try_scan(self) -> bool:
+        """스캔 레인(빌려 쓰기) 1회 시도 - 시세 버킷에 남는 토큰이 있으면 가져감
+
+        재평가 호출이 예약한 토큰은 음수로 잡혀 있어 가져가지 않으므로 재평가가 항상 먼저 통과한다.
+        """
+        if self.quote_bucket.try_take():
+            self.scan_borrowed += 1
+            return True
+        return False
+
+    def _scan_retry_delay(self) -> float:
+        return max(SCAN_POLL_MIN_SECONDS, self.quote_bucket.time_until_token())
+
+    def acquire(self, tr_id: str, priority: Optional[RateLimitPriority] = None) -> float:
+        """호출 허가 대기 (동기)"""
+        buckets = self._lane_buckets(tr_id, priority)
+        total_wait = 0.0
+        if self.scan_borrow and buckets[0] is self.scan_bucket:
+            while not self._try_scan():
+                delay = self._scan_retry_delay()
+                time.sleep(delay)
+                total_wait += delay
+            return total_wait
+        for bucket in buckets:
+            total_wait += bucket.acquire()
+        return total_wait
+
+    async def acquire_async(self, tr_id: str, priority: Optional[RateLimitPriority] = None) -> float:
+        """호출 허가 대기 (비동기)"""
+        buckets = self._lane_buckets(tr_id, priority)
+        total_wait = 0.0
+        if self.scan_borrow and buckets[0] is self.scan_bucket:
+            while not self._try_scan():
+                delay = self._scan_retry_delay()
+                await asyncio.sleep(delay)
+                total_wait += delay
+            return total_wait
+        for bucket in buckets:
+            total_wait += await bucket.acquire_async()
+        return total_wait
+
+    def on_throttled(self, tr_id: str) -> None:
+        """EGW00201(초당 거래건수 초과) 응답 시 해당 레인 일시 정지"""
+        bucket = self.order_bucket if self.is_order_tr(tr_id) else self.quote_bucket
+        bucket.penalize(THROTTLE_PENALTY_SECONDS)
+        logger.warning(f"⏳ API 속도 제한 응답 ({tr_id}) - {bucket.name} 레인 {THROTTLE_PENALTY_SECONDS}초 정지")
+
+    def configure(self, quote_rate: Optional[float] = None, order_rate: Optional[float] = None,
+                  scan_rate: Optional[float] = None, scan_borrow: Optional[bool] = None) -> None:
+        """레인별 초당 호출수 변경 (scan_borrow: 스캔이 남는 시세 토큰을 빌려 쓸지)"""
+        self.quote_bucket.configure(rate=quote_rate)
+        self.order_bucket.configure(rate=order_rate)
+        self.scan_bucket.configure(rate=scan_rate)
+        if scan_borrow is not None:
+            self.scan_borrow = scan_borrow
+
+        window_max = (self.quote_bucket.rate + self.quote_bucket.capacity +
+                      self.order_bucket.rate + self.order_bucket.capacity)
+        if window_max > 20:
+            logger.warning(f"⚠️ 설정된 1초 창 최대 호출수({window_max:.0f})가 KIS 계좌 한도(20건)를 초과합니다")
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            'order': self.order_bucket.get_stats(),
+            'quote': self.quote_bucket.get_stats(),
+            'scan': {**self.scan_bucket.get_stats(), 'borrowed': self.scan_borrowed, 'borrow': self.scan_borrow}
+        }
+
+
+# 전역 속도 제한기 (kis_auth._url_fetch / kis_async_client._url_fetch_async 공용)
+_rate_limiter = KISRateLimiter()
+
+
+def get_rate_limiter() -> KISRateLimiter:
+    """전역 속도 제한기 반환"""
+    return _rate_limiter
+
+
+@contextmanager
+def api_priority(priority: RateLimitPriority):
+    """블록 안에서 실행되는 API 호출의 우선순위 지정
+
+    예) with api_priority(RateLimitPriority.LOW):
+            await scanner.process_full_screening_batch(...)
+    """
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
@@ -0,0 +1,180 @@
+"""
+KIS API 응답 디코딩 레코드
+
+JSON 응답(dict)을 바로 타입이 정해진 슬롯 객체로 변환
+- 숫자 필드는 디코딩 시 한 번만 float/int 변환 (소비 코드의 iloc[0].get() + 캐스팅 반복 제거)
+- 원본 필드는 raw에 그대로 보관하여 get()/to_dict()로 기존 컬럼명 접근 가능
+- DataFrame은 to_frame()을 호출할 때만 생성
+"""
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import pandas as pd
+
+
+def to_float(value: Any) -> float:
+    """KIS 숫자 문자열 → float (빈 값/오류는 0.0)"""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def to_int(value: Any) -> int:
+    """KIS 숫자 문자열 → int (빈 값/오류는 0)"""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        try:
+            return int(float(value))
+        except (TypeError, ValueError):
+            return 0
+
+
+class ResponseFields:
+    """응답 헤더/바디 필드를 속성으로 접근하는 가벼운 뷰 (응답마다 namedtuple 클래스를 만들지 않음)"""
+
+    __slots__ = ('_fields',)
+
+    def __init__(self, fields: Dict[str, Any]):
+        object.__setattr__(self, '_fields', fields)
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self._fields[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError('ResponseFields는 읽기 전용입니다')
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._fields
+
+    def __repr__(self) -> str:
+        return f"ResponseFields({self._fields!r})"
+
+    def get(self, name: str, default: Any = None) -> Any:
+        return self._fields.get(name, default)
+
+    def keys(self):
+        return self._fields.keys()
+
+    def _asdict(self) -> Dict[str, Any]:
+        """namedtuple 호환"""
+        return dict(self._fields)
+
+
+class StockQuote:
+    """주식 현재가 (inquire-price output / 일괄 시세)"""
+
+    __slots__ = ('stock_code', 'stock_name', 'current_price', 'open_price', 'high_price', 'low_price',
+                 'prev_diff', 'change_rate', 'volume', 'trading_value', 'raw')
+
+    def __init__(self, stock_code: str, raw: Dict[str, Any]):
+        self.stock_code = stock_code
+        self.stock_name = raw.get('hts_kor_isnm') or raw.get('prdt_name') or stock_code
+        self.current_price = to_float(raw.get('stck_prpr'))
+        self.open_price = to_float(raw.get('stck_oprc'))
+        self.high_price = to_float(raw.get('stck_hgpr'))
+        self.low_price = to_float(raw.get('stck_lwpr'))
+        self.prev_diff = to_float(raw.get('prdy_vrss'))
+        self.change_rate = to_float(raw.get('prdy_ctrt'))
+        self.volume = to_int(raw.get('acml_vol'))
+        self.trading_value = to_int(raw.get('acml_tr_pbmn'))
+        self.raw = raw
+
+    def __repr__(self) -> str:
+        return (f"StockQuote({self.stock_code}, 현재가={self.current_price:,.0f}, "
+                f"시가={self.open_price:,.0f}, 거래량={self.volume:,})")
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """원본 컬럼명으로 값 조회 (기존 stock_info dict 소비 코드 호환)"""
+        return self.raw.get(key, default)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(self.raw)
+
+    def to_frame(self) -> pd.DataFrame:
+        """inquire-price 형식 한 행 DataFrame"""
+        return pd.DataFrame(self.raw, index=[0])
+
+
+class OrderBook:
+    """주식 호가 (inquire-asking-price-exp-ccn output1)"""
+
+    __slots__ = ('stock_code', 'asks', 'bids', 'total_ask_volume', 'total_bid_volume', 'raw')
+
+    DEPTH = 10
+
+    def __init__(self, stock_code: str, raw: Dict[str, Any]):
+        self.stock_code = stock_code
+        # (가격, 잔량) 목록 - 1호가부터, 가격이 있는 호가만
+        self.asks: List[Tuple[int, int]] = []
+        self.bids: List[Tuple[int, int]] = []
+        for i in range(1, self.DEPTH + 1):
+            ask_price = to_int(raw.get(f'askp{i}'))
+            if ask_price > 0:
+                self.asks.append((ask_price, to_int(raw.get(f'askp_rsqn{i}'))))
+            bid_price = to_int(raw.get(f'bidp{i}'))
+            if bid_price > 0:
+                self.bids.append((bid_price, to_int(raw.get(f'bidp_rsqn{i}'))))
+        self.total_ask_volume = to_int(raw.get('total_askp_rsqn'))
+        self.total_bid_volume = to_int(raw.get('total_bidp_rsqn'))
+        self.raw = raw
+
+    def __repr__(self) -> str:
+        best_ask = self.asks[0][0] if self.asks else 0
+        best_bid = self.bids[0][0] if self.bids else 0
+        return f"OrderBook({self.stock_code}, 매도1={best_ask:,}, 매수1={best_bid:,})"
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.raw.get(key, default)
+
+    def to_frame(self) -> pd.DataFrame:
+        return pd.DataFrame(self.raw, index=[0])
+
+
+class DailyBar:
+    """일봉 한 개 (inquire-daily-itemchartprice output2 한 행)"""
+
+    __slots__ = ('date', 'open', 'high', 'low', 'close', 'volume', 'trading_value', 'prev_diff', 'prev_sign')
+
+    def __init__(self, row: Dict[str, Any]):
+        self.date = str(row.get('stck_bsop_date') or '').strip()
+        self.open = to_float(row.get('stck_oprc'))
+        self.high = to_float(row.get('stck_hgpr'))
+        self.low = to_float(row.get('stck_lwpr'))
+        self.close = to_float(row.get('stck_clpr'))
+        self.volume = to_int(row.get('acml_vol'))
+        self.trading_value = to_int(row.get('acml_tr_pbmn'))
+        self.prev_diff = to_float(row.get('prdy_vrss'))
+        self.prev_sign = str(row.get('prdy_vrss_sign') or '')
+
+    def __repr__(self) -> str:
+        return f"DailyBar({self.date}, O={self.open:,.0f} H={self.high:,.0f} L={self.low:,.0f} C={self.close:,.0f})"
+
+
+def decode_quote(stock_code: str, output: Optional[Dict[str, Any]]) -> Optional[StockQuote]:
+    """inquire-price output → StockQuote (빈 응답은 None)"""
+    if not output:
+        return None
+    return StockQuote(stock_code, output)
+
+
+def decode_orderbook(stock_code: str, output: Optional[Dict[str, Any]]) -> Optional[OrderBook]:
+    """호가 output1 → OrderBook (빈 응답은 None)"""
+    if not output:
+        return None
+    return OrderBook(stock_code, output)
+
+
+def decode_daily_bars(rows: Optional[Iterable[Dict[str, Any]]]) -> List[DailyBar]:
+    """일봉 output2 → DailyBar 목록 (날짜 없는 빈 행 제외, 응답 순서 유지)"""
+    bars = []
+    for row in rows or ():
+        if row:
+            bar = DailyBar(row)
+            if bar.date:
+                bars.append(bar)
+    return bars
+
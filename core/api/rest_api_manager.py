@@ -254,19 +254,18 @@ class KISRestAPIManager:
 
     def get_current_price(self, stock_code: str) -> Dict:
         """현재가 조회"""
-        result = market_api.get_inquire_price("J", stock_code)
+        quote = market_api.get_quote("J", stock_code)
 
-        if result is not None and not result.empty:
-            data = result.iloc[0].to_dict()
+        if quote is not None:
             return {
                 "status": "success",
                 "stock_code": stock_code,
-                "current_price": int(data.get('stck_prpr', 0)),
-                "change_rate": float(data.get('prdy_ctrt', 0)),
-                "volume": int(data.get('acml_vol', 0)),
-                "high_price": int(data.get('stck_hgpr', 0)),
-                "low_price": int(data.get('stck_lwpr', 0)),
-                "open_price": int(data.get('stck_oprc', 0))
+                "current_price": int(quote.current_price),
+                "change_rate": quote.change_rate,
+                "volume": quote.volume,
+                "high_price": int(quote.high_price),
+                "low_price": int(quote.low_price),
+                "open_price": int(quote.open_price)
             }
         else:
             return {
@@ -276,33 +275,19 @@ class KISRestAPIManager:
 
     def get_orderbook(self, stock_code: str) -> Dict:
         """호가 조회"""
-        result = market_api.get_inquire_asking_price_exp_ccn("1", "J", stock_code)
-
-        if result is not None and not result.empty:
-            data = result.iloc[0].to_dict()
-
-            # 호가 데이터 파싱
-            asks = []  # 매도호가
-            bids = []  # 매수호가
+        orderbook = market_api.get_orderbook("J", stock_code)
 
-            for i in range(1, 11):  # 1~10호가
-                ask_price = int(data.get(f'askp{i}', 0))
-                ask_volume = int(data.get(f'askp_rsqn{i}', 0))
-                bid_price = int(data.get(f'bidp{i}', 0))
-                bid_volume = int(data.get(f'bidp_rsqn{i}', 0))
-
-                if ask_price > 0:
-                    asks.append({"price": ask_price, "volume": ask_volume})
-                if bid_price > 0:
-                    bids.append({"price": bid_price, "volume": bid_volume})
+        if orderbook is not None:
+            asks = [{"price": price, "volume": volume} for price, volume in orderbook.asks]  # 매도호가
+            bids = [{"price": price, "volume": volume} for price, volume in orderbook.bids]  # 매수호가
 
             return {
                 "status": "success",
                 "stock_code": stock_code,
                 "asks": asks,
                 "bids": bids,
-                "total_ask_volume": int(data.get('total_askp_rsqn', 0)),
-                "total_bid_volume": int(data.get('total_bidp_rsqn', 0))
+                "total_ask_volume": orderbook.total_ask_volume,
+                "total_bid_volume": orderbook.total_bid_volume
             }
         else:
             return {
@@ -353,10 +338,11 @@ class KISRestAPIManager:
 
     @staticmethod
     def get_api_stats() -> Dict:
-        """API 호출 통계 (간소화)"""
+        """API 호출 통계 (HTTP 연결 풀 재사용/핸드셰이크 포함)"""
         return {
-            "message": "API 통계는 kis_auth 모듈에서 확인하세요",
-            "status": "info"
+            "status": "success",
+            "rate_limit": kis.get_api_rate_limit_info(),
+            "http_pool": kis.get_http_pool_stats()
         }
 
     # === 기존 호환성 메서드들 ===
@@ -0,0 +1,29 @@
+"""
+백테스트 모듈
+로컬 일봉 저장소 기반 캔들 전략 이벤트 재생 / 설정 파라미터 탐색
+"""
+
+from .candle_backtester import (
+    BacktestSettings, BacktestTrade, BacktestResult, CandleBacktester,
+    CandleStrategySimulator, SimulatedClock, load_strategy_config
+)
+from .price_archive import PriceArchive
+from .parameter_sweep import (
+    SweepParameter, BayesianSampler, SweepResultStore, ParameterSweep, apply_parameters
+)
+
+__all__ = [
+    'BacktestSettings',
+    'BacktestTrade',
+    'BacktestResult',
+    'CandleBacktester',
+    'CandleStrategySimulator',
+    'SimulatedClock',
+    'load_strategy_config',
+    'PriceArchive',
+    'SweepParameter',
+    'BayesianSampler',
+    'SweepResultStore',
+    'ParameterSweep',
+    'apply_parameters'
+]
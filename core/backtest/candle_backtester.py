@@ -0,0 +1,581 @@
+#!/usr/bin/env python3
+"""
+캔들 전략 이벤트 기반 백테스터
+
+실제 전략 클래스를 그대로 사용해 로컬 일봉 저장소의 과거 데이터를 재생한다.
+- 스캔: 전일 종가 기준 패턴(BatchCandlePatternEngine) → MarketScanner의 거래량/가격위치/패턴점수 필터,
+  매매 신호, 진입 우선순위, 리스크 설정 (MarketScanner 배치 스캔 경로와 같은 순서)
+- 매수: 당일 시가 시점에 CandleAnalyzer.quick_buy_decision 호출, 'buy'이면 시가에 체결
+- 매도: CandleTradeManager._check_simple_sell_conditions를 시가 → (손절가/목표가 도달 시) 장중 → 종가 순서로 평가
+- 체결가: 슬리피지 적용 후 TradeExecutor와 같은 호가 단위 조정, 수수료/거래세 차감
+
+속도를 위해
+- 종목별 모든 거래일의 일봉 창(최신일이 0번 열)을 슬라이딩 윈도우로 만들어 패턴을 한 번에 일괄 감지하고
+- 종목 묶음을 프로세스 풀로 나눠 병렬 재생한다 (종목 간 상태를 공유하지 않음).
+
+전략 코드가 datetime.now()로 장 시간대/보유 시간을 판단하므로 재생 중에는 SimulatedClock이
+전략 모듈의 datetime을 시뮬레이션 시각을 돌려주는 클래스로 바꿔 둔다.
+포트폴리오 제약(최대 보유 종목 수, 예수금)은 적용하지 않고 종목마다 고정 금액으로 진입한다.
+"""
+import asyncio
+import datetime as _datetime_module
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, asdict
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+from utils.logger import setup_logger
+from ..api.kis_records import StockQuote
+from ..data.ohlcv_store import DEFAULT_WINDOW_DAYS
+from ..strategy.candle_trade_candidate import CandleTradeCandidate, CandlePatternInfo, TradeSignal, CandleStatus
+from ..strategy.candle_pattern_detector import CandlePatternDetector
+from ..strategy.candle_pattern_batch import BatchPatternInput, BatchCandlePatternEngine
+from ..strategy.candle_analyzer import CandleAnalyzer
+from ..strategy.candle_trade_manager import CandleTradeManager
+from ..strategy.market_scanner import MarketScanner
+from ..trading.trade_executor import adjust_to_tick_size
+
+logger = setup_logger(__name__)
+
+CONFIG_PATH = Path(__file__).parent.parent.parent / "config" / "candle_strategy_config.json"
+KOREA_TZ = timezone(timedelta(hours=9))
+
+MIN_SCAN_BARS = 10              # MarketScanner: 일봉 10개 미만 종목 제외
+MIN_PATTERN_SCORE = 0.3         # MarketScanner: 최소 패턴 점수
+ENTRY_TIME = "09:05"            # 매수 판단 시각 (시가 근처)
+OPEN_TIME = "09:00"
+INTRADAY_TIME = "12:00"         # 장중 손절가/목표가 도달 평가 시각
+CLOSE_TIME = "15:20"            # 종가 평가 시각 (trading_end_time)
+BUY_SIGNALS = (TradeSignal.BUY, TradeSignal.STRONG_BUY)
+EXIT_SIGNALS = (TradeSignal.SELL, TradeSignal.STRONG_SELL)
+
+# 스캔 창 DataFrame 컬럼 (스캐너 필터가 읽는 KIS output2 컬럼)
+_KIS_COLUMNS = ('stck_bsop_date', 'stck_oprc', 'stck_hgpr', 'stck_lwpr', 'stck_clpr', 'acml_vol', 'acml_tr_pbmn')
+
+
+def load_strategy_config(path: Path = CONFIG_PATH) -> Dict:
+    """캔들 전략 설정 파일 로드 (CandleTradeManager._load_trading_config와 같은 파일)"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception as e:
+        logger.warning(f"⚠️ 전략 설정 파일 로드 실패: {e} - 기본 설정 사용")
+        return {}
+
+
+# ========== 시뮬레이션 시계 ==========
+
+class _ClockMeta(type):
+    """교체된 datetime 클래스로도 실제 datetime 객체의 isinstance 검사가 통과하도록"""
+
+    def __instancecheck__(cls, instance) -> bool:
+        return isinstance(instance, datetime)
+
+
+class _SimulatedDatetime(datetime, metaclass=_ClockMeta):
+    """now()만 시뮬레이션 시각(KST)을 돌려주는 datetime"""
+
+    current: Optional[datetime] = None
+
+    @classmethod
+    def now(cls, tz=None):
+        current = cls.current
+        if current is None:
+            return datetime.now(tz)
+        if tz is None:
+            return current.replace(tzinfo=None)
+        return current.astimezone(tz)
+
+
+class SimulatedClock:
+    """전략 모듈(core.strategy.*)의 datetime.now()를 시뮬레이션 시각으로 대체하는 컨텍스트
+
+    함수 안에서 `from datetime import datetime`을 다시 import하는 코드도 있어 datetime 모듈 속성까지 바꾼다.
+    프로세스 전체에 영향을 주므로 백테스트 전용 프로세스나 재생 구간에서만 사용한다.
+    """
+
+    def __init__(self):
+        self._saved: List[Tuple[Any, str, Any]] = []
+
+    def set(self, day: str, hhmm: str) -> datetime:
+        """시뮬레이션 시각 설정 (YYYYMMDD, HH:MM)"""
+        moment = datetime.strptime(f"{day}{hhmm}", "%Y%m%d%H:%M").replace(tzinfo=KOREA_TZ)
+        _SimulatedDatetime.current = moment
+        return moment
+
+    def install(self) -> None:
+        if self._saved:
+            return
+        targets = [(_datetime_module, 'datetime')]
+        targets.extend((module, 'datetime') for name, module in list(sys.modules.items())
+                       if name.startswith('core.strategy.') and getattr(module, 'datetime', None) is datetime)
+        for module, attr in targets:
+            self._saved.append((module, attr, getattr(module, attr)))
+            setattr(module, attr, _SimulatedDatetime)
+
+    def uninstall(self) -> None:
+        for module, attr, original in reversed(self._saved):
+            setattr(module, attr, original)
+        self._saved = []
+        _SimulatedDatetime.current = None
+
+    def __enter__(self) -> "SimulatedClock":
+        self.install()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.uninstall()
+
+
+# ========== 설정 / 결과 ==========
+
+@dataclass
+class BacktestSettings:
+    """백테스트 설정 (프로세스 풀 워커로 그대로 전달되므로 pickle 가능한 값만)"""
+    config: Dict[str, Any] = field(default_factory=load_strategy_config)
+    start_date: Optional[str] = None            # 이 날짜(YYYYMMDD)부터 진입 (이전 봉은 스캔 창으로만 사용)
+    window_days: int = DEFAULT_WINDOW_DAYS      # 스캔 시 일봉 조회 봉 수 (get_or_sync_daily_bars 기본값)
+    investment_amount: int = 500_000            # 종목당 투자금 (TradeExecutor 기본 투자금)
+    commission_rate: float = 0.00015            # 매수/매도 수수료율
+    sell_tax_rate: float = 0.0018               # 매도 거래세율 (농특세 포함, 시기에 맞게 조정)
+    slippage: float = 0.001                     # 체결 슬리피지 (매수는 +, 매도는 -)
+    min_pattern_score: float = MIN_PATTERN_SCORE
+    pattern_thresholds: Dict[str, float] = field(default_factory=dict)   # CandlePatternDetector.thresholds 덮어쓰기
+    entry_time: str = ENTRY_TIME
+    seed: int = 0                               # 진입 우선순위의 시장상황 보정(random) 재현용
+
+
+@dataclass
+class BacktestTrade:
+    """체결 완료된 가상 거래 1건"""
+    stock_code: str
+    pattern: str
+    signal_date: str
+    entry_date: str
+    entry_price: int
+    quantity: int
+    exit_date: str
+    exit_price: int
+    exit_reason: str
+    buy_score: int
+    gross_pnl: int
+    fees: int
+    net_pnl: int
+    return_pct: float
+    holding_days: int
+
+
+@dataclass
+class BacktestResult:
+    """백테스트 결과 (거래 목록 + 재생 통계)"""
+    trades: List[BacktestTrade]
+    stats: Dict[str, Any]
+
+    def to_frame(self) -> pd.DataFrame:
+        return pd.DataFrame([asdict(trade) for trade in self.trades])
+
+    def summary(self) -> Dict[str, Any]:
+        """거래 수, 승률, 손익, 최대 낙폭(청산일 기준 누적 손익), 패턴별 성과"""
+        trades = self.trades
+        result = {**self.stats, 'trades': len(trades)}
+        if not trades:
+            return result
+
+        net = np.array([trade.net_pnl for trade in trades], dtype=np.float64)
+        order = np.argsort([trade.exit_date for trade in trades], kind='stable')
+        equity = np.cumsum(net[order])
+        drawdown = np.maximum.accumulate(np.maximum(equity, 0)) - equity
+
+        by_pattern: Dict[str, Dict[str, Any]] = {}
+        for trade in trades:
+            entry = by_pattern.setdefault(trade.pattern, {'trades': 0, 'wins': 0, 'net_pnl': 0})
+            entry['trades'] += 1
+            entry['wins'] += trade.net_pnl > 0
+            entry['net_pnl'] += trade.net_pnl
+
+        result.update({
+            'wins': int((net > 0).sum()),
+            'win_rate': float((net > 0).mean() * 100),
+            'net_pnl': int(net.sum()),
+            'gross_pnl': int(sum(trade.gross_pnl for trade in trades)),
+            'fees': int(sum(trade.fees for trade in trades)),
+            'avg_return_pct': float(np.mean([trade.return_pct for trade in trades])),
+            'max_drawdown': int(drawdown.max()),
+            'avg_holding_days': float(np.mean([trade.holding_days for trade in trades])),
+            'by_pattern': by_pattern,
+        })
+        return result
+
+
+# ========== 전략 재생 ==========
+
+class _BacktestStrategyHost:
+    """MarketScanner / 매도 조건 판단이 참조하는 CandleTradeManager 속성만 갖춘 대역
+
+    CandleTradeManager.__init__은 API/웹소켓/DB에 연결하므로 생성하지 않고,
+    매도 조건 메서드는 CandleTradeManager의 것을 그대로 빌려 쓴다.
+    """
+
+    _check_simple_sell_conditions = CandleTradeManager._check_simple_sell_conditions
+
+    def __init__(self, config: Dict, pattern_detector: CandlePatternDetector):
+        self.config = config
+        self.korea_tz = KOREA_TZ
+        self.pattern_detector = pattern_detector
+        self.candle_analyzer = CandleAnalyzer(pattern_detector, config, KOREA_TZ)
+        self.stock_manager = None
+        self.trade_db = None
+        self.websocket_manager = None
+        self.subscribed_stocks = set()
+        self.pattern_manager = None
+
+
+class CandleStrategySimulator:
+    """종목 단위 일봉 재생기 (프로세스마다 1개)"""
+
+    def __init__(self, settings: BacktestSettings):
+        self.settings = settings
+        self.detector = CandlePatternDetector(settings.config)
+        self.detector.thresholds.update(settings.pattern_thresholds)
+        self.engine = BatchCandlePatternEngine(self.detector)
+        self.host = _BacktestStrategyHost(settings.config, self.detector)
+        self.analyzer = self.host.candle_analyzer
+        self.scanner = MarketScanner(self.host)
+        self.clock = SimulatedClock()
+        self._loop = asyncio.new_event_loop()
+
+        self.stats = {
+            'symbols': 0,
+            'bars': 0,
+            'pattern_days': 0,
+            'candidates': 0,
+            'buy_decisions': 0,
+        }
+
+    # ---------- 일괄 패턴 감지 ----------
+
+    def precompute_patterns(self, histories: Dict[str, Dict[str, np.ndarray]]) -> Dict[str, Dict[int, List[CandlePatternInfo]]]:
+        """종목별 {거래일 인덱스: 그날 종가 기준 최종 패턴} - 모든 (종목, 거래일) 창을 한 번에 감지"""
+        width = self.settings.window_days
+        owners: List[Tuple[str, int]] = []
+        blocks: Dict[str, List[np.ndarray]] = {name: [] for name in ('open', 'high', 'low', 'close')}
+        lengths = []
+
+        for code, bars in histories.items():
+            count = len(bars['close'])
+            days = np.arange(count)
+            usable = days[np.minimum(days + 1, width) >= MIN_SCAN_BARS]
+            if len(usable) == 0:
+                continue
+            for name in blocks:
+                padded = np.concatenate([np.full(width - 1, np.nan), bars[name].astype(np.float64)])
+                windows = sliding_window_view(padded, width)[usable, ::-1]   # 최신일이 0번 열, 뒤쪽 NaN
+                blocks[name].append(windows)
+            lengths.append(np.minimum(usable + 1, width))
+            owners.extend((code, int(day)) for day in usable)
+
+        patterns: Dict[str, Dict[int, List[CandlePatternInfo]]] = {code: {} for code in histories}
+        if not owners:
+            return patterns
+
+        data = BatchPatternInput([str(row) for row in range(len(owners))], np.concatenate(lengths),
+                                 *(np.ascontiguousarray(np.concatenate(blocks[name]))
+                                   for name in ('open', 'high', 'low', 'close')))
+        for row, found in self.engine.analyze(data).items():
+            if found:
+                code, day = owners[int(row)]
+                patterns[code][day] = found
+        return patterns
+
+    # ---------- 종목 재생 ----------
+
+    def simulate(self, code: str, bars: Dict[str, np.ndarray],
+                 patterns: Dict[int, List[CandlePatternInfo]]) -> List[BacktestTrade]:
+        """한 종목의 전체 기간 재생 (전일 패턴 → 당일 시가 매수 판단 → 보유 중 매도 조건 평가)"""
+        random.seed(f"{self.settings.seed}:{code}")
+        dates = bars['date']
+        trades: List[BacktestTrade] = []
+        position: Optional[CandleTradeCandidate] = None
+        entry_day = 0
+
+        self.stats['symbols'] += 1
+        self.stats['bars'] += len(dates)
+        self.stats['pattern_days'] += len(patterns)
+
+        trade_from = self.settings.start_date or ''
+        for day in range(len(dates)):
+            entered_today = False
+            if position is None and (day - 1) in patterns and dates[day] >= trade_from:
+                candidate = self._scan_candidate(code, bars, day - 1, patterns[day - 1])
+                if candidate is not None:
+                    position = self._try_entry(candidate, bars, day)
+                    entered_today = position is not None
+                    entry_day = day
+
+            if position is not None:
+                trade = self._check_exit(position, bars, day, entered_today, entry_day)
+                if trade is not None:
+                    trades.append(trade)
+                    position = None
+
+        if position is not None:
+            # 데이터 끝까지 보유 중이면 마지막 종가로 청산
+            last = len(dates) - 1
+            trades.append(self._close_trade(position, bars, entry_day, last, bars['close'][last], '백테스트 종료'))
+        return trades
+
+    def _window_frame(self, bars: Dict[str, np.ndarray], day: int) -> pd.DataFrame:
+        """day 종가 기준 일봉 창 (OHLCVStore.get_daily_bars와 같은 KIS output2 형식, 최신일이 0번 행)"""
+        start = max(0, day + 1 - self.settings.window_days)
+        window = slice(day, start - 1 if start > 0 else None, -1)
+        return pd.DataFrame({
+            'stck_bsop_date': bars['date'][window],
+            'stck_oprc': bars['open'][window],
+            'stck_hgpr': bars['high'][window],
+            'stck_lwpr': bars['low'][window],
+            'stck_clpr': bars['close'][window],
+            'acml_vol': bars['volume'][window],
+            'acml_tr_pbmn': bars['trading_value'][window],
+        }, columns=list(_KIS_COLUMNS))
+
+    def _scan_candidate(self, code: str, bars: Dict[str, np.ndarray], day: int,
+                        patterns: List[CandlePatternInfo]) -> Optional[CandleTradeCandidate]:
+        """장 시작 전 스캔 - MarketScanner 배치 스캔 경로의 필터와 후보 생성 순서"""
+        self.clock.set(bars['date'][day], "08:30")
+        trade_signal, signal_strength = self.scanner._generate_trade_signal(patterns)
+        if trade_signal not in BUY_SIGNALS:
+            return None   # 매수 신호가 아니면 quick_buy_decision까지 가지 않으므로 무거운 필터 생략
+
+        ohlcv_data = self._window_frame(bars, day)
+        current_price = float(bars['close'][day])
+        if not self.scanner._check_recent_volume_filter(ohlcv_data):
+            return None
+        position_check = self.scanner.price_position_filter.check_price_position_safety(
+            code, current_price, ohlcv_data, {'rsi_value': None}
+        )
+        if not position_check['is_safe']:
+            return None
+        if self.scanner._calculate_enhanced_pattern_score(patterns, ohlcv_data) < self.settings.min_pattern_score:
+            return None
+
+        candidate = CandleTradeCandidate(stock_code=code, stock_name=code,
+                                         current_price=current_price, market_type="KOSPI")
+        for pattern in patterns:
+            candidate.add_pattern(pattern)
+        # 일봉 캐시는 두지 않음: 매도 시 _get_pattern_based_target이 같은 창을 재분석하는 대신
+        # 같은 결과인 detected_patterns의 최강 패턴을 사용
+        candidate.trade_signal = trade_signal
+        candidate.signal_strength = signal_strength
+        candidate.signal_updated_at = datetime.now()
+        candidate.entry_priority = self.analyzer.calculate_entry_priority(candidate)
+        candidate.risk_management = self.scanner._calculate_risk_management(candidate)
+        candidate.status = CandleStatus.WATCHING
+        candidate.metadata['signal_date'] = bars['date'][day]
+        self.stats['candidates'] += 1
+        return candidate
+
+    def _try_entry(self, candidate: CandleTradeCandidate, bars: Dict[str, np.ndarray],
+                   day: int) -> Optional[CandleTradeCandidate]:
+        """당일 시가 시점 quick_buy_decision → 'buy'이면 시가(슬리피지, 호가 단위 적용)에 체결"""
+        open_price = float(bars['open'][day])
+        if open_price <= 0:
+            return None
+
+        self.clock.set(bars['date'][day], self.settings.entry_time)
+        # 시가 직후의 누적 거래량은 일봉에 없으므로 전일 거래량으로 대신함
+        current_data = StockQuote(candidate.stock_code, {
+            'stck_prpr': open_price,
+            'stck_oprc': open_price,
+            'acml_vol': int(bars['volume'][day - 1]) if day > 0 else 0,
+        })
+        decision = self._loop.run_until_complete(self.analyzer.quick_buy_decision(candidate, current_data))
+        if not decision or decision.get('buy_decision') != 'buy':
+            return None
+
+        fill_price = adjust_to_tick_size(int(open_price * (1 + self.settings.slippage)))
+        quantity = self.settings.investment_amount // fill_price if fill_price > 0 else 0
+        if quantity <= 0:
+            return None
+
+        candidate.enter_position(float(fill_price), quantity)
+        candidate.metadata['buy_score'] = decision.get('buy_score', 0)
+        self.stats['buy_decisions'] += 1
+        return candidate
+
+    def _check_exit(self, position: CandleTradeCandidate, bars: Dict[str, np.ndarray], day: int,
+                    entered_today: bool, entry_day: int) -> Optional[BacktestTrade]:
+        """보유 종목 매도 조건 평가 - 시가, 손절가/목표가 도달 시점, 종가 순서
+
+        장중 시점에서는 목표/손절(STRONG_SELL)만 인정하고 해당 기준가에 체결한 것으로 본다.
+        같은 봉에서 손절가와 목표가가 모두 닿으면 손절을 먼저 평가한다 (보수적).
+        """
+        target_pct, stop_pct, _, _ = self.analyzer._get_pattern_based_target(position)
+        entry_price = position.performance.entry_price
+        stop_price = entry_price * (1 - stop_pct / 100)
+        target_price = entry_price * (1 + target_pct / 100)
+        date = bars['date'][day]
+
+        checkpoints = []
+        if not entered_today:
+            checkpoints.append((OPEN_TIME, float(bars['open'][day]), None))
+        if bars['low'][day] <= stop_price:
+            checkpoints.append((INTRADAY_TIME, float(bars['low'][day]), stop_price))
+        if bars['high'][day] >= target_price:
+            checkpoints.append((INTRADAY_TIME, float(bars['high'][day]), target_price))
+        checkpoints.append((CLOSE_TIME, float(bars['close'][day]), None))
+
+        for hhmm, price, fill_at in checkpoints:
+            self.clock.set(date, hhmm)
+            should_sell, reason, signal = self.host._check_simple_sell_conditions(position, price)
+            if not should_sell or signal not in EXIT_SIGNALS:
+                continue
+            if fill_at is not None:
+                if signal != TradeSignal.STRONG_SELL:
+                    continue
+                price = fill_at
+            return self._close_trade(position, bars, entry_day, day, price, reason)
+        return None
+
+    def _close_trade(self, position: CandleTradeCandidate, bars: Dict[str, np.ndarray],
+                     entry_day: int, exit_day: int, price: float, reason: str) -> BacktestTrade:
+        settings = self.settings
+        exit_price = adjust_to_tick_size(int(price * (1 - settings.slippage)))
+        entry_price = int(position.performance.entry_price)
+        quantity = int(position.performance.entry_quantity)
+        position.exit_position(float(exit_price), reason)
+
+        buy_amount = entry_price * quantity
+        sell_amount = exit_price * quantity
+        fees = int(buy_amount * settings.commission_rate
+                   + sell_amount * (settings.commission_rate + settings.sell_tax_rate))
+        gross = sell_amount - buy_amount
+        net = gross - fees
+        return BacktestTrade(
+            stock_code=position.stock_code,
+            pattern=position.primary_pattern.pattern_type.value if position.primary_pattern else '',
+            signal_date=position.metadata.get('signal_date', ''),
+            entry_date=bars['date'][entry_day],
+            entry_price=entry_price,
+            quantity=quantity,
+            exit_date=bars['date'][exit_day],
+            exit_price=exit_price,
+            exit_reason=reason,
+            buy_score=int(position.metadata.get('buy_score', 0)),
+            gross_pnl=int(gross),
+            fees=fees,
+            net_pnl=int(net),
+            return_pct=net / buy_amount * 100 if buy_amount else 0.0,
+            holding_days=exit_day - entry_day,
+        )
+
+    def run_chunk(self, histories: Dict[str, Dict[str, np.ndarray]]) -> List[BacktestTrade]:
+        """종목 묶음 재생 (일괄 패턴 감지 후 종목별 재생)"""
+        # 공유 메모리 배열(memmap)로 받은 경우 날짜만 문자열로 바꾸고 가격 배열은 그대로 참조
+        histories = {code: bars if bars['date'].dtype == object else {**bars, 'date': bars['date'].astype(str).astype(object)}
+                     for code, bars in histories.items()}
+        patterns = self.precompute_patterns(histories)
+        trades = []
+        for code, bars in histories.items():
+            try:
+                trades.extend(self.simulate(code, bars, patterns.get(code, {})))
+            except Exception as e:
+                logger.error(f"❌ {code} 백테스트 재생 오류: {e}")
+        return trades
+
+
+# ========== 프로세스 풀 워커 ==========
+
+_worker_simulator: Optional[CandleStrategySimulator] = None
+
+
+def _init_worker(settings: BacktestSettings, log_level: str) -> None:
+    """워커 프로세스 초기화 - 전략 객체 1회 생성, 시계 교체 (백테스트 전용 프로세스이므로 복원하지 않음)"""
+    global _worker_simulator
+    from loguru import logger as _loguru
+    _loguru.remove()
+    _loguru.add(sys.stderr, level=log_level)
+
+    _worker_simulator = CandleStrategySimulator(settings)
+    _worker_simulator.clock.install()
+
+
+def _run_worker_chunk(histories: Dict[str, Dict[str, np.ndarray]]) -> Tuple[List[BacktestTrade], Dict[str, int]]:
+    before = dict(_worker_simulator.stats)
+    trades = _worker_simulator.run_chunk(histories)
+    stats = {key: value - before[key] for key, value in _worker_simulator.stats.items()}
+    return trades, stats
+
+
+class CandleBacktester:
+    """종목 묶음을 프로세스 풀로 나눠 재생하는 백테스트 실행기"""
+
+    def __init__(self, settings: Optional[BacktestSettings] = None, workers: Optional[int] = None,
+                 chunk_size: int = 20, log_level: str = 'WARNING'):
+        self.settings = settings or BacktestSettings()
+        self.workers = workers or max(1, (os.cpu_count() or 2) - 1)
+        self.chunk_size = chunk_size
+        self.log_level = log_level
+
+    def run(self, histories: Dict[str, Dict[str, np.ndarray]]) -> BacktestResult:
+        """종목별 일봉 이력(get_daily_history 형식) 재생"""
+        start = time.perf_counter()
+        codes = list(histories)
+        chunks = [{code: histories[code] for code in codes[i:i + self.chunk_size]}
+                  for i in range(0, len(codes), self.chunk_size)]
+
+        trades: List[BacktestTrade] = []
+        stats = {'symbols': 0, 'bars': 0, 'pattern_days': 0, 'candidates': 0, 'buy_decisions': 0}
+
+        if self.workers <= 1 or len(chunks) <= 1:
+            simulator = CandleStrategySimulator(self.settings)
+            with simulator.clock:
+                for chunk in chunks:
+                    trades.extend(simulator.run_chunk(chunk))
+            stats.update(simulator.stats)
+        else:
+            logger.info(f"🧪 백테스트 시작: {len(codes)}개 종목, {len(chunks)}개 묶음, 워커 {self.workers}개")
+            with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                     initargs=(self.settings, self.log_level)) as executor:
+                for chunk_trades, chunk_stats in executor.map(_run_worker_chunk, chunks):
+                    trades.extend(chunk_trades)
+                    for key, value in chunk_stats.items():
+                        stats[key] += value
+
+        trades.sort(key=lambda trade: (trade.entry_date, trade.stock_code))
+        stats['elapsed_seconds'] = time.perf_counter() - start
+        stats['workers'] = 1 if self.workers <= 1 or len(chunks) <= 1 else self.workers
+        logger.info(f"🧪 백테스트 완료: {stats['symbols']}개 종목, {stats['bars']:,}봉, "
+                    f"거래 {len(trades)}건 ({stats['elapsed_seconds']:.1f}초)")
+        return BacktestResult(trades, stats)
+
+    def run_store(self, stock_codes: List[str], start_date: Optional[str] = None,
+                  end_date: Optional[str] = None, store=None) -> BacktestResult:
+        """로컬 일봉 저장소 기간 데이터로 재생 (시작일 이전 window_days 봉은 스캔 창으로만 사용)"""
+        from ..data.ohlcv_store import get_ohlcv_store
+        store = store or get_ohlcv_store()
+        histories = store.get_daily_history(stock_codes, end_date=end_date)
+        if start_date:
+            self.settings.start_date = start_date
+            histories = self._trim_warmup(histories, start_date)
+        return self.run(histories)
+
+    def _trim_warmup(self, histories: Dict[str, Dict[str, np.ndarray]], start_date: str) -> Dict[str, Dict[str, np.ndarray]]:
+        """시작일 이전 봉은 스캔 창에 필요한 만큼만 남김"""
+        trimmed = {}
+        for code, bars in histories.items():
+            first = int(np.searchsorted(bars['date'].astype(str), start_date))
+            begin = max(0, first - self.settings.window_days)
+            if first >= len(bars['date']):
+                continue
+            trimmed[code] = {name: values[begin:] for name, values in bars.items()}
+        return trimmed
@@ -0,0 +1,501 @@
+#!/usr/bin/env python3
+"""
+캔들 전략 설정 파라미터 탐색 (그리드 / 랜덤 / 베이지안)
+
+- 파라미터는 점(.) 경로로 지정
+    thresholds.<키>        → CandlePatternDetector.thresholds (예: thresholds.hammer_lower_shadow_min)
+    <BacktestSettings 필드> → 백테스트 설정 (예: min_pattern_score, slippage)
+    그 외                  → candle_strategy_config.json 경로 (예: pattern_targets.hammer.target)
+- 일봉은 PriceArchive(memmap .npy)로 한 번만 저장하고 워커는 파일을 열어 공유하므로
+  (설정 변형 × 종목 묶음) 작업마다 가격 배열을 복사해 보내지 않는다
+- 결과는 data/backtest_sweeps.db 의 sweep_trials 테이블에 저장, sweep_trial_ranks 뷰로 손익/낙폭/승률 순위 조회
+"""
+import copy
+import json
+import math
+import sqlite3
+import sys
+import threading
+import time
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, fields, replace
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from utils.logger import setup_logger
+from .candle_backtester import (
+    BacktestSettings, BacktestResult, BacktestTrade, CandleStrategySimulator, SimulatedClock
+)
+from .price_archive import PriceArchive
+
+logger = setup_logger(__name__)
+
+SWEEP_DB_PATH = Path(__file__).parent.parent.parent / "data" / "backtest_sweeps.db"
+
+OBJECTIVES = ('net_pnl', 'win_rate', 'pnl_to_drawdown')
+_SETTINGS_FIELDS = {f.name for f in fields(BacktestSettings)} - {'config', 'pattern_thresholds'}
+_STAT_KEYS = ('symbols', 'bars', 'pattern_days', 'candidates', 'buy_decisions')
+
+
+# ========== 탐색 공간 ==========
+
+@dataclass
+class SweepParameter:
+    """탐색 파라미터 1개 (choices 또는 low~high 범위)"""
+    name: str
+    choices: Optional[List[Any]] = None
+    low: Optional[float] = None
+    high: Optional[float] = None
+    integer: bool = False
+
+    @classmethod
+    def parse(cls, spec: str) -> "SweepParameter":
+        """'이름=0.35:0.6' (범위) 또는 '이름=1.5,2.0,2.5' (후보 목록)"""
+        name, _, values = spec.partition('=')
+        if not name or not values:
+            raise ValueError(f"파라미터 형식 오류: {spec} (이름=low:high 또는 이름=a,b,c)")
+        if ':' in values:
+            low, high = values.split(':', 1)
+            integer = '.' not in low and '.' not in high
+            return cls(name.strip(), low=float(low), high=float(high), integer=integer)
+        choices = [int(v) if v.strip().lstrip('-').isdigit() else float(v) for v in values.split(',')]
+        return cls(name.strip(), choices=choices)
+
+    def grid(self, steps: int) -> List[Any]:
+        if self.choices is not None:
+            return list(self.choices)
+        values = np.linspace(self.low, self.high, steps)
+        return sorted({int(round(v)) for v in values}) if self.integer else [round(float(v), 6) for v in values]
+
+    def sample(self, rng: np.random.Generator) -> Any:
+        if self.choices is not None:
+            return self.choices[int(rng.integers(len(self.choices)))]
+        return self.decode(rng.random())
+
+    def encode(self, value: Any) -> float:
+        """[0, 1] 구간 좌표 (베이지안 탐색용)"""
+        if self.choices is not None:
+            return self.choices.index(value) / max(1, len(self.choices) - 1)
+        return (float(value) - self.low) / (self.high - self.low) if self.high > self.low else 0.0
+
+    def decode(self, unit: float) -> Any:
+        if self.choices is not None:
+            return self.choices[int(round(unit * (len(self.choices) - 1)))]
+        value = self.low + unit * (self.high - self.low)
+        return int(round(value)) if self.integer else round(float(value), 6)
+
+
+def apply_parameters(base: BacktestSettings, params: Dict[str, Any]) -> BacktestSettings:
+    """기준 설정에 파라미터 값을 적용한 새 설정 (기준 설정은 변경하지 않음)"""
+    config = copy.deepcopy(base.config)
+    thresholds = dict(base.pattern_thresholds)
+    overrides: Dict[str, Any] = {}
+
+    for name, value in params.items():
+        if name.startswith('thresholds.'):
+            thresholds[name.split('.', 1)[1]] = value
+        elif name in _SETTINGS_FIELDS:
+            overrides[name] = value
+        else:
+            node = config
+            *path, key = name.split('.')
+            for part in path:
+                node = node.setdefault(part, {})
+            if key not in node:
+                logger.warning(f"⚠️ 전략 설정에 없는 키를 추가합니다: {name}")
+            node[key] = value
+
+    return replace(base, config=config, pattern_thresholds=thresholds, **overrides)
+
+
+def score_summary(summary: Dict[str, Any], objective: str) -> float:
+    """최대화할 목표값 (거래가 없으면 0)"""
+    if not summary.get('trades'):
+        return 0.0
+    if objective == 'win_rate':
+        return float(summary['win_rate'])
+    if objective == 'pnl_to_drawdown':
+        return float(summary['net_pnl']) / max(1.0, float(summary['max_drawdown']))
+    return float(summary['net_pnl'])
+
+
+class BayesianSampler:
+    """가우시안 프로세스(RBF) + 기대 개선량(EI) 기반 순차 탐색
+
+    외부 최적화 라이브러리 없이 NumPy만 사용한다. 배치로 제안할 때는 이미 고른 점의 예측값을
+    관측값으로 가정(kriging believer)해 같은 점이 몰리지 않게 한다.
+    """
+
+    def __init__(self, parameters: List[SweepParameter], seed: int = 0, initial_trials: int = 8,
+                 candidates: int = 2000, length_scale: float = 0.25, noise: float = 1e-4):
+        self.parameters = parameters
+        self.rng = np.random.default_rng(seed)
+        self.initial_trials = initial_trials
+        self.candidates = candidates
+        self.length_scale = length_scale
+        self.noise = noise
+        self._x: List[np.ndarray] = []
+        self._y: List[float] = []
+
+    @property
+    def observed(self) -> int:
+        return len(self._y)
+
+    def observe(self, params: Dict[str, Any], score: float) -> None:
+        self._x.append(np.array([p.encode(params[p.name]) for p in self.parameters]))
+        self._y.append(float(score))
+
+    def suggest(self, count: int) -> List[Dict[str, Any]]:
+        if self.observed < self.initial_trials:
+            return [{p.name: p.sample(self.rng) for p in self.parameters} for _ in range(count)]
+
+        x = np.array(self._x)
+        y = np.array(self._y)
+        suggestions = []
+        for _ in range(count):
+            unit = self._best_candidate(x, y)
+            params = {p.name: p.decode(u) for p, u in zip(self.parameters, unit)}
+            suggestions.append(params)
+            snapped = np.array([p.encode(params[p.name]) for p in self.parameters])
+            mean, _ = self._predict(x, y, snapped[None, :])
+            x = np.vstack([x, snapped])
+            y = np.append(y, mean[0])
+        return suggestions
+
+    def _kernel(self, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        sq = ((a[:, None, :] - b[None, :, :]) ** 2).sum(axis=2)
+        return np.exp(-0.5 * sq / self.length_scale ** 2)
+
+    def _predict(self, x: np.ndarray, y: np.ndarray, query: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        mu, sigma = y.mean(), y.std() or 1.0
+        norm = (y - mu) / sigma
+        k = self._kernel(x, x) + self.noise * np.eye(len(x))
+        chol = np.linalg.cholesky(k)
+        alpha = np.linalg.solve(chol.T, np.linalg.solve(chol, norm))
+        k_star = self._kernel(query, x)
+        mean = k_star @ alpha
+        v = np.linalg.solve(chol, k_star.T)
+        var = np.clip(1.0 - (v ** 2).sum(axis=0), 1e-12, None)
+        return mean * sigma + mu, np.sqrt(var) * sigma
+
+    def _best_candidate(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        query = self.rng.random((self.candidates, len(self.parameters)))
+        mean, std = self._predict(x, y, query)
+        improvement = mean - y.max()
+        z = improvement / std
+        cdf = 0.5 * (1 + np.vectorize(math.erf)(z / math.sqrt(2)))
+        pdf = np.exp(-0.5 * z ** 2) / math.sqrt(2 * math.pi)
+        expected = improvement * cdf + std * pdf
+        return query[int(np.argmax(expected))]
+
+
+# ========== 결과 저장소 ==========
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sweep_runs (
+    run_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    created_at TEXT NOT NULL,
+    method TEXT NOT NULL,
+    objective TEXT NOT NULL,
+    parameters TEXT NOT NULL,
+    base_settings TEXT NOT NULL,
+    symbols INTEGER NOT NULL DEFAULT 0,
+    trials INTEGER NOT NULL DEFAULT 0,
+    elapsed_seconds REAL NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS sweep_trials (
+    run_id INTEGER NOT NULL,
+    trial_id INTEGER NOT NULL,
+    params TEXT NOT NULL,
+    trades INTEGER NOT NULL,
+    wins INTEGER NOT NULL,
+    win_rate REAL NOT NULL,
+    net_pnl INTEGER NOT NULL,
+    gross_pnl INTEGER NOT NULL,
+    fees INTEGER NOT NULL,
+    max_drawdown INTEGER NOT NULL,
+    avg_return_pct REAL NOT NULL,
+    avg_holding_days REAL NOT NULL,
+    score REAL NOT NULL,
+    elapsed_seconds REAL NOT NULL,
+    PRIMARY KEY (run_id, trial_id)
+);
+
+CREATE VIEW IF NOT EXISTS sweep_trial_ranks AS
+SELECT *,
+    RANK() OVER (PARTITION BY run_id ORDER BY net_pnl DESC) AS pnl_rank,
+    RANK() OVER (PARTITION BY run_id ORDER BY max_drawdown ASC) AS drawdown_rank,
+    RANK() OVER (PARTITION BY run_id ORDER BY win_rate DESC) AS hit_rank,
+    RANK() OVER (PARTITION BY run_id ORDER BY score DESC) AS score_rank
+FROM sweep_trials;
+"""
+
+# top() 정렬 기준 → 뷰 순위 컬럼
+_RANK_COLUMNS = {
+    'net_pnl': 'pnl_rank',
+    'max_drawdown': 'drawdown_rank',
+    'win_rate': 'hit_rank',
+    'score': 'score_rank',
+}
+
+
+class SweepResultStore:
+    """파라미터 탐색 결과 SQLite 저장소 (스레드 안전)"""
+
+    def __init__(self, db_path: Path = SWEEP_DB_PATH):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, timeout=30.0)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    def create_run(self, method: str, objective: str, parameters: List[SweepParameter],
+                   base: BacktestSettings, symbols: int) -> int:
+        base_settings = {name: getattr(base, name) for name in sorted(_SETTINGS_FIELDS)}
+        base_settings['pattern_thresholds'] = base.pattern_thresholds
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT INTO sweep_runs (created_at, method, objective, parameters, base_settings, symbols) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (datetime.now().isoformat(), method, objective,
+                 json.dumps([p.__dict__ for p in parameters], ensure_ascii=False),
+                 json.dumps(base_settings, ensure_ascii=False), symbols)
+            )
+            self._conn.commit()
+            return int(cursor.lastrowid)
+
+    def save_trial(self, run_id: int, trial_id: int, params: Dict[str, Any],
+                   summary: Dict[str, Any], score: float, elapsed: float) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sweep_trials VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (run_id, trial_id, json.dumps(params, ensure_ascii=False),
+                 summary.get('trades', 0), summary.get('wins', 0), summary.get('win_rate', 0.0),
+                 summary.get('net_pnl', 0), summary.get('gross_pnl', 0), summary.get('fees', 0),
+                 summary.get('max_drawdown', 0), summary.get('avg_return_pct', 0.0),
+                 summary.get('avg_holding_days', 0.0), score, elapsed)
+            )
+            self._conn.commit()
+
+    def finish_run(self, run_id: int, trials: int, elapsed: float) -> None:
+        with self._lock:
+            self._conn.execute("UPDATE sweep_runs SET trials = ?, elapsed_seconds = ? WHERE run_id = ?",
+                               (trials, elapsed, run_id))
+            self._conn.commit()
+
+    def top(self, run_id: int, order_by: str = 'net_pnl', limit: int = 10) -> pd.DataFrame:
+        """순위 뷰 조회 (order_by: net_pnl / max_drawdown / win_rate / score)"""
+        rank_column = _RANK_COLUMNS.get(order_by)
+        if rank_column is None:
+            raise ValueError(f"지원하지 않는 정렬 기준: {order_by} ({', '.join(_RANK_COLUMNS)})")
+        with self._lock:
+            return pd.read_sql_query(
+                f"SELECT * FROM sweep_trial_ranks WHERE run_id = ? ORDER BY {rank_column}, trial_id LIMIT ?",
+                self._conn, params=(run_id, int(limit))
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+# ========== 프로세스 풀 워커 ==========
+
+_sweep_archive: Optional[PriceArchive] = None
+_sweep_simulators: Dict[int, CandleStrategySimulator] = {}
+_sweep_clock: Optional[SimulatedClock] = None
+_MAX_CACHED_SIMULATORS = 4
+
+
+def _init_sweep_worker(archive_dir: str, log_level: str) -> None:
+    """워커 초기화 - 보관소 memmap 열기, 시계 교체 (탐색 전용 프로세스이므로 복원하지 않음)"""
+    global _sweep_archive, _sweep_clock
+    from loguru import logger as _loguru
+    _loguru.remove()
+    _loguru.add(sys.stderr, level=log_level)
+
+    _sweep_archive = PriceArchive.open(Path(archive_dir))
+    _sweep_clock = SimulatedClock()
+    _sweep_clock.install()
+
+
+def _trial_simulator(trial_id: int, settings: BacktestSettings) -> CandleStrategySimulator:
+    """같은 변형 설정의 묶음이 이어서 들어오므로 변형별 재생기를 몇 개만 보관"""
+    simulator = _sweep_simulators.get(trial_id)
+    if simulator is None:
+        if len(_sweep_simulators) >= _MAX_CACHED_SIMULATORS:
+            _sweep_simulators.pop(next(iter(_sweep_simulators)))
+        simulator = CandleStrategySimulator(settings)
+        _sweep_simulators[trial_id] = simulator
+    return simulator
+
+
+def _run_sweep_task(task: Tuple[int, BacktestSettings, List[str]]) -> Tuple[int, List[BacktestTrade], Dict[str, int]]:
+    trial_id, settings, codes = task
+    simulator = _trial_simulator(trial_id, settings)
+    before = dict(simulator.stats)
+    trades = simulator.run_chunk(_sweep_archive.histories(codes))
+    stats = {key: value - before[key] for key, value in simulator.stats.items()}
+    return trial_id, trades, stats
+
+
+# ========== 탐색 실행기 ==========
+
+@dataclass
+class SweepTrial:
+    """평가 완료된 변형 설정 1개"""
+    trial_id: int
+    params: Dict[str, Any]
+    summary: Dict[str, Any]
+    score: float
+    elapsed_seconds: float = 0.0
+
+
+@dataclass
+class SweepReport:
+    run_id: int
+    trials: List[SweepTrial] = field(default_factory=list)
+
+    def best(self) -> Optional[SweepTrial]:
+        return max(self.trials, key=lambda trial: trial.score) if self.trials else None
+
+    def has_trades(self) -> bool:
+        """거래가 1건 이상 나온 설정이 있는지"""
+        return any(trial.summary.get('trades') for trial in self.trials)
+
+
+class ParameterSweep:
+    """설정 변형 × 종목 묶음을 프로세스 풀로 평가하는 파라미터 탐색기"""
+
+    def __init__(self, archive: PriceArchive, parameters: Sequence[SweepParameter],
+                 base_settings: Optional[BacktestSettings] = None, workers: int = 1,
+                 chunk_size: int = 20, objective: str = 'net_pnl',
+                 store: Optional[SweepResultStore] = None, log_level: str = 'WARNING'):
+        if objective not in OBJECTIVES:
+            raise ValueError(f"지원하지 않는 목표: {objective} ({', '.join(OBJECTIVES)})")
+        self.archive = archive
+        self.parameters = list(parameters)
+        self.base_settings = base_settings or BacktestSettings()
+        self.workers = max(1, workers)
+        self.chunk_size = chunk_size
+        self.objective = objective
+        self.store = store or SweepResultStore()
+        self.log_level = log_level
+
+    # ---------- 탐색 방식 ----------
+
+    def grid(self, steps: int = 3) -> SweepReport:
+        """모든 조합 평가 (범위 파라미터는 steps개 균등 분할)"""
+        names = [p.name for p in self.parameters]
+        combos = [dict(zip(names, values)) for values in itertools.product(*(p.grid(steps) for p in self.parameters))]
+        return self._run('grid', [combos])
+
+    def random(self, trials: int, seed: int = 0) -> SweepReport:
+        rng = np.random.default_rng(seed)
+        combos = [{p.name: p.sample(rng) for p in self.parameters} for _ in range(trials)]
+        return self._run('random', [combos])
+
+    def bayesian(self, trials: int, batch_size: Optional[int] = None, seed: int = 0,
+                 initial_trials: int = 8) -> SweepReport:
+        """GP/EI 순차 탐색 (배치마다 워커 수만큼 제안해 병렬 평가)"""
+        sampler = BayesianSampler(self.parameters, seed=seed, initial_trials=min(initial_trials, trials))
+        batch_size = batch_size or self.workers
+
+        def batches():
+            remaining = trials
+            while remaining > 0:
+                count = min(batch_size, remaining)
+                if sampler.observed < sampler.initial_trials:
+                    # 초기 무작위 표본이 모두 관측된 뒤부터 GP 제안
+                    count = min(count, sampler.initial_trials - sampler.observed)
+                remaining -= count
+                yield sampler.suggest(count)
+
+        return self._run('bayesian', batches(), on_trial=lambda trial: sampler.observe(trial.params, trial.score))
+
+    # ---------- 평가 ----------
+
+    def _run(self, method: str, batches, on_trial=None) -> SweepReport:
+        start = time.perf_counter()
+        chunks = self.archive.chunks(self.chunk_size)
+        run_id = self.store.create_run(method, self.objective, self.parameters, self.base_settings, len(self.archive))
+        report = SweepReport(run_id)
+        logger.info(f"🔎 파라미터 탐색 시작 (run {run_id}, {method}): {len(self.archive)}개 종목, "
+                    f"{len(chunks)}개 묶음, 워커 {self.workers}개, 목표 {self.objective}")
+
+        executor = None
+        clock = None
+        if self.workers > 1:
+            executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_sweep_worker,
+                                           initargs=(str(self.archive.directory), self.log_level))
+        else:
+            clock = SimulatedClock()
+            clock.install()
+
+        try:
+            for combos in batches:
+                trials = [(len(report.trials) + index, params) for index, params in enumerate(combos)]
+                for trial in self._evaluate(trials, chunks, executor):
+                    report.trials.append(trial)
+                    self.store.save_trial(run_id, trial.trial_id, trial.params, trial.summary,
+                                          trial.score, trial.elapsed_seconds)
+                    if on_trial:
+                        on_trial(trial)
+                    if trial.summary.get('candidates') and not trial.summary.get('buy_decisions'):
+                        logger.warning(f"⚠️ trial {trial.trial_id}: 후보 {trial.summary['candidates']}개 중 매수 판단 0건 "
+                                       f"- 매수 판단 경로 오류 가능성")
+                    logger.info(f"🔎 trial {trial.trial_id}: 거래 {trial.summary.get('trades', 0)}건, "
+                                f"승률 {trial.summary.get('win_rate', 0.0):.1f}%, "
+                                f"순손익 {trial.summary.get('net_pnl', 0):,}원, 점수 {trial.score:,.2f} {trial.params}")
+        finally:
+            if executor is not None:
+                executor.shutdown()
+            if clock is not None:
+                clock.uninstall()
+
+        elapsed = time.perf_counter() - start
+        self.store.finish_run(run_id, len(report.trials), elapsed)
+        logger.info(f"🔎 파라미터 탐색 완료 (run {run_id}): {len(report.trials)}개 설정, {elapsed:.1f}초")
+        if report.trials and not report.has_trades():
+            # 짧은 기간/엄격한 설정에서는 정상일 수 있지만 순위는 의미 없음 (점수가 모두 0)
+            logger.warning(f"⚠️ 파라미터 탐색 run {run_id}: {len(report.trials)}개 설정 모두 거래 0건 "
+                           f"- 종목/기간 또는 매수 판단 경로를 확인하세요")
+        return report
+
+    def _evaluate(self, trials: List[Tuple[int, Dict[str, Any]]], chunks: List[List[str]],
+                  executor: Optional[ProcessPoolExecutor]) -> List[SweepTrial]:
+        """변형 설정 묶음 평가 (작업 단위: 설정 × 종목 묶음)"""
+        settings = {trial_id: apply_parameters(self.base_settings, params) for trial_id, params in trials}
+        trades: Dict[int, List[BacktestTrade]] = {trial_id: [] for trial_id, _ in trials}
+        stats = {trial_id: dict.fromkeys(_STAT_KEYS, 0) for trial_id, _ in trials}
+        started = time.perf_counter()
+
+        if executor is None:
+            for trial_id, _ in trials:
+                simulator = CandleStrategySimulator(settings[trial_id])
+                for codes in chunks:
+                    trades[trial_id].extend(simulator.run_chunk(self.archive.histories(codes)))
+                stats[trial_id].update({key: simulator.stats[key] for key in _STAT_KEYS})
+        else:
+            tasks = [(trial_id, settings[trial_id], codes) for trial_id, _ in trials for codes in chunks]
+            for trial_id, chunk_trades, chunk_stats in executor.map(_run_sweep_task, tasks):
+                trades[trial_id].extend(chunk_trades)
+                for key in _STAT_KEYS:
+                    stats[trial_id][key] += chunk_stats.get(key, 0)
+
+        # 병렬 평가는 설정별 소요 시간을 나눌 수 없어 배치 평균으로 기록
+        elapsed = (time.perf_counter() - started) / max(1, len(trials))
+        results = []
+        for trial_id, params in trials:
+            summary = BacktestResult(trades[trial_id], stats[trial_id]).summary()
+            summary.pop('by_pattern', None)
+            results.append(SweepTrial(trial_id, params, summary, score_summary(summary, self.objective), elapsed))
+        return results
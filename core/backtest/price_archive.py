@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+백테스트용 읽기 전용 일봉 배열 보관소
+
+종목별 일봉 이력을 컬럼별 .npy 파일 하나씩(전 종목을 이어 붙인 1차원 배열)과 종목별 구간 색인으로 저장한다.
+워커 프로세스는 np.load(mmap_mode='r')로 열기 때문에 같은 파일을 OS 페이지 캐시에서 공유하고,
+종목 구간은 복사 없이 memmap 슬라이스로 넘겨받는다 (파라미터 탐색 시 변형 설정마다 데이터를 다시 보내지 않음).
+"""
+import json
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+DEFAULT_ARCHIVE_DIR = Path(__file__).parent.parent.parent / "data" / "backtest_archive"
+
+# 컬럼 → 저장 dtype (날짜는 YYYYMMDD 정수)
+_COLUMNS = {
+    'date': np.int32,
+    'open': np.float64,
+    'high': np.float64,
+    'low': np.float64,
+    'close': np.float64,
+    'volume': np.int64,
+    'trading_value': np.int64,
+}
+_INDEX_FILE = 'index.json'
+
+
+class PriceArchive:
+    """memmap 기반 전 종목 일봉 배열 (읽기 전용)"""
+
+    def __init__(self, directory: Path, codes: List[str], offsets: np.ndarray, columns: Dict[str, np.ndarray]):
+        self.directory = Path(directory)
+        self.codes = codes
+        self.offsets = offsets          # 종목 i의 구간: offsets[i]:offsets[i + 1]
+        self.columns = columns
+        self._row_of = {code: row for row, code in enumerate(codes)}
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __contains__(self, stock_code: str) -> bool:
+        return stock_code in self._row_of
+
+    @property
+    def bar_count(self) -> int:
+        return int(self.offsets[-1]) if len(self.offsets) else 0
+
+    # ========== 생성 / 열기 ==========
+
+    @classmethod
+    def build(cls, histories: Dict[str, Dict[str, np.ndarray]], directory: Path = DEFAULT_ARCHIVE_DIR) -> "PriceArchive":
+        """OHLCVStore.get_daily_history 결과를 저장하고 memmap으로 다시 열어 반환"""
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+
+        codes = [code for code, bars in histories.items() if len(bars['close'])]
+        lengths = np.array([len(histories[code]['close']) for code in codes], dtype=np.int64)
+        offsets = np.concatenate([[0], np.cumsum(lengths)]).astype(np.int64)
+
+        for name, dtype in _COLUMNS.items():
+            values = [np.asarray(histories[code][name]) for code in codes]
+            if name == 'date':
+                values = [v.astype(str).astype(np.int64) for v in values]
+            merged = np.concatenate(values).astype(dtype) if values else np.zeros(0, dtype=dtype)
+            np.save(directory / f"{name}.npy", merged)
+
+        np.save(directory / "offsets.npy", offsets)
+        with open(directory / _INDEX_FILE, 'w', encoding='utf-8') as f:
+            json.dump({'codes': codes}, f)
+
+        logger.info(f"💾 백테스트 일봉 보관소 생성: {directory} ({len(codes)}개 종목, {int(offsets[-1]):,}봉)")
+        return cls.open(directory)
+
+    @classmethod
+    def open(cls, directory: Path = DEFAULT_ARCHIVE_DIR) -> "PriceArchive":
+        """읽기 전용 memmap으로 열기 (여러 프로세스가 같은 페이지를 공유)"""
+        directory = Path(directory)
+        with open(directory / _INDEX_FILE, 'r', encoding='utf-8') as f:
+            codes = json.load(f)['codes']
+        offsets = np.load(directory / "offsets.npy")
+        columns = {name: np.load(directory / f"{name}.npy", mmap_mode='r') for name in _COLUMNS}
+        return cls(directory, codes, offsets, columns)
+
+    # ========== 조회 ==========
+
+    def bars(self, stock_code: str) -> Optional[Dict[str, np.ndarray]]:
+        """한 종목의 컬럼별 memmap 슬라이스 (복사 없음, 오래된 날짜가 0번 원소)"""
+        row = self._row_of.get(stock_code)
+        if row is None:
+            return None
+        start, end = self.offsets[row], self.offsets[row + 1]
+        return {name: values[start:end] for name, values in self.columns.items()}
+
+    def histories(self, stock_codes: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, np.ndarray]]:
+        """여러 종목 bars() 묶음 (CandleBacktester.run 입력 형식)"""
+        codes = self.codes if stock_codes is None else [code for code in stock_codes if code in self._row_of]
+        return {code: self.bars(code) for code in codes}
+
+    def chunks(self, size: int, stock_codes: Optional[List[str]] = None) -> List[List[str]]:
+        """워커 작업 단위 종목 묶음"""
+        codes = self.codes if stock_codes is None else [code for code in stock_codes if code in self._row_of]
+        return [codes[i:i + size] for i in range(0, len(codes), size)]
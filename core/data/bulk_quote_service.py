@@ -0,0 +1,291 @@
+"""
+여러 종목 현재가 일괄 조회 서비스 (관찰/보유 종목 재평가용)
+
+조회 순서 (앞 단계에서 채운 종목은 다음 단계에서 제외)
+1. 웹소켓 체결로 집계 중인 당일 봉(IntradayBarAggregator) / 웹소켓 현재가 캐시 - API 호출 없음
+2. 순위 API 스냅샷(거래량순위, 등락률 상승/하락순위) - 호출 한 번에 최대 30종목, 짧은 TTL 동안 재사용
+   (장중 급등 스캔처럼 다른 경로에서 받은 순위 결과도 record_ranking()으로 함께 사용)
+3. 남은 종목만 inquire-price 단건 비동기 동시 호출 (공유 토큰 버킷 + 동시 호출 수 제한)
+
+단계마다 호출자가 요구한 필드(required_fields)를 모두 채울 수 있는 종목만 채택하고,
+결과는 종목별 StockQuote (원본 필드는 inquire-price output과 같은 컬럼명으로 get() 조회 가능)
+"""
+import asyncio
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from utils.logger import setup_logger
+from ..api.kis_records import StockQuote
+
+logger = setup_logger(__name__)
+
+PRICE_FIELDS = ('stck_prpr',)                          # 보유 종목 매도 조건 체크용
+ENTRY_FIELDS = ('stck_prpr', 'stck_oprc', 'acml_vol')  # 관찰 종목 매수 판단용 (시가/거래량 필요)
+
+WEBSOCKET_MAX_AGE = 5.0     # 웹소켓 데이터 최대 허용 나이 (초)
+RANKING_TTL = 10.0          # 순위 스냅샷 재사용 시간 (초)
+REST_CONCURRENCY = 8        # 단건 REST 동시 호출 수
+
+# 순위 응답에서 inquire-price 컬럼으로 그대로 옮길 필드
+_RANKING_COLUMNS = ('stck_prpr', 'prdy_vrss', 'prdy_vrss_sign', 'prdy_ctrt', 'acml_vol',
+                    'acml_tr_pbmn', 'stck_hgpr', 'stck_lwpr', 'hts_kor_isnm')
+
+
+def _fetch_volume_rank() -> Optional[pd.DataFrame]:
+    from ..api.kis_market_api import get_volume_rank
+    return get_volume_rank()
+
+
+def _fetch_rising_rank() -> Optional[pd.DataFrame]:
+    from ..api.kis_market_api import get_fluctuation_rank
+    return get_fluctuation_rank(fid_rank_sort_cls_code="0")
+
+
+def _fetch_falling_rank() -> Optional[pd.DataFrame]:
+    from ..api.kis_market_api import get_fluctuation_rank
+    return get_fluctuation_rank(fid_rank_sort_cls_code="1")
+
+
+# 스냅샷 갱신 시 호출하는 순위 조회 (동기 함수, 스레드에서 실행)
+RANKING_QUERIES = (
+    ('volume', _fetch_volume_rank),
+    ('rising', _fetch_rising_rank),
+    ('falling', _fetch_falling_rank),
+)
+
+
+def _ranking_row_to_quote(row: Dict[str, Any]) -> Optional[Tuple[str, Dict[str, Any]]]:
+    """순위 응답 한 행 → (종목코드, inquire-price 컬럼 dict)"""
+    stock_code = row.get('mksc_shrn_iscd') or row.get('stck_shrn_iscd')
+    if not stock_code:
+        return None
+    quote = {column: row[column] for column in _RANKING_COLUMNS if row.get(column) not in (None, '')}
+    # 등락률 순위는 시가 대비 값을 주므로 시가 복원 (현재가 - 시가대비)
+    if 'stck_prpr' in quote and row.get('oprc_vrss_prpr') not in (None, ''):
+        try:
+            quote['stck_oprc'] = float(quote['stck_prpr']) - float(row['oprc_vrss_prpr'])
+        except (TypeError, ValueError):
+            pass
+    return stock_code, quote
+
+
+def _has_fields(quote: Dict[str, Any], required_fields: Sequence[str]) -> bool:
+    return all(quote.get(field) not in (None, '') for field in required_fields)
+
+
+class BulkQuoteService:
+    """여러 종목 현재가를 가장 싼 소스부터 채우는 일괄 조회기"""
+
+    def __init__(self, websocket_max_age: float = WEBSOCKET_MAX_AGE, ranking_ttl: float = RANKING_TTL,
+                 rest_concurrency: int = REST_CONCURRENCY, ranking_min_missing: Optional[int] = None):
+        """
+        Args:
+            websocket_max_age: 웹소켓 데이터 최대 허용 나이 (초)
+            ranking_ttl: 순위 스냅샷 재사용 시간 (초)
+            rest_concurrency: 단건 REST 동시 호출 수
+            ranking_min_missing: 남은 종목이 이 수 이상일 때만 순위 스냅샷 갱신
+                                 (기본: 순위 조회 호출 수의 2배 - 아끼는 단건 호출이 더 많을 때만)
+        """
+        self.websocket_max_age = websocket_max_age
+        self.ranking_ttl = ranking_ttl
+        self.rest_concurrency = rest_concurrency
+        self.ranking_min_missing = (ranking_min_missing if ranking_min_missing is not None
+                                    else 2 * len(RANKING_QUERIES))
+
+        self._ranking: Dict[str, Tuple[float, Dict[str, Any]]] = {}   # 종목코드 → (수신 시각, 시세)
+        self._ranking_fetched_at = 0.0
+        # 폴링 스레드/메인 루프/웹소켓 루프가 함께 쓰는 전역 인스턴스라 asyncio.Lock 대신 스레드 락 사용
+        self._ranking_refresh_lock = threading.Lock()
+        self._lock = threading.Lock()
+
+        self.stats = {
+            'requests': 0,
+            'symbols': 0,
+            'from_websocket': 0,
+            'from_ranking': 0,
+            'from_rest': 0,
+            'rest_failed': 0,
+            'ranking_refreshes': 0,
+            'ranking_calls': 0,
+        }
+
+    # ========== 조회 ==========
+
+    async def fetch(self, stock_codes: Iterable[str],
+                    required_fields: Sequence[str] = PRICE_FIELDS,
+                    use_websocket: bool = True, refresh_ranking: bool = True) -> Dict[str, StockQuote]:
+        """
+        종목별 현재가 (StockQuote), 조회 실패 종목은 결과에서 제외
+
+        Args:
+            use_websocket: False면 웹소켓 데이터를 건너뜀 (웹소켓 공백 구간 보충용)
+            refresh_ranking: False면 순위 스냅샷을 갱신하지 않고 남아 있는 스냅샷만 사용
+        """
+        codes = list(dict.fromkeys(stock_codes))
+        self.stats['requests'] += 1
+        self.stats['symbols'] += len(codes)
+        quotes: Dict[str, Dict[str, Any]] = {}
+
+        # 1. 웹소켓 실시간 데이터
+        for stock_code in codes if use_websocket else ():
+            quote = self._websocket_quote(stock_code)
+            if quote is not None and _has_fields(quote, required_fields):
+                quotes[stock_code] = quote
+        from_websocket = len(quotes)
+        self.stats['from_websocket'] += from_websocket
+
+        # 2. 순위 스냅샷
+        missing = [code for code in codes if code not in quotes]
+        if missing:
+            if refresh_ranking and len(missing) >= self.ranking_min_missing:
+                await self._refresh_ranking_if_stale()
+            now = time.time()
+            for stock_code in missing:
+                entry = self._ranking.get(stock_code)
+                if entry is not None and now - entry[0] <= self.ranking_ttl and _has_fields(entry[1], required_fields):
+                    quotes[stock_code] = entry[1]
+                    self.stats['from_ranking'] += 1
+
+        result = {code: StockQuote(code, quote) for code, quote in quotes.items()}
+
+        # 3. 남은 종목만 단건 REST
+        missing = [code for code in codes if code not in result]
+        if missing:
+            result.update(await self._fetch_rest(missing))
+
+        logger.debug(f"📦 일괄 시세 {len(result)}/{len(codes)}개 (웹소켓 {from_websocket}, "
+                     f"순위 {len(quotes) - from_websocket}, REST 요청 {len(missing)})")
+        return result
+
+    def _websocket_quote(self, stock_code: str) -> Optional[Dict[str, Any]]:
+        """웹소켓 체결 집계(당일 봉) 또는 웹소켓 현재가 캐시에서 시세 구성"""
+        from .intraday_bars import get_intraday_bar_aggregator
+        aggregator = get_intraday_bar_aggregator()
+        if aggregator.is_live(stock_code, self.websocket_max_age):
+            daily = aggregator.get_forming_daily_bar(stock_code)
+            if daily is not None:
+                return {
+                    'stck_prpr': daily['stck_clpr'],
+                    'stck_oprc': daily['stck_oprc'],
+                    'stck_hgpr': daily['stck_hgpr'],
+                    'stck_lwpr': daily['stck_lwpr'],
+                    'acml_vol': daily['acml_vol'],
+                    'acml_tr_pbmn': daily['acml_tr_pbmn'],
+                    'prdy_vrss': daily['prdy_vrss'],
+                    'prdy_vrss_sign': daily['prdy_vrss_sign'],
+                }
+
+        from .kis_data_cache import get_cached_price
+        cached = get_cached_price(stock_code)
+        if (cached and cached.get('source') == 'websocket'
+                and time.time() - cached.get('timestamp', 0) <= self.websocket_max_age
+                and cached.get('current_price')):
+            return {
+                'stck_prpr': cached['current_price'],
+                'prdy_ctrt': cached.get('change_rate', 0.0),
+                'acml_vol': cached.get('volume', 0),
+            }
+        return None
+
+    async def _fetch_rest(self, stock_codes: List[str]) -> Dict[str, StockQuote]:
+        from ..api.kis_market_api import get_quote_async
+        semaphore = asyncio.Semaphore(self.rest_concurrency)
+
+        async def _one(stock_code: str):
+            async with semaphore:
+                return await get_quote_async("J", stock_code)
+
+        responses = await asyncio.gather(*(_one(code) for code in stock_codes), return_exceptions=True)
+
+        result = {}
+        for stock_code, quote in zip(stock_codes, responses):
+            if isinstance(quote, Exception):
+                logger.debug(f"가격 조회 오류 ({stock_code}): {quote}")
+            elif quote is not None:
+                result[stock_code] = quote
+                continue
+            self.stats['rest_failed'] += 1
+        self.stats['from_rest'] += len(result)
+        return result
+
+    # ========== 순위 스냅샷 ==========
+
+    def record_ranking(self, ranking_data: Optional[pd.DataFrame]) -> int:
+        """순위 API 응답을 스냅샷에 반영 (다른 경로에서 이미 받은 순위 결과 재사용), 반영 종목 수 반환"""
+        if ranking_data is None or ranking_data.empty:
+            return 0
+        received_at = time.time()
+        count = 0
+        with self._lock:
+            for row in ranking_data.to_dict('records'):
+                parsed = _ranking_row_to_quote(row)
+                if parsed is None:
+                    continue
+                stock_code, quote = parsed
+                previous = self._ranking.get(stock_code)
+                if previous is not None and received_at - previous[0] <= self.ranking_ttl:
+                    quote = {**previous[1], **quote}   # 같은 시점 다른 순위의 필드(시가 등) 보존
+                self._ranking[stock_code] = (received_at, quote)
+                count += 1
+        return count
+
+    async def _refresh_ranking_if_stale(self) -> None:
+        """순위 스냅샷이 오래됐으면 갱신 (다른 루프/스레드가 갱신 중이면 기다리지 않고 기존 스냅샷 사용)"""
+        if time.time() - self._ranking_fetched_at <= self.ranking_ttl:
+            return
+        if not self._ranking_refresh_lock.acquire(blocking=False):
+            return
+        try:
+            if time.time() - self._ranking_fetched_at <= self.ranking_ttl:
+                return
+            responses = await asyncio.gather(
+                *(asyncio.to_thread(query) for _, query in RANKING_QUERIES), return_exceptions=True
+            )
+            self._ranking_fetched_at = time.time()
+            self.stats['ranking_refreshes'] += 1
+            self.stats['ranking_calls'] += len(RANKING_QUERIES)
+
+            covered = 0
+            for (name, _), ranking_data in zip(RANKING_QUERIES, responses):
+                if isinstance(ranking_data, Exception):
+                    logger.debug(f"순위 스냅샷 조회 오류 ({name}): {ranking_data}")
+                    continue
+                covered += self.record_ranking(ranking_data)
+
+            # 오래된 항목 정리
+            cutoff = self._ranking_fetched_at - self.ranking_ttl
+            with self._lock:
+                for stock_code in [code for code, (at, _) in self._ranking.items() if at < cutoff]:
+                    del self._ranking[stock_code]
+            logger.debug(f"📊 순위 스냅샷 갱신: {covered}개 종목")
+        finally:
+            self._ranking_refresh_lock.release()
+
+    # ========== 통계 ==========
+
+    def get_stats(self) -> Dict[str, Any]:
+        symbols = self.stats['symbols']
+        served = self.stats['from_websocket'] + self.stats['from_ranking']
+        return {
+            **self.stats,
+            'ranking_snapshot_size': len(self._ranking),
+            'api_free_ratio': served / symbols if symbols else 0.0,
+        }
+
+
+# 전역 인스턴스
+_bulk_quote_service: Optional[BulkQuoteService] = None
+_bulk_quote_service_lock = threading.Lock()
+
+
+def get_bulk_quote_service() -> BulkQuoteService:
+    """전역 일괄 시세 조회 서비스 반환"""
+    global _bulk_quote_service
+    if _bulk_quote_service is None:
+        with _bulk_quote_service_lock:
+            if _bulk_quote_service is None:
+                _bulk_quote_service = BulkQuoteService()
+    return _bulk_quote_service
@@ -12,6 +12,8 @@ from .kis_data_collector import KISDataCollector
 from .data_priority import DataPriority
 from ..websocket.kis_websocket_manager import KISWebSocketManager
 from ..api.rest_api_manager import KISRestAPIManager
+from ..analysis.streaming_indicators import get_streaming_indicators
+from .subscription_scheduler import SubscriptionScheduler
 
 logger = setup_logger(__name__)
 
@@ -24,6 +26,10 @@ class SimpleHybridDataManager:
         self.WEBSOCKET_LIMIT = 41  # KIS 웹소켓 연결 제한
         self.STREAMS_PER_STOCK = 2  # 종목당 스트림 수 (체결가, 호가)
         self.MAX_REALTIME_STOCKS = self.WEBSOCKET_LIMIT // self.STREAMS_PER_STOCK  # 20개
+        subscription_manager = getattr(websocket_manager, 'subscription_manager', None)
+        if subscription_manager is not None:
+            # 웹소켓 구독 관리자의 실제 한도 사용 (연결당 19개, 연결 풀 모드는 세션 수만큼)
+            self.MAX_REALTIME_STOCKS = subscription_manager.MAX_STOCKS
 
         self.websocket_manager = websocket_manager
         self.collector = data_collector
@@ -36,15 +42,20 @@ class SimpleHybridDataManager:
         self.subscriptions: Dict[str, Dict] = {}  # {stock_code: {strategy, callback, ...}}
         self.subscription_lock = threading.RLock()
 
-        # 실시간/폴링 분리 관리
+        # 실시간/폴링 분리 관리 (가치 순위 + 히스테리시스로 실시간 슬롯 배분)
         self.realtime_stocks: List[str] = []  # 실시간 구독 종목
-        self.realtime_priority_queue: List[str] = []  # 실시간 대기열 (우선순위순)
         self.polling_stocks: List[str] = []
+        self.scheduler = SubscriptionScheduler(capacity=self.MAX_REALTIME_STOCKS)
+        self._rebalance_lock = threading.Lock()
 
         # 폴링 관리
         self.polling_active = False
         self.polling_thread: Optional[threading.Thread] = None
         self.polling_interval = 15  # 15초 간격
+        self.polling_budget = 40    # 폴링 주기당 최대 조회 종목 수 (일괄 시세 1회)
+
+        # 종목별 스트리밍 지표 (틱마다 O(1) 갱신, 분석기에서 재계산 없이 조회)
+        self.streaming_indicators = get_streaming_indicators()
 
         # 통계
         self.stats = {
@@ -168,7 +179,7 @@ class SimpleHybridDataManager:
 
     def add_stock(self, stock_code: str, strategy_name: str,
                   use_realtime: bool = False, callback: Optional[Callable] = None,
-                  priority: int = 1) -> bool:
+                  priority: int = 1, score: float = 0.0, pinned: bool = False) -> bool:
         """
         종목 추가 (웹소켓 제한 고려)
 
@@ -178,6 +189,8 @@ class SimpleHybridDataManager:
             use_realtime: 실시간 선호 여부
             callback: 콜백 함수
             priority: 우선순위 (1:높음, 2:보통, 3:낮음)
+            score: 같은 우선순위 내 가치 점수
+            pinned: 항상 실시간 유지 (보유 종목 등)
         """
         with self.subscription_lock:
             if stock_code in self.subscriptions:
@@ -194,23 +207,22 @@ class SimpleHybridDataManager:
                 'added_time': time.time(),
                 'last_update': None,
                 'update_count': 0,
-                'score': 0.0  # 동적 점수
+                'score': score,  # 동적 점수
+                'pinned': pinned
             }
 
             self.subscriptions[stock_code] = subscription
             self.stats['total_subscriptions'] += 1
+            self._add_to_polling(stock_code)
+            self._update_schedule(stock_code)
 
-            # 실시간 또는 폴링 할당
-            if use_realtime and self._can_add_realtime():
-                self._add_to_realtime(stock_code)
-            elif use_realtime:
-                self._add_to_priority_queue(stock_code)
-                self._add_to_polling(stock_code)
-                logger.info(f"실시간 대기열 추가: {stock_code} (현재 {len(self.realtime_stocks)}/{self.MAX_REALTIME_STOCKS})")
-            else:
-                self._add_to_polling(stock_code)
+        # 실시간 여부는 스케줄러가 가치 순위로 결정
+        if use_realtime:
+            self._rebalance()
+            if not subscription['use_realtime']:
+                logger.info(f"실시간 대기: {stock_code} (현재 {len(self.realtime_stocks)}/{self.MAX_REALTIME_STOCKS})")
 
-            return True
+        return True
 
     def remove_stock(self, stock_code: str) -> bool:
         """종목 제거"""
@@ -219,28 +231,26 @@ class SimpleHybridDataManager:
                 return False
 
             subscription = self.subscriptions[stock_code]
-
-            # 실시간에서 제거
-            if subscription['use_realtime']:
-                self._remove_from_realtime(stock_code)
-                # 대기열에서 실시간으로 승격
-                self._promote_from_queue()
+            was_realtime = subscription['use_realtime']
+            self.scheduler.remove(stock_code)
 
             # 폴링에서 제거
             self._remove_from_polling(stock_code)
 
-            # 우선순위 대기열에서 제거
-            if stock_code in self.realtime_priority_queue:
-                self.realtime_priority_queue.remove(stock_code)
-
             # 구독 제거
             del self.subscriptions[stock_code]
+            self.streaming_indicators.discard(stock_code)
 
-            logger.info(f"종목 구독 제거: {stock_code}")
-            return True
+        # 실시간에서 제거 후 빈 슬롯 재배분
+        if was_realtime:
+            self._remove_from_realtime(stock_code)
+            self._rebalance()
+
+        logger.info(f"종목 구독 제거: {stock_code}")
+        return True
 
     def update_stock_priority(self, stock_code: str, new_priority: int, new_score: Optional[float] = None):
-        """종목 우선순위 업데이트 (동적 교체)"""
+        """종목 우선순위 업데이트 (가치 재계산 후 히스테리시스 교체)"""
         with self.subscription_lock:
             if stock_code not in self.subscriptions:
                 return
@@ -252,25 +262,72 @@ class SimpleHybridDataManager:
             if new_score is not None:
                 subscription['score'] = new_score
 
-            # 우선순위가 상승했고 실시간을 원하지만 폴링 중인 경우
-            if (new_priority < old_priority and
-                subscription['preferred_realtime'] and
-                not subscription['use_realtime']):
+            self._update_schedule(stock_code)
+
+        if subscription['preferred_realtime'] and not subscription['use_realtime']:
+            self._rebalance()
+
+        logger.debug(f"우선순위 업데이트: {stock_code} P{old_priority}→P{new_priority}")
+
+    def sync_stock_values(self, strategy_name: str, values: Dict[str, tuple]) -> None:
+        """
+        전략의 추적 종목과 가치를 한 번에 동기화 (없어진 종목은 제거, 구독 교체는 폴링 주기에 반영)
+
+        Args:
+            strategy_name: 전략명
+            values: {종목코드: (가치 점수, 고정 여부)}
+        """
+        with self.subscription_lock:
+            stale = [code for code, sub in self.subscriptions.items()
+                     if sub['strategy_name'] == strategy_name and code not in values]
+            for stock_code, (score, pinned) in values.items():
+                subscription = self.subscriptions.get(stock_code)
+                if subscription is None:
+                    self.add_stock(stock_code, strategy_name, use_realtime=False, priority=1,
+                                   score=score, pinned=pinned)
+                    self.subscriptions[stock_code]['preferred_realtime'] = True
+                    self._update_schedule(stock_code)
+                elif subscription['strategy_name'] == strategy_name:
+                    subscription['score'] = score
+                    subscription['pinned'] = pinned
+                    self._update_schedule(stock_code)
+
+        for stock_code in stale:
+            self.remove_stock(stock_code)
+
+    def _update_schedule(self, stock_code: str) -> None:
+        """구독 정보를 스케줄러 가치로 반영 (우선순위 1 → 500점 ... 5 → 100점, + 점수)"""
+        subscription = self.subscriptions[stock_code]
+        value = (6 - subscription['priority']) * 100 + subscription['score']
+        self.scheduler.set_value(stock_code, value, pinned=subscription.get('pinned', False),
+                                 realtime=subscription['preferred_realtime'])
+
+    def _realtime_capacity(self) -> int:
+        """이 관리자가 쓸 수 있는 실시간 슬롯 (다른 경로에서 직접 구독한 종목 제외)"""
+        subscribed = getattr(self.websocket_manager, 'subscribed_stocks', None) or set()
+        external = len(set(subscribed) - set(self.realtime_stocks))
+        return max(self.MAX_REALTIME_STOCKS - external, 0)
+
+    def _rebalance(self) -> None:
+        """스케줄러 계획대로 실시간 구독 교체 (웹소켓 I/O는 subscription_lock 밖에서 수행)"""
+        if not self.websocket_manager or not getattr(self.websocket_manager, 'is_connected', False):
+            return
 
-                self._try_promote_to_realtime(stock_code)
+        with self._rebalance_lock:
+            to_subscribe, to_unsubscribe = self.scheduler.rebalance(self._realtime_capacity())
 
-            logger.debug(f"우선순위 업데이트: {stock_code} P{old_priority}→P{new_priority}")
+            for stock_code in to_unsubscribe:
+                self._remove_from_realtime(stock_code)
+            for stock_code in to_subscribe:
+                self._add_to_realtime(stock_code)
 
-    def _can_add_realtime(self) -> bool:
-        """실시간 추가 가능 여부"""
-        return len(self.realtime_stocks) < self.MAX_REALTIME_STOCKS
+            swaps = min(len(to_subscribe), len(to_unsubscribe))
+            if swaps:
+                self.stats['priority_swaps'] += swaps
+                logger.info(f"🔄 실시간 교체: {to_unsubscribe} → {to_subscribe}")
 
     def _add_to_realtime(self, stock_code: str) -> bool:
         """실시간 구독 추가"""
-        if not self._can_add_realtime():
-            logger.warning(f"실시간 구독 한계 도달: {len(self.realtime_stocks)}/{self.MAX_REALTIME_STOCKS}")
-            return False
-
         try:
             success = False
 
@@ -306,7 +363,7 @@ class SimpleHybridDataManager:
             if hasattr(self.websocket_manager, 'subscribed_stocks'):
                 if stock_code in self.websocket_manager.subscribed_stocks:
                     logger.info(f"이미 웹소켓 구독 중: {stock_code}")
-                    success = True
+                    success = self.websocket_manager.subscribe_stock_sync(stock_code, self._websocket_callback)
                 else:
                     # 새로운 구독 시도
                     success = self._execute_websocket_subscription(stock_code)
@@ -315,16 +372,14 @@ class SimpleHybridDataManager:
                 success = self._execute_websocket_subscription(stock_code)
 
             if success:
-                # 구독 성공 처리
-                if stock_code not in self.realtime_stocks:
-                    self.realtime_stocks.append(stock_code)
-
-                self.subscriptions[stock_code]['use_realtime'] = True
-                self._remove_from_polling(stock_code)
-
-                # 대기열에서 제거
-                if stock_code in self.realtime_priority_queue:
-                    self.realtime_priority_queue.remove(stock_code)
+                with self.subscription_lock:
+                    # 구독 성공 처리 (그 사이 제거된 종목이면 다음 재조정에서 해제)
+                    if stock_code not in self.realtime_stocks:
+                        self.realtime_stocks.append(stock_code)
+                    if stock_code in self.subscriptions:
+                        self.subscriptions[stock_code]['use_realtime'] = True
+                    self._remove_from_polling(stock_code)
+                self.scheduler.mark_subscribed(stock_code)
 
                 self._update_stats()
                 logger.info(f"✅ 실시간 구독 추가: {stock_code} ({len(self.realtime_stocks)}/{self.MAX_REALTIME_STOCKS})")
@@ -336,20 +391,12 @@ class SimpleHybridDataManager:
 
                 return True
             else:
-                logger.error(f"❌ 실시간 구독 실패: {stock_code}")
-                # 🔧 실패해도 폴링으로 대체하여 계속 진행
-                self._add_to_polling(stock_code)
-                logger.info(f"📡 {stock_code} 폴링으로 대체하여 계속 진행")
+                # 🔧 실패해도 폴링으로 계속 진행 (다음 재조정에서 다시 시도)
+                logger.error(f"❌ 실시간 구독 실패: {stock_code} - 폴링으로 계속 진행")
                 return False
 
         except Exception as e:
             logger.error(f"실시간 구독 오류: {stock_code} - {e}")
-            # 🔧 예외 발생시에도 폴링으로 대체
-            try:
-                self._add_to_polling(stock_code)
-                logger.info(f"📡 {stock_code} 예외 발생으로 폴링 대체")
-            except Exception as fallback_e:
-                logger.error(f"폴링 대체도 실패: {stock_code} - {fallback_e}")
             return False
 
     def _execute_websocket_subscription(self, stock_code: str) -> bool:
@@ -423,74 +470,21 @@ class SimpleHybridDataManager:
             return False
 
     def _remove_from_realtime(self, stock_code: str):
-        """실시간 구독 제거"""
+        """실시간 구독 해제 (추적 중인 종목이면 폴링으로 전환)"""
         if stock_code in self.realtime_stocks:
             try:
-                # self.collector.unsubscribe_realtime(stock_code)
-                pass  # 임시
+                if hasattr(self.websocket_manager, 'unsubscribe_stock_sync'):
+                    self.websocket_manager.unsubscribe_stock_sync(stock_code)
             except Exception as e:
                 logger.error(f"실시간 구독 해제 오류: {stock_code} - {e}")
 
-            self.realtime_stocks.remove(stock_code)
-            self.subscriptions[stock_code]['use_realtime'] = False
+            with self.subscription_lock:
+                self.realtime_stocks.remove(stock_code)
+                if stock_code in self.subscriptions:
+                    self.subscriptions[stock_code]['use_realtime'] = False
+                    self._add_to_polling(stock_code)
             self._update_stats()
-
-    def _add_to_priority_queue(self, stock_code: str):
-        """우선순위 대기열에 추가"""
-        if stock_code not in self.realtime_priority_queue:
-            self.realtime_priority_queue.append(stock_code)
-            self._sort_priority_queue()
-
-    def _sort_priority_queue(self):
-        """우선순위 대기열 정렬 (우선순위 + 점수 기준)"""
-        def priority_key(stock_code: str) -> tuple:
-            sub = self.subscriptions.get(stock_code, {})
-            return (sub.get('priority', 999), -sub.get('score', 0))
-
-        self.realtime_priority_queue.sort(key=priority_key)
-
-    def _promote_from_queue(self):
-        """대기열에서 실시간으로 승격"""
-        if not self._can_add_realtime() or not self.realtime_priority_queue:
-            return
-
-        # 가장 높은 우선순위 종목 승격
-        stock_code = self.realtime_priority_queue[0]
-        if self._add_to_realtime(stock_code):
-            self.stats['priority_swaps'] += 1
-            logger.info(f"대기열→실시간 승격: {stock_code}")
-
-    def _try_promote_to_realtime(self, stock_code: str):
-        """특정 종목을 실시간으로 승격 시도"""
-        if stock_code not in self.subscriptions:
-            return
-
-        # 실시간 여유 공간이 있으면 바로 승격
-        if self._can_add_realtime():
-            self._add_to_realtime(stock_code)
-            return
-
-        # 더 낮은 우선순위 종목과 교체
-        current_priority = self.subscriptions[stock_code]['priority']
-        current_score = self.subscriptions[stock_code]['score']
-
-        for realtime_stock in self.realtime_stocks:
-            realtime_sub = self.subscriptions[realtime_stock]
-
-            # 우선순위가 더 높거나, 같은 우선순위에서 점수가 더 높으면 교체
-            if (current_priority < realtime_sub['priority'] or
-                (current_priority == realtime_sub['priority'] and current_score > realtime_sub['score'])):
-
-                # 교체 실행
-                self._remove_from_realtime(realtime_stock)
-                self._add_to_polling(realtime_stock)
-                self._add_to_priority_queue(realtime_stock)
-
-                self._add_to_realtime(stock_code)
-
-                self.stats['priority_swaps'] += 1
-                logger.info(f"실시간 교체: {realtime_stock}→{stock_code}")
-                break
+        self.scheduler.mark_unsubscribed(stock_code)
 
     def _add_to_polling(self, stock_code: str) -> None:
         """폴링에 추가"""
@@ -538,9 +532,11 @@ class SimpleHybridDataManager:
         logger.info("스마트 폴링 중지")
 
     def _polling_loop(self) -> None:
-        """폴링 루프"""
+        """폴링 루프 (주기마다 실시간 슬롯 재조정 후 나머지 종목 일괄 조회)"""
         while self.polling_active:
             try:
+                self._rebalance()
+
                 if self.polling_stocks:
                     self._poll_data()
 
@@ -551,31 +547,34 @@ class SimpleHybridDataManager:
                 time.sleep(5)
 
     def _poll_data(self) -> None:
-        """데이터 폴링 실행"""
-        for stock_code in self.polling_stocks.copy():
-            try:
-                # 현재가 조회
-                data = self.collector.get_current_price(stock_code, use_cache=True)
+        """데이터 폴링 실행 (가치 × 경과 시간 상위 종목만 일괄 시세 경로로 한 번에 조회)"""
+        batch = self.scheduler.polling_batch(self.polling_budget)
+        if not batch:
+            return
 
+        results = self.collector.get_multiple_prices(batch, use_cache=True)
+        failed = 0
+        for stock_code, data in results.items():
+            try:
                 if data.get('status') == 'success':
-                    self._process_data_update(stock_code, data)
+                    self._process_data_update(stock_code, data, source='poll')
                 else:
-                    logger.warning(f"폴링 데이터 조회 실패: {stock_code}")
-
-                time.sleep(0.1)  # Rate limiting
-
+                    failed += 1
             except Exception as e:
                 logger.error(f"종목 폴링 오류: {stock_code} - {e}")
 
+        if failed:
+            logger.warning(f"폴링 데이터 조회 실패: {failed}/{len(batch)}개")
+
     def _data_callback(self, stock_code: str, data: Dict) -> None:
         """실시간 데이터 콜백 (폴링용)"""
-        self._process_data_update(stock_code, data)
+        self._process_data_update(stock_code, data, source='poll')
 
     def _websocket_callback(self, data_type: str, stock_code: str, data: Dict) -> None:
         """웹소켓 실시간 데이터 콜백 - 🆕 data_type 파라미터 추가"""
         try:
             logger.debug(f"웹소켓 데이터 수신: {stock_code} - {data.get('current_price', 0):,}원")
-            self._process_data_update(stock_code, data)
+            self._process_data_update(stock_code, data, source='websocket')
         except Exception as e:
             logger.error(f"웹소켓 콜백 오류: {stock_code} - {e}")
 
@@ -783,7 +782,7 @@ class SimpleHybridDataManager:
             logger.error(f"❌ 웹소켓 연결 보장 중 오류: {e}")
             return False
 
-    def _process_data_update(self, stock_code: str, data: Dict) -> None:
+    def _process_data_update(self, stock_code: str, data: Dict, source: str = 'poll') -> None:
         """데이터 업데이트 처리"""
         with self.subscription_lock:
             if stock_code not in self.subscriptions:
@@ -792,9 +791,20 @@ class SimpleHybridDataManager:
             subscription = self.subscriptions[stock_code]
             subscription['last_update'] = time.time()
             subscription['update_count'] += 1
+            self.scheduler.record_update(
+                stock_code, source, subscription['last_update'],
+                price=float(data.get('current_price', 0) or 0),
+                high=float(data.get('high_price', 0) or 0),
+                low=float(data.get('low_price', 0) or 0)
+            )
 
             self.stats['data_updates'] += 1
 
+            try:
+                self.streaming_indicators.on_price_update(stock_code, data)
+            except Exception as e:
+                logger.debug(f"스트리밍 지표 갱신 오류: {stock_code} - {e}")
+
             # 사용자 콜백 실행 - 🆕 새로운 시그니처 지원
             if subscription['callback']:
                 try:
@@ -851,14 +861,11 @@ class SimpleHybridDataManager:
                 return True  # 이미 실시간
 
             subscription['preferred_realtime'] = True
+            self._update_schedule(stock_code)
 
-            if self._can_add_realtime():
-                return self._add_to_realtime(stock_code)
-            else:
-                # 우선순위 대기열에 추가
-                self._add_to_priority_queue(stock_code)
-                self._try_promote_to_realtime(stock_code)
-                return subscription['use_realtime']
+        # 빈 슬롯이 있거나 가치가 충분히 높으면 교체되어 실시간 전환
+        self._rebalance()
+        return subscription['use_realtime']
 
     def downgrade_to_polling(self, stock_code: str) -> bool:
         """폴링으로 다운그레이드"""
@@ -871,14 +878,14 @@ class SimpleHybridDataManager:
                 return True  # 이미 폴링
 
             subscription['preferred_realtime'] = False
-            self._remove_from_realtime(stock_code)
-            self._add_to_polling(stock_code)
+            self._update_schedule(stock_code)
 
-            # 대기열에서 승격
-            self._promote_from_queue()
+        # 해제 후 빈 슬롯은 대기 종목 중 가치 최상위로 채움
+        self._remove_from_realtime(stock_code)
+        self._rebalance()
 
-            logger.info(f"폴링 다운그레이드: {stock_code}")
-            return True
+        logger.info(f"폴링 다운그레이드: {stock_code}")
+        return True
 
     # === 상태 조회 ===
 
@@ -908,10 +915,11 @@ class SimpleHybridDataManager:
                 'realtime_capacity': f"{len(self.realtime_stocks)}/{self.MAX_REALTIME_STOCKS}",
                 'websocket_usage': f"{self.stats['websocket_usage']}/{self.WEBSOCKET_LIMIT}",
                 'websocket_details': websocket_details,
-                'priority_queue_size': len(self.realtime_priority_queue),
+                'priority_queue_size': len(self.scheduler.get_waiting()),
                 'polling_active': self.polling_active,
                 'polling_interval': self.polling_interval,
                 'stats': self.stats.copy(),
+                'scheduler_stats': self.scheduler.get_stats(),
                 'collector_stats': self.collector.get_stats(),
                 'cache_stats': cache.get_all_cache_stats()
             }
@@ -938,8 +946,12 @@ class SimpleHybridDataManager:
         return self.realtime_stocks.copy()
 
     def get_priority_queue(self) -> List[str]:
-        """우선순위 대기열"""
-        return self.realtime_priority_queue.copy()
+        """실시간 대기 종목 (가치 높은 순)"""
+        return self.scheduler.get_waiting()
+
+    def get_staleness_report(self) -> List[Dict]:
+        """종목별 데이터 신선도 (가치 높은 순, 마지막 갱신 후 경과 초/소스)"""
+        return self.scheduler.get_staleness()
 
     def _verify_realtime_subscription(self, stock_code: str) -> bool:
         """실시간 구독 상태 검증"""
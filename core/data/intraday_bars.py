@@ -0,0 +1,419 @@
+"""
+실시간 체결(H0STCNT0) 틱 → 분봉/당일 일봉 집계기
+
+- 종목별 1/3/5/15분봉을 고정 크기 NumPy 링버퍼에 집계 (틱당 O(1), 장중 메모리 고정)
+- 봉 거래량은 누적거래량 차이로 계산해 한 프레임에 묶여 온 체결이나 누락된 틱도 반영
+- 형성 중인 당일 일봉(시가/고가/저가는 거래소 제공값)을 함께 유지해 확정 봉만 가진 일봉 저장소를 보완
+- 분봉 REST(inquire-time-itemchartprice, 최대 30건)는 틱이 없는 종목의 콜드 스타트 보충에만 사용
+"""
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Optional, Any
+
+import numpy as np
+import pandas as pd
+
+from utils.logger import setup_logger
+from utils.korean_time import now_kst
+
+logger = setup_logger(__name__)
+
+BAR_INTERVALS = (1, 3, 5, 15)   # 집계할 분봉 주기 (분)
+SESSION_MINUTES = 400           # 링버퍼 크기 기준 (정규장 390분 + 여유)
+LIVE_TICK_SECONDS = 60          # 이 시간 안에 틱이 있으면 실시간 집계 중인 종목으로 취급
+
+# 링버퍼 열 구성
+_T, _O, _H, _L, _C, _V = range(6)
+
+
+def _to_number(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _minute_of_day(hhmmss: str) -> Optional[int]:
+    """'HHMMSS' → 자정 기준 분"""
+    if not hhmmss or len(hhmmss) < 4:
+        return None
+    try:
+        return int(hhmmss[:2]) * 60 + int(hhmmss[2:4])
+    except ValueError:
+        return None
+
+
+class _BarRing:
+    """주기 하나의 분봉 링버퍼 (행: 시작분, 시가, 고가, 저가, 종가, 거래량)"""
+
+    def __init__(self, interval: int, capacity: int):
+        self.interval = interval
+        self.data = np.zeros((capacity, 6))
+        self.head = -1   # 가장 최근(형성 중) 봉 위치
+        self.count = 0
+
+    def update(self, minute: int, price: float, volume: float) -> bool:
+        """틱 반영, 현재 봉보다 이전 시각의 늦은 틱이면 False"""
+        start = minute - minute % self.interval
+        if self.count:
+            bar = self.data[self.head]
+            if start == bar[_T]:
+                if price > bar[_H]:
+                    bar[_H] = price
+                if price < bar[_L]:
+                    bar[_L] = price
+                bar[_C] = price
+                bar[_V] += volume
+                return True
+            if start < bar[_T]:
+                return False
+        self.append(start, price, price, price, price, volume)
+        return True
+
+    def append(self, start: float, open_: float, high: float, low: float, close: float, volume: float) -> None:
+        self.head = (self.head + 1) % len(self.data)
+        self.data[self.head] = (start, open_, high, low, close, volume)
+        self.count = min(self.count + 1, len(self.data))
+
+    def chronological(self, count: Optional[int] = None) -> np.ndarray:
+        """오래된 봉 → 최신 봉 순서의 복사본 (count개)"""
+        n = self.count if count is None else min(count, self.count)
+        if n == 0:
+            return np.zeros((0, 6))
+        idx = (self.head - np.arange(n - 1, -1, -1)) % len(self.data)
+        return self.data[idx].copy()
+
+    def rebuild(self, bars: np.ndarray) -> None:
+        """봉 배열(시간순)로 링버퍼 재구성 (용량을 넘으면 최신 봉만 유지)"""
+        bars = bars[-len(self.data):]
+        self.data[:len(bars)] = bars
+        self.count = len(bars)
+        self.head = len(bars) - 1 if len(bars) else -1
+
+
+def _resample(one_minute: np.ndarray, interval: int) -> np.ndarray:
+    """1분봉 배열(시간순) → interval분봉 배열"""
+    if interval == 1 or len(one_minute) == 0:
+        return one_minute
+    starts = one_minute[:, _T] - one_minute[:, _T] % interval
+    boundaries = np.flatnonzero(np.diff(starts)) + 1
+    first = np.concatenate([[0], boundaries])
+    last = np.concatenate([boundaries - 1, [len(one_minute) - 1]])
+    return np.column_stack([
+        starts[first],
+        one_minute[first, _O],
+        np.maximum.reduceat(one_minute[:, _H], first),
+        np.minimum.reduceat(one_minute[:, _L], first),
+        one_minute[last, _C],
+        np.add.reduceat(one_minute[:, _V], first),
+    ])
+
+
+def _rest_minute_bars(minute_df: pd.DataFrame) -> np.ndarray:
+    """REST 분봉(KIS output2) → 1분봉 배열 (시간순, 같은 분 중복은 마지막 값 유지)"""
+    times = minute_df['stck_cntg_hour'].astype(str).map(_minute_of_day)
+    bars = np.column_stack([
+        times.astype(float).to_numpy(),
+        pd.to_numeric(minute_df['stck_oprc'], errors='coerce').to_numpy(dtype=float),
+        pd.to_numeric(minute_df['stck_hgpr'], errors='coerce').to_numpy(dtype=float),
+        pd.to_numeric(minute_df['stck_lwpr'], errors='coerce').to_numpy(dtype=float),
+        pd.to_numeric(minute_df['stck_prpr'], errors='coerce').to_numpy(dtype=float),
+        pd.to_numeric(minute_df['cntg_vol'], errors='coerce').fillna(0).to_numpy(dtype=float),
+    ])
+    bars = bars[~np.isnan(bars).any(axis=1)]
+    bars = bars[np.argsort(bars[:, _T], kind='stable')]
+    if len(bars):
+        keep = np.append(np.diff(bars[:, _T]) != 0, True)
+        bars = bars[keep]
+    return bars
+
+
+def _rest_session_date(minute_df: pd.DataFrame) -> str:
+    if 'stck_bsop_date' in minute_df.columns and len(minute_df):
+        return str(minute_df['stck_bsop_date'].iloc[0]) or now_kst().strftime('%Y%m%d')
+    return now_kst().strftime('%Y%m%d')
+
+
+def _bars_to_frame(bars: np.ndarray, session_date: str) -> pd.DataFrame:
+    """분봉 배열(시간순) → KIS 분봉 output2 형식 DataFrame (최신 봉이 0번 행)"""
+    bars = bars[::-1]
+    minutes = bars[:, _T].astype(np.int64)
+    return pd.DataFrame({
+        'stck_bsop_date': session_date,
+        'stck_cntg_hour': [f"{m // 60:02d}{m % 60:02d}00" for m in minutes],
+        'stck_prpr': bars[:, _C],
+        'stck_oprc': bars[:, _O],
+        'stck_hgpr': bars[:, _H],
+        'stck_lwpr': bars[:, _L],
+        'cntg_vol': bars[:, _V].astype(np.int64),
+    })
+
+
+class SymbolBarSeries:
+    """종목 하나의 당일 분봉 + 형성 중인 일봉"""
+
+    def __init__(self, stock_code: str, session_date: str):
+        self.stock_code = stock_code
+        self.session_date = session_date
+        self.rings = {interval: _BarRing(interval, SESSION_MINUTES // interval + 1)
+                      for interval in BAR_INTERVALS}
+        self.daily: Dict[str, Any] = {}
+        self.last_acc_volume = 0
+        self.last_tick_time = 0.0
+        self.tick_count = 0
+        self.late_ticks = 0
+        self.backfilled = False
+
+    def on_tick(self, minute: int, price: float, tick: Dict) -> None:
+        acc_volume = int(tick.get('acc_volume', 0) or 0)
+        if acc_volume and self.last_acc_volume and acc_volume >= self.last_acc_volume:
+            volume = acc_volume - self.last_acc_volume
+        else:
+            volume = int(tick.get('contract_volume', 0) or 0)
+        if acc_volume > self.last_acc_volume:
+            self.last_acc_volume = acc_volume
+
+        # 늦게 도착한 틱은 해당 봉이 아직 형성 중인 주기에만 반영
+        accepted = [ring.update(minute, price, volume) for ring in self.rings.values()]
+        if not all(accepted):
+            self.late_ticks += 1
+
+        self._update_daily(price, tick)
+        self.last_tick_time = time.time()
+        self.tick_count += 1
+
+    def _update_daily(self, price: float, tick: Dict) -> None:
+        daily = self.daily
+        open_ = tick.get('open_price') or daily.get('open') or price
+        high = max(tick.get('high_price') or price, daily.get('high', price), price)
+        low_tick = tick.get('low_price') or price
+        low = min(low_tick, daily.get('low', low_tick), price)
+        daily.update({
+            'open': open_,
+            'high': high,
+            'low': low,
+            'close': price,
+            'volume': max(int(tick.get('acc_volume', 0) or 0), daily.get('volume', 0)),
+            'trading_value': int(tick.get('acc_trade_amount', 0) or 0) or daily.get('trading_value', 0),
+            'change': tick.get('change_amount', daily.get('change', 0)),
+            'change_sign': tick.get('change_sign', daily.get('change_sign', '')),
+        })
+
+    def merge_backfill(self, one_minute: np.ndarray) -> None:
+        """REST 1분봉(시간순) 반영
+
+        실시간 틱으로 만든 봉이 있으면 그보다 이전 시각의 봉만 앞에 붙이고,
+        틱 없이 REST로만 채운 종목이면 새 조회 결과로 교체
+        """
+        if self.tick_count:
+            existing_first = self.rings[1].chronological()[:1]
+            if len(existing_first):
+                one_minute = one_minute[one_minute[:, _T] < existing_first[0, _T]]
+
+        for interval, ring in self.rings.items():
+            older = _resample(one_minute, interval)
+            current = ring.chronological() if self.tick_count else np.zeros((0, 6))
+            if len(older) and len(current) and older[-1, _T] == current[0, _T]:
+                # 같은 봉 구간: REST 쪽 시가 + 실시간 쪽 종가로 병합
+                first = current[0]
+                first[_O] = older[-1, _O]
+                first[_H] = max(first[_H], older[-1, _H])
+                first[_L] = min(first[_L], older[-1, _L])
+                first[_V] += older[-1, _V]
+                older = older[:-1]
+            ring.rebuild(np.concatenate([older, current]) if len(current) else older)
+
+        self.backfilled = True
+
+
+class IntradayBarAggregator:
+    """실시간 체결 틱 기반 분봉/당일 일봉 집계기"""
+
+    def __init__(self):
+        self._series: Dict[str, SymbolBarSeries] = {}
+        self._lock = threading.RLock()
+        self.stats = {
+            'ticks': 0,
+            'late_ticks': 0,
+            'backfills': 0,
+            'rest_fetches': 0,
+            'served_from_ticks': 0,
+        }
+
+    # ========== 틱 반영 ==========
+
+    def on_contract(self, tick: Dict) -> None:
+        """파싱된 H0STCNT0 체결 데이터 반영 (웹소켓 메시지 처리 경로에서 호출)"""
+        stock_code = tick.get('stock_code')
+        price = _to_number(tick.get('current_price'))
+        minute = _minute_of_day(tick.get('contract_time', ''))
+        if not stock_code or price <= 0 or minute is None:
+            return
+
+        session_date = tick.get('business_date') or now_kst().strftime('%Y%m%d')
+        with self._lock:
+            series = self._series.get(stock_code)
+            if series is None or series.session_date != session_date:
+                series = SymbolBarSeries(stock_code, session_date)
+                self._series[stock_code] = series
+            late_before = series.late_ticks
+            series.on_tick(minute, price, tick)
+            self.stats['ticks'] += 1
+            self.stats['late_ticks'] += series.late_ticks - late_before
+
+    def backfill_minute_bars(self, stock_code: str, minute_df: pd.DataFrame) -> int:
+        """REST 분봉(KIS output2) 반영, 반영된 1분봉 수 반환"""
+        if minute_df is None or minute_df.empty:
+            return 0
+
+        bars = _rest_minute_bars(minute_df)
+        session_date = _rest_session_date(minute_df)
+        with self._lock:
+            series = self._series.get(stock_code)
+            if series is None or series.session_date != session_date:
+                series = SymbolBarSeries(stock_code, session_date)
+                self._series[stock_code] = series
+            series.merge_backfill(bars)
+            self.stats['backfills'] += 1
+        return len(bars)
+
+    # ========== 조회 ==========
+
+    def is_live(self, stock_code: str, max_age: float = LIVE_TICK_SECONDS) -> bool:
+        """최근 체결 틱을 받고 있는 종목인지"""
+        series = self._series.get(stock_code)
+        return series is not None and time.time() - series.last_tick_time <= max_age
+
+    def bar_count(self, stock_code: str, interval: int = 1) -> int:
+        series = self._series.get(stock_code)
+        return series.rings[interval].count if series and interval in series.rings else 0
+
+    def get_bars(self, stock_code: str, interval: int = 1, count: Optional[int] = None) -> Optional[Dict[str, np.ndarray]]:
+        """분봉 배열 (시간순, 'minute'은 자정 기준 봉 시작 분)"""
+        with self._lock:
+            series = self._series.get(stock_code)
+            if series is None or interval not in series.rings:
+                return None
+            bars = series.rings[interval].chronological(count)
+        if len(bars) == 0:
+            return None
+        return {
+            'minute': bars[:, _T].astype(np.int64),
+            'open': bars[:, _O],
+            'high': bars[:, _H],
+            'low': bars[:, _L],
+            'close': bars[:, _C],
+            'volume': bars[:, _V].astype(np.int64),
+        }
+
+    def get_minute_frame(self, stock_code: str, interval: int = 1, count: int = 30) -> Optional[pd.DataFrame]:
+        """KIS 분봉 output2 형식 DataFrame (최신 봉이 0번 행)"""
+        with self._lock:
+            series = self._series.get(stock_code)
+            if series is None or interval not in series.rings or series.rings[interval].count == 0:
+                return None
+            bars = series.rings[interval].chronological(count)
+            session_date = series.session_date
+        return _bars_to_frame(bars, session_date)
+
+    def get_forming_daily_bar(self, stock_code: str) -> Optional[Dict[str, Any]]:
+        """형성 중인 당일 일봉 (KIS 일봉 output2 컬럼명), 틱이 없으면 None"""
+        with self._lock:
+            series = self._series.get(stock_code)
+            if series is None or not series.daily:
+                return None
+            daily = dict(series.daily)
+            session_date = series.session_date
+        return {
+            'stck_bsop_date': session_date,
+            'stck_oprc': float(daily['open']),
+            'stck_hgpr': float(daily['high']),
+            'stck_lwpr': float(daily['low']),
+            'stck_clpr': float(daily['close']),
+            'acml_vol': int(daily['volume']),
+            'acml_tr_pbmn': int(daily['trading_value']),
+            'prdy_vrss': float(daily['change'] or 0),
+            'prdy_vrss_sign': daily['change_sign'],
+        }
+
+    def merge_forming_daily_bar(self, stock_code: str, daily_df: Optional[pd.DataFrame]) -> Optional[pd.DataFrame]:
+        """확정 일봉 DataFrame(최신일이 0번 행) 앞에 형성 중인 당일 봉을 붙임 (이미 있으면 그대로)"""
+        forming = self.get_forming_daily_bar(stock_code)
+        if forming is None or daily_df is None or daily_df.empty:
+            return daily_df
+        if 'stck_bsop_date' in daily_df.columns and str(daily_df['stck_bsop_date'].iloc[0]) >= forming['stck_bsop_date']:
+            return daily_df
+        today = pd.DataFrame([{col: forming.get(col) for col in daily_df.columns}])
+        return pd.concat([today, daily_df], ignore_index=True)
+
+    async def get_minute_frame_async(self, stock_code: str, interval: int = 1,
+                                     count: int = 30) -> Optional[pd.DataFrame]:
+        """분봉 조회 - 실시간 집계 우선, 틱이 부족하면 REST로 콜드 스타트 보충
+
+        체결 틱을 받지 않는 종목(스캔 대상 등)은 REST 결과를 저장하지 않고 바로 변환해 반환
+        """
+        with self._lock:
+            series = self._series.get(stock_code)
+            live = series is not None and self.is_live(stock_code)
+            enough = live and (series.rings[1].count >= count * interval or series.backfilled)
+        if enough:
+            self.stats['served_from_ticks'] += 1
+            return self.get_minute_frame(stock_code, interval, count)
+
+        minute_df = await self._fetch_minute_bars(stock_code)
+        if minute_df is None or minute_df.empty:
+            return self.get_minute_frame(stock_code, interval, count) if live else None
+
+        if live:
+            self.backfill_minute_bars(stock_code, minute_df)
+            return self.get_minute_frame(stock_code, interval, count)
+
+        bars = _resample(_rest_minute_bars(minute_df), interval)[-count:]
+        return _bars_to_frame(bars, _rest_session_date(minute_df)) if len(bars) else None
+
+    async def _fetch_minute_bars(self, stock_code: str) -> Optional[pd.DataFrame]:
+        """REST 분봉 조회 (최근 30분, KIS 1회 최대 30건)"""
+        try:
+            from ..api.kis_market_api import get_inquire_time_itemchartprice_async
+
+            input_hour = (datetime.now() - timedelta(minutes=30)).strftime("%H%M%S")
+            self.stats['rest_fetches'] += 1
+            return await get_inquire_time_itemchartprice_async(
+                output_dv="2",              # 분봉 데이터 배열 (output2)
+                div_code="J",               # 조건시장분류코드 (J: 주식)
+                itm_no=stock_code,
+                input_hour=input_hour,
+                past_data_yn="Y",           # 과거데이터포함여부
+                etc_cls_code=""
+            )
+        except Exception as e:
+            logger.debug(f"❌ {stock_code} 분봉 REST 조회 오류: {e}")
+            return None
+
+    def discard(self, stock_code: str) -> None:
+        with self._lock:
+            self._series.pop(stock_code, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self.stats,
+                'symbols': len(self._series),
+                'live_symbols': sum(1 for code in self._series if self.is_live(code)),
+            }
+
+
+# 전역 인스턴스
+_bar_aggregator: Optional[IntradayBarAggregator] = None
+_bar_aggregator_lock = threading.Lock()
+
+
+def get_intraday_bar_aggregator() -> IntradayBarAggregator:
+    """전역 분봉 집계기 반환"""
+    global _bar_aggregator
+    if _bar_aggregator is None:
+        with _bar_aggregator_lock:
+            if _bar_aggregator is None:
+                _bar_aggregator = IntradayBarAggregator()
+    return _bar_aggregator
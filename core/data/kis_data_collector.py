@@ -275,13 +275,46 @@ class KISDataCollector:
             return []
 
     def get_multiple_prices(self, stock_codes: List[str], use_cache: bool = False) -> Dict[str, Dict]:
-        """여러 종목 현재가 배치 조회 (실시간 우선)"""
-        results = {}
+        """여러 종목 현재가 일괄 조회 (웹소켓 → 순위 스냅샷 → 남은 종목만 동시 REST)"""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            # 이벤트 루프 스레드에서 동기 호출된 경우 - 루프를 막지 않도록 기존 단건 경로 사용
+            return {stock_code: self.get_current_price(stock_code, use_cache) for stock_code in stock_codes}
 
-        for stock_code in stock_codes:
-            results[stock_code] = self.get_current_price(stock_code, use_cache)
-            time.sleep(0.05)  # API Rate Limiting (더 빠르게)
+        from .bulk_quote_service import get_bulk_quote_service
+        from ..api.kis_async_client import close_async_client
+
+        async def _fetch():
+            try:
+                return await get_bulk_quote_service().fetch(stock_codes)
+            finally:
+                await close_async_client()
 
+        self.stats['total_requests'] += len(stock_codes)
+        quotes = asyncio.run(_fetch())
+
+        results = {}
+        for stock_code in stock_codes:
+            quote = quotes.get(stock_code)
+            if quote is None:
+                results[stock_code] = {'status': 'error', 'message': '현재가 조회 실패', 'source': 'none'}
+                continue
+            results[stock_code] = {
+                "status": "success",
+                "stock_code": stock_code,
+                "current_price": int(quote.current_price),
+                "change_rate": quote.change_rate,
+                "volume": quote.volume,
+                "high_price": int(quote.high_price),
+                "low_price": int(quote.low_price),
+                "open_price": int(quote.open_price),
+                "timestamp": time.time(),
+                "source": "bulk_quote",
+                "from_cache": False,
+            }
         return results
 
     def get_stock_overview(self, stock_code: str, use_cache: bool = True) -> Dict:
@@ -0,0 +1,527 @@
+"""
+로컬 일봉(OHLCV) 저장소 (SQLite, data/ohlcv.db)
+
+- 종목별 확정 일봉을 디스크에 보관하고 실행마다 마지막 저장일 이후 날짜만 API로 보충
+  (KIS 1회 최대 100봉이므로 오래 비운 뒤에는 시작일까지 페이지를 나눠 조회)
+- 조회는 KIS output2와 같은 컬럼/정렬(최신일이 0번 행)의 DataFrame 또는 NumPy 배열로 반환하므로
+  CandlePatternDetector / PricePositionFilter / CandleAnalyzer가 API 호출 없이 그대로 사용
+- 당일 봉은 장 마감(15:40) 이후에만 확정 봉으로 저장 (장중 형성 중인 봉은 저장하지 않음)
+- 장중 조회 시 include_forming=True면 형성 중인 당일 봉(체결 틱 집계 → 현재가 시세 순)을 맨 앞에 붙여 반환
+"""
+import sqlite3
+import asyncio
+import threading
+from datetime import datetime, timedelta, time as dt_time
+from pathlib import Path
+from typing import Dict, List, Optional, Any, Iterable, Union
+
+import numpy as np
+import pandas as pd
+
+from utils.logger import setup_logger
+from utils.korean_time import now_kst
+from ..api.kis_records import DailyBar, StockQuote, decode_daily_bars
+
+logger = setup_logger(__name__)
+
+DB_PATH = Path(__file__).parent.parent.parent / "data" / "ohlcv.db"
+
+DEFAULT_HISTORY_DAYS = 140          # 최초 적재 시 조회 기간 (달력일, KIS 1회 조회 최대 100봉 이내)
+KIS_DAILY_PAGE_SIZE = 100           # KIS 기간별시세 1회 조회 최대 봉 수
+MAX_SYNC_PAGES = 20                 # 보충 1회 최대 페이지 수 (약 8년치, 초과분은 공백으로 기록)
+DEFAULT_WINDOW_DAYS = 30            # 기본 조회 봉 수 (기존 45일 조회 범위와 동일한 규모)
+MARKET_OPEN = dt_time(9, 0)             # 이 시각 이후 당일 봉이 형성됨
+MARKET_CLOSE_CONFIRM = dt_time(15, 40)  # 이 시각 이후 당일 봉을 확정 봉으로 취급
+
+# 조회 결과 DataFrame 컬럼 (KIS output2와 동일)
+_KIS_COLUMNS = ['stck_bsop_date', 'stck_oprc', 'stck_hgpr', 'stck_lwpr', 'stck_clpr',
+                'acml_vol', 'acml_tr_pbmn', 'prdy_vrss', 'prdy_vrss_sign']
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS daily_bars (
+    stock_code TEXT NOT NULL,
+    date TEXT NOT NULL,
+    open REAL NOT NULL,
+    high REAL NOT NULL,
+    low REAL NOT NULL,
+    close REAL NOT NULL,
+    volume INTEGER NOT NULL,
+    trading_value INTEGER NOT NULL DEFAULT 0,
+    change REAL NOT NULL DEFAULT 0,
+    change_sign TEXT NOT NULL DEFAULT '',
+    PRIMARY KEY (stock_code, date)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS sync_state (
+    stock_code TEXT PRIMARY KEY,
+    last_bar_date TEXT,
+    synced_through TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+"""
+
+
+def last_confirmed_trading_date(now: Optional[datetime] = None) -> str:
+    """확정 일봉이 존재해야 하는 마지막 날짜 (YYYYMMDD, 주말 제외, 휴장일은 동기화 기록으로 흡수)"""
+    now = now or now_kst()
+    day = now.date()
+    if now.time() < MARKET_CLOSE_CONFIRM:
+        day -= timedelta(days=1)
+    while day.weekday() >= 5:
+        day -= timedelta(days=1)
+    return day.strftime("%Y%m%d")
+
+
+def forming_session_date(now: Optional[datetime] = None) -> Optional[str]:
+    """당일 봉이 형성 중(장 시작 후 ~ 확정 전)이면 당일 날짜 (YYYYMMDD), 아니면 None"""
+    now = now or now_kst()
+    if now.weekday() >= 5 or not (MARKET_OPEN <= now.time() < MARKET_CLOSE_CONFIRM):
+        return None
+    return now.strftime("%Y%m%d")
+
+
+def forming_bar_from_quote(quote: StockQuote, session_date: str) -> Optional[Dict[str, Any]]:
+    """현재가 시세로 만든 형성 중인 당일 봉 (KIS 일봉 output2 컬럼명), 시가가 없으면 None"""
+    if quote is None or quote.open_price <= 0 or quote.current_price <= 0:
+        return None
+    return {
+        'stck_bsop_date': session_date,
+        'stck_oprc': quote.open_price,
+        'stck_hgpr': quote.high_price or max(quote.open_price, quote.current_price),
+        'stck_lwpr': quote.low_price or min(quote.open_price, quote.current_price),
+        'stck_clpr': quote.current_price,
+        'acml_vol': quote.volume,
+        'acml_tr_pbmn': quote.trading_value,
+        'prdy_vrss': quote.prev_diff,
+        'prdy_vrss_sign': quote.get('prdy_vrss_sign', ''),
+    }
+
+
+class OHLCVStore:
+    """SQLite 기반 종목별 일봉 저장소 (스레드 안전)"""
+
+    def __init__(self, db_path: Path = DB_PATH):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, timeout=30.0)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+        # 종목별 동기화 완료일 (DB sync_state의 메모리 사본)
+        self._synced_through: Dict[str, str] = dict(
+            self._conn.execute("SELECT stock_code, synced_through FROM sync_state").fetchall()
+        )
+        # 같은 종목을 동시에 보충하지 않도록 진행 중인 동기화 태스크 공유
+        self._pending: Dict[str, asyncio.Future] = {}
+
+        self.stats = {
+            'reads': 0,
+            'api_fetches': 0,
+            'bars_written': 0,
+            'sync_skipped': 0,
+            'forming_from_ticks': 0,
+            'forming_from_quote': 0,
+            'sync_pages': 0,
+            'sync_gaps': 0
+        }
+
+        logger.info(f"📦 일봉 저장소 초기화: {self.db_path} ({len(self._synced_through)}개 종목 보유)")
+
+    # ========== 쓰기 ==========
+
+    def upsert_bars(self, stock_code: str, ohlcv_data: Union[pd.DataFrame, List[DailyBar], None],
+                    synced_through: Optional[str] = None) -> int:
+        """KIS output2 형식 DataFrame 또는 DailyBar 목록을 저장 (확정일 이후 봉은 제외), 저장한 봉 수 반환"""
+        confirmed = synced_through or last_confirmed_trading_date()
+        rows = []
+
+        if isinstance(ohlcv_data, pd.DataFrame):
+            bars = decode_daily_bars(ohlcv_data.to_dict('records')) if not ohlcv_data.empty else []
+        else:
+            bars = ohlcv_data or []
+
+        for bar in bars:
+            if not bar.date or bar.date > confirmed or bar.close <= 0:
+                continue
+            rows.append((
+                stock_code, bar.date, bar.open, bar.high, bar.low, bar.close,
+                bar.volume, bar.trading_value, bar.prev_diff, bar.prev_sign
+            ))
+
+        with self._lock:
+            if rows:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO daily_bars VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows
+                )
+            last_bar = self._conn.execute(
+                "SELECT MAX(date) FROM daily_bars WHERE stock_code = ?", (stock_code,)
+            ).fetchone()[0]
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sync_state VALUES (?, ?, ?, ?)",
+                (stock_code, last_bar, confirmed, now_kst().isoformat())
+            )
+            self._conn.commit()
+            self._synced_through[stock_code] = confirmed
+            self.stats['bars_written'] += len(rows)
+
+        return len(rows)
+
+    # ========== 동기화 ==========
+
+    def last_bar_date(self, stock_code: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT MAX(date) FROM daily_bars WHERE stock_code = ?", (stock_code,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def needs_sync(self, stock_code: str) -> bool:
+        """마지막 확정 거래일까지 동기화되지 않았으면 True"""
+        return self._synced_through.get(stock_code, '') < last_confirmed_trading_date()
+
+    def _missing_range(self, stock_code: str, history_days: int) -> tuple:
+        """보충 조회할 (시작일, 종료일)"""
+        end_date = last_confirmed_trading_date()
+        last_bar = self.last_bar_date(stock_code)
+        if last_bar:
+            start = datetime.strptime(last_bar, "%Y%m%d") + timedelta(days=1)
+        else:
+            start = datetime.strptime(end_date, "%Y%m%d") - timedelta(days=history_days)
+        return start.strftime("%Y%m%d"), end_date
+
+    def _next_page_end(self, stock_code: str, start_date: str, page: List[DailyBar], pages: int) -> Optional[str]:
+        """다음 페이지 조회 종료일 (KIS는 종료일부터 과거로 최대 100봉) - 시작일까지 채웠으면 None"""
+        if len(page) < KIS_DAILY_PAGE_SIZE:
+            return None
+        oldest = min(bar.date for bar in page if bar.date)
+        if oldest <= start_date:
+            return None
+        next_end = (datetime.strptime(oldest, "%Y%m%d") - timedelta(days=1)).strftime("%Y%m%d")
+        if pages >= MAX_SYNC_PAGES:
+            self.stats['sync_gaps'] += 1
+            logger.warning(f"⚠️ {stock_code} 일봉 보충 페이지 한도({MAX_SYNC_PAGES}) 도달 - "
+                           f"{start_date}~{next_end} 구간 누락")
+            return None
+        return next_end
+
+    def sync(self, stock_code: str, history_days: int = DEFAULT_HISTORY_DAYS) -> bool:
+        """누락 날짜만 API로 보충 (동기, 100봉 단위로 시작일까지 나눠 조회)"""
+        if not self.needs_sync(stock_code):
+            self.stats['sync_skipped'] += 1
+            return True
+
+        start_date, end_date = self._missing_range(stock_code, history_days)
+        from ..api.kis_market_api import get_daily_bars
+        fetched: List[DailyBar] = []
+        page_end: Optional[str] = end_date
+        pages = 0
+        while page_end is not None:
+            page = get_daily_bars(stock_code, inqr_strt_dt=start_date, inqr_end_dt=page_end)
+            if page is None:
+                return self._apply_fetched(stock_code, None, end_date)
+            pages += 1
+            fetched.extend(page)
+            page_end = self._next_page_end(stock_code, start_date, page, pages)
+        return self._apply_fetched(stock_code, fetched, end_date, pages)
+
+    async def sync_async(self, stock_code: str, history_days: int = DEFAULT_HISTORY_DAYS) -> bool:
+        """누락 날짜만 API로 보충 (비동기, 같은 종목 동시 요청은 1회로 합침)"""
+        if not self.needs_sync(stock_code):
+            self.stats['sync_skipped'] += 1
+            return True
+
+        pending = self._pending.get(stock_code)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending[stock_code] = future
+        result = False
+        try:
+            start_date, end_date = self._missing_range(stock_code, history_days)
+            from ..api.kis_market_api import get_daily_bars_async
+            fetched: Optional[List[DailyBar]] = []
+            page_end: Optional[str] = end_date
+            pages = 0
+            while page_end is not None:
+                page = await get_daily_bars_async(stock_code, inqr_strt_dt=start_date, inqr_end_dt=page_end)
+                if page is None:
+                    fetched = None
+                    break
+                pages += 1
+                fetched.extend(page)
+                page_end = self._next_page_end(stock_code, start_date, page, pages)
+            result = self._apply_fetched(stock_code, fetched, end_date, pages)
+        except Exception as e:
+            logger.debug(f"📦 {stock_code} 일봉 보충 오류: {e}")
+        finally:
+            # 취소되더라도 대기 중인 다른 요청이 멈추지 않도록 항상 결과를 채움
+            self._pending.pop(stock_code, None)
+            future.set_result(result)
+        return result
+
+    async def sync_many_async(self, stock_codes: Iterable[str],
+                              history_days: int = DEFAULT_HISTORY_DAYS) -> Dict[str, bool]:
+        """여러 종목 동시 보충 (호출 속도는 전역 속도 제한기가 조절)"""
+        targets = [code for code in stock_codes if self.needs_sync(code)]
+        if not targets:
+            return {}
+        results = await asyncio.gather(
+            *(self.sync_async(code, history_days) for code in targets), return_exceptions=True
+        )
+        return {code: result is True for code, result in zip(targets, results)}
+
+    def _apply_fetched(self, stock_code: str, fetched: Optional[List[DailyBar]], end_date: str,
+                       pages: int = 1) -> bool:
+        # None은 API 실패 (페이지 중간 실패 포함) → 받은 페이지도 저장하지 않고 동기화 기록을 남기지 않아
+        # 다음 조회 때 같은 구간을 처음부터 재시도 (최신 페이지만 저장하면 그 이전 구간이 영구 공백이 됨)
+        if fetched is None:
+            return False
+        self.stats['api_fetches'] += 1
+        self.stats['sync_pages'] += pages
+        written = self.upsert_bars(stock_code, fetched, synced_through=end_date)
+        logger.debug(f"📦 {stock_code} 일봉 {written}개 보충 (~{end_date}, {pages}페이지)")
+        return True
+
+    # ========== 조회 ==========
+
+    def get_daily_bars(self, stock_code: str, days: int = DEFAULT_WINDOW_DAYS,
+                       end_date: Optional[str] = None) -> Optional[pd.DataFrame]:
+        """KIS output2 형식 일봉 DataFrame (최신일이 0번 행), 저장된 봉이 없으면 None"""
+        arrays = self.get_daily_arrays(stock_code, days, end_date)
+        if arrays is None:
+            return None
+
+        df = pd.DataFrame({
+            'stck_bsop_date': arrays['date'],
+            'stck_oprc': arrays['open'],
+            'stck_hgpr': arrays['high'],
+            'stck_lwpr': arrays['low'],
+            'stck_clpr': arrays['close'],
+            'acml_vol': arrays['volume'],
+            'acml_tr_pbmn': arrays['trading_value'],
+            'prdy_vrss': arrays['change'],
+            'prdy_vrss_sign': arrays['change_sign'],
+        }, columns=_KIS_COLUMNS)
+        return df
+
+    def get_daily_arrays(self, stock_code: str, days: int = DEFAULT_WINDOW_DAYS,
+                         end_date: Optional[str] = None) -> Optional[Dict[str, np.ndarray]]:
+        """컬럼별 NumPy 배열 (최신일이 0번 원소), 저장된 봉이 없으면 None"""
+        query = ("SELECT date, open, high, low, close, volume, trading_value, change, change_sign "
+                 "FROM daily_bars WHERE stock_code = ?")
+        params: List[Any] = [stock_code]
+        if end_date:
+            query += " AND date <= ?"
+            params.append(end_date)
+        query += " ORDER BY date DESC LIMIT ?"
+        params.append(int(days))
+
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+            self.stats['reads'] += 1
+
+        if not rows:
+            return None
+
+        date, open_, high, low, close, volume, trading_value, change, change_sign = zip(*rows)
+        return {
+            'date': np.array(date, dtype=object),
+            'open': np.array(open_, dtype=np.float64),
+            'high': np.array(high, dtype=np.float64),
+            'low': np.array(low, dtype=np.float64),
+            'close': np.array(close, dtype=np.float64),
+            'volume': np.array(volume, dtype=np.int64),
+            'trading_value': np.array(trading_value, dtype=np.int64),
+            'change': np.array(change, dtype=np.float64),
+            'change_sign': np.array(change_sign, dtype=object),
+        }
+
+    def get_daily_matrix(self, stock_codes: List[str], days: int = DEFAULT_WINDOW_DAYS,
+                         end_date: Optional[str] = None) -> Dict[str, Any]:
+        """여러 종목 일봉을 (종목 × 일) 배열로 한 번에 조회
+
+        Returns:
+            {'codes': 저장된 봉이 있는 종목코드 리스트, 'lengths': 종목별 봉 수,
+             'open'/'high'/'low'/'close'/'volume': (종목 × days) float64 배열}
+            각 행은 최신일이 0번 열이며 봉 수가 days보다 적으면 뒤쪽을 NaN으로 채움
+        """
+        codes_found: List[str] = []
+        row_of: Dict[str, int] = {}
+        matrix = np.full((5, len(stock_codes), int(days)), np.nan, dtype=np.float64)
+        lengths = np.zeros(len(stock_codes), dtype=np.int64)
+
+        date_filter = " AND date <= ?" if end_date else ""
+        chunk_size = 500  # SQLite 바인딩 변수 개수 제한 대비
+        for start in range(0, len(stock_codes), chunk_size):
+            chunk = stock_codes[start:start + chunk_size]
+            placeholders = ','.join('?' * len(chunk))
+            query = (
+                "SELECT stock_code, open, high, low, close, volume FROM ("
+                "  SELECT *, ROW_NUMBER() OVER (PARTITION BY stock_code ORDER BY date DESC) AS rn"
+                f"  FROM daily_bars WHERE stock_code IN ({placeholders}){date_filter}"
+                ") WHERE rn <= ? ORDER BY stock_code, date DESC"
+            )
+            params: List[Any] = list(chunk)
+            if end_date:
+                params.append(end_date)
+            params.append(int(days))
+
+            with self._lock:
+                rows = self._conn.execute(query, params).fetchall()
+                self.stats['reads'] += 1
+
+            for code, open_, high, low, close, volume in rows:
+                row = row_of.get(code)
+                if row is None:
+                    row = len(codes_found)
+                    row_of[code] = row
+                    codes_found.append(code)
+                col = lengths[row]
+                matrix[:, row, col] = (open_, high, low, close, volume)
+                lengths[row] = col + 1
+
+        count = len(codes_found)
+        return {
+            'codes': codes_found,
+            'lengths': lengths[:count],
+            'open': matrix[0, :count],
+            'high': matrix[1, :count],
+            'low': matrix[2, :count],
+            'close': matrix[3, :count],
+            'volume': matrix[4, :count],
+        }
+
+    def get_daily_history(self, stock_codes: List[str], start_date: Optional[str] = None,
+                          end_date: Optional[str] = None) -> Dict[str, Dict[str, np.ndarray]]:
+        """여러 종목의 기간 전체 일봉 (백테스트용, 종목별로 오래된 날짜가 0번 원소)
+
+        Returns:
+            {종목코드: {'date': YYYYMMDD 문자열 배열, 'open'/'high'/'low'/'close'/'volume'/'trading_value'}}
+            저장된 봉이 없는 종목은 제외
+        """
+        date_filter = ""
+        date_params: List[Any] = []
+        if start_date:
+            date_filter += " AND date >= ?"
+            date_params.append(start_date)
+        if end_date:
+            date_filter += " AND date <= ?"
+            date_params.append(end_date)
+
+        rows_by_code: Dict[str, list] = {}
+        chunk_size = 500  # SQLite 바인딩 변수 개수 제한 대비
+        for start in range(0, len(stock_codes), chunk_size):
+            chunk = stock_codes[start:start + chunk_size]
+            placeholders = ','.join('?' * len(chunk))
+            query = ("SELECT stock_code, date, open, high, low, close, volume, trading_value "
+                     f"FROM daily_bars WHERE stock_code IN ({placeholders}){date_filter} "
+                     "ORDER BY stock_code, date")
+            with self._lock:
+                rows = self._conn.execute(query, list(chunk) + date_params).fetchall()
+                self.stats['reads'] += 1
+            for row in rows:
+                rows_by_code.setdefault(row[0], []).append(row[1:])
+
+        history = {}
+        for code, rows in rows_by_code.items():
+            date, open_, high, low, close, volume, trading_value = zip(*rows)
+            history[code] = {
+                'date': np.array(date, dtype=object),
+                'open': np.array(open_, dtype=np.float64),
+                'high': np.array(high, dtype=np.float64),
+                'low': np.array(low, dtype=np.float64),
+                'close': np.array(close, dtype=np.float64),
+                'volume': np.array(volume, dtype=np.int64),
+                'trading_value': np.array(trading_value, dtype=np.int64),
+            }
+        return history
+
+    async def get_or_sync_daily_bars(self, stock_code: str, days: int = DEFAULT_WINDOW_DAYS,
+                                     history_days: int = DEFAULT_HISTORY_DAYS, include_forming: bool = False,
+                                     quote: Optional[StockQuote] = None) -> Optional[pd.DataFrame]:
+        """누락 날짜가 있을 때만 보충한 뒤 저장소에서 일봉 조회
+
+        Args:
+            include_forming: 장중이면 형성 중인 당일 봉을 0번 행에 추가 (직접 일봉 조회와 같은 형태)
+            quote: 이미 조회한 현재가 시세 - 체결 틱 집계가 없을 때 당일 봉 생성에 사용 (없으면 REST 1회 조회)
+        """
+        if self.needs_sync(stock_code):
+            await self.sync_async(stock_code, history_days)
+        daily_df = self.get_daily_bars(stock_code, days)
+        if include_forming:
+            daily_df = await self.merge_forming_bar(stock_code, daily_df, quote)
+        return daily_df
+
+    async def merge_forming_bar(self, stock_code: str, daily_df: Optional[pd.DataFrame],
+                                quote: Optional[StockQuote] = None) -> Optional[pd.DataFrame]:
+        """확정 일봉(최신일이 0번 행) 앞에 형성 중인 당일 봉 추가 - 체결 틱 집계 우선, 없으면 현재가 시세"""
+        session_date = forming_session_date()
+        if session_date is None or daily_df is None or daily_df.empty:
+            return daily_df
+        if str(daily_df['stck_bsop_date'].iloc[0]) >= session_date:
+            return daily_df
+
+        from .intraday_bars import get_intraday_bar_aggregator
+        aggregator = get_intraday_bar_aggregator()
+        if aggregator.get_forming_daily_bar(stock_code) is not None:
+            self.stats['forming_from_ticks'] += 1
+            return aggregator.merge_forming_daily_bar(stock_code, daily_df)
+
+        if quote is None:
+            try:
+                from ..api.kis_market_api import get_quote_async
+                quote = await get_quote_async("J", stock_code)
+            except Exception as e:
+                logger.debug(f"📦 {stock_code} 당일 봉 시세 조회 오류: {e}")
+                return daily_df
+
+        forming = forming_bar_from_quote(quote, session_date)
+        if forming is None:
+            return daily_df
+        self.stats['forming_from_quote'] += 1
+        today = pd.DataFrame([forming], columns=_KIS_COLUMNS)
+        return pd.concat([today, daily_df], ignore_index=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            bar_count = self._conn.execute("SELECT COUNT(*) FROM daily_bars").fetchone()[0]
+        return {
+            'db_path': str(self.db_path),
+            'stocks': len(self._synced_through),
+            'bars': bar_count,
+            'confirmed_through': last_confirmed_trading_date(),
+            **self.stats
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+# 전역 일봉 저장소 (최초 사용 시 생성)
+_ohlcv_store: Optional[OHLCVStore] = None
+_ohlcv_store_lock = threading.Lock()
+
+
+def get_ohlcv_store() -> OHLCVStore:
+    """전역 일봉 저장소 반환"""
+    global _ohlcv_store
+    if _ohlcv_store is None:
+        with _ohlcv_store_lock:
+            if _ohlcv_store is None:
+                _ohlcv_store = OHLCVStore()
+    return _ohlcv_store
+
+
+def close_ohlcv_store() -> None:
+    """전역 일봉 저장소 종료"""
+    global _ohlcv_store
+    with _ohlcv_store_lock:
+        if _ohlcv_store is not None:
+            _ohlcv_store.close()
+            _ohlcv_store = None
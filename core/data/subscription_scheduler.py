@@ -0,0 +1,302 @@
+"""
+실시간 구독 스케줄러 (KIS 웹소켓 종목 구독 한도 관리)
+
+- 종목별 가치(호출자가 정한 기본 가치 + 장중 변동폭 가산점)를 힙으로 유지하여 상위 종목을 실시간 구독
+  (고정 종목은 가치와 관계없이 먼저 배정)
+- 히스테리시스: 구독 중인 종목은 최소 유지 시간 동안 교체하지 않고, 대기 종목 가치가 일정 비율 이상 높을 때만 교체
+  (한 번의 재조정에서 교체 수도 제한하여 구독/해제 반복 방지, 고정 종목은 예외)
+- 실시간에서 밀린 종목은 가치 × 경과 시간 순으로 폴링 배치를 구성 (REST 예산 안에서 신선도 최대화)
+- 종목별 마지막 갱신 시각/소스로 데이터 신선도(staleness) 통계 제공
+
+스케줄러는 계획만 세우고 실제 구독/해제는 호출자가 수행한 뒤 mark_subscribed()/mark_unsubscribed()로 확정
+"""
+import heapq
+import itertools
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+DEFAULT_CAPACITY = 19           # KIS 웹소켓 세션당 실시간 종목 수 (체결가+호가 2건씩, 41건 제한)
+HYSTERESIS_RATIO = 0.2          # 대기 종목 가치가 교체 대상보다 20% 이상 높아야 교체
+HYSTERESIS_MARGIN = 10.0        # 비율과 함께 요구하는 최소 절대 차이
+MIN_DWELL_SECONDS = 60.0        # 구독 후 최소 유지 시간 (초)
+MAX_SWAPS_PER_REBALANCE = 3     # 재조정 1회당 최대 교체 수 (고정 종목 승격 제외)
+FRESH_SECONDS = 5.0             # 이 시간 이내 갱신된 시세를 신선한 것으로 집계 (초)
+
+VOLATILITY_WEIGHT = 10.0        # 장중 변동폭 1%당 가산점
+VOLATILITY_CAP = 100.0          # 변동폭 가산점 상한
+
+
+class SubscriptionScheduler:
+    """가치 기반 실시간 구독/폴링 배분기 (스레드 안전)"""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY,
+                 hysteresis_ratio: float = HYSTERESIS_RATIO,
+                 hysteresis_margin: float = HYSTERESIS_MARGIN,
+                 min_dwell: float = MIN_DWELL_SECONDS,
+                 max_swaps: int = MAX_SWAPS_PER_REBALANCE,
+                 fresh_seconds: float = FRESH_SECONDS):
+        self.capacity = capacity
+        self.hysteresis_ratio = hysteresis_ratio
+        self.hysteresis_margin = hysteresis_margin
+        self.min_dwell = min_dwell
+        self.max_swaps = max_swaps
+        self.fresh_seconds = fresh_seconds
+
+        self._lock = threading.Lock()
+        self._base: Dict[str, float] = {}           # 종목 → 호출자가 정한 기본 가치
+        self._bonus: Dict[str, float] = {}          # 종목 → 변동폭 가산점
+        self._pinned: set = set()                   # 항상 실시간 유지 (보유/주문 중)
+        self._polling_only: set = set()             # 실시간 배정 제외 (폴링만)
+        self._value: Dict[str, float] = {}          # 종목 → 최종 가치 (기본 + 가산점)
+
+        # 최대 힙 (-가치, 순번, 종목) - 갱신 시 새 항목을 넣고 이전 항목은 순번 불일치로 무시
+        self._heap: List[Tuple[float, int, str]] = []
+        self._entry_seq: Dict[str, int] = {}
+        self._counter = itertools.count()
+
+        self._subscribed: Dict[str, float] = {}     # 실시간 구독 종목 → 구독 시각
+        self._last_update: Dict[str, Tuple[float, str]] = {}   # 종목 → (갱신 시각, 소스)
+
+        self.stats = {
+            'rebalances': 0,
+            'subscribes': 0,
+            'unsubscribes': 0,
+            'swaps': 0,
+            'swaps_suppressed': 0,     # 히스테리시스로 보류된 교체
+            'polled': 0,
+        }
+
+    # ========== 가치 ==========
+
+    def set_value(self, stock_code: str, value: float, pinned: bool = False, realtime: bool = True) -> None:
+        """종목 기본 가치 설정 (추적 시작 포함), realtime=False면 폴링 대상으로만 관리"""
+        with self._lock:
+            self._base[stock_code] = value
+            if pinned:
+                self._pinned.add(stock_code)
+            else:
+                self._pinned.discard(stock_code)
+            if realtime:
+                self._polling_only.discard(stock_code)
+            else:
+                self._polling_only.add(stock_code)
+            self._push(stock_code)
+
+    def remove(self, stock_code: str) -> None:
+        """추적 중단 (구독 중이면 다음 재조정에서 해제 대상)"""
+        with self._lock:
+            self._base.pop(stock_code, None)
+            self._bonus.pop(stock_code, None)
+            self._value.pop(stock_code, None)
+            self._entry_seq.pop(stock_code, None)
+            self._pinned.discard(stock_code)
+            self._polling_only.discard(stock_code)
+            self._last_update.pop(stock_code, None)
+            # 힙의 항목은 순번이 없으므로 꺼낼 때 버려짐
+            if len(self._heap) > 2 * len(self._entry_seq) + 64:
+                self._compact()
+
+    def is_tracked(self, stock_code: str) -> bool:
+        return stock_code in self._base
+
+    def get_value(self, stock_code: str) -> Optional[float]:
+        return self._value.get(stock_code)
+
+    def _push(self, stock_code: str) -> None:
+        value = self._base[stock_code] + self._bonus.get(stock_code, 0.0)
+        if self._value.get(stock_code) == value and stock_code in self._entry_seq:
+            return
+        self._value[stock_code] = value
+        seq = next(self._counter)
+        self._entry_seq[stock_code] = seq
+        heapq.heappush(self._heap, (-value, seq, stock_code))
+        if len(self._heap) > 2 * len(self._entry_seq) + 64:
+            self._compact()
+
+    def _compact(self) -> None:
+        self._heap = [entry for entry in self._heap if self._entry_seq.get(entry[2]) == entry[1]]
+        heapq.heapify(self._heap)
+
+    def _top(self, limit: int) -> List[str]:
+        """실시간 배정 가능한 가치 상위 limit개 종목 (무효 항목은 꺼내면서 정리, 유효 항목은 되돌려 넣음)"""
+        taken = []
+        ranked = []
+        while self._heap and len(ranked) < limit:
+            entry = heapq.heappop(self._heap)
+            if self._entry_seq.get(entry[2]) == entry[1]:
+                taken.append(entry)
+                if entry[2] not in self._polling_only:
+                    ranked.append(entry[2])
+        for entry in taken:
+            heapq.heappush(self._heap, entry)
+        return ranked
+
+    # ========== 신선도 ==========
+
+    def record_update(self, stock_code: str, source: str, at: Optional[float] = None,
+                      price: float = 0.0, high: float = 0.0, low: float = 0.0) -> None:
+        """시세 수신 기록 (고가/저가가 있으면 변동폭 가산점 갱신)"""
+        if stock_code not in self._base:
+            return
+        with self._lock:
+            if stock_code not in self._base:
+                return
+            self._last_update[stock_code] = (at or time.time(), source)
+            if price > 0 and high > 0 and low > 0:
+                bonus = min(round((high - low) / price * 100 * VOLATILITY_WEIGHT), VOLATILITY_CAP)
+                if bonus != self._bonus.get(stock_code, 0.0):
+                    self._bonus[stock_code] = bonus
+                    self._push(stock_code)
+
+    def get_age(self, stock_code: str, now: Optional[float] = None) -> Optional[float]:
+        """마지막 갱신 후 경과 시간 (초), 한 번도 갱신되지 않았으면 None"""
+        last = self._last_update.get(stock_code)
+        if last is None:
+            return None
+        return (now or time.time()) - last[0]
+
+    # ========== 구독 계획 ==========
+
+    def rebalance(self, capacity: Optional[int] = None,
+                  now: Optional[float] = None) -> Tuple[List[str], List[str]]:
+        """(구독할 종목, 해제할 종목) 계획 - 호출자가 실행 후 mark_subscribed/mark_unsubscribed로 확정"""
+        capacity = self.capacity if capacity is None else max(capacity, 0)
+        now = now or time.time()
+
+        with self._lock:
+            self.stats['rebalances'] += 1
+            value = self._value
+            to_unsubscribe = [code for code in self._subscribed if code not in value]
+            active = [code for code in self._subscribed if code in value]
+
+            # 고정 종목은 가치 순위와 관계없이 먼저 배정 (가치 상위 밖이어도 실시간 유지), 나머지는 가치 순
+            pinned = sorted((code for code in self._pinned if code in value and code not in self._polling_only),
+                            key=lambda code: value[code], reverse=True)[:capacity]
+            ranked = pinned + [code for code in self._top(capacity) if code not in self._pinned]
+            ranked = ranked[:capacity]
+            desired = set(ranked)
+            outsiders = [code for code in ranked if code not in self._subscribed]
+
+            # 폴링 전용으로 바뀐 종목은 즉시 해제
+            for code in [code for code in active if code in self._polling_only]:
+                to_unsubscribe.append(code)
+                active.remove(code)
+
+            # 교체 후보: 목표 집합 밖의 구독 종목, 가치 낮은 순 (고정 종목 제외)
+            victims = sorted((code for code in active if code not in desired and code not in self._pinned),
+                             key=lambda code: value[code])
+
+            # 용량 축소 시 약한 종목부터 해제
+            overflow = len(active) - capacity
+            while overflow > 0 and victims:
+                victim = victims.pop(0)
+                to_unsubscribe.append(victim)
+                active.remove(victim)
+                overflow -= 1
+
+            free = capacity - len(active)
+            to_subscribe = outsiders[:max(free, 0)]
+            swaps = 0
+            for code in outsiders[len(to_subscribe):]:
+                pinned = code in self._pinned
+                eligible = [victim for victim in victims
+                            if pinned or now - self._subscribed[victim] >= self.min_dwell]
+                if not eligible:
+                    self.stats['swaps_suppressed'] += 1
+                    continue
+                victim = eligible[0]
+                better = value[code] > value[victim] * (1 + self.hysteresis_ratio) + self.hysteresis_margin
+                if not pinned and (not better or swaps >= self.max_swaps):
+                    self.stats['swaps_suppressed'] += 1
+                    continue
+                victims.remove(victim)
+                to_unsubscribe.append(victim)
+                to_subscribe.append(code)
+                if not pinned:
+                    swaps += 1
+            self.stats['swaps'] += swaps
+
+        return to_subscribe, to_unsubscribe
+
+    def mark_subscribed(self, stock_code: str, at: Optional[float] = None) -> None:
+        with self._lock:
+            if stock_code not in self._subscribed:
+                self._subscribed[stock_code] = at or time.time()
+                self.stats['subscribes'] += 1
+
+    def mark_unsubscribed(self, stock_code: str) -> None:
+        with self._lock:
+            if self._subscribed.pop(stock_code, None) is not None:
+                self.stats['unsubscribes'] += 1
+
+    def is_subscribed(self, stock_code: str) -> bool:
+        return stock_code in self._subscribed
+
+    def get_subscribed(self) -> List[str]:
+        with self._lock:
+            return list(self._subscribed)
+
+    def get_waiting(self) -> List[str]:
+        """실시간 대기 종목 (가치 높은 순)"""
+        with self._lock:
+            ranked = self._top(len(self._entry_seq))
+        return [code for code in ranked if code not in self._subscribed]
+
+    def polling_batch(self, limit: int, now: Optional[float] = None) -> List[str]:
+        """실시간이 아닌 종목 중 이번 폴링 주기에 조회할 종목 (가치 × 경과 시간 높은 순)"""
+        now = now or time.time()
+        with self._lock:
+            value = self._value
+            last_update = self._last_update
+
+            def urgency(code: str) -> float:
+                last = last_update.get(code)
+                age = now - last[0] if last else 86400.0   # 한 번도 갱신되지 않은 종목 우선
+                return max(value[code], 1.0) * (age + 1.0)
+
+            waiting = [code for code in value if code not in self._subscribed]
+            batch = heapq.nlargest(limit, waiting, key=urgency) if len(waiting) > limit else waiting
+            self.stats['polled'] += len(batch)
+        return batch
+
+    # ========== 통계 ==========
+
+    def get_staleness(self, now: Optional[float] = None) -> List[Dict[str, Any]]:
+        """종목별 신선도 (가치 높은 순)"""
+        now = now or time.time()
+        with self._lock:
+            rows = []
+            for code, value in self._value.items():
+                last = self._last_update.get(code)
+                rows.append({
+                    'stock_code': code,
+                    'value': value,
+                    'pinned': code in self._pinned,
+                    'realtime': code in self._subscribed,
+                    'age': round(now - last[0], 1) if last else None,
+                    'source': last[1] if last else None,
+                })
+        rows.sort(key=lambda row: row['value'], reverse=True)
+        return rows
+
+    def get_stats(self, now: Optional[float] = None) -> Dict[str, Any]:
+        now = now or time.time()
+        with self._lock:
+            tracked = len(self._value)
+            ages = sorted(now - self._last_update[code][0] for code in self._value if code in self._last_update)
+            fresh = sum(1 for age in ages if age <= self.fresh_seconds)
+            result = {
+                **self.stats,
+                'tracked': tracked,
+                'realtime': len(self._subscribed),
+                'pinned': len(self._pinned),
+                'never_updated': tracked - len(ages),
+                'fresh_ratio': fresh / tracked if tracked else 0.0,
+                'heap_size': len(self._heap),
+            }
+        if ages:
+            result['age_p50'] = round(ages[len(ages) // 2], 1)
+            result['age_p95'] = round(ages[min(len(ages) - 1, int(len(ages) * 0.95))], 1)
+            result['age_max'] = round(ages[-1], 1)
+        return result
@@ -40,10 +40,10 @@ class BuyOpportunityEvaluator:
                 #return
             
             # 🚨 이미 보유 중인 종목 목록 확보 (중복 매수 방지)
-            already_owned_stocks = set()
-            for candidate in self.manager.stock_manager._all_stocks.values():
-                if candidate.status in [CandleStatus.ENTERED, CandleStatus.PENDING_ORDER]:
-                    already_owned_stocks.add(candidate.stock_code)
+            already_owned_stocks = {
+                candidate.stock_code for candidate in self.manager.stock_manager.get_stocks_by_statuses(
+                    CandleStatus.ENTERED, CandleStatus.PENDING_ORDER)
+            }
             
             if already_owned_stocks:
                 logger.debug(f"🚫 이미 보유/주문 중인 종목: {len(already_owned_stocks)}개 - {', '.join(list(already_owned_stocks)[:5])}")
@@ -157,8 +157,8 @@ class BuyOpportunityEvaluator:
                         break  # 자금 부족시 추가 매수 중단
 
                     # 🎯 개별 종목 투자금액 계산
-                    current_positions = len([c for c in self.manager.stock_manager._all_stocks.values()
-                                           if c.status in [CandleStatus.ENTERED, CandleStatus.PENDING_ORDER]])
+                    current_positions = len(self.manager.stock_manager.get_stocks_by_statuses(
+                        CandleStatus.ENTERED, CandleStatus.PENDING_ORDER))
                     min_investment = self.manager.config['investment_calculation']['min_investment']
 
                     #logger.info(f"🔍 {candidate.stock_code} 투자금액 계산: 현재포지션={current_positions}개, "
@@ -402,14 +402,14 @@ class BuyOpportunityEvaluator:
         try:
             # 1. 가격 정보 (파라미터로 받거나 API 조회)
             if current_data is None:
-                from ..api.kis_market_api import get_inquire_price
-                current_data = get_inquire_price("J", candidate.stock_code)
+                from ..api.kis_market_api import get_quote
+                current_data = get_quote("J", candidate.stock_code)
 
-            if current_data is None or current_data.empty:
+            if current_data is None:
                 logger.debug(f"❌ {candidate.stock_code} 가격 정보 조회 실패")
                 return False
 
-            current_price = float(current_data.iloc[0].get('stck_prpr', 0))
+            current_price = current_data.current_price
             if current_price <= 0:
                 logger.debug(f"❌ {candidate.stock_code} 유효하지 않은 가격 {current_price}")
                 return False
@@ -418,7 +418,7 @@ class BuyOpportunityEvaluator:
 
             # 가격 업데이트
             candidate.update_price(current_price)
-            stock_info_dict = current_data.iloc[0].to_dict()
+            stock_info_dict = current_data.raw
 
             # 2. 🔍 기본 필터 체크
             if not self.manager._passes_basic_filters(current_price, stock_info_dict):
@@ -433,13 +433,10 @@ class BuyOpportunityEvaluator:
                 # 캐시된 일봉 데이터 우선 사용
                 daily_data = candidate.get_ohlcv_data()
                 if daily_data is None:
-                    # 캐시에 없으면 API 조회
-                    from ..api.kis_market_api import get_inquire_daily_itemchartprice
-                    daily_data = get_inquire_daily_itemchartprice(
-                        output_dv="2",  # 일자별 차트 데이터 배열
-                        itm_no=candidate.stock_code,
-                        period_code="D",  # 일봉
-                        adj_prc="1"
+                    # 캐시에 없으면 로컬 일봉 저장소 조회 (누락 날짜만 API 보충, 장중이면 당일 봉 포함)
+                    from ..data.ohlcv_store import get_ohlcv_store
+                    daily_data = await get_ohlcv_store().get_or_sync_daily_bars(
+                        candidate.stock_code, include_forming=True, quote=current_data
                     )
                     # 조회 성공시 캐싱
                     if daily_data is not None and not daily_data.empty:
@@ -641,15 +638,15 @@ class BuyOpportunityEvaluator:
                 return False
 
             # 🆕 최신 가격 정보 조회 (시가 포함)
-            from ..api.kis_market_api import get_inquire_price
-            current_data = get_inquire_price("J", candidate.stock_code)
-            
-            if current_data is None or current_data.empty:
+            from ..api.kis_market_api import get_quote
+            current_data = get_quote("J", candidate.stock_code)
+
+            if current_data is None:
                 logger.warning(f"❌ {candidate.stock_code} 현재가 정보 조회 실패")
                 return False
 
-            current_price = float(current_data.iloc[0].get('stck_prpr', 0))
-            today_open = float(current_data.iloc[0].get('stck_oprc', 0))
+            current_price = current_data.current_price
+            today_open = current_data.open_price
             
             if current_price <= 0:
                 logger.warning(f"❌ {candidate.stock_code} 유효하지 않은 현재가: {current_price}")
@@ -684,9 +681,9 @@ class BuyOpportunityEvaluator:
                 'entry_priority': candidate.entry_priority,
                 'pre_validated': True,  # 캔들 시스템에서 이미 검증 완료
                 # 🆕 기술적 지표 정보 추가 (진입 조건 체크에서 계산된 값들)
-                'rsi_value': getattr(candidate, '_rsi_value', None),
-                'macd_value': getattr(candidate, '_macd_value', None),
-                'volume_ratio': getattr(candidate, '_volume_ratio', None),
+                'rsi_value': candidate._rsi_value,
+                'macd_value': candidate._macd_value,
+                'volume_ratio': candidate._volume_ratio,
                 'investment_amount': int(current_price * quantity),
                 'investment_ratio': investment_amount / max(available_funds, 1) if 'available_funds' in locals() else 0.0
             }
@@ -768,7 +765,7 @@ class BuyOpportunityEvaluator:
                 return True
 
             # 3. 매수 결정 변화 (buy_decision이 바뀐 경우)
-            prev_decision = getattr(candidate, '_last_buy_decision', None)
+            prev_decision = candidate._last_buy_decision
             if prev_decision != buy_decision:
                 candidate._last_buy_decision = buy_decision
                 logger.debug(f"🚀 {candidate.stock_code} 매수 결정 변화: {prev_decision} → {buy_decision}")
@@ -11,6 +11,10 @@ from .candle_trade_candidate import (
     CandleTradeCandidate, PatternType, TradeSignal, CandlePatternInfo, CandleStatus
 )
 from .candle_pattern_detector import CandlePatternDetector
+from ..data.ohlcv_store import get_ohlcv_store
+from ..analysis.streaming_indicators import get_streaming_indicators
+from ..data.intraday_bars import get_intraday_bar_aggregator
+from ..api.kis_records import StockQuote
 from utils.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -153,6 +157,14 @@ class CandleAnalyzer:
     async def analyze_technical_indicators(self, stock_code: str, current_price: float, ohlcv_data: Optional[Any]) -> Dict:
         """📈 기술적 지표 분석"""
         try:
+            # 🚀 실시간 구독 종목은 스트리밍 지표 상태에서 바로 조회 (재계산 없음)
+            snapshot = get_streaming_indicators().get_snapshot(stock_code, current_price)
+            if snapshot and snapshot.get('ma_20') is not None and snapshot['bars'] >= 20:
+                current_rsi = snapshot['rsi']
+                ma_5, ma_20 = snapshot['ma_5'], snapshot['ma_20']
+                trend = self._classify_ma_trend(current_price, ma_5, ma_20)
+                return self._build_technical_signal(current_rsi, trend, ma_5, ma_20)
+
             # 전달받은 OHLCV 데이터 사용
             if ohlcv_data is None or ohlcv_data.empty or len(ohlcv_data) < 20:
                 return {'signal': 'neutral', 'rsi': 50.0, 'trend': 'neutral'}
@@ -176,47 +188,50 @@ class CandleAnalyzer:
             current_rsi = rsi_values[-1] if rsi_values else 50.0
 
             # 이동평균 추세
-            if len(close_prices) >= 5:
-                ma_5 = sum(close_prices[:5]) / 5
-                ma_20 = sum(close_prices[:20]) / 20 if len(close_prices) >= 20 else ma_5
-
-                if current_price > ma_5 > ma_20:
-                    trend = 'uptrend'
-                elif current_price < ma_5 < ma_20:
-                    trend = 'downtrend'
-                else:
-                    trend = 'neutral'
-            else:
-                trend = 'neutral'
-
-            # 종합 신호
-            # 🔧 config에서 RSI 임계값 가져오기
-            rsi_oversold = self.config.get('rsi_oversold_threshold', 30)
-            rsi_overbought = self.config.get('rsi_overbought_threshold', 70)
-
-            if current_rsi < rsi_oversold and trend in ['uptrend', 'neutral']:
-                signal = 'oversold_bullish'
-            elif current_rsi > rsi_overbought and trend in ['downtrend', 'neutral']:
-                signal = 'overbought_bearish'
-            elif current_rsi < rsi_oversold:
-                signal = 'oversold'
-            elif current_rsi > rsi_overbought:
-                signal = 'overbought'
-            else:
-                signal = 'neutral'
+            ma_5 = sum(close_prices[:5]) / 5
+            ma_20 = sum(close_prices[:20]) / 20 if len(close_prices) >= 20 else ma_5
+            trend = self._classify_ma_trend(current_price, ma_5, ma_20)
 
-            return {
-                'signal': signal,
-                'rsi': current_rsi,
-                'trend': trend,
-                'ma_5': ma_5 if 'ma_5' in locals() else current_price,
-                'ma_20': ma_20 if 'ma_20' in locals() else current_price
-            }
+            return self._build_technical_signal(current_rsi, trend, ma_5, ma_20)
 
         except Exception as e:
             logger.debug(f"기술적 지표 분석 오류 ({stock_code}): {e}")
             return {'signal': 'neutral', 'rsi': 50.0, 'trend': 'neutral'}
 
+    @staticmethod
+    def _classify_ma_trend(current_price: float, ma_5: float, ma_20: float) -> str:
+        """현재가와 5/20일 이동평균 배열로 추세 판단"""
+        if current_price > ma_5 > ma_20:
+            return 'uptrend'
+        elif current_price < ma_5 < ma_20:
+            return 'downtrend'
+        return 'neutral'
+
+    def _build_technical_signal(self, current_rsi: float, trend: str, ma_5: float, ma_20: float) -> Dict:
+        """RSI와 추세로 종합 기술적 신호 생성"""
+        # 🔧 config에서 RSI 임계값 가져오기
+        rsi_oversold = self.config.get('rsi_oversold_threshold', 30)
+        rsi_overbought = self.config.get('rsi_overbought_threshold', 70)
+
+        if current_rsi < rsi_oversold and trend in ['uptrend', 'neutral']:
+            signal = 'oversold_bullish'
+        elif current_rsi > rsi_overbought and trend in ['downtrend', 'neutral']:
+            signal = 'overbought_bearish'
+        elif current_rsi < rsi_oversold:
+            signal = 'oversold'
+        elif current_rsi > rsi_overbought:
+            signal = 'overbought'
+        else:
+            signal = 'neutral'
+
+        return {
+            'signal': signal,
+            'rsi': current_rsi,
+            'trend': trend,
+            'ma_5': ma_5,
+            'ma_20': ma_20
+        }
+
     def analyze_time_conditions(self, candidate: CandleTradeCandidate) -> Dict:
         """🕯️ 단순화된 시간 조건 분석 - 24시간 내에는 시간 압박 없음"""
         try:
@@ -346,20 +361,20 @@ class CandleAnalyzer:
 
 
 
-    async def quick_buy_decision(self, candidate: CandleTradeCandidate, current_data: Optional[Any] = None) -> Optional[Dict]:
+    async def quick_buy_decision(self, candidate: CandleTradeCandidate, current_data: Optional[StockQuote] = None) -> Optional[Dict]:
         """🚀 매수 실행 가능 여부 빠른 판단 - 확정된 신호 기반, 현재 가격에서 매수 가능한지만 체크"""
         try:
             stock_code = candidate.stock_code
 
             # 1️⃣ 현재가격 확보 (가장 중요!)
             if current_data is None:
-                from ..api.kis_market_api import get_inquire_price
-                current_data = get_inquire_price("J", stock_code)
+                from ..api.kis_market_api import get_quote_async
+                current_data = await get_quote_async("J", stock_code)
 
-            if current_data is None or current_data.empty:
+            if current_data is None:
                 return None
 
-            current_price = float(current_data.iloc[0].get('stck_prpr', 0))
+            current_price = current_data.current_price
             if current_price <= 0:
                 return None
 
@@ -430,7 +445,7 @@ class CandleAnalyzer:
             logger.error(f"❌ 매수 실행 가능성 판단 오류 ({candidate.stock_code}): {e}")
             return None
 
-    def _check_basic_buy_conditions(self, candidate: CandleTradeCandidate, current_price: float, current_data: Any) -> Dict:
+    def _check_basic_buy_conditions(self, candidate: CandleTradeCandidate, current_price: float, current_data: StockQuote) -> Dict:
         """🔍 기본 매수 조건 빠른 체크 - 신호 재검증 제거"""
         try:
             # 1. 가격대 체크
@@ -442,7 +457,7 @@ class CandleAnalyzer:
                 return {'passed': False, 'fail_reason': '장 시간 외'}
 
             # 3. 최소 거래량 체크
-            volume = int(current_data.iloc[0].get('acml_vol', 0))
+            volume = current_data.volume
             min_volume = self.config.get('min_volume', 10000)
             if volume < min_volume:
                 return {'passed': False, 'fail_reason': f'거래량 부족 ({volume:,}주 < {min_volume:,}주)'}
@@ -457,11 +472,11 @@ class CandleAnalyzer:
             logger.error(f"기본 매수 조건 체크 오류: {e}")
             return {'passed': False, 'fail_reason': f'체크 오류: {str(e)}'}
 
-    def _check_entry_timing_conditions(self, candidate: CandleTradeCandidate, current_price: float, current_data: Any) -> Dict:
+    def _check_entry_timing_conditions(self, candidate: CandleTradeCandidate, current_price: float, current_data: StockQuote) -> Dict:
         """⏰ 진입 타이밍 조건 체크 - 현실적인 시가 기준 적용"""
         try:
             # 오늘 시가 가져오기
-            today_open = float(current_data.iloc[0].get('stck_oprc', 0))
+            today_open = current_data.open_price
             if today_open <= 0:
                 return {'good_timing': False, 'reason': '시가 정보 없음', 'today_open': 0}
 
@@ -677,63 +692,25 @@ class CandleAnalyzer:
 
 
     async def _get_minute_candle_data(self, stock_code: str, period_minutes: int = 5, count: int = 20) -> Optional[Any]:
-        """분봉 데이터 조회 (KIS API 활용) - 최대 30분봉만 제공"""
+        """분봉 데이터 조회 - 웹소켓 체결 틱 집계 우선, 틱이 없으면 KIS API(최근 30분)로 보충"""
         try:
-            from ..api.kis_market_api import get_inquire_time_itemchartprice
-            from datetime import datetime, timedelta
-
-            # 🔧 현실적 제한: 최대 30분봉만 조회 가능 (KIS API 30건 제한)
-            now = datetime.now()
-            thirty_minutes_ago = now - timedelta(minutes=30)
-            
-            # 시간 형식 변환 (HHMMSS)
-            input_hour = thirty_minutes_ago.strftime("%H%M%S")
-            
-            logger.debug(f"📊 {stock_code} 분봉 데이터 조회: 최근 30분 (제한된 범위)")
-
-            # KIS API 호출 - 최대 30분 전부터 현재까지
-            minute_data = get_inquire_time_itemchartprice(
-                output_dv="2",              # 분봉 데이터 배열 (output2)
-                div_code="J",               # 조건시장분류코드 (J: 주식)
-                itm_no=stock_code,          # 입력종목코드
-                input_hour=input_hour,      # 30분 전 시간 설정
-                past_data_yn="Y",           # 과거데이터포함여부 (Y: 포함)
-                etc_cls_code=""             # 기타구분코드 (공백)
+            minute_data = await get_intraday_bar_aggregator().get_minute_frame_async(
+                stock_code, interval=period_minutes, count=count
             )
 
             if minute_data is not None and not minute_data.empty:
-                # 데이터 품질 확인
-                data_count = len(minute_data)
-                if data_count > 0:
-                    first_time = minute_data.iloc[0].get('stck_cntg_hour', 'N/A')
-                    last_time = minute_data.iloc[-1].get('stck_cntg_hour', 'N/A')
-                    logger.debug(f"✅ {stock_code} 분봉 데이터 조회 성공: {data_count}건 (최대 30분)")
-                    logger.debug(f"   📅 시간 범위: {first_time} ~ {last_time}")
-                    
-                    # 최신 데이터 우선 정렬 (최신순)
-                    minute_data = minute_data.sort_values('stck_cntg_hour', ascending=False).reset_index(drop=True)
-                    
-                    # count 제한 적용 (기본 20개)
-                    if data_count > count:
-                        limited_data = minute_data.head(count)
-                        logger.debug(f"   📊 데이터 제한 적용: {data_count}건 → {count}건 (최신순)")
-                        return limited_data
-                    
-                    return minute_data
-                else:
-                    logger.debug(f"⚠️ {stock_code} 분봉 데이터 조회 결과 없음")
-                    return None
-            else:
-                logger.debug(f"⚠️ {stock_code} 분봉 데이터 조회 결과 없음")
-                return None
+                logger.debug(f"✅ {stock_code} {period_minutes}분봉 {len(minute_data)}건 "
+                             f"({minute_data.iloc[-1]['stck_cntg_hour']} ~ {minute_data.iloc[0]['stck_cntg_hour']})")
+                return minute_data
+
+            logger.debug(f"⚠️ {stock_code} 분봉 데이터 조회 결과 없음")
+            return None
 
         except Exception as e:
             logger.debug(f"❌ {stock_code} 분봉 데이터 조회 오류: {e}")
             # 분봉 데이터 조회 실패시에도 장중 분석은 계속 진행
             return None
 
-
-
     def _detect_volume_surge(self, minute_data: Any) -> bool:
         """거래량 급증 감지"""
         try:
@@ -818,15 +795,10 @@ class CandleAnalyzer:
                 logger.debug(f"📊 {stock_code} 캐시된 일봉 데이터 사용")
                 return cached_data
 
-            # 🆕 최신 일봉 데이터 조회
-            logger.debug(f"📥 {stock_code} 최신 일봉 데이터 조회")
-            from ..api.kis_market_api import get_inquire_daily_itemchartprice
-            fresh_ohlcv = get_inquire_daily_itemchartprice(
-                output_dv="2",  # 일자별 차트 데이터
-                itm_no=stock_code,
-                period_code="D",
-                adj_prc="1"
-            )
+            # 🆕 로컬 일봉 저장소 조회 (누락된 확정 봉이 있을 때만 API 보충)
+            logger.debug(f"📦 {stock_code} 일봉 저장소 조회")
+            # 장중에는 형성 중인 당일 봉을 맨 앞에 추가 (저장소는 확정 봉만 보관)
+            fresh_ohlcv = await get_ohlcv_store().get_or_sync_daily_bars(stock_code, include_forming=True)
 
             if fresh_ohlcv is not None and not fresh_ohlcv.empty:
                 # 캐시 업데이트
@@ -0,0 +1,328 @@
+"""
+전체 종목 일괄 캔들 패턴 감지 엔진 (NumPy 벡터화)
+
+CandlePatternDetector의 완화된 4가지 패턴(망치형/상승장악형/관통형/아침샛별) 조건,
+신뢰도/강도 공식, 하락추세 체크를 (종목 × 일) 배열에 대해 한 번에 계산한다.
+종목별 경로(analyze_stock_patterns)와 같은 CandlePatternInfo 결과를 반환한다.
+
+배열의 일(day) 축은 종목별 경로의 전처리(_prepare_basic_data_safe) 결과와 같은 행 순서를 따른다.
+"""
+from typing import Dict, List, Optional, Any
+
+import numpy as np
+import pandas as pd
+
+from utils.logger import setup_logger
+from .candle_trade_candidate import CandlePatternInfo, PatternType
+from .candle_pattern_detector import CandlePatternDetector
+
+logger = setup_logger(__name__)
+
+_OHLC = ('open', 'high', 'low', 'close')
+_KIS_OHLC = {'open': 'stck_oprc', 'high': 'stck_hgpr', 'low': 'stck_lwpr', 'close': 'stck_clpr'}
+
+
+class BatchPatternInput:
+    """일괄 감지 입력 (종목코드 + 감지 순서로 정렬된 (종목 × 일) OHLC 배열)"""
+
+    def __init__(self, codes: List[str], lengths: np.ndarray, open_: np.ndarray,
+                 high: np.ndarray, low: np.ndarray, close: np.ndarray):
+        self.codes = codes
+        self.lengths = lengths
+        self.open = open_
+        self.high = high
+        self.low = low
+        self.close = close
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    @classmethod
+    def from_frames(cls, frames: Dict[str, pd.DataFrame]) -> "BatchPatternInput":
+        """KIS output2 형식 DataFrame(최신일이 0번 행) 묶음으로부터 생성"""
+        codes, columns = [], []
+        for code, df in frames.items():
+            if df is None or df.empty:
+                continue
+            ohlc = []
+            for name in _OHLC:
+                col = name if name in df.columns else _KIS_OHLC[name]
+                if col not in df.columns:
+                    break
+                ohlc.append(pd.to_numeric(df[col], errors='coerce').to_numpy(dtype=np.float64))
+            if len(ohlc) < 4:
+                continue
+            order = np.argsort(df.index.to_numpy(), kind='stable')[::-1]   # 전처리의 sort_index(ascending=False)
+            stacked = np.vstack(ohlc)[:, order]
+            stacked = stacked[:, ~np.isnan(stacked).any(axis=0)]    # 전처리의 dropna와 동일
+            if stacked.shape[1] == 0:
+                continue
+            codes.append(code)
+            columns.append(stacked)
+
+        width = max((c.shape[1] for c in columns), default=0)
+        matrix = np.full((4, len(codes), width), np.nan, dtype=np.float64)
+        lengths = np.zeros(len(codes), dtype=np.int64)
+        for row, stacked in enumerate(columns):
+            matrix[:, row, :stacked.shape[1]] = stacked
+            lengths[row] = stacked.shape[1]
+
+        return cls(codes, lengths, *matrix)
+
+    @classmethod
+    def from_matrix(cls, matrix: Dict[str, Any]) -> "BatchPatternInput":
+        """OHLCVStore.get_daily_matrix 결과(최신일이 0번 열, 뒤쪽 NaN 패딩)로부터 생성"""
+        lengths = np.asarray(matrix['lengths'], dtype=np.int64)
+        width = matrix['close'].shape[1] if len(lengths) else 0
+
+        # 종목별 유효 구간만 뒤집기: j번째 열 ← (length - 1 - j)번째 열
+        cols = np.arange(width)[None, :]
+        src = lengths[:, None] - 1 - cols
+        valid = src >= 0
+        src = np.where(valid, src, 0)
+
+        arrays = []
+        for name in _OHLC:
+            values = np.take_along_axis(matrix[name], src, axis=1)
+            arrays.append(np.where(valid, values, np.nan))
+
+        return cls(list(matrix['codes']), lengths, *arrays)
+
+
+class BatchCandlePatternEngine:
+    """(종목 × 일) 배열 기반 캔들 패턴 일괄 감지기"""
+
+    def __init__(self, detector: Optional[CandlePatternDetector] = None):
+        # 패턴 설정(Config)과 최종 필터링 규칙은 종목별 감지기와 공유
+        self.detector = detector or CandlePatternDetector()
+
+    # ========== 공개 API ==========
+
+    def analyze_frames(self, frames: Dict[str, pd.DataFrame]) -> Dict[str, List[CandlePatternInfo]]:
+        """종목별 DataFrame 묶음 분석 (analyze_stock_patterns와 같은 결과)"""
+        return self.analyze(BatchPatternInput.from_frames(frames))
+
+    def analyze_matrix(self, matrix: Dict[str, Any]) -> Dict[str, List[CandlePatternInfo]]:
+        """OHLCVStore.get_daily_matrix 결과 분석"""
+        return self.analyze(BatchPatternInput.from_matrix(matrix))
+
+    def analyze(self, data: BatchPatternInput) -> Dict[str, List[CandlePatternInfo]]:
+        """필터링/정렬까지 적용한 종목별 최종 패턴 (패턴이 없는 종목은 빈 리스트)"""
+        raw = self.detect(data)
+        return {code: self.detector._filter_and_sort_patterns(patterns, None) if patterns else []
+                for code, patterns in raw.items()}
+
+    def detect(self, data: BatchPatternInput) -> Dict[str, List[CandlePatternInfo]]:
+        """필터링 전 종목별 감지 패턴 (망치형 → 상승장악형 → 관통형 → 아침샛별 순서)"""
+        results: Dict[str, List[CandlePatternInfo]] = {code: [] for code in data.codes}
+        if len(data) == 0 or data.close.shape[1] < 2:
+            return results
+
+        hit_count = 0
+        with np.errstate(divide='ignore', invalid='ignore'):
+            for detector in (self._detect_hammer, self._detect_engulfing,
+                             self._detect_piercing, self._detect_morning_star):
+                for row, pattern in detector(data):
+                    results[data.codes[row]].append(pattern)
+                    hit_count += 1
+
+        logger.debug(f"🧮 일괄 패턴 감지: {len(data)}개 종목, {hit_count}개 패턴")
+        return results
+
+    # ========== 공통 계산 ==========
+
+    @staticmethod
+    def _at(values: np.ndarray, idx: np.ndarray) -> np.ndarray:
+        """종목별 열 인덱스의 값"""
+        return values[np.arange(values.shape[0]), np.minimum(idx, values.shape[1] - 1)]
+
+    def _simple_downtrend(self, data: BatchPatternInput, start_idx: int, days: int) -> np.ndarray:
+        """_check_simple_downtrend 벡터화"""
+        n = data.lengths
+        days_eff = np.where(start_idx + days >= n, n - start_idx - 1, days)
+        usable = days_eff >= 2
+
+        start_price = self._at(data.close, np.maximum(start_idx + days_eff - 1, 0))  # 과거 가격
+        end_price = self._at(data.close, np.full_like(n, start_idx))                # 최근 가격
+        decline = np.clip((start_price - end_price) / start_price, 0.0, 1.0)
+
+        return np.where(usable & (start_price > 0), decline, 0.0)
+
+    # ========== 패턴별 감지 ==========
+
+    def _detect_hammer(self, data: BatchPatternInput):
+        n = data.lengths
+        o, h, l, c = (v[:, 1] for v in (data.open, data.high, data.low, data.close))
+
+        body_size = np.abs(c - o)
+        total_range = h - l
+        lower_shadow_ratio = (np.minimum(o, c) - l) / total_range
+        upper_shadow_ratio = (h - np.maximum(o, c)) / total_range
+        body_ratio = body_size / total_range
+        close_position = (c - l) / total_range
+        downtrend = self._simple_downtrend(data, 1, 3)
+
+        # 임계값은 _detect_hammer_pattern_relaxed와 동일 (감지기의 thresholds 공유)
+        t = self.detector.thresholds
+        hit = ((n >= 3) & (total_range > 0) &
+               (lower_shadow_ratio >= t['hammer_lower_shadow_min']) & (body_ratio <= t['hammer_body_max']) &
+               (upper_shadow_ratio <= t['hammer_upper_shadow_max']) &
+               (downtrend >= t['downtrend_strength_min']) & (close_position >= 0.30))
+        if not hit.any():
+            return
+
+        confidence = 0.6 + (lower_shadow_ratio * 0.3) + (downtrend * 0.1)
+        strength = 60 + (lower_shadow_ratio * 25) + (downtrend * 15)
+        config = self.detector._get_pattern_config(PatternType.HAMMER)
+
+        for row in np.flatnonzero(hit):
+            lsr, dt = lower_shadow_ratio[row], downtrend[row]
+            yield row, CandlePatternInfo(
+                pattern_type=PatternType.HAMMER,
+                confidence=min(confidence[row], 0.9),
+                strength=min(int(strength[row]), 95),
+                description=f"망치형 - 아래꼬리:{lsr:.1%}, 하락추세:{dt:.1%}",
+                detected_at=1,
+                target_price_ratio=config['target_price_ratio'],
+                stop_loss_ratio=config['stop_loss_ratio'],
+                expected_duration_hours=config['max_hours'],
+                metadata={
+                    'lower_shadow_ratio': lsr,
+                    'body_ratio': body_ratio[row],
+                    'simple_downtrend': dt,
+                    'support_price': l[row],
+                    'config_target_pct': (config['target_price_ratio'] - 1.0) * 100,
+                    'config_stop_pct': (1.0 - config['stop_loss_ratio']) * 100
+                }
+            )
+
+    def _two_day_candles(self, data: BatchPatternInput):
+        """어제(1번 행)와 그 전날(2번 행, 데이터가 2일뿐이면 1번 행)"""
+        prev_idx = np.where(data.lengths > 2, 2, 1)
+        yesterday = tuple(v[:, 1] for v in (data.open, data.high, data.low, data.close))
+        day_before = tuple(self._at(v, prev_idx) for v in (data.open, data.high, data.low, data.close))
+        return yesterday, day_before
+
+    def _detect_engulfing(self, data: BatchPatternInput):
+        (yo, yh, yl, yc), (do, dh, dl, dc) = self._two_day_candles(data)
+
+        yesterday_body = np.abs(yc - yo)
+        day_before_body = np.abs(do - dc)
+        size_ratio = np.where(day_before_body > 0, yesterday_body / day_before_body, 1.0)
+        engulfs_open = yo <= do * 1.01
+        engulfs_close = yc >= dc * 0.99
+        downtrend = self._simple_downtrend(data, 2, 3)
+
+        t = self.detector.thresholds
+        hit = ((data.lengths >= 2) & (dc < do) & (yc > yo) &
+               (size_ratio >= t['engulfing_ratio_min']) & engulfs_open & engulfs_close &
+               (downtrend >= t['downtrend_strength_min']))
+        if not hit.any():
+            return
+
+        confidence = 0.65 + (size_ratio * 0.15) + (downtrend * 0.1)
+        strength = 65 + (size_ratio * 20) + (downtrend * 15)
+        config = self.detector._get_pattern_config(PatternType.BULLISH_ENGULFING)
+
+        for row in np.flatnonzero(hit):
+            ratio, dt = size_ratio[row], downtrend[row]
+            yield row, CandlePatternInfo(
+                pattern_type=PatternType.BULLISH_ENGULFING,
+                confidence=min(confidence[row], 0.9),
+                strength=min(int(strength[row]), 95),
+                description=f"상승장악형 - 크기비율:{ratio:.2f}, 하락추세:{dt:.1%}",
+                detected_at=1,
+                target_price_ratio=config['target_price_ratio'],
+                stop_loss_ratio=config['stop_loss_ratio'],
+                expected_duration_hours=config['max_hours'],
+                metadata={
+                    'size_ratio': ratio,
+                    'engulfs_range': (engulfs_open[row], engulfs_close[row]),
+                    'simple_downtrend': dt,
+                    'support_price': yl[row],
+                    'config_target_pct': (config['target_price_ratio'] - 1.0) * 100,
+                    'config_stop_pct': (1.0 - config['stop_loss_ratio']) * 100
+                }
+            )
+
+    def _detect_piercing(self, data: BatchPatternInput):
+        (yo, yh, yl, yc), (do, dh, dl, dc) = self._two_day_candles(data)
+
+        day_before_body = do - dc
+        penetration_ratio = (yc - dc) / day_before_body
+        gap_down = yo <= dc
+        downtrend = self._simple_downtrend(data, 2, 3)
+
+        t = self.detector.thresholds
+        hit = ((data.lengths >= 2) & (dc < do) & (yc > yo) & (day_before_body > 0) &
+               (penetration_ratio >= t['piercing_penetration_min']) & gap_down &
+               (downtrend >= t['downtrend_strength_min']))
+        if not hit.any():
+            return
+
+        confidence = 0.65 + (penetration_ratio * 0.2) + (downtrend * 0.1)
+        strength = 65 + (penetration_ratio * 25) + (downtrend * 10)
+        config = self.detector._get_pattern_config(PatternType.PIERCING_LINE)
+
+        for row in np.flatnonzero(hit):
+            ratio, dt = penetration_ratio[row], downtrend[row]
+            yield row, CandlePatternInfo(
+                pattern_type=PatternType.PIERCING_LINE,
+                confidence=min(confidence[row], 0.9),
+                strength=min(int(strength[row]), 95),
+                description=f"관통형 - 관통비율:{ratio:.1%}, 하락추세:{dt:.1%}",
+                detected_at=1,
+                target_price_ratio=config['target_price_ratio'],
+                stop_loss_ratio=config['stop_loss_ratio'],
+                expected_duration_hours=config['max_hours'],
+                metadata={
+                    'penetration_ratio': ratio,
+                    'gap_down': gap_down[row],
+                    'simple_downtrend': dt,
+                    'support_price': yl[row],
+                    'config_target_pct': (config['target_price_ratio'] - 1.0) * 100,
+                    'config_stop_pct': (1.0 - config['stop_loss_ratio']) * 100
+                }
+            )
+
+    def _detect_morning_star(self, data: BatchPatternInput):
+        if data.close.shape[1] < 3:
+            return
+
+        first_idx = np.where(data.lengths > 3, 3, 2)
+        yo, yh, yl, yc = (v[:, 1] for v in (data.open, data.high, data.low, data.close))
+        mo, mh, ml, mc = (v[:, 2] for v in (data.open, data.high, data.low, data.close))
+        fo, fc = self._at(data.open, first_idx), self._at(data.close, first_idx)
+
+        middle_range = mh - ml
+        middle_body_ratio = np.where(middle_range > 0, np.abs(mc - mo) / middle_range, 1.0)
+        yesterday_range = yh - yl
+        bullish_strength = np.where(yesterday_range > 0, np.abs(yc - yo) / yesterday_range, 0)
+        downtrend = self._simple_downtrend(data, 3, 5)
+
+        hit = ((data.lengths >= 3) & (fc < fo) & (yc > yo) &
+               (middle_body_ratio <= 0.6) & (downtrend >= 0.005) & (bullish_strength >= 0.15))
+        if not hit.any():
+            return
+
+        confidence = 0.7 + (bullish_strength * 0.15) + (downtrend * 0.1)
+        strength = 70 + (bullish_strength * 20) + (downtrend * 10)
+
+        for row in np.flatnonzero(hit):
+            middle, bullish = middle_body_ratio[row], bullish_strength[row]
+            yield row, CandlePatternInfo(
+                pattern_type=PatternType.MORNING_STAR,
+                confidence=min(confidence[row], 0.95),
+                strength=min(int(strength[row]), 95),
+                description=f"아침샛별 - 중간몸통:{middle:.1%}, 양봉강도:{bullish:.1%}",
+                detected_at=1,
+                target_price_ratio=1.06,  # 6% 목표 (종목별 경로와 동일)
+                stop_loss_ratio=0.95,     # 5% 손절
+                metadata={
+                    'middle_body_ratio': middle,
+                    'bullish_strength': bullish,
+                    'gap_condition': True,
+                    'simple_downtrend': downtrend[row],
+                    'support_price': ml[row]
+                }
+            )
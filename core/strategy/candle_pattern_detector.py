@@ -19,7 +19,11 @@ logger = setup_logger(__name__)
 class CandlePatternDetector:
     """캔들 패턴 감지 및 분석 시스템"""
 
-    def __init__(self):
+    def __init__(self, config: Optional[Dict] = None):
+        """
+        Args:
+            config: 전략 설정 딕셔너리 (생략 시 candle_strategy_config.json을 읽음, 백테스트 변형 설정용)
+        """
         # 🎯 새로운 4가지 패턴 전용 가중치 설정
         self.pattern_weights = {
             PatternType.HAMMER: 0.80,                    # 망치형 - 2% 목표
@@ -53,9 +57,13 @@ class CandlePatternDetector:
         )
         self._config_cache = None
         self._config_last_loaded = None
+        self._config_override = config
 
     def _load_config(self) -> Dict:
         """🆕 Config 파일 로드 (캐싱 적용)"""
+        if self._config_override is not None:
+            return self._config_override
+
         try:
             # 캐시된 설정이 있고 5분 이내라면 재사용
             if (self._config_cache and self._config_last_loaded and 
@@ -877,9 +885,9 @@ class CandlePatternDetector:
             
             # 🆕 현실적인 망치형 조건 (기존 relaxed에서 강화)
             conditions = {
-                'long_lower_shadow': lower_shadow_ratio >= 0.45,  # 15% → 45%로 강화
-                'small_body': body_ratio <= 0.40,               # 75% → 40%로 강화
-                'short_upper_shadow': upper_shadow_ratio <= 0.15 # 50% → 15%로 강화
+                'long_lower_shadow': lower_shadow_ratio >= self.thresholds['hammer_lower_shadow_min'],  # 15% → 45%로 강화
+                'small_body': body_ratio <= self.thresholds['hammer_body_max'],                         # 75% → 40%로 강화
+                'short_upper_shadow': upper_shadow_ratio <= self.thresholds['hammer_upper_shadow_max']  # 50% → 15%로 강화
             }
             
             if all(conditions.values()):
@@ -890,7 +898,7 @@ class CandlePatternDetector:
                 close_position = (yesterday['close'] - yesterday['low']) / total_range
                 
                 # 🔧 강화된 조건: 하락추세 1.5% 이상 AND 종가위치 30% 이상
-                if simple_downtrend >= 0.015 and close_position >= 0.30:
+                if simple_downtrend >= self.thresholds['downtrend_strength_min'] and close_position >= 0.30:
                     confidence = 0.6 + (lower_shadow_ratio * 0.3) + (simple_downtrend * 0.1)
                     strength = int(60 + (lower_shadow_ratio * 25) + (simple_downtrend * 15))
                     
@@ -953,7 +961,7 @@ class CandlePatternDetector:
             
             # 🔧 크기 비교 (0.5배 → 0.85배로 강화)
             size_ratio = yesterday_body_size / day_before_body_size if day_before_body_size > 0 else 1.0
-            size_condition = size_ratio >= 0.85  # 85% 크기 필요
+            size_condition = size_ratio >= self.thresholds['engulfing_ratio_min']  # 85% 크기 필요
             
             # 🔧 포함 조건 (1% 여유로 강화)
             engulfs_open = yesterday['open'] <= day_before['open'] * 1.01   # 1% 여유
@@ -964,7 +972,7 @@ class CandlePatternDetector:
                 simple_downtrend = self._check_simple_downtrend(df, 2, 3)
                 
                 # 🔧 하락 추세 1.5% 이상 필요 (기존 0.5%)
-                if simple_downtrend >= 0.015:
+                if simple_downtrend >= self.thresholds['downtrend_strength_min']:
                     confidence = 0.65 + (size_ratio * 0.15) + (simple_downtrend * 0.1)
                     strength = int(65 + (size_ratio * 20) + (simple_downtrend * 15))
                     
@@ -1027,7 +1035,7 @@ class CandlePatternDetector:
             # 🔧 관통 정도 (15% → 35%로 강화)
             if day_before_body > 0:
                 penetration_ratio = (yesterday['close'] - day_before['close']) / day_before_body
-                penetration_condition = penetration_ratio >= 0.35  # 35% 이상 관통
+                penetration_condition = penetration_ratio >= self.thresholds['piercing_penetration_min']  # 35% 이상 관통
             else:
                 penetration_condition = False
             
@@ -1039,7 +1047,7 @@ class CandlePatternDetector:
                 simple_downtrend = self._check_simple_downtrend(df, 2, 3)
                 
                 # 🔧 하락 추세 1.5% 이상 필요 (기존 0.5%)
-                if simple_downtrend >= 0.015:
+                if simple_downtrend >= self.thresholds['downtrend_strength_min']:
                     confidence = 0.65 + (penetration_ratio * 0.2) + (simple_downtrend * 0.1)
                     strength = int(65 + (penetration_ratio * 25) + (simple_downtrend * 10))
                     
@@ -14,6 +14,60 @@ from .candle_trade_candidate import (
 
 logger = setup_logger(__name__)
 
+_BUY_SIGNALS = (TradeSignal.STRONG_BUY, TradeSignal.BUY)
+_SELL_SIGNALS = (TradeSignal.SELL, TradeSignal.STRONG_SELL)
+
+
+class _PriorityView:
+    """점수 내림차순 힙 뷰 - 종목별 최신 항목만 유효 (지연 삭제)"""
+
+    __slots__ = ('_heap', '_current', '_seq')
+
+    def __init__(self):
+        self._heap: List[list] = []
+        self._current: Dict[str, list] = {}
+        self._seq = 0
+
+    def __len__(self) -> int:
+        return len(self._current)
+
+    def update(self, stock_code: str, score: float):
+        """점수 등록/갱신 (기존 항목은 무효화되어 조회 시 버려짐)"""
+        current = self._current.get(stock_code)
+        if current is not None and current[0] == -score:
+            return
+        self._seq += 1
+        entry = [-score, self._seq, stock_code]
+        self._current[stock_code] = entry
+        heapq.heappush(self._heap, entry)
+        if len(self._heap) > 2 * len(self._current) + 64:
+            self._heap = list(self._current.values())
+            heapq.heapify(self._heap)
+
+    def discard(self, stock_code: str):
+        self._current.pop(stock_code, None)
+
+    def clear(self):
+        self._heap.clear()
+        self._current.clear()
+
+    def top(self, limit: int, resolve) -> List[CandleTradeCandidate]:
+        """점수 높은 순으로 resolve(종목코드)가 반환한 후보를 최대 limit개 수집"""
+        result = []
+        visited = []
+        heap = self._heap
+        while heap and len(result) < limit:
+            entry = heapq.heappop(heap)
+            if self._current.get(entry[2]) is not entry:
+                continue  # 무효 항목은 영구 제거
+            visited.append(entry)
+            candidate = resolve(entry[2])
+            if candidate is not None:
+                result.append(candidate)
+        for entry in visited:
+            heapq.heappush(heap, entry)
+        return result
+
 
 class CandleStockManager:
     """캔들 전략 종목 통합 관리자 - 시간대별 전략 자동 전환"""
@@ -25,6 +79,15 @@ class CandleStockManager:
         # ========== 🎯 단일 데이터 소스 (메인 종목 저장소) ==========
         self._all_stocks: Dict[str, CandleTradeCandidate] = {}
 
+        # ========== 🆕 보조 인덱스 (추가/교체/제거/상태 전환 시 증분 유지) ==========
+        # 값은 삽입 순서를 유지하는 dict (종목코드 → None)
+        self._by_status: Dict[CandleStatus, Dict[str, None]] = defaultdict(dict)
+        self._by_signal: Dict[TradeSignal, Dict[str, None]] = defaultdict(dict)
+        self._by_pattern: Dict[PatternType, Dict[str, None]] = defaultdict(dict)
+        self._index_keys: Dict[str, Tuple[CandleStatus, TradeSignal, frozenset]] = {}
+        self._buy_view = _PriorityView()    # 매수 신호 종목 - entry_priority 순
+        self._sell_view = _PriorityView()   # 매도 신호 종목 - signal_strength 순
+
         # ========== 🆕 시간대별 전략 관리 ==========
         self._current_strategy_mode = "auto"  # "premarket", "realtime", "auto"
         self._strategy_transition_log = deque(maxlen=50)  # 전략 전환 이력
@@ -212,6 +275,7 @@ class CandleStockManager:
 
             # 종목 추가
             self._all_stocks[stock_code] = candidate
+            self._attach(candidate)
 
             # 🆕 전략별 통계 업데이트
             self._performance_stats['total_scanned'] += 1
@@ -254,6 +318,9 @@ class CandleStockManager:
 
             # 새 정보로 교체
             self._all_stocks[stock_code] = candidate
+            if old_candidate is not candidate:
+                self._detach(old_candidate)
+            self._attach(candidate)
 
             # 업데이트 이력 기록
             self._recent_updates.append({
@@ -281,6 +348,7 @@ class CandleStockManager:
 
             # 메인 저장소에서 제거
             del self._all_stocks[stock_code]
+            self._detach(candidate)
 
             # 업데이트 이력 기록
             self._recent_updates.append({
@@ -305,31 +373,33 @@ class CandleStockManager:
 
     def get_stocks_by_status(self, status: CandleStatus) -> List[CandleTradeCandidate]:
         """상태별 종목 조회"""
-        return [candidate for candidate in self._all_stocks.values() if candidate.status == status]
+        return [self._all_stocks[code] for code in self._by_status.get(status, ())]
+
+    def get_stocks_by_statuses(self, *statuses: CandleStatus) -> List[CandleTradeCandidate]:
+        """여러 상태의 종목 조회"""
+        return [self._all_stocks[code] for status in statuses for code in self._by_status.get(status, ())]
+
+    def get_status_counts(self) -> Dict[str, int]:
+        """상태별 종목 수"""
+        return {status.value: len(codes) for status, codes in self._by_status.items() if codes}
 
     def get_stocks_by_signal(self, signal: TradeSignal) -> List[CandleTradeCandidate]:
         """신호별 종목 조회"""
-        return [candidate for candidate in self._all_stocks.values() if candidate.trade_signal == signal]
+        return [self._all_stocks[code] for code in self._by_signal.get(signal, ())]
 
     def get_stocks_by_pattern(self, pattern: PatternType) -> List[CandleTradeCandidate]:
         """패턴별 종목 조회"""
-        return [candidate for candidate in self._all_stocks.values()
-                for pattern_info in candidate.detected_patterns
-                if pattern_info.pattern_type == pattern]
+        return [self._all_stocks[code] for code in self._by_pattern.get(pattern, ())]
 
     def get_top_buy_candidates(self, limit: int = 10) -> List[CandleTradeCandidate]:
         """상위 매수 후보 조회 (우선순위순)"""
         try:
-            # 🎯 직접 _all_stocks에서 매수 후보 조회 및 정렬
-            candidates = [
-                candidate for candidate in self._all_stocks.values()
-                if candidate.is_ready_for_entry() and candidate.trade_signal in [TradeSignal.STRONG_BUY, TradeSignal.BUY]
-            ]
-
-            # 진입 우선순위 순으로 정렬 (높은 순)
-            candidates.sort(key=lambda c: c.entry_priority, reverse=True)
+            # 🎯 매수 신호 힙에서 진입 우선순위 높은 순으로 진입 준비된 종목만 수집
+            def _resolve(stock_code: str) -> Optional[CandleTradeCandidate]:
+                candidate = self._all_stocks.get(stock_code)
+                return candidate if candidate is not None and candidate.is_ready_for_entry() else None
 
-            return candidates[:limit]
+            return self._buy_view.top(limit, _resolve)
 
         except Exception as e:
             logger.error(f"상위 매수 후보 조회 오류: {e}")
@@ -338,16 +408,8 @@ class CandleStockManager:
     def get_top_sell_candidates(self, limit: int = 10) -> List[CandleTradeCandidate]:
         """상위 매도 후보 조회"""
         try:
-            # 🎯 직접 _all_stocks에서 매도 후보 조회 및 정렬
-            candidates = [
-                candidate for candidate in self._all_stocks.values()
-                if candidate.trade_signal in [TradeSignal.SELL, TradeSignal.STRONG_SELL]
-            ]
-
-            # 신호 강도 순으로 정렬 (높은 순)
-            candidates.sort(key=lambda c: c.signal_strength, reverse=True)
-
-            return candidates[:limit]
+            # 🎯 매도 신호 힙에서 신호 강도 높은 순으로 수집
+            return self._sell_view.top(limit, self._all_stocks.get)
 
         except Exception as e:
             logger.error(f"상위 매도 후보 조회 오류: {e}")
@@ -361,6 +423,61 @@ class CandleStockManager:
         """관찰 중인 종목 조회"""
         return self.get_stocks_by_status(CandleStatus.WATCHING)
 
+    # ========== 🆕 보조 인덱스 관리 ==========
+
+    def _attach(self, candidate: CandleTradeCandidate):
+        """후보를 인덱스에 등록하고 이후 인덱스 필드 변경을 통지받음"""
+        candidate._index_listener = self._on_candidate_changed
+        self._reindex(candidate)
+
+    def _detach(self, candidate: CandleTradeCandidate):
+        """후보를 인덱스에서 제거 (이미 다른 후보로 교체된 경우 통지만 끊음)"""
+        candidate._index_listener = None
+        stock_code = candidate.stock_code
+        if stock_code in self._all_stocks:
+            return
+        keys = self._index_keys.pop(stock_code, None)
+        if keys is not None:
+            self._drop_keys(stock_code, keys)
+        self._buy_view.discard(stock_code)
+        self._sell_view.discard(stock_code)
+
+    def _on_candidate_changed(self, candidate: CandleTradeCandidate):
+        # 등록된 객체가 아니면 (복사본, 교체된 이전 객체) 무시
+        if self._all_stocks.get(candidate.stock_code) is candidate:
+            self._reindex(candidate)
+
+    def _reindex(self, candidate: CandleTradeCandidate):
+        stock_code = candidate.stock_code
+        keys = (candidate.status, candidate.trade_signal,
+                frozenset(p.pattern_type for p in candidate.detected_patterns))
+        old_keys = self._index_keys.get(stock_code)
+        if old_keys != keys:
+            if old_keys is not None:
+                self._drop_keys(stock_code, old_keys)
+            status, signal, patterns = keys
+            self._by_status[status][stock_code] = None
+            self._by_signal[signal][stock_code] = None
+            for pattern in patterns:
+                self._by_pattern[pattern][stock_code] = None
+            self._index_keys[stock_code] = keys
+
+        if candidate.trade_signal in _BUY_SIGNALS:
+            self._buy_view.update(stock_code, candidate.entry_priority)
+        else:
+            self._buy_view.discard(stock_code)
+        if candidate.trade_signal in _SELL_SIGNALS:
+            self._sell_view.update(stock_code, candidate.signal_strength)
+        else:
+            self._sell_view.discard(stock_code)
+
+    def _drop_keys(self, stock_code: str, keys: Tuple[CandleStatus, TradeSignal, frozenset]):
+        status, signal, patterns = keys
+        self._by_status[status].pop(stock_code, None)
+        self._by_signal[signal].pop(stock_code, None)
+        for pattern in patterns:
+            self._by_pattern[pattern].pop(stock_code, None)
+
     # ========== 실시간 업데이트 ==========
 
     def update_stock_price(self, stock_code: str, new_price: float):
@@ -466,25 +583,16 @@ class CandleStockManager:
                 if update_times:
                     last_update = max(update_times)
 
-            # 🎯 _all_stocks에서 직접 통계 계산
-            status_counts = {}
-            signal_counts = {}
-
-            for candidate in self._all_stocks.values():
-                # 상태별 카운트
-                status_key = candidate.status.value
-                status_counts[status_key] = status_counts.get(status_key, 0) + 1
-
-                # 신호별 카운트
-                signal_key = candidate.trade_signal.value
-                signal_counts[signal_key] = signal_counts.get(signal_key, 0) + 1
+            # 🎯 보조 인덱스에서 통계 계산
+            signal_counts = {signal.value: len(codes) for signal, codes in self._by_signal.items() if codes}
 
             stats = {
                 'total_stocks': len(self._all_stocks),
-                'by_status': status_counts,
+                'by_status': self.get_status_counts(),
                 'by_signal': signal_counts,
-                'active_positions': len(self.get_active_positions()),
-                'buy_ready': len([c for c in self._all_stocks.values() if c.is_ready_for_entry()]),
+                'active_positions': len(self._by_status.get(CandleStatus.ENTERED, ())),
+                'buy_ready': len([c for signal in _BUY_SIGNALS for c in self.get_stocks_by_signal(signal)
+                                  if c.is_ready_for_entry()]),
                 'top_patterns': self._get_top_patterns(),
                 'performance': self._calculate_performance_stats(),
                 'last_update': last_update
@@ -510,8 +618,8 @@ class CandleStockManager:
     def _calculate_performance_stats(self) -> Dict:
         """성과 통계 계산"""
         try:
-            completed_trades = [c for c in self._all_stocks.values()
-                              if c.status == CandleStatus.EXITED and c.performance.realized_pnl is not None]
+            completed_trades = [c for c in self.get_stocks_by_status(CandleStatus.EXITED)
+                              if c.performance.realized_pnl is not None]
 
             if not completed_trades:
                 return self._performance_stats
@@ -1,13 +1,82 @@
 """
 캔들 기반 매매 종목 정보 데이터 클래스
 """
-from dataclasses import dataclass, field
+from copy import deepcopy
+from dataclasses import dataclass, field, fields
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from operator import attrgetter
+from typing import Dict, List, Optional, Any, Tuple
 from enum import Enum
 import pandas as pd
 
 
+_object_setattr = object.__setattr__
+
+# 복사 시 공유해도 되는 불변 값 타입 (deepcopy 디스패치 생략)
+_IMMUTABLE_TYPES = (type(None), bool, int, float, str, datetime, Enum)
+
+# 복사/직렬화하지 않는 슬롯 (복사본은 None)
+_TRANSIENT_SLOTS = frozenset({'_index_listener'})
+
+
+def _slot_copy(self):
+    cls = type(self)
+    new = cls.__new__(cls)
+    for name in cls.__slots__:
+        _object_setattr(new, name, None if name in _TRANSIENT_SLOTS else getattr(self, name, None))
+    return new
+
+
+def _slot_deepcopy(self, memo):
+    cls = type(self)
+    new = cls.__new__(cls)
+    memo[id(self)] = new
+    for name in cls.__slots__:
+        value = None if name in _TRANSIENT_SLOTS else getattr(self, name, None)
+        if not isinstance(value, _IMMUTABLE_TYPES):
+            value = deepcopy(value, memo)
+        _object_setattr(new, name, value)
+    return new
+
+
+def _notifying_property(name: str, slot: str) -> property:
+    """슬롯 slot에 값을 보관하고, 값을 쓰면 인스턴스의 _notify_index()를 호출하는 필드 속성"""
+    def _set(self, value):
+        _object_setattr(self, slot, value)
+        self._notify_index()
+    return property(attrgetter(slot), _set, doc=f"{name} (변경 시 인덱스 통지)")
+
+
+def _slotted(*extra_slots: str, notify: Tuple[str, ...] = ()):
+    """dataclass를 __slots__ 클래스로 재생성하는 데코레이터
+
+    dataclass(slots=True)와 달리 필드가 아닌 런타임 속성(extra_slots)도 슬롯으로 선언할 수 있어
+    캐시/통지 콜백이 __init__/__eq__/__repr__/fields()에 섞이지 않음.
+
+    인스턴스 __dict__가 없어져 객체당 메모리가 줄고 속성 접근이 빨라짐.
+    필드 외 속성은 extra_slots로 선언해야 하며, 선언되지 않은 속성을 붙이면 AttributeError.
+    copy/deepcopy는 슬롯을 직접 복사 (불변 값은 공유, 통지 콜백은 복사하지 않음).
+
+    notify 필드는 '_'+이름 슬롯에 보관하고 같은 이름의 속성으로 노출 - 쓰기만 _notify_index()를 거치고
+    나머지 필드 쓰기와 모든 읽기는 슬롯 그대로의 속도.
+    """
+    def wrap(cls):
+        field_names = tuple(f.name for f in fields(cls))
+        cls_dict = dict(cls.__dict__)
+        cls_dict['__slots__'] = tuple(f'_{name}' if name in notify else name
+                                      for name in field_names) + extra_slots
+        for name in field_names:
+            cls_dict.pop(name, None)   # 클래스 속성 기본값 제거 (기본값은 생성된 __init__이 보관)
+        for name in notify:
+            cls_dict[name] = _notifying_property(name, f'_{name}')
+        cls_dict.pop('__dict__', None)
+        cls_dict.pop('__weakref__', None)
+        cls_dict.setdefault('__copy__', _slot_copy)
+        cls_dict.setdefault('__deepcopy__', _slot_deepcopy)
+        return type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    return wrap
+
+
 class PatternType(Enum):
     """캔들 패턴 타입"""
     HAMMER = "hammer"
@@ -44,6 +113,7 @@ class CandleStatus(Enum):
     STOPPED = "stopped"          # 손절 완료
 
 
+@_slotted()
 @dataclass
 class CandlePatternInfo:
     """캔들 패턴 정보"""
@@ -62,6 +132,7 @@ class CandlePatternInfo:
     description: str = ""          # 패턴 설명
 
 
+@_slotted()
 @dataclass
 class EntryConditions:
     """진입 조건 체크 결과"""
@@ -77,6 +148,7 @@ class EntryConditions:
     technical_indicators: Dict[str, Any] = field(default_factory=dict)  # 기술적 지표 값들
 
 
+@_slotted()
 @dataclass
 class RiskManagement:
     """리스크 관리 정보"""
@@ -93,6 +165,7 @@ class RiskManagement:
     last_trailing_update: Optional[datetime] = None
 
 
+@_slotted()
 @dataclass
 class PerformanceTracking:
     """성과 추적 정보"""
@@ -121,6 +194,23 @@ class PerformanceTracking:
     max_unrealized_loss: Optional[float] = None
 
 
+# CandleStockManager 보조 인덱스에 영향을 주는 필드 (변경 시 관리자에 통지)
+_INDEXED_FIELDS = ('status', 'trade_signal', 'detected_patterns', 'entry_priority', 'signal_strength')
+
+# 필드 외 런타임 속성 (캐시/평가 보조값) - __post_init__에서 None으로 초기화
+_RUNTIME_SLOTS = (
+    '_cached_ohlcv_data',     # 일봉 데이터 캐시 (DataFrame)
+    '_cached_minute_data',    # 분봉 데이터 캐시 (DataFrame)
+    '_last_holding_check',    # 마지막 실보유 확인 결과 {'time', 'has_holding'}
+    '_last_buy_decision',     # 직전 매수 판단 (로그 중복 방지)
+    '_rsi_value',             # 최근 RSI
+    '_macd_value',            # 최근 MACD 히스토그램
+    '_volume_ratio',          # 최근 거래량 비율
+    '_index_listener',        # CandleStockManager 인덱스 변경 통지 콜백
+)
+
+
+@_slotted(*_RUNTIME_SLOTS, notify=_INDEXED_FIELDS)
 @dataclass
 class CandleTradeCandidate:
     """캔들 기반 매매 종목 정보 - 메인 클래스"""
@@ -178,6 +268,25 @@ class CandleTradeCandidate:
     metadata: Dict[str, Any] = field(default_factory=dict)
     notes: List[str] = field(default_factory=list)
 
+    def __post_init__(self):
+        for name in _RUNTIME_SLOTS:
+            _object_setattr(self, name, None)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # 인덱스 통지 콜백은 직렬화하지 않음 (복원된 객체는 관리자에 등록되지 않은 별개 객체)
+        return {name: getattr(self, name) for name in self.__slots__ if name not in _TRANSIENT_SLOTS}
+
+    def __setstate__(self, state: Dict[str, Any]):
+        _object_setattr(self, '_index_listener', None)
+        for name, value in state.items():
+            _object_setattr(self, name, value)
+
+    def _notify_index(self):
+        """인덱스 필드 변경을 등록된 관리자에 통지 (관리자에 등록되기 전에는 무시)"""
+        listener = getattr(self, '_index_listener', None)
+        if listener is not None:
+            listener(self)
+
     # ========== 🆕 일봉 데이터 캐싱 메서드 ==========
 
     def cache_ohlcv_data(self, ohlcv_data: pd.DataFrame):
@@ -187,18 +296,17 @@ class CandleTradeCandidate:
 
     def get_ohlcv_data(self) -> Optional[pd.DataFrame]:
         """캐싱된 OHLCV 데이터 조회"""
-        return getattr(self, '_cached_ohlcv_data', None)
+        return self._cached_ohlcv_data
 
     def invalidate_ohlcv_cache(self):
         """일봉 데이터 캐시 무효화"""
-        if hasattr(self, '_cached_ohlcv_data'):
-            delattr(self, '_cached_ohlcv_data')
-        if hasattr(self, '_cached_minute_data'):
-            delattr(self, '_cached_minute_data')
+        self._cached_ohlcv_data = None
+        self._cached_minute_data = None
 
     def add_pattern(self, pattern_info: CandlePatternInfo):
         """패턴 정보 추가"""
         self.detected_patterns.append(pattern_info)
+        self._notify_index()
 
         # 가장 강한 패턴을 primary로 설정
         if not self.primary_pattern or pattern_info.strength > self.primary_pattern.strength:
@@ -416,15 +524,15 @@ class CandleTradeCandidate:
 
     def get_minute_data(self) -> Optional[pd.DataFrame]:
         """캐싱된 분봉 데이터 조회"""
-        return getattr(self, '_cached_minute_data', None)
+        return self._cached_minute_data
 
     def has_cached_ohlcv_data(self) -> bool:
         """일봉 데이터 캐시 존재 여부"""
-        return hasattr(self, '_cached_ohlcv_data') and self._cached_ohlcv_data is not None
+        return self._cached_ohlcv_data is not None
 
     def has_cached_minute_data(self) -> bool:
         """분봉 데이터 캐시 존재 여부"""
-        return hasattr(self, '_cached_minute_data') and self._cached_minute_data is not None
+        return self._cached_minute_data is not None
 
     def get_cache_info(self) -> Dict[str, Any]:
         """캐시 정보 조회"""
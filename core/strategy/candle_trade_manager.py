@@ -4,7 +4,7 @@
 import asyncio
 import time
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any, Sequence
 from core.api.rest_api_manager import KISRestAPIManager
 from utils.logger import setup_logger
 
@@ -17,6 +17,9 @@ from .candle_pattern_detector import CandlePatternDetector
 from .candle_analyzer import CandleAnalyzer
 from .market_scanner import MarketScanner
 from core.data.hybrid_data_manager import SimpleHybridDataManager
+from core.data.ohlcv_store import get_ohlcv_store
+from core.data.bulk_quote_service import get_bulk_quote_service, PRICE_FIELDS, ENTRY_FIELDS
+from core.api.kis_records import StockQuote
 from core.trading.trade_executor import TradeExecutor
 from core.websocket.kis_websocket_manager import KISWebSocketManager
 import pandas as pd
@@ -490,15 +493,9 @@ class CandleTradeManager:
                 await self._reanalyze_patterns_for_holding(candidate, existing_data)
                 return True
 
-            # OHLCV 데이터 조회
-            logger.debug(f"📥 {stock_code} OHLCV 데이터 조회 시작")
-            from ..api.kis_market_api import get_inquire_daily_itemchartprice
-            ohlcv_data = get_inquire_daily_itemchartprice(
-                output_dv="2",  # 일자별 차트 데이터 배열
-                itm_no=stock_code,
-                period_code="D",  # 일봉
-                adj_prc="1"
-            )
+            # OHLCV 데이터 조회 (로컬 일봉 저장소, 누락 날짜만 API 보충, 장중이면 당일 봉 포함)
+            logger.debug(f"📦 {stock_code} OHLCV 데이터 조회 시작")
+            ohlcv_data = await get_ohlcv_store().get_or_sync_daily_bars(stock_code, include_forming=True)
 
             if ohlcv_data is not None and not ohlcv_data.empty:
                 # 캐싱 수행
@@ -591,41 +588,17 @@ class CandleTradeManager:
             trade_id = latest_trade.get('id')
             
             if trade_id:
-                # 🆕 DB 업데이트 (직접 SQL 실행)
+                # 🆕 DB 업데이트 (쓰기 스레드에서 커밋)
                 import sqlite3
-                
+
                 try:
-                    with self.trade_db._get_connection() as conn:
-                        cursor = conn.cursor()
-                        
-                        cursor.execute("""
-                            UPDATE trades 
-                            SET pattern_type = ?, 
-                                pattern_confidence = ?, 
-                                pattern_strength = ?,
-                                rsi_value = ?,
-                                macd_value = ?,
-                                volume_ratio = ?
-                            WHERE id = ? AND trade_type = 'BUY'
-                        """, (
-                            pattern_info['pattern_type'],
-                            pattern_info['pattern_confidence'],
-                            pattern_info['pattern_strength'],
-                            pattern_info['rsi_value'],
-                            pattern_info['macd_value'],
-                            pattern_info['volume_ratio'],
-                            trade_id
-                        ))
-                        
-                        conn.commit()
-                        
-                        if cursor.rowcount > 0:
-                            logger.info(f"📝 {stock_code} 거래 레코드 패턴 정보 업데이트 완료 (ID: {trade_id})")
-                            return True
-                        else:
-                            logger.warning(f"⚠️ {stock_code} 거래 레코드 업데이트 실패 (ID: {trade_id})")
-                            return False
-                            
+                    if self.trade_db.update_trade_pattern_info(trade_id, pattern_info):
+                        logger.info(f"📝 {stock_code} 거래 레코드 패턴 정보 업데이트 완료 (ID: {trade_id})")
+                        return True
+                    else:
+                        logger.warning(f"⚠️ {stock_code} 거래 레코드 업데이트 실패 (ID: {trade_id})")
+                        return False
+
                 except sqlite3.Error as e:
                     logger.error(f"❌ {stock_code} DB 업데이트 오류: {e}")
                     return False
@@ -1130,8 +1103,7 @@ class CandleTradeManager:
         """🧹 EXITED 상태 종목들을 _all_stocks에서 제거 (메모리 정리)"""
         try:
             exited_stocks = [
-                stock_code for stock_code, candidate in self.stock_manager._all_stocks.items()
-                if candidate.status == CandleStatus.EXITED
+                candidate.stock_code for candidate in self.stock_manager.get_stocks_by_status(CandleStatus.EXITED)
             ]
 
             cleanup_count = 0
@@ -1152,8 +1124,8 @@ class CandleTradeManager:
                         except Exception as ws_error:
                             logger.debug(f"웹소켓 구독 해제 오류 ({stock_code}): {ws_error}")
 
-                    # _all_stocks에서 제거
-                    del self.stock_manager._all_stocks[stock_code]
+                    # _all_stocks에서 제거 (보조 인덱스 포함)
+                    self.stock_manager.remove_stock(stock_code)
                     cleanup_count += 1
 
                     logger.debug(f"🧹 {stock_code} EXITED 종목 제거 완료{profit_info}")
@@ -1166,10 +1138,7 @@ class CandleTradeManager:
                 
                 # 🆕 정리 후 상태 로깅
                 remaining_count = len(self.stock_manager._all_stocks)
-                status_summary = {}
-                for candidate in self.stock_manager._all_stocks.values():
-                    status = candidate.status.value
-                    status_summary[status] = status_summary.get(status, 0) + 1
+                status_summary = self.stock_manager.get_status_counts()
                 
                 logger.debug(f"🔍 정리 후 _all_stocks 상태: {status_summary} (총 {remaining_count}개)")
 
@@ -1386,28 +1355,20 @@ class CandleTradeManager:
     async def _periodic_signal_evaluation(self):
         """🔄 주기적 신호 재평가 - 30초마다 실행"""
         try:
-            # 🎯 현재 모든 종목 상태별 분류 (PENDING_ORDER, EXITED 제외)
-            all_candidates = [
-                candidate for candidate in self.stock_manager._all_stocks.values()
-                if candidate.status not in [CandleStatus.PENDING_ORDER, CandleStatus.EXITED]  # 주문 대기 중이거나 매도 완료된 종목 제외
-            ]
-
-            # 🆕 상세 상태별 분석 로깅
-            all_status_count = {}
-            for candidate in self.stock_manager._all_stocks.values():
-                status = candidate.status.value
-                all_status_count[status] = all_status_count.get(status, 0) + 1
-
+            # 🎯 상태 인덱스에서 재평가 대상 조회 (PENDING_ORDER, EXITED 제외)
+            all_status_count = self.stock_manager.get_status_counts()
             logger.debug(f"🔍 _all_stocks 전체 상태: {all_status_count} (총 {len(self.stock_manager._all_stocks)}개)")
 
-            if not all_candidates:
+            # 상태별 분류
+            watching_candidates = self.stock_manager.get_stocks_by_statuses(
+                CandleStatus.WATCHING, CandleStatus.BUY_READY, CandleStatus.SCANNING
+            )
+            entered_candidates = self.stock_manager.get_stocks_by_status(CandleStatus.ENTERED)
+
+            if not watching_candidates and not entered_candidates:
                 logger.debug("📊 평가할 종목이 없습니다 (PENDING_ORDER, EXITED 제외)")
                 return
 
-            # 상태별 분류
-            watching_candidates = [c for c in all_candidates if c.status == CandleStatus.WATCHING or c.status == CandleStatus.BUY_READY or c.status == CandleStatus.SCANNING]
-            entered_candidates = [c for c in all_candidates if c.status == CandleStatus.ENTERED]
-
             # 🆕 상세 디버깅 로깅
             watching_status_detail = {}
             for c in watching_candidates:
@@ -1434,11 +1395,36 @@ class CandleTradeManager:
                 enter_updated = await self._batch_evaluate_entered_stocks(entered_candidates)
                 logger.debug(f"✅ 진입 종목 신호 업데이트: {enter_updated}개")
 
+            # 🎯 3. 재평가 결과로 실시간 구독 슬롯 가치 갱신 (교체는 데이터 매니저 폴링 주기에 반영)
+            self._sync_subscription_values()
+
         except Exception as e:
             logger.error(f"주기적 신호 재평가 오류: {e}")
             import traceback
             logger.error(f"상세 오류:\n{traceback.format_exc()}")
 
+    # 상태별 실시간 구독 기본 가치 (보유/주문 중 종목은 고정)
+    _SUBSCRIPTION_BASE_VALUES = {
+        CandleStatus.BUY_READY: 400,
+        CandleStatus.WATCHING: 200,
+        CandleStatus.SCANNING: 100,
+    }
+    _PINNED_STATUSES = (CandleStatus.ENTERED, CandleStatus.PENDING_ORDER, CandleStatus.SELL_READY)
+
+    def _sync_subscription_values(self):
+        """후보 종목 가치(상태 + 신호 강도 + 진입 우선순위)를 데이터 매니저 구독 스케줄러에 전달"""
+        if not hasattr(self.data_manager, 'sync_stock_values'):
+            return
+
+        values = {}
+        for candidate in self.stock_manager.get_stocks_by_statuses(*self._PINNED_STATUSES):
+            values[candidate.stock_code] = (1000 + candidate.signal_strength, True)
+        for status, base in self._SUBSCRIPTION_BASE_VALUES.items():
+            for candidate in self.stock_manager.get_stocks_by_status(status):
+                values[candidate.stock_code] = (base + candidate.signal_strength + candidate.entry_priority, False)
+
+        self.data_manager.sync_stock_values('candle_trading', values)
+
     async def _batch_evaluate_watching_stocks(self, candidates: List[CandleTradeCandidate]) -> int:
         """🆕 관찰 중인 종목들 통합 처리 - 신호 업데이트 및 상태 전환"""
         try:
@@ -1457,75 +1443,56 @@ class CandleTradeManager:
 
             logger.info(f"🔍 관찰 종목 통합 처리 대상: {len(eligible_candidates)}개 (WATCHING/SCANNING/BUY_READY)")
 
-            # 🆕 Step 1: 배치별 가격 정보 조회 (API 호출 최적화)
-            batch_size = 10
-            current_data_dict = {}  # 종목별 current_data 저장
-
-            for i in range(0, len(eligible_candidates), batch_size):
-                batch = eligible_candidates[i:i + batch_size]
+            # 🆕 Step 1: 가격 정보 일괄 조회 (매수 판단에 시가/거래량까지 필요)
+            current_data_dict = await self._fetch_current_data_async(eligible_candidates, ENTRY_FIELDS)
 
-                # 🎯 배치 시작 시 가격 정보 조회
-                for candidate in batch:
-                    try:
-                        from ..api.kis_market_api import get_inquire_price
-                        current_data = get_inquire_price("J", candidate.stock_code)
-                        if current_data is not None and not current_data.empty:
-                            current_data_dict[candidate.stock_code] = current_data
-                    except Exception as e:
-                        logger.debug(f"가격 조회 오류 ({candidate.stock_code}): {e}")
+            # 🎯 Step 2: 신호(TradeSignal) 업데이트 (current_data 활용)
+            for candidate in eligible_candidates:
+                try:
+                    stock_current_data = current_data_dict.get(candidate.stock_code)
+                    if stock_current_data is None:
                         continue
 
-                # 🎯 Step 2: 신호(TradeSignal) 업데이트 (current_data 활용)
-                for candidate in batch:
-                    try:
-                        stock_current_data = current_data_dict.get(candidate.stock_code)
-                        if stock_current_data is None:
-                            continue
-
-                        # 🚀 매수 전용 빠른 판단 수행 (current_data 전달)
-                        analysis_result = await self.candle_analyzer.quick_buy_decision(
-                            candidate, current_data=stock_current_data
-                        )
-
-                        if analysis_result and self.buy_evaluator.should_update_buy_signal(candidate, analysis_result):
-                            # 🚀 매수 신호 업데이트 (quick_buy_decision 결과 처리)
-                            old_signal = candidate.trade_signal
-                            buy_decision = analysis_result['buy_decision']
-                            buy_score = analysis_result.get('buy_score', 50)
-
-                            # 매수 결정을 TradeSignal로 변환
-                            if buy_decision == 'buy':
-                                if buy_score >= 85:
-                                    new_signal = TradeSignal.STRONG_BUY
-                                else:
-                                    new_signal = TradeSignal.BUY
-                            elif buy_decision == 'wait':
-                                new_signal = TradeSignal.HOLD
-                            else:  # 'reject'
-                                new_signal = TradeSignal.HOLD
-
-                            candidate.trade_signal = new_signal
-                            candidate.signal_strength = buy_score
-                            candidate.signal_updated_at = datetime.now(self.korea_tz)
-
-                            # 우선순위 재계산
-                            candidate.entry_priority = self.candle_analyzer.calculate_entry_priority(candidate)
-
-                            # stock_manager 업데이트
-                            self.stock_manager.update_candidate(candidate)
-
-                            logger.debug(f"🔄 {candidate.stock_code} 매수 신호 업데이트: "
-                                       f"{old_signal.value} → {candidate.trade_signal.value} "
-                                       f"(점수:{buy_score}, 결정:{buy_decision})")
-                            signal_updated_count += 1
-
-                    except Exception as e:
-                        logger.debug(f"종목 신호 재평가 오류 ({candidate.stock_code}): {e}")
-                        continue
+                    # 🚀 매수 전용 빠른 판단 수행 (current_data 전달)
+                    analysis_result = await self.candle_analyzer.quick_buy_decision(
+                        candidate, current_data=stock_current_data
+                    )
+
+                    if analysis_result and self.buy_evaluator.should_update_buy_signal(candidate, analysis_result):
+                        # 🚀 매수 신호 업데이트 (quick_buy_decision 결과 처리)
+                        old_signal = candidate.trade_signal
+                        buy_decision = analysis_result['buy_decision']
+                        buy_score = analysis_result.get('buy_score', 50)
+
+                        # 매수 결정을 TradeSignal로 변환
+                        if buy_decision == 'buy':
+                            if buy_score >= 85:
+                                new_signal = TradeSignal.STRONG_BUY
+                            else:
+                                new_signal = TradeSignal.BUY
+                        elif buy_decision == 'wait':
+                            new_signal = TradeSignal.HOLD
+                        else:  # 'reject'
+                            new_signal = TradeSignal.HOLD
+
+                        candidate.trade_signal = new_signal
+                        candidate.signal_strength = buy_score
+                        candidate.signal_updated_at = datetime.now(self.korea_tz)
+
+                        # 우선순위 재계산
+                        candidate.entry_priority = self.candle_analyzer.calculate_entry_priority(candidate)
+
+                        # stock_manager 업데이트
+                        self.stock_manager.update_candidate(candidate)
+
+                        logger.debug(f"🔄 {candidate.stock_code} 매수 신호 업데이트: "
+                                   f"{old_signal.value} → {candidate.trade_signal.value} "
+                                   f"(점수:{buy_score}, 결정:{buy_decision})")
+                        signal_updated_count += 1
 
-                # API 호출 간격 조절
-                if i + batch_size < len(eligible_candidates):
-                    await asyncio.sleep(0.5)  # 0.5초 대기
+                except Exception as e:
+                    logger.debug(f"종목 신호 재평가 오류 ({candidate.stock_code}): {e}")
+                    continue
 
             # 🎯 Step 3: 상태(CandleStatus) 전환 검토 (current_data_dict 전달)
             status_changed_count = await self.buy_evaluator.evaluate_watching_stocks_for_entry(
@@ -1548,54 +1515,38 @@ class CandleTradeManager:
         """🆕 진입한 종목들 단순 매도 조건 체크 (패턴별 target/stop/max_hours 기준)"""
         try:
             updated_count = 0
-            batch_size = 10
 
-            # 배치로 나누어 처리 (API 부하 방지)
-            for i in range(0, len(candidates), batch_size):
-                batch = candidates[i:i + batch_size]
+            # 🚀 가격 정보만 일괄 조회 (분석 생략)
+            current_data_dict = await self._fetch_current_data_async(candidates)
+            current_prices = {
+                stock_code: quote.current_price
+                for stock_code, quote in current_data_dict.items() if quote.current_price > 0
+            }
 
-                # 🚀 배치 시작 시 가격 정보만 조회 (분석 생략)
-                current_prices = {}
-                for candidate in batch:
-                    try:
-                        from ..api.kis_market_api import get_inquire_price
-                        current_data = get_inquire_price("J", candidate.stock_code)
-                        if current_data is not None and not current_data.empty:
-                            current_price = float(current_data.iloc[0].get('stck_prpr', 0))
-                            if current_price > 0:
-                                current_prices[candidate.stock_code] = current_price
-                    except Exception as e:
-                        logger.debug(f"가격 조회 오류 ({candidate.stock_code}): {e}")
+            # 🎯 각 종목별 단순 매도 조건 체크
+            for candidate in candidates:
+                try:
+                    current_price = current_prices.get(candidate.stock_code)
+                    if not current_price:
                         continue
 
-                # 🎯 각 종목별 단순 매도 조건 체크
-                for candidate in batch:
-                    try:
-                        current_price = current_prices.get(candidate.stock_code)
-                        if not current_price:
-                            continue
-
-                        # 🚀 단순 매도 조건 체크 (복잡한 분석 생략)
-                        should_sell, sell_reason, new_signal = self._check_simple_sell_conditions(candidate, current_price)
+                    # 🚀 단순 매도 조건 체크 (복잡한 분석 생략)
+                    should_sell, sell_reason, new_signal = self._check_simple_sell_conditions(candidate, current_price)
 
-                        if should_sell and new_signal != candidate.trade_signal:
-                            # 매도 신호 업데이트
-                            old_signal = candidate.trade_signal
-                            candidate.trade_signal = new_signal
-                            candidate.signal_strength = 85 if new_signal == TradeSignal.STRONG_SELL else 70
-                            candidate.signal_updated_at = datetime.now(self.korea_tz)
+                    if should_sell and new_signal != candidate.trade_signal:
+                        # 매도 신호 업데이트
+                        old_signal = candidate.trade_signal
+                        candidate.trade_signal = new_signal
+                        candidate.signal_strength = 85 if new_signal == TradeSignal.STRONG_SELL else 70
+                        candidate.signal_updated_at = datetime.now(self.korea_tz)
 
-                            logger.info(f"🔄 {candidate.stock_code} 단순 매도 조건: "
-                                       f"{old_signal.value} → {new_signal.value} ({sell_reason})")
-                            updated_count += 1
-
-                    except Exception as e:
-                        logger.debug(f"진입 종목 단순 체크 오류 ({candidate.stock_code}): {e}")
-                        continue
+                        logger.info(f"🔄 {candidate.stock_code} 단순 매도 조건: "
+                                   f"{old_signal.value} → {new_signal.value} ({sell_reason})")
+                        updated_count += 1
 
-                # 배치 간 짧은 간격
-                if i + batch_size < len(candidates):
-                    await asyncio.sleep(0.3)
+                except Exception as e:
+                    logger.debug(f"진입 종목 단순 체크 오류 ({candidate.stock_code}): {e}")
+                    continue
 
             if updated_count > 0:
                 logger.debug(f"✅ 진입 종목 단순 매도 체크 완료: {updated_count}개 업데이트")
@@ -1606,6 +1557,13 @@ class CandleTradeManager:
             logger.error(f"진입 종목 단순 매도 체크 오류: {e}")
             return 0
 
+    async def _fetch_current_data_async(self, candidates: List[CandleTradeCandidate],
+                                        required_fields: Sequence[str] = PRICE_FIELDS) -> Dict[str, StockQuote]:
+        """종목별 현재가 일괄 조회 (웹소켓 → 순위 스냅샷 → 남은 종목만 동시 REST, 실패 종목은 결과에서 제외)"""
+        return await get_bulk_quote_service().fetch(
+            [candidate.stock_code for candidate in candidates], required_fields
+        )
+
     def _check_simple_sell_conditions(self, candidate: CandleTradeCandidate, current_price: float) -> Tuple[bool, str, TradeSignal]:
         """🚀 단순 매도 조건 체크 (패턴별 target/stop/max_hours 기준만)"""
         try:
@@ -1813,10 +1771,7 @@ class CandleTradeManager:
             current_time = datetime.now()
 
             # ========== 1. 웹소켓 관리 종목들의 PENDING_ORDER 상태 체크 ==========
-            pending_candidates = [
-                candidate for candidate in self.stock_manager._all_stocks.values()
-                if candidate.status == CandleStatus.PENDING_ORDER
-            ]
+            pending_candidates = self.stock_manager.get_stocks_by_status(CandleStatus.PENDING_ORDER)
 
             if pending_candidates:
                 logger.debug(f"🕐 웹소켓 관리 종목 미체결 주문 체크: {len(pending_candidates)}개")
@@ -2,8 +2,9 @@
 시장 스캔 및 캔들 패턴 감지 전용 클래스
 종목 스캔, 패턴 감지, 후보 생성 등을 담당
 """
+import time
 import asyncio
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Dict, List, Optional, Tuple, Any, TYPE_CHECKING
 import pandas as pd
 
@@ -13,6 +14,11 @@ from .candle_trade_candidate import (
 )
 from .price_position_filter import PricePositionFilter
 from .pattern_manager import PatternManager
+from ..api.kis_rate_limiter import api_priority, RateLimitPriority
+from ..data.ohlcv_store import get_ohlcv_store
+from ..data.intraday_bars import get_intraday_bar_aggregator
+from ..data.bulk_quote_service import get_bulk_quote_service
+from .candle_pattern_batch import BatchCandlePatternEngine
 from utils.logger import setup_logger
 
 # 순환 import 방지를 위한 TYPE_CHECKING 사용
@@ -21,6 +27,8 @@ if TYPE_CHECKING:
 
 logger = setup_logger(__name__)
 
+MIN_SCREENING_PATTERN_SCORE = 0.3   # 전체 스크리닝 최소 패턴 점수
+
 
 class MarketScanner:
     """시장 스캔 및 캔들 패턴 감지 전용 클래스"""
@@ -50,6 +58,11 @@ class MarketScanner:
         # 🆕 가격 위치 필터 초기화
         self.price_position_filter = PricePositionFilter(self.config)
 
+        # 🆕 전체 종목 일괄 패턴 감지 (저장소 일봉 기준, 스캔 1회 동안만 유효)
+        self.batch_pattern_engine = BatchCandlePatternEngine(self.pattern_detector)
+        self._batch_patterns: Dict[str, List[CandlePatternInfo]] = {}
+        self._batch_matrix: Optional[Dict[str, Any]] = None
+
         logger.info("✅ MarketScanner 초기화 완료 (PatternManager 포함)")
 
     def _get_current_strategy_source(self) -> str:
@@ -75,6 +88,11 @@ class MarketScanner:
 
     async def scan_and_detect_patterns(self):
         """🚀 스마트 종목 스캔 - 장전 전체 스캔 vs 장중 급등/급증 모니터링"""
+        # 스캔 중 API 호출은 LOW 우선순위 (관찰/보유 종목 및 주문 호출보다 뒤)
+        with api_priority(RateLimitPriority.LOW):
+            await self._scan_and_detect_patterns()
+
+    async def _scan_and_detect_patterns(self):
         try:
             current_time = datetime.now()
             current_hour = current_time.hour
@@ -121,6 +139,7 @@ class MarketScanner:
 
             if fluctuation_data is not None and not fluctuation_data.empty:
                 candidates.extend(fluctuation_data.head(50)['stck_shrn_iscd'].tolist())
+                get_bulk_quote_service().record_ranking(fluctuation_data)   # 관찰 종목 일괄 시세에 재사용
 
             # 거래량 급증 종목
             from ..api.kis_market_api import get_volume_rank
@@ -132,6 +151,7 @@ class MarketScanner:
 
             if volume_data is not None and not volume_data.empty:
                 candidates.extend(volume_data.head(50)['mksc_shrn_iscd'].tolist())
+                get_bulk_quote_service().record_ranking(volume_data)
 
             # 중복 제거
             unique_candidates = list(set(candidates))[:50]  # 최대 50개
@@ -143,48 +163,48 @@ class MarketScanner:
             logger.info(f"📊 {market_name} 장중 급등/급증 후보: {len(unique_candidates)}개")
 
             # 2. 후보 종목들에 대해 빠른 패턴 분석
-            new_candidates_count = 0
+            analysis_targets = []
             for stock_code in unique_candidates:
-                try:
-                    # 🚨 이미 보유/주문 중인 종목은 스캔에서 제외 (중복 매수 방지)
-                    skip_analysis = False
-
-                    if stock_code in self.manager.stock_manager._all_stocks:
-                        
-                        existing_candidate = self.manager.stock_manager._all_stocks[stock_code]
-                        
-                        # 🚨 이미 보유/주문 중인 종목은 스캔에서 완전 제외 (중복 매수 방지)
-                        if existing_candidate.status in [CandleStatus.ENTERED, CandleStatus.PENDING_ORDER]:
-                            logger.debug(f"🚫 {stock_code} 이미 보유/주문 중 - 스캔 제외 ({existing_candidate.status.value})")
-                            skip_analysis = True
-                        
-                        # 🔧 EXITED 상태도 스캔에서 제외 (당일 재매수 방지)
-                        elif existing_candidate.status == CandleStatus.EXITED:
-                            logger.debug(f"🚫 {stock_code} 당일 매도 완료 종목 - 스캔 제외 (재매수 방지)")
-                            skip_analysis = True
-                        
-                        # 🔄 WATCHING, SCANNING, BUY_READY 상태는 신호 업데이트를 위해 분석 계속
-                        else:
-                            logger.debug(f"🔄 {stock_code} 기존 관리 종목 신호 업데이트: {existing_candidate.status.value}")
-                        
+                # 🚨 이미 보유/주문 중인 종목은 스캔에서 제외 (중복 매수 방지)
+                if stock_code in self.manager.stock_manager._all_stocks:
+                    
+                    existing_candidate = self.manager.stock_manager._all_stocks[stock_code]
                     
-                    if skip_analysis:
+                    # 🚨 이미 보유/주문 중인 종목은 스캔에서 완전 제외 (중복 매수 방지)
+                    if existing_candidate.status in [CandleStatus.ENTERED, CandleStatus.PENDING_ORDER]:
+                        logger.debug(f"🚫 {stock_code} 이미 보유/주문 중 - 스캔 제외 ({existing_candidate.status.value})")
                         continue
-
-                    # 빠른 패턴 분석
-                    candidate = await self.analyze_stock_for_patterns(stock_code, market_name)
                     
-                    # 🆕 현재 시간대에 따른 전략 소스 결정
-                    strategy_source = self._get_current_strategy_source()
+                    # 🔧 EXITED 상태도 스캔에서 제외 (당일 재매수 방지)
+                    elif existing_candidate.status == CandleStatus.EXITED:
+                        logger.debug(f"🚫 {stock_code} 당일 매도 완료 종목 - 스캔 제외 (재매수 방지)")
+                        continue
                     
-                    if candidate and self.stock_manager.add_candidate(candidate, strategy_source=strategy_source):
-                        new_candidates_count += 1
-                        logger.debug(f"✅ 장중 신규 후보: {candidate.stock_code}({candidate.stock_name}) - 전략:{strategy_source}")
+                    # 🔄 WATCHING, SCANNING, BUY_READY 상태는 신호 업데이트를 위해 분석 계속
+                    else:
+                        logger.debug(f"🔄 {stock_code} 기존 관리 종목 신호 업데이트: {existing_candidate.status.value}")
 
-                except Exception as e:
-                    logger.debug(f"장중 종목 분석 오류 ({stock_code}): {e}")
+                analysis_targets.append(stock_code)
+
+            # 빠른 패턴 분석 (비동기 REST 호출로 동시 처리)
+            results = await asyncio.gather(
+                *(self.analyze_stock_for_patterns(stock_code, market_name) for stock_code in analysis_targets),
+                return_exceptions=True
+            )
+
+            # 🆕 현재 시간대에 따른 전략 소스 결정
+            strategy_source = self._get_current_strategy_source()
+
+            new_candidates_count = 0
+            for stock_code, candidate in zip(analysis_targets, results):
+                if isinstance(candidate, Exception):
+                    logger.debug(f"장중 종목 분석 오류 ({stock_code}): {candidate}")
                     continue
 
+                if candidate and self.stock_manager.add_candidate(candidate, strategy_source=strategy_source):
+                    new_candidates_count += 1
+                    logger.debug(f"✅ 장중 신규 후보: {candidate.stock_code}({candidate.stock_name}) - 전략:{strategy_source}")
+
             logger.info(f"🎯 {market_name} 장중 신규 후보: {new_candidates_count}개 추가")
 
         except Exception as e:
@@ -202,8 +222,9 @@ class MarketScanner:
             logger.info(f"📊 {market_name} 전체 종목 캔들 패턴 스캔 시작")
 
             # 🆕 1. 전체 KOSPI 종목 리스트 로드
+            # 상장주식수 1,000만주 미만은 _passes_enhanced_basic_filters에서 어차피 제외되므로 API 호출 전에 걸러냄
             from ..utils.stock_list_loader import load_kospi_stocks
-            all_kospi_stocks = load_kospi_stocks()
+            all_kospi_stocks = load_kospi_stocks(min_listed_shares=10_000_000)
 
             if not all_kospi_stocks:
                 logger.error("❌ KOSPI 종목 리스트 로드 실패")
@@ -211,11 +232,22 @@ class MarketScanner:
 
             logger.info(f"📋 전체 KOSPI 종목: {len(all_kospi_stocks)}개")
 
+            # 🆕 저장소 일봉으로 전체 종목 패턴을 한 번에 감지 → 패턴이 있는 종목만 현재가 조회
+            all_kospi_stocks = await self._prepare_batch_patterns(all_kospi_stocks)
+
             # 🆕 2. 성능 최적화된 종목 스크리닝 (30분 → 10분)
             candidates_with_scores = []
             processed_count = 0
             batch_size = 20  # 🚀 배치 크기 증가 (10 → 20)
 
+            # 🆕 CPU 단계를 프로세스 풀로 나눠 처리 (SCAN_PROCESS_WORKERS > 1, 일괄 감지 성공 시)
+            from config.settings import SCAN_PROCESS_WORKERS
+            if SCAN_PROCESS_WORKERS > 1 and self._batch_matrix is not None:
+                candidates_with_scores = await self._screen_with_process_pool(
+                    all_kospi_stocks, market_name, SCAN_PROCESS_WORKERS
+                )
+                all_kospi_stocks = []  # 아래 단일 프로세스 배치 루프 생략
+
             # 배치 단위로 처리
             for batch_start in range(0, len(all_kospi_stocks), batch_size):
                 batch_end = min(batch_start + batch_size, len(all_kospi_stocks))
@@ -224,7 +256,7 @@ class MarketScanner:
                 logger.debug(f"📊 배치 처리: {batch_start+1}-{batch_end}/{len(all_kospi_stocks)} "
                            f"종목 ({len(batch_stocks)}개)")
 
-                # 배치 내 종목들 병렬 처리
+                # 배치 내 종목들 동시 처리 (비동기 REST 호출로 이벤트 루프를 막지 않음)
                 batch_results = await self.process_full_screening_batch(batch_stocks, market_name)
 
                 # 패턴이 감지된 종목들 수집
@@ -240,9 +272,7 @@ class MarketScanner:
                                f"({processed_count/len(all_kospi_stocks)*100:.1f}%) "
                                f"- 현재 후보: {len(candidates_with_scores)}개")
 
-                # 🚀 API 대기 시간 최적화 (300ms → 100ms)
-                if batch_end < len(all_kospi_stocks):
-                    await asyncio.sleep(0.1)  # 100ms 대기 (초당 20회 제한 준수)
+                # 배치 간 대기 없음: 비동기 클라이언트가 API 호출 간격(초당 20회 제한)을 직접 관리
 
             # 🆕 3. 패턴 점수 기준으로 상위 50개 선별
             candidates_with_scores.sort(key=lambda x: x['pattern_score'], reverse=True)
@@ -268,11 +298,93 @@ class MarketScanner:
             logger.error(f"시장 {market} 전체 스캔 오류: {e}")
             import traceback
             traceback.print_exc()
+        finally:
+            self._batch_patterns = {}
+            self._batch_matrix = None
+
+    async def _prepare_batch_patterns(self, stock_codes: List[str]) -> List[str]:
+        """🆕 일봉 저장소 동기화 후 전체 종목 패턴 일괄 감지, 스크리닝 대상 종목 반환"""
+        try:
+            store = get_ohlcv_store()
+            await store.sync_many_async(stock_codes)
+
+            start = time.perf_counter()
+            matrix = store.get_daily_matrix(stock_codes)
+            self._batch_patterns = self.batch_pattern_engine.analyze_matrix(matrix)
+            self._batch_matrix = matrix
+            elapsed_ms = (time.perf_counter() - start) * 1000
+
+            # 패턴이 없는 종목은 어차피 탈락하므로 제외 (기존 후보는 캐시 일봉으로 재분석하므로 유지)
+            existing = self.stock_manager._all_stocks
+            targets = [code for code in stock_codes
+                       if code in existing or code not in self._batch_patterns or self._batch_patterns[code]]
+
+            logger.info(f"🧮 일괄 패턴 감지: {len(matrix['codes'])}개 종목 {elapsed_ms:.1f}ms "
+                        f"→ 스크리닝 대상 {len(targets)}개")
+            return targets
+
+        except Exception as e:
+            logger.warning(f"⚠️ 일괄 패턴 감지 실패 - 종목별 분석으로 진행: {e}")
+            self._batch_patterns = {}
+            self._batch_matrix = None
+            return stock_codes
+
+    async def _screen_with_process_pool(self, stock_codes: List[str], market_name: str, workers: int) -> List[Dict]:
+        """🆕 현재가 조회(I/O)는 이벤트 루프에서, 필터/패턴 점수(CPU)는 프로세스 풀에서 처리
+
+        기존 후보의 캐시 일봉을 쓰는 종목은 메인 프로세스에서 기존 방식으로 스크리닝한다.
+        """
+        from .parallel_screening import ParallelScreener
+
+        start = time.perf_counter()
+        cached_codes = [code for code in stock_codes if self._get_cached_screening_ohlcv(code) is not None]
+        cached_set = set(cached_codes)
+        pool_codes = [code for code in stock_codes
+                      if code not in cached_set and self._batch_patterns.get(code)]
+
+        # 1. 현재가 조회 + 기본 필터 (배치 단위 동시 호출, 속도는 전역 속도 제한기가 조절)
+        quotes: Dict[str, Tuple[str, float]] = {}
+        batch_size = 20
+        for batch_start in range(0, len(pool_codes), batch_size):
+            batch = pool_codes[batch_start:batch_start + batch_size]
+            results = await asyncio.gather(*(self._fetch_screening_quote(code) for code in batch),
+                                           return_exceptions=True)
+            for code, quote in zip(batch, results):
+                if quote is not None and not isinstance(quote, Exception):
+                    quotes[code] = quote
+        quote_elapsed = time.perf_counter() - start
+
+        # 2. CPU 단계 (공유 메모리 일봉 + 프로세스 풀)
+        targets = [(code, quotes[code][1], self._batch_patterns[code]) for code in pool_codes if code in quotes]
+        screener = ParallelScreener(self.config, workers=workers)
+        scored = await screener.screen(self._batch_matrix, targets)
+        cpu_elapsed = time.perf_counter() - start - quote_elapsed
+
+        # 3. 통과 종목만 전체 일봉(날짜 포함)으로 후보 생성
+        candidates_with_scores = []
+        store = get_ohlcv_store()
+        for code, patterns, pattern_score in scored:
+            ohlcv_data = store.get_daily_bars(code)
+            if ohlcv_data is None or ohlcv_data.empty:
+                continue
+            stock_name, current_price = quotes[code]
+            candidates_with_scores.append(self._build_screened_candidate(
+                code, stock_name, current_price, market_name, patterns, pattern_score, ohlcv_data
+            ))
+
+        # 4. 캐시 일봉 종목은 기존 방식
+        if cached_codes:
+            results = await self.process_full_screening_batch(cached_codes, market_name)
+            candidates_with_scores.extend(result for result in results
+                                          if result and result['candidate'] and result['pattern_score'] > 0)
+
+        logger.info(f"⚙️ 프로세스 풀 스크리닝: 현재가 {len(quotes)}/{len(pool_codes)}개 {quote_elapsed:.1f}초, "
+                    f"CPU 단계 {len(targets)}개 → {len(scored)}개 통과 {cpu_elapsed:.1f}초 (워커 {screener.workers}개), "
+                    f"캐시 일봉 {len(cached_codes)}개")
+        return candidates_with_scores
 
     async def process_full_screening_batch(self, stock_codes: List[str], market_name: str) -> List[Optional[Dict]]:
         """🆕 전체 스크리닝 배치 처리 (기본 필터링 + 패턴 분석)"""
-        import asyncio
-
         try:
             # 배치 내 모든 종목을 비동기로 동시 처리
             tasks = [
@@ -303,21 +415,20 @@ class MarketScanner:
         """개별 종목 패턴 분석"""
         try:
             # 1. 기본 정보 조회
-            from ..api.kis_market_api import get_inquire_price
-            current_info = get_inquire_price(itm_no=stock_code)
-            # ✅ DataFrame ambiguous 오류 해결
-            if current_info is None or current_info.empty:
+            from ..api.kis_market_api import get_quote_async
+            current_info = await get_quote_async(itm_no=stock_code)
+            if current_info is None:
                 return None
 
             # 기본 정보 추출
-            current_price = float(current_info.iloc[0].get('stck_prpr', 0))
-            stock_name = current_info.iloc[0].get('prdt_name', f'{stock_code}')
+            current_price = current_info.current_price
+            stock_name = current_info.get('prdt_name', f'{stock_code}')
 
             if current_price <= 0:
                 return None
 
             # 2. 기본 필터링
-            if not self._passes_basic_filters(current_price, current_info.iloc[0].to_dict()):
+            if not self._passes_basic_filters(current_price, current_info.raw):
                 return None
 
             # 🆕 3. 🚀 고성능 OHLCV 데이터 준비 (캐시 우선 + 에러 핸들링)
@@ -338,23 +449,18 @@ class MarketScanner:
                     use_cached_data = True
 
                     
-            # 캐시에 없으면 API 호출 (timeout 설정으로 성능 향상)
+            # 캐시에 없으면 로컬 일봉 저장소 조회 (누락 날짜가 있을 때만 API 보충, 장중이면 당일 봉 포함)
             if ohlcv_data is None or ohlcv_data.empty:
                 try:
-                    from ..api.kis_market_api import get_inquire_daily_itemchartprice
-                    ohlcv_data = get_inquire_daily_itemchartprice(
-                        output_dv="2",  # ✅ output2 데이터 (일자별 차트 데이터 배열) 조회
-                        itm_no=stock_code,
-                        period_code="D",  # 일봉
-                        adj_prc="1"
+                    ohlcv_data = await get_ohlcv_store().get_or_sync_daily_bars(
+                        stock_code, include_forming=True, quote=current_info
                     )
                 except Exception as e:
-                    # 🚀 API 오류 시 빠른 실패로 성능 확보
+                    # 🚀 조회 오류 시 빠른 실패로 성능 확보
                     return None
 
-                # 🆕 API 조회 성공시 로그
                 if ohlcv_data is not None and not ohlcv_data.empty:
-                    logger.debug(f"📥 {stock_code} API로 일봉 데이터 조회 완료")
+                    logger.debug(f"📦 {stock_code} 일봉 저장소 조회 완료")
                 else:
                     logger.debug(f"❌ {stock_code} 일봉 데이터 조회 실패")
 
@@ -370,25 +476,10 @@ class MarketScanner:
             minute_data = None
             if current_strategy_source == "realtime":
                 try:
-                    from ..api.kis_market_api import get_inquire_time_itemchartprice
-
-                    # 🔧 현실적 제한: 최대 30분봉만 조회 가능
-                    now = datetime.now()
-                    thirty_minutes_ago = now - timedelta(minutes=30)
-                    input_hour = thirty_minutes_ago.strftime("%H%M%S")
-
-                    minute_data = get_inquire_time_itemchartprice(
-                        output_dv="2",              # 분봉 데이터 배열
-                        div_code="J",               # 주식
-                        itm_no=stock_code,
-                        input_hour=input_hour,      # 30분 전부터 조회
-                        past_data_yn="Y",           # 과거데이터포함
-                        etc_cls_code=""             # 기타구분코드
-                    )
+                    # 웹소켓 체결 틱 집계 분봉 우선, 틱이 없는 종목만 REST(최근 30분) 조회
+                    minute_data = await get_intraday_bar_aggregator().get_minute_frame_async(stock_code, interval=1, count=30)
                     if minute_data is not None and not minute_data.empty:
-                        # 최신순 정렬
-                        minute_data = minute_data.sort_values('stck_cntg_hour', ascending=False).reset_index(drop=True)
-                        logger.debug(f"📊 {stock_code} 분봉 데이터 조회 성공: {len(minute_data)}개 (최대 30분)")
+                        logger.debug(f"📊 {stock_code} 분봉 데이터 조회 성공: {len(minute_data)}개")
                     else:
                         logger.debug(f"📊 {stock_code} 분봉 데이터 없음")
                         minute_data = None
@@ -650,186 +741,190 @@ class MarketScanner:
     # _calculate_risk_score 함수는 candle_analyzer.py로 이동됨
 
     async def analyze_stock_with_full_screening(self, stock_code: str, market_name: str) -> Optional[Dict]:
-        """🆕 🚀 고성능 개별 종목 전체 스크리닝 (빠른 실패 + 캐시 활용)"""
-        try:
-            # 🚀 1. 엑셀에서 종목 기본 정보 조회 (빠른 실패)
-            from ..utils.stock_list_loader import get_stock_info_from_excel
-            stock_excel_info = get_stock_info_from_excel(stock_code)
-            
-            if not stock_excel_info:
-                return None
-
-            stock_name = stock_excel_info['stock_name_short']
-            listed_shares = stock_excel_info['listed_shares']
-
-            # 🚀 2. 현재가 조회 (timeout 처리)
-            try:
-                from ..api.kis_market_api import get_inquire_price
-                current_info = get_inquire_price(itm_no=stock_code)
-                
-                if current_info is None or current_info.empty:
-                    return None
+        """🆕 🚀 고성능 개별 종목 전체 스크리닝 (빠른 실패 + 캐시 활용)
 
-                current_price = float(current_info.iloc[0].get('stck_prpr', 0))
-                volume = int(current_info.iloc[0].get('acml_vol', 0))
-                trading_value = int(current_info.iloc[0].get('acml_tr_pbmn', 0))
-                
-                if current_price <= 0:
-                    return None
-
-            except Exception:
-                return None  # 빠른 실패
-
-            # 🚀 3. 기본 필터링 조건 체크 (빠른 제외)
-            if not self._passes_enhanced_basic_filters(
-                current_price, volume, trading_value, listed_shares, stock_code
-            ):
+        Returns:
+            {'candidate': CandleTradeCandidate, 'pattern_score': float} 또는 None
+            (후보 등록은 scan_market_for_patterns가 점수 상위 종목만 수행)
+        """
+        try:
+            # 🚀 1~3. 종목 기본 정보 + 현재가 조회 + 기본 필터링 (빠른 실패)
+            quote = await self._fetch_screening_quote(stock_code)
+            if quote is None:
                 return None
+            stock_name, current_price = quote
 
             # 🚀 4. 캐시 우선 일봉 데이터 조회
-            ohlcv_data = None
-            use_cached = False
+            ohlcv_data = self._get_cached_screening_ohlcv(stock_code)
+            use_cached = ohlcv_data is not None
 
-            # 캐시 확인 (기존 candidate에서 OHLCV 데이터 재사용)
-            if hasattr(self.manager, 'stock_manager') and hasattr(self.manager.stock_manager, '_all_stocks'):
-                if stock_code in self.manager.stock_manager._all_stocks:
-                    existing_candidate = self.manager.stock_manager._all_stocks[stock_code]
-                    # 중요 상태 제외
-                    if existing_candidate.status not in [CandleStatus.ENTERED, CandleStatus.PENDING_ORDER]:
-                        cached_ohlcv = existing_candidate.get_ohlcv_data()
-                        if cached_ohlcv is not None and not cached_ohlcv.empty and len(cached_ohlcv) >= 20:
-                            ohlcv_data = cached_ohlcv
-                            use_cached = True
-
-            # 캐시 없으면 API 호출
+            # 캐시 없으면 로컬 일봉 저장소 조회 (확정 봉만 보관하므로 당일 제외, 누락 날짜만 API 보충)
             if ohlcv_data is None:
                 try:
-                    from ..api.kis_market_api import get_inquire_daily_itemchartprice
-                    
-                    # 시작일 (30거래일 전 approximate)
-                    start_date = (datetime.now() - timedelta(days=45)).strftime("%Y%m%d")
-                    end_date = (datetime.now() - timedelta(days=1)).strftime("%Y%m%d")  # 당일 제외
-                    
-                    ohlcv_data = get_inquire_daily_itemchartprice(
-                        output_dv="2",  # 일봉 데이터 배열
-                        itm_no=stock_code,
-                        inqr_strt_dt=start_date,
-                        inqr_end_dt=end_date,
-                        period_code="D",  # 일봉
-                        adj_prc="1"       # 원주가
-                    )
+                    ohlcv_data = await get_ohlcv_store().get_or_sync_daily_bars(stock_code)
                 except Exception:
                     return None  # 빠른 실패
 
-            if ohlcv_data is None or ohlcv_data.empty or len(ohlcv_data) < 10:
+            # 🚀 5~8. 거래량/가격 위치 필터 + 패턴 분석 + 패턴 점수 (저장소 일봉이면 일괄 감지 결과 재사용)
+            scored = self._score_screening_target(
+                stock_code, current_price, ohlcv_data,
+                None if use_cached else self._batch_patterns.get(stock_code)
+            )
+            if scored is None:
                 return None
+            pattern_result, pattern_score = scored
 
-            # 🚀 5. 거래량 필터링 (빠른 체크)
-            if not self._check_recent_volume_filter(ohlcv_data):
-                return None
+            # 🚀 9. 후보 생성
+            return self._build_screened_candidate(stock_code, stock_name, current_price, market_name,
+                                                  pattern_result, pattern_score, ohlcv_data)
 
-            # 🆕 6. 가격 위치 안전성 체크 (고점 매수 방지)
-            price_position_check = self.price_position_filter.check_price_position_safety(
-                stock_code, current_price, ohlcv_data, {'rsi_value': None}
-            )
-            
-            if not price_position_check['is_safe']:
-                risk_factors = ', '.join(price_position_check['risk_factors'])
-                logger.debug(f"🚫 {stock_code} 가격위치 필터링: {risk_factors}")
+        except Exception as e:
+            logger.error(f"❌ {stock_code} 패턴 분석 오류: {e}")
+            return None
+
+    async def _fetch_screening_quote(self, stock_code: str) -> Optional[Tuple[str, float]]:
+        """종목 기본 정보 + 현재가 조회 후 기본 필터링 통과 시 (종목명, 현재가)"""
+        # 엑셀에서 종목 기본 정보 조회 (빠른 실패)
+        from ..utils.stock_list_loader import get_stock_info_from_excel
+        stock_excel_info = get_stock_info_from_excel(stock_code)
+
+        if not stock_excel_info:
+            return None
+
+        stock_name = stock_excel_info['stock_name_short']
+        listed_shares = stock_excel_info['listed_shares']
+
+        # 현재가 조회 (timeout 처리)
+        try:
+            from ..api.kis_market_api import get_quote_async
+            current_info = await get_quote_async(itm_no=stock_code)
+
+            if current_info is None:
                 return None
-            elif price_position_check['risk_factors']:
-                # 위험 요소가 있지만 통과한 경우 로깅
-                position_summary = self.price_position_filter.get_position_summary(
-                    price_position_check['position_scores']
-                )
-                logger.debug(f"⚠️ {stock_code} 가격위치 주의: {position_summary}")
 
-            # 🚀 7. 캔들 패턴 분석 (에러 처리 강화)
-            try:
-                pattern_result = self.pattern_detector.analyze_stock_patterns(stock_code, ohlcv_data)
-                
-                if not pattern_result or len(pattern_result) == 0:
-                    return None
-            except Exception:
-                return None  # 빠른 실패
+            current_price = current_info.current_price
+            volume = current_info.volume
+            trading_value = current_info.trading_value
 
-            # 🚀 8. 패턴 점수 계산 (최적화)
-            pattern_score = self._calculate_enhanced_pattern_score(pattern_result, ohlcv_data)
-            
-            if pattern_score < 0.3:  # 최소 점수 기준
+            if current_price <= 0:
                 return None
 
-            # 🚀 9. 후보 생성 (필수 데이터만)
-            candidate = CandleTradeCandidate(
-                stock_code=stock_code,
-                stock_name=stock_name,
-                current_price=current_price,
-                market_type=market_name
-            )
+        except Exception:
+            return None  # 빠른 실패
 
-            # 패턴 정보 추가
-            for pattern in pattern_result:
-                candidate.add_pattern(pattern)
+        # 기본 필터링 조건 체크 (빠른 제외)
+        if not self._passes_enhanced_basic_filters(
+            current_price, volume, trading_value, listed_shares, stock_code
+        ):
+            return None
 
-            # 일봉 데이터 캐싱
-            candidate.cache_ohlcv_data(ohlcv_data)
+        return stock_name, current_price
+
+    def _get_cached_screening_ohlcv(self, stock_code: str) -> Optional[pd.DataFrame]:
+        """기존 후보에 캐시된 일봉 (중요 상태 제외, 20봉 이상일 때만)"""
+        if hasattr(self.manager, 'stock_manager') and hasattr(self.manager.stock_manager, '_all_stocks'):
+            existing_candidate = self.manager.stock_manager._all_stocks.get(stock_code)
+            if existing_candidate is not None and existing_candidate.status not in [CandleStatus.ENTERED, CandleStatus.PENDING_ORDER]:
+                cached_ohlcv = existing_candidate.get_ohlcv_data()
+                if cached_ohlcv is not None and not cached_ohlcv.empty and len(cached_ohlcv) >= 20:
+                    return cached_ohlcv
+        return None
+
+    def _score_screening_target(self, stock_code: str, current_price: float, ohlcv_data: Optional[pd.DataFrame],
+                                pattern_result: Optional[List[CandlePatternInfo]] = None
+                                ) -> Optional[Tuple[List[CandlePatternInfo], float]]:
+        """스크리닝 CPU 단계 - 거래량/가격 위치 필터, 패턴 분석, 패턴 점수 (프로세스 풀 워커도 사용)
+
+        Returns:
+            (패턴 목록, 패턴 점수) 또는 탈락 시 None
+        """
+        if ohlcv_data is None or ohlcv_data.empty or len(ohlcv_data) < 10:
+            return None
 
-            # 매매 신호 생성
-            trade_signal, signal_strength = self._generate_trade_signal(pattern_result)
-            candidate.trade_signal = trade_signal
-            candidate.signal_strength = signal_strength
-            candidate.signal_updated_at = datetime.now()
+        # 거래량 필터링 (빠른 체크)
+        if not self._check_recent_volume_filter(ohlcv_data):
+            return None
 
-            # 진입 우선순위 계산
-            candidate.entry_priority = self.manager.candle_analyzer.calculate_entry_priority(candidate)
+        # 🆕 가격 위치 안전성 체크 (고점 매수 방지)
+        price_position_check = self.price_position_filter.check_price_position_safety(
+            stock_code, current_price, ohlcv_data, {'rsi_value': None}
+        )
 
-            # 리스크 관리 설정
-            candidate.risk_management = self._calculate_risk_management(candidate)
+        if not price_position_check['is_safe']:
+            risk_factors = ', '.join(price_position_check['risk_factors'])
+            logger.debug(f"🚫 {stock_code} 가격위치 필터링: {risk_factors}")
+            return None
+        elif price_position_check['risk_factors']:
+            # 위험 요소가 있지만 통과한 경우 로깅
+            position_summary = self.price_position_filter.get_position_summary(
+                price_position_check['position_scores']
+            )
+            logger.debug(f"⚠️ {stock_code} 가격위치 주의: {position_summary}")
 
-            # 🆕 신호 정보 메타데이터에 저장 (신호 고정용)
-            if not hasattr(candidate, 'metadata') or candidate.metadata is None:
-                candidate.metadata = {}
-            
-            candidate.metadata.update({
-                'pattern_detected_signal': candidate.trade_signal.value,
-                'pattern_detected_strength': candidate.signal_strength,
-                'pattern_detected_time': datetime.now().isoformat(),
-                'pattern_detected_price': candidate.current_price,
-                'signal_locked': True,  # 🔒 신호 고정 플래그
-                'lock_reason': f'패턴감지시점_신호고정_{strongest_pattern.pattern_type.value}'
-            })
+        # 캔들 패턴 분석 (일괄 감지 결과가 없을 때만 종목별 감지)
+        try:
+            if pattern_result is None:
+                pattern_result = self.pattern_detector.analyze_stock_patterns(stock_code, ohlcv_data)
 
-            # 🎯 패턴 감지 성공 - 후보 종목으로 등록
-            success = self.manager.stock_manager.add_candidate(candidate, strategy_source=current_strategy_source)
-            
-            if success:
-                logger.info(f"✅ {stock_code}({stock_name}) 패턴 감지: {strongest_pattern.description} 흐름: {strongest_pattern.pattern_type.value} 신뢰도:{strongest_pattern.confidence:.2f} 강도:{strongest_pattern.strength}점")
-                return candidate
-            else:
-                logger.warning(f"⚠️ {stock_code}({stock_name}) 패턴 감지했으나 후보 등록 실패: {strongest_pattern.description}")
-                # 🆕 등록 실패 이유 상세 분석
-                existing_candidate = self.manager.stock_manager.get_stock(stock_code)
-                if existing_candidate:
-                    existing_status = existing_candidate.status.value
-                    existing_source = existing_candidate.metadata.get('strategy_source', 'unknown') if existing_candidate.metadata else 'unknown'
-                    logger.warning(f"   📋 기존 종목 정보: 상태={existing_status}, 전략소스={existing_source}")
-                    
-                    # 중요 상태인지 확인
-                    if existing_candidate.status in [CandleStatus.ENTERED, CandleStatus.PENDING_ORDER]:
-                        logger.warning(f"   🚨 중요 상태 보호로 인한 등록 거부")
-                    
-                    # 전략 소스 충돌인지 확인
-                    if current_strategy_source != existing_source:
-                        logger.warning(f"   🔄 전략 소스 충돌: {existing_source} → {current_strategy_source}")
-                else:
-                    logger.warning(f"   📊 관찰 한도 초과 또는 품질 기준 미달로 추정")
-                
+            if not pattern_result or len(pattern_result) == 0:
                 return None
+        except Exception:
+            return None  # 빠른 실패
 
-        except Exception as e:
-            logger.error(f"❌ {stock_code} 패턴 분석 오류: {e}")
+        # 패턴 점수 계산 (최적화)
+        pattern_score = self._calculate_enhanced_pattern_score(pattern_result, ohlcv_data)
+
+        if pattern_score < MIN_SCREENING_PATTERN_SCORE:
             return None
 
+        return pattern_result, pattern_score
+
+    def _build_screened_candidate(self, stock_code: str, stock_name: str, current_price: float, market_name: str,
+                                  pattern_result: List[CandlePatternInfo], pattern_score: float,
+                                  ohlcv_data: pd.DataFrame) -> Dict:
+        """스크리닝 통과 종목의 후보 생성 (신호/우선순위/리스크 설정, 감지 시점 신호 고정)"""
+        candidate = CandleTradeCandidate(
+            stock_code=stock_code,
+            stock_name=stock_name,
+            current_price=current_price,
+            market_type=market_name
+        )
+
+        # 패턴 정보 추가
+        for pattern in pattern_result:
+            candidate.add_pattern(pattern)
+
+        # 일봉 데이터 캐싱
+        candidate.cache_ohlcv_data(ohlcv_data)
+
+        # 매매 신호 생성
+        trade_signal, signal_strength = self._generate_trade_signal(pattern_result)
+        candidate.trade_signal = trade_signal
+        candidate.signal_strength = signal_strength
+        candidate.signal_updated_at = datetime.now()
+
+        # 진입 우선순위 계산
+        candidate.entry_priority = self.manager.candle_analyzer.calculate_entry_priority(candidate)
+
+        # 리스크 관리 설정
+        candidate.risk_management = self._calculate_risk_management(candidate)
+
+        # 🆕 신호 정보 메타데이터에 저장 (신호 고정용)
+        if not hasattr(candidate, 'metadata') or candidate.metadata is None:
+            candidate.metadata = {}
+
+        strongest_pattern = max(pattern_result, key=lambda p: p.strength)
+        candidate.metadata.update({
+            'pattern_detected_signal': candidate.trade_signal.value,
+            'pattern_detected_strength': candidate.signal_strength,
+            'pattern_detected_time': datetime.now().isoformat(),
+            'pattern_detected_price': candidate.current_price,
+            'signal_locked': True,  # 🔒 신호 고정 플래그
+            'lock_reason': f'패턴감지시점_신호고정_{strongest_pattern.pattern_type.value}'
+        })
+
+        return {'candidate': candidate, 'pattern_score': pattern_score}
+
     def _passes_enhanced_basic_filters(self, current_price: float, volume: int, 
                                      trading_value: int, listed_shares: int, stock_code: str) -> bool:
         """🆕 강화된 기본 필터링 (시가총액, 거래량, 가격대 등)"""
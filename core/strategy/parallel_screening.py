@@ -0,0 +1,177 @@
+"""
+프로세스 풀 스크리닝 (장전 전체 스캔의 CPU 단계)
+
+MarketScanner의 종목별 CPU 작업(거래량 필터 → 가격 위치 필터 → 패턴 점수)은 GIL 때문에 한 코어에서만 돈다.
+OHLCVStore.get_daily_matrix 결과를 공유 메모리(multiprocessing.shared_memory) 한 블록에 올리고
+워커 프로세스에는 (행 번호, 현재가, 일괄 감지 패턴) 묶음만 보내 여러 코어에서 나눠 처리한다.
+점수가 매겨진 결과는 메인 프로세스에서 후보로 만들어 CandleStockManager에 등록한다.
+"""
+import os
+import sys
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .candle_trade_candidate import CandlePatternInfo
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# 공유 메모리 블록의 필드 순서 (get_daily_matrix 키 → KIS output2 컬럼)
+_MATRIX_FIELDS = (
+    ('open', 'stck_oprc'),
+    ('high', 'stck_hgpr'),
+    ('low', 'stck_lwpr'),
+    ('close', 'stck_clpr'),
+    ('volume', 'acml_vol'),
+)
+
+# (종목코드, 현재가, 일괄 감지 패턴)
+ScreeningTarget = Tuple[str, float, List[CandlePatternInfo]]
+
+
+class SharedOHLCVMatrix:
+    """(필드 × 종목 × 일) float64 일봉 배열을 담은 공유 메모리 블록"""
+
+    def __init__(self, shm: shared_memory.SharedMemory, codes: List[str], lengths: List[int],
+                 shape: Tuple[int, int, int], owner: bool):
+        self._shm = shm
+        self.codes = codes
+        self.lengths = lengths
+        self.values = np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+        self._owner = owner
+        self._row_of = {code: row for row, code in enumerate(codes)}
+
+    @classmethod
+    def create(cls, matrix: Dict[str, Any]) -> "SharedOHLCVMatrix":
+        """get_daily_matrix 결과를 공유 메모리로 복사 (메인 프로세스, 스캔 1회당 1번)"""
+        codes = list(matrix['codes'])
+        shape = (len(_MATRIX_FIELDS), len(codes), matrix['close'].shape[1] if codes else 0)
+        shm = shared_memory.SharedMemory(create=True, size=max(1, int(np.prod(shape)) * 8))
+        shared = cls(shm, codes, [int(n) for n in matrix['lengths']], shape, owner=True)
+        for index, (name, _) in enumerate(_MATRIX_FIELDS):
+            shared.values[index] = matrix[name]
+        return shared
+
+    @classmethod
+    def attach(cls, descriptor: Dict[str, Any]) -> "SharedOHLCVMatrix":
+        """워커에서 이름으로 연결 (복사 없음, 워커는 메인 프로세스의 resource tracker를 공유하므로 해제는 메인이 담당)"""
+        shm = shared_memory.SharedMemory(name=descriptor['name'])
+        return cls(shm, descriptor['codes'], descriptor['lengths'], tuple(descriptor['shape']), owner=False)
+
+    def descriptor(self) -> Dict[str, Any]:
+        return {'name': self._shm.name, 'codes': self.codes, 'lengths': self.lengths,
+                'shape': self.values.shape}
+
+    def row(self, stock_code: str) -> Optional[int]:
+        return self._row_of.get(stock_code)
+
+    def frame(self, row: int) -> pd.DataFrame:
+        """한 종목 일봉 DataFrame (KIS output2 컬럼, 최신일이 0번 행)"""
+        length = self.lengths[row]
+        return pd.DataFrame({column: self.values[index, row, :length].copy()
+                             for index, (_, column) in enumerate(_MATRIX_FIELDS)})
+
+    def close(self) -> None:
+        self.values = None
+        self._shm.close()
+        if self._owner:
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass
+
+
+# ========== 워커 프로세스 ==========
+
+class _ScreeningHost:
+    """MarketScanner가 참조하는 CandleTradeManager 속성만 갖춘 대역 (워커는 API/DB에 연결하지 않음)"""
+
+    def __init__(self, config: Dict):
+        from .candle_pattern_detector import CandlePatternDetector
+        from utils.korean_time import KST
+        self.config = config
+        self.pattern_detector = CandlePatternDetector()
+        self.stock_manager = None
+        self.trade_db = None
+        self.websocket_manager = None
+        self.subscribed_stocks = set()
+        self.korea_tz = KST
+        self.pattern_manager = None
+
+
+_worker_scanner = None
+_worker_matrix: Optional[SharedOHLCVMatrix] = None
+
+
+def _init_screening_worker(config: Dict, log_level: str) -> None:
+    """워커 초기화 - 스캐너 1회 생성 (워커 로그는 경고 이상만)"""
+    global _worker_scanner
+    from loguru import logger as _loguru
+    _loguru.remove()
+    _loguru.add(sys.stderr, level=log_level)
+
+    from .market_scanner import MarketScanner
+    _worker_scanner = MarketScanner(_ScreeningHost(config))
+
+
+def _screen_shard(descriptor: Dict[str, Any], targets: List[ScreeningTarget]) -> List[Tuple[str, List[CandlePatternInfo], float]]:
+    """종목 묶음 CPU 스크리닝 → 통과 종목의 (종목코드, 패턴, 패턴 점수)"""
+    global _worker_matrix
+    if _worker_matrix is None or _worker_matrix.descriptor()['name'] != descriptor['name']:
+        if _worker_matrix is not None:
+            _worker_matrix.close()
+        _worker_matrix = SharedOHLCVMatrix.attach(descriptor)
+
+    passed = []
+    for stock_code, current_price, patterns in targets:
+        row = _worker_matrix.row(stock_code)
+        if row is None:
+            continue
+        scored = _worker_scanner._score_screening_target(stock_code, current_price,
+                                                         _worker_matrix.frame(row), patterns)
+        if scored is not None:
+            passed.append((stock_code, scored[0], scored[1]))
+    return passed
+
+
+# ========== 메인 프로세스 ==========
+
+class ParallelScreener:
+    """공유 메모리 일봉 + 프로세스 풀 스크리닝 실행기 (스캔 1회 동안만 풀 유지)"""
+
+    def __init__(self, config: Dict, workers: Optional[int] = None, shard_size: int = 50,
+                 log_level: str = 'WARNING'):
+        self.config = config
+        self.workers = workers or max(1, (os.cpu_count() or 2) - 1)
+        self.shard_size = shard_size
+        self.log_level = log_level
+
+    async def screen(self, matrix: Dict[str, Any], targets: List[ScreeningTarget]
+                     ) -> List[Tuple[str, List[CandlePatternInfo], float]]:
+        """대상 종목을 shard_size 단위로 나눠 워커에서 채점 (이벤트 루프는 막지 않음)"""
+        if not targets:
+            return []
+
+        shared = SharedOHLCVMatrix.create(matrix)
+        # 메인 프로세스의 스레드(웹소켓/텔레그램 등)를 fork로 복제하지 않도록 spawn 사용
+        context = multiprocessing.get_context('spawn')
+        loop = asyncio.get_running_loop()
+        try:
+            with ProcessPoolExecutor(max_workers=self.workers, mp_context=context,
+                                     initializer=_init_screening_worker,
+                                     initargs=(self.config, self.log_level)) as executor:
+                descriptor = shared.descriptor()
+                shards = [targets[i:i + self.shard_size] for i in range(0, len(targets), self.shard_size)]
+                results = await asyncio.gather(
+                    *(loop.run_in_executor(executor, _screen_shard, descriptor, shard) for shard in shards)
+                )
+        finally:
+            shared.close()
+
+        return [item for shard_result in results for item in shard_result]
@@ -10,6 +10,8 @@ from utils.logger import setup_logger
 from .candle_trade_candidate import (
     CandlePatternInfo, PatternType, TradeSignal
 )
+from ..analysis.streaming_indicators import get_streaming_indicators
+from ..data.intraday_bars import get_intraday_bar_aggregator
 
 logger = setup_logger(__name__)
 
@@ -54,6 +56,14 @@ class RealtimePatternDetector:
                 logger.warning(f"🔍 {stock_code}: 일봉 데이터 없음")
                 return patterns
 
+            # 확정 일봉만 전달된 경우 체결 틱으로 형성 중인 오늘 봉을 앞에 추가
+            bar_aggregator = get_intraday_bar_aggregator()
+            daily_ohlcv = bar_aggregator.merge_forming_daily_bar(stock_code, daily_ohlcv)
+
+            # 분봉이 전달되지 않았으면 실시간 집계 분봉 사용 (REST 호출 없음)
+            if minute_data is None and bar_aggregator.is_live(stock_code):
+                minute_data = bar_aggregator.get_minute_frame(stock_code, interval=1, count=30)
+
             # 1. 진행 중인 오늘 캔들 분석
             today_patterns = self._analyze_forming_candle(stock_code, daily_ohlcv, current_price)
             patterns.extend(today_patterns)
@@ -65,6 +75,13 @@ class RealtimePatternDetector:
 
             # 3. 실시간 필터링
             filtered_patterns = self._filter_realtime_patterns(patterns, current_price)
+
+            # 4. 스트리밍 지표값 첨부 (틱마다 갱신된 상태 조회, 재계산 없음)
+            if filtered_patterns:
+                indicators = self.get_indicator_snapshot(stock_code, current_price)
+                if indicators:
+                    for pattern in filtered_patterns:
+                        pattern.metadata['indicators'] = indicators
             
             if filtered_patterns:
                 pattern_summary = [f"{p.pattern_type.value}({p.confidence:.2f})" 
@@ -77,6 +94,18 @@ class RealtimePatternDetector:
             logger.error(f"실시간 패턴 분석 오류 ({stock_code}): {e}")
             return []
 
+    def get_indicator_snapshot(self, stock_code: str, current_price: float) -> Optional[Dict]:
+        """📈 스트리밍 지표 현재값 (RSI/MACD/볼린저/이동평균, 구독 전이면 None)"""
+        try:
+            snapshot = get_streaming_indicators().get_snapshot(stock_code, current_price)
+            if not snapshot:
+                return None
+            keys = ('rsi', 'macd', 'macd_signal', 'macd_histogram', 'bb_percent', 'ma_5', 'ma_20')
+            return {key: snapshot[key] for key in keys if snapshot.get(key) is not None}
+        except Exception as e:
+            logger.debug(f"스트리밍 지표 조회 오류 ({stock_code}): {e}")
+            return None
+
     def _prepare_realtime_data(self, ohlcv_data: pd.DataFrame) -> pd.DataFrame:
         """🔧 실시간 분석용 데이터 전처리 (KIS API 컬럼명 정규화)"""
         try:
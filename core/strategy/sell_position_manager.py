@@ -85,11 +85,7 @@ class SellPositionManager:
             # 🆕 _all_stocks에서 ENTERED 상태인 모든 종목 관리 (기존 보유 + 새로 매수)
             # 🔧 더 강화된 필터링: 실제로 관리가 필요한 종목만 선별
             entered_positions = []
-            for stock in self.manager.stock_manager._all_stocks.values():
-                # 기본 상태 체크
-                if stock.status != CandleStatus.ENTERED:
-                    continue
-                
+            for stock in self.manager.stock_manager.get_stocks_by_status(CandleStatus.ENTERED):
                 # 매도 체결 확인 완료된 종목 제외
                 if stock.metadata.get('final_exit_confirmed', False):
                     continue
@@ -98,10 +94,6 @@ class SellPositionManager:
                 if stock.metadata.get('auto_exit_reason'):
                     continue
                 
-                # PENDING_ORDER 상태로 변경된 종목 제외 (매도 주문 대기 중)
-                if stock.status == CandleStatus.PENDING_ORDER:
-                    continue
-                
                 entered_positions.append(stock)
 
             if not entered_positions:
@@ -137,7 +129,7 @@ class SellPositionManager:
                 return
 
             # 🆕 실제 보유 여부 사전 체크 (매번 API 호출하지 않고 캐시 활용)
-            if hasattr(position, '_last_holding_check'):
+            if position._last_holding_check:
                 last_check_time = position._last_holding_check.get('time', datetime.min)
                 if (datetime.now() - last_check_time).total_seconds() < 60:  # 1분 이내 체크했으면 스킵
                     if not position._last_holding_check.get('has_holding', True):
@@ -911,12 +903,11 @@ class SellPositionManager:
         """🧹 이미 매도 완료된 종목들을 정리 (시스템 관리 수량 기준)"""
         try:
             cleanup_count = 0
-            all_stocks = list(self.manager.stock_manager._all_stocks.values())
+            entered_stocks = self.manager.stock_manager.get_stocks_by_status(CandleStatus.ENTERED)
             
-            for position in all_stocks:
+            for position in entered_stocks:
                 # ENTERED 상태이지만 실제로는 보유하지 않는 종목들 정리
-                if (position.status == CandleStatus.ENTERED and 
-                    not position.metadata.get('final_exit_confirmed', False) and
+                if (not position.metadata.get('final_exit_confirmed', False) and
                     not position.metadata.get('auto_exit_reason')):
                     
                     # 🆕 시스템 관리 수량 기준으로 정리 (API 호출 제거)
@@ -2,50 +2,267 @@
 비동기 데이터 저장 시스템
 매수 시도/실패, 신호 분석 데이터를 머신러닝용으로 비동기 저장
 """
-import asyncio
+import atexit
 import sqlite3
 import json
 import time
 import threading
+from collections import deque
 from datetime import datetime
-from typing import Dict, List, Optional, Any
-from queue import Queue, Empty
+from typing import Deque, Dict, List, Optional, Any
 from pathlib import Path
 from utils.logger import setup_logger
+from .ml_parquet_sink import create_parquet_sink
 
 logger = setup_logger(__name__)
 
+_JSON = object()  # 값을 JSON 문자열로 저장하는 열 표시
+
+# 테이블별 INSERT 열 정의: (열 이름, 입력 dict 키, 기본값) - timestamp 열은 항상 맨 앞에 자동 추가
+# 기본값의 타입이 Parquet 열 타입도 결정함 (str/_JSON → string, bool → bool, 숫자 → float64)
+_SIGNAL_FIELDS = (
+    ('stock_code', 'stock_code', ''),
+    ('stock_name', 'stock_name', ''),
+    ('strategy_type', 'strategy_type', ''),
+    ('signal_strength', 'signal_strength', 0.0),
+    ('signal_threshold', 'signal_threshold', 0.0),
+    ('signal_passed', 'signal_passed', False),
+    ('signal_reason', 'signal_reason', ''),
+    ('current_price', 'current_price', 0),
+    ('open_price', 'open_price', 0),
+    ('high_price', 'high_price', 0),
+    ('low_price', 'low_price', 0),
+    ('prev_close', 'prev_close', 0),
+    ('price_change', 'price_change', 0),
+    ('price_change_pct', 'price_change_pct', 0.0),
+    ('volume', 'volume', 0),
+    ('volume_power', 'volume_power', 0.0),
+    ('avg_volume_5', 'avg_volume_5', 0),
+    ('avg_volume_20', 'avg_volume_20', 0),
+    ('avg_volume_60', 'avg_volume_60', 0),
+    ('volume_ratio_5d', 'volume_ratio_5d', 0.0),
+    ('volume_ratio_20d', 'volume_ratio_20d', 0.0),
+    ('rsi', 'rsi', 50.0),
+    ('rsi_9', 'rsi_9', 50.0),
+    ('rsi_14', 'rsi_14', 50.0),
+    ('macd', 'macd', 0.0),
+    ('macd_signal', 'macd_signal', 0.0),
+    ('macd_histogram', 'macd_histogram', 0.0),
+    ('bb_upper', 'bb_upper', 0),
+    ('bb_middle', 'bb_middle', 0),
+    ('bb_lower', 'bb_lower', 0),
+    ('bb_position', 'bb_position', 0.5),
+    ('bb_width', 'bb_width', 0.0),
+    ('ma5', 'ma5', 0),
+    ('ma10', 'ma10', 0),
+    ('ma20', 'ma20', 0),
+    ('ma60', 'ma60', 0),
+    ('ma120', 'ma120', 0),
+    ('disparity_5d', 'disparity_5d', 100.0),
+    ('disparity_10d', 'disparity_10d', 100.0),
+    ('disparity_20d', 'disparity_20d', 100.0),
+    ('disparity_60d', 'disparity_60d', 100.0),
+    ('disparity_120d', 'disparity_120d', 100.0),
+    ('momentum_5d', 'momentum_5d', 0.0),
+    ('momentum_10d', 'momentum_10d', 0.0),
+    ('momentum_20d', 'momentum_20d', 0.0),
+    ('rate_of_change', 'rate_of_change', 0.0),
+    ('volatility_5d', 'volatility_5d', 0.0),
+    ('volatility_20d', 'volatility_20d', 0.0),
+    ('atr', 'atr', 0.0),
+    ('market_cap', 'market_cap', 0),
+    ('sector', 'sector', ''),
+    ('market_type', 'market_type', ''),
+    ('listing_date', 'listing_date', ''),
+    ('foreign_ownership_pct', 'foreign_ownership_pct', 0.0),
+    ('bid_ask_spread', 'bid_ask_spread', 0.0),
+    ('bid_volume', 'bid_volume', 0),
+    ('ask_volume', 'ask_volume', 0),
+    ('bid_ask_ratio', 'bid_ask_ratio', 0.0),
+    ('hour_of_day', 'hour_of_day', 0),
+    ('minute_of_hour', 'minute_of_hour', 0),
+    ('day_of_week', 'day_of_week', 0),
+    ('is_opening_hour', 'is_opening_hour', False),
+    ('is_closing_hour', 'is_closing_hour', False),
+    ('performance_1d', 'performance_1d', 0.0),
+    ('performance_3d', 'performance_3d', 0.0),
+    ('performance_1w', 'performance_1w', 0.0),
+    ('performance_1m', 'performance_1m', 0.0),
+    ('price_1h_later', 'price_1h_later', 0),
+    ('price_4h_later', 'price_4h_later', 0),
+    ('price_1d_later', 'price_1d_later', 0),
+    ('price_1w_later', 'price_1w_later', 0),
+    ('max_price_24h', 'max_price_24h', 0),
+    ('min_price_24h', 'min_price_24h', 0),
+    ('raw_data_json', 'raw_data', _JSON),
+)
+
+_BUY_ATTEMPT_FIELDS = (
+    ('stock_code', 'stock_code', ''),
+    ('stock_name', 'stock_name', ''),
+    ('attempt_result', 'attempt_result', ''),
+    ('failure_reason', 'failure_reason', ''),
+    ('signal_strength', 'signal_strength', 0.0),
+    ('strategy_type', 'strategy_type', ''),
+    ('signal_data_json', 'signal_data', _JSON),
+    ('buy_price', 'buy_price', 0),
+    ('quantity', 'quantity', 0),
+    ('total_amount', 'total_amount', 0),
+    ('validation_checks', 'validation_checks', _JSON),
+    ('market_condition', 'market_condition', ''),
+    ('portfolio_status', 'portfolio_status', ''),
+    ('available_cash', 'available_cash', 0),
+)
+
+_MARKET_FIELDS = (
+    ('kospi_value', 'kospi_value', 0.0),
+    ('kosdaq_value', 'kosdaq_value', 0.0),
+    ('kospi_change_pct', 'kospi_change_pct', 0.0),
+    ('kosdaq_change_pct', 'kosdaq_change_pct', 0.0),
+    ('kospi_volume', 'kospi_volume', 0),
+    ('kosdaq_volume', 'kosdaq_volume', 0),
+    ('rising_stocks', 'rising_stocks', 0),
+    ('falling_stocks', 'falling_stocks', 0),
+    ('unchanged_stocks', 'unchanged_stocks', 0),
+    ('market_volatility', 'market_volatility', 0.0),
+    ('vix_korea', 'vix_korea', 0.0),
+    ('hour_of_day', 'hour_of_day', 0),
+    ('is_opening', 'is_opening', False),
+    ('is_closing', 'is_closing', False),
+)
+
+_json_encoder = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'), default=str)
+
+
+def _encode_json(value) -> str:
+    """JSON 직렬화 (키가 없으면 '{}', 빈 리스트 등 나머지 값은 그대로 인코딩, datetime 등은 str로 변환)"""
+    if value is _JSON:
+        return '{}'
+    return _json_encoder.encode(value)
+
+
+def _insert_sql(table: str, fields) -> str:
+    columns = ['timestamp'] + [column for column, _, _ in fields]
+    return f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})"
+
+
+def _build_rows(fields, batch: List[Dict]) -> List[tuple]:
+    """dict 배치를 INSERT 열 순서의 튜플 목록으로 변환"""
+    rows = []
+    now = time.time()
+    for data in batch:
+        get = data.get
+        row = [datetime.fromtimestamp(get('timestamp', now))]
+        for _, key, default in fields:
+            row.append(_encode_json(get(key, _JSON)) if default is _JSON else get(key, default))
+        rows.append(tuple(row))
+    return rows
+
+
+def _parquet_columns(fields):
+    def kind(default):
+        if default is _JSON or isinstance(default, str):
+            return 'str'
+        if isinstance(default, bool):
+            return 'bool'
+        return 'float'
+    return [('timestamp', 'timestamp')] + [(column, kind(default)) for column, _, default in fields]
+
+
+# 테이블 이름 → (필드 정의, INSERT 문, 통계 키)
+_TABLES = {
+    'signal_analysis': (_SIGNAL_FIELDS, _insert_sql('signal_analysis', _SIGNAL_FIELDS), 'signals_logged'),
+    'buy_attempts': (_BUY_ATTEMPT_FIELDS, _insert_sql('buy_attempts', _BUY_ATTEMPT_FIELDS), 'buy_attempts_logged'),
+    'market_snapshots': (_MARKET_FIELDS, _insert_sql('market_snapshots', _MARKET_FIELDS), 'market_states_logged'),
+}
+
+# 대기열이 가득 찼을 때 정책
+DROP_OLDEST = 'drop_oldest'     # 가장 오래된 기록을 버리고 새 기록 추가 (최신 값이 더 중요한 데이터)
+BLOCK = 'block'                 # 호출 스레드가 BLOCK_TIMEOUT 까지 기다린 뒤에도 가득 차 있으면 새 기록 폐기
+
+_CHANNEL_POLICIES = {
+    'signal_analysis': DROP_OLDEST,
+    'buy_attempts': BLOCK,          # 매수 시도는 드물고 손실되면 안 되는 기록
+    'market_snapshots': DROP_OLDEST,
+}
+BLOCK_TIMEOUT = 0.5
+MAX_BATCH_SIZE = 5000           # 대기열 적체 시 한 번에 저장하는 최대 건수 (채널별)
+
+
+class _RecordChannel:
+    """테이블 하나로 가는 기록 대기열"""
+
+    __slots__ = ('table', 'label', 'policy', 'items', 'dropped', 'blocked')
+
+    def __init__(self, table: str, label: str, policy: str):
+        self.table = table
+        self.label = label
+        self.policy = policy
+        self.items: Deque[Dict[str, Any]] = deque()
+        self.dropped = 0
+        self.blocked = 0
+
+
 class AsyncDataLogger:
-    """💾 비동기 데이터 저장 시스템 (머신러닝용)"""
+    """💾 비동기 데이터 저장 시스템 (머신러닝용)
+
+    기록 종류별 채널에 쌓인 데이터를 쓰기 스레드 하나가 모아 저장함.
+    대기열이 쌓이면 배치 크기를 늘리고(최대 MAX_BATCH_SIZE), 비면 다시 batch_size 로 줄임.
+    """
 
-    def __init__(self, db_path: str = "data/ml_training_data.db", max_queue_size: int = 10000):
-        """초기화"""
+    def __init__(self, db_path: str = "data/ml_training_data.db", max_queue_size: int = 10000,
+                 parquet_dir: Optional[str] = None):
+        """초기화 (parquet_dir 지정 시 ML 테이블을 Parquet에도 추가 저장, pyarrow 필요)"""
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(exist_ok=True)
         
-        # 🚀 비동기 처리용 큐들
-        self.signal_queue = Queue(maxsize=max_queue_size)
-        self.buy_attempt_queue = Queue(maxsize=max_queue_size)
-        self.market_state_queue = Queue(maxsize=max_queue_size)
-        
+        # 🚀 기록 종류별 채널 (쓰기 스레드 하나가 모두 처리)
+        self._channels: Dict[str, _RecordChannel] = {
+            'signal_analysis': _RecordChannel('signal_analysis', "신호 분석", _CHANNEL_POLICIES['signal_analysis']),
+            'buy_attempts': _RecordChannel('buy_attempts', "매수 시도", _CHANNEL_POLICIES['buy_attempts']),
+            'market_snapshots': _RecordChannel('market_snapshots', "시장 상태", _CHANNEL_POLICIES['market_snapshots']),
+        }
+        self._lock = threading.Lock()
+        self._has_data = threading.Condition(self._lock)
+        self._has_space = threading.Condition(self._lock)
+        self._pending = 0
+        self._flush_requested = False   # 가득 찬 BLOCK 채널이 배치 크기와 무관하게 즉시 저장 요청
+
         # 🔧 설정
-        self.max_queue_size = max_queue_size
-        self.batch_size = 100  # 배치 단위로 DB 저장
+        self.max_queue_size = max_queue_size   # 채널별 최대 대기 건수
+        self.batch_size = 100  # 배치 단위로 DB 저장 (적체 시 자동 확대)
         self.flush_interval = 30  # 30초마다 강제 플러시
-        
+        self._batch_limit = self.batch_size
+
         # 🎯 상태 관리
         self.is_running = False
-        self.worker_threads = []
+        self._closing = False
+        self._writer_thread: Optional[threading.Thread] = None
         self.stats = {
             'signals_logged': 0,
             'buy_attempts_logged': 0,
             'market_states_logged': 0,
             'db_writes': 0,
-            'errors': 0
+            'rows_written': 0,
+            'dropped': 0,
+            'errors': 0,
+            'parquet_errors': 0
         }
-        
+        self._started_at = time.time()
+        self._write_seconds = 0.0   # executemany + COMMIT 에 쓴 누적 시간
+
         # 데이터베이스 초기화
         self._init_database()
+
+        # 🚀 배치 저장용 영구 연결 (WAL) + Parquet 싱크
+        self._conn = sqlite3.connect(str(self.db_path), timeout=30.0,
+                                     check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._parquet_sink = create_parquet_sink(parquet_dir)
+        if self._parquet_sink is not None:
+            for table, (fields, _, _) in _TABLES.items():
+                self._parquet_sink.register_table(table, _parquet_columns(fields))
         
         # 워커 스레드 시작
         self.start_workers()
@@ -410,477 +627,203 @@ class AsyncDataLogger:
             raise
 
     def start_workers(self):
-        """워커 스레드들 시작"""
+        """쓰기 스레드 시작"""
         if self.is_running:
             return
-            
+
         self.is_running = True
-        
-        # 📊 신호 데이터 처리 워커
-        signal_worker = threading.Thread(
-            target=self._signal_worker,
-            name="SignalDataWorker",
-            daemon=True
-        )
-        
-        # 📈 매수 시도 처리 워커  
-        buy_worker = threading.Thread(
-            target=self._buy_attempt_worker,
-            name="BuyAttemptWorker",
+        self._writer_thread = threading.Thread(
+            target=self._writer_loop,
+            name="MLDataWriter",
             daemon=True
         )
-        
-        # 🌍 시장 상태 처리 워커
-        market_worker = threading.Thread(
-            target=self._market_worker,
-            name="MarketDataWorker", 
-            daemon=True
-        )
-        
-        self.worker_threads = [signal_worker, buy_worker, market_worker]
-        
-        for worker in self.worker_threads:
-            worker.start()
-            
-        logger.info("🚀 비동기 데이터 로거 워커 스레드 시작")
+        self._writer_thread.start()
+
+        logger.info("🚀 비동기 데이터 로거 쓰기 스레드 시작")
 
     def log_signal_analysis(self, signal_data: Dict[str, Any]):
         """📊 신호 분석 데이터 로깅 (비동기)"""
-        try:
-            # 타임스탬프 추가
-            signal_data['logged_at'] = time.time()
-            
-            # 큐에 추가 (논블로킹)
-            if not self.signal_queue.full():
-                self.signal_queue.put_nowait(signal_data)
-                logger.debug(f"🔍 신호 분석 데이터 큐 추가: {signal_data.get('stock_code', 'Unknown')}")
-            else:
-                logger.warning(f"⚠️ 신호 분석 큐 가득참 - 데이터 무시: {signal_data.get('stock_code', 'Unknown')}")
-                self.stats['errors'] += 1
-                
-        except Exception as e:
-            logger.error(f"❌ 신호 분석 데이터 로깅 오류: {e}")
-            self.stats['errors'] += 1
+        self._enqueue('signal_analysis', signal_data)
 
     def log_buy_attempt(self, attempt_data: Dict[str, Any]):
         """📈 매수 시도 데이터 로깅 (비동기)"""
-        try:
-            # 타임스탬프 추가
-            attempt_data['logged_at'] = time.time()
-            
-            # 큐에 추가 (논블로킹)
-            if not self.buy_attempt_queue.full():
-                self.buy_attempt_queue.put_nowait(attempt_data)
-                logger.debug(f"💰 매수 시도 데이터 큐 추가: {attempt_data.get('stock_code', 'Unknown')}")
-            else:
-                logger.warning(f"⚠️ 매수 시도 큐 가득참 - 데이터 무시: {attempt_data.get('stock_code', 'Unknown')}")
-                self.stats['errors'] += 1
-                
-        except Exception as e:
-            logger.error(f"❌ 매수 시도 데이터 로깅 오류: {e}")
-            self.stats['errors'] += 1
+        self._enqueue('buy_attempts', attempt_data)
 
     def log_market_snapshot(self, market_data: Dict[str, Any]):
         """🌍 시장 상태 스냅샷 로깅 (비동기)"""
+        self._enqueue('market_snapshots', market_data)
+
+    def _enqueue(self, table: str, data: Dict[str, Any]) -> bool:
+        """채널에 기록 추가 - 가득 차면 채널 정책(DROP_OLDEST/BLOCK)에 따라 처리"""
         try:
             # 타임스탬프 추가
-            market_data['logged_at'] = time.time()
-            
-            # 큐에 추가 (논블로킹)
-            if not self.market_state_queue.full():
-                self.market_state_queue.put_nowait(market_data)
-                logger.debug("🌍 시장 상태 스냅샷 큐 추가")
-            else:
-                logger.warning("⚠️ 시장 상태 큐 가득참 - 데이터 무시")
-                self.stats['errors'] += 1
-                
-        except Exception as e:
-            logger.error(f"❌ 시장 상태 스냅샷 로깅 오류: {e}")
-            self.stats['errors'] += 1
+            data['logged_at'] = time.time()
+            channel = self._channels[table]
 
-    def _signal_worker(self):
-        """📊 신호 데이터 처리 워커"""
-        batch = []
-        last_flush = time.time()
-        
-        while self.is_running:
-            try:
-                # 큐에서 데이터 가져오기 (타임아웃 1초)
-                try:
-                    data = self.signal_queue.get(timeout=1.0)
-                    batch.append(data)
-                except Empty:
-                    pass
-                
-                # 배치 크기 도달 또는 시간 초과시 DB 저장
-                current_time = time.time()
-                should_flush = (
-                    len(batch) >= self.batch_size or 
-                    (batch and current_time - last_flush >= self.flush_interval)
-                )
-                
-                if should_flush:
-                    self._save_signal_batch(batch)
-                    batch.clear()
-                    last_flush = current_time
-                    
-            except Exception as e:
-                logger.error(f"❌ 신호 워커 오류: {e}")
-                time.sleep(1)
-        
-        # 종료시 남은 데이터 처리
-        if batch:
-            self._save_signal_batch(batch)
-
-    def _buy_attempt_worker(self):
-        """📈 매수 시도 처리 워커"""
-        batch = []
-        last_flush = time.time()
-        
-        while self.is_running:
-            try:
-                # 큐에서 데이터 가져오기 (타임아웃 1초)
-                try:
-                    data = self.buy_attempt_queue.get(timeout=1.0)
-                    batch.append(data)
-                except Empty:
-                    pass
-                
-                # 배치 크기 도달 또는 시간 초과시 DB 저장
-                current_time = time.time()
-                should_flush = (
-                    len(batch) >= self.batch_size or 
-                    (batch and current_time - last_flush >= self.flush_interval)
-                )
-                
-                if should_flush:
-                    self._save_buy_attempt_batch(batch)
-                    batch.clear()
-                    last_flush = current_time
-                    
-            except Exception as e:
-                logger.error(f"❌ 매수 시도 워커 오류: {e}")
-                time.sleep(1)
-        
-        # 종료시 남은 데이터 처리
-        if batch:
-            self._save_buy_attempt_batch(batch)
-
-    def _market_worker(self):
-        """🌍 시장 상태 처리 워커"""
-        batch = []
-        last_flush = time.time()
-        
-        while self.is_running:
-            try:
-                # 큐에서 데이터 가져오기 (타임아웃 1초)
-                try:
-                    data = self.market_state_queue.get(timeout=1.0)
-                    batch.append(data)
-                except Empty:
-                    pass
-                
-                # 배치 크기 도달 또는 시간 초과시 DB 저장
-                current_time = time.time()
-                should_flush = (
-                    len(batch) >= self.batch_size or 
-                    (batch and current_time - last_flush >= self.flush_interval)
-                )
-                
-                if should_flush:
-                    self._save_market_batch(batch)
-                    batch.clear()
-                    last_flush = current_time
-                    
-            except Exception as e:
-                logger.error(f"❌ 시장 상태 워커 오류: {e}")
-                time.sleep(1)
-        
-        # 종료시 남은 데이터 처리
-        if batch:
-            self._save_market_batch(batch)
+            with self._lock:
+                if self._closing:
+                    logger.warning(f"⚠️ 데이터 로거 종료 중 - {channel.label} 데이터 무시: {data.get('stock_code', 'Unknown')}")
+                    self.stats['dropped'] += 1
+                    return False
 
-    def _save_signal_batch(self, batch: List[Dict]):
-        """📊 신호 분석 배치 저장"""
-        if not batch:
-            return
-            
-        try:
-            with sqlite3.connect(str(self.db_path), timeout=30.0) as conn:
-                cursor = conn.cursor()
-                
-                for data in batch:
-                    # JSON 직렬화
-                    raw_data_json = json.dumps(data.get('raw_data', {}))
-                    
-                    cursor.execute("""
-                        INSERT INTO signal_analysis (
-                            timestamp, stock_code, stock_name, strategy_type,
-                            signal_strength, signal_threshold, signal_passed, signal_reason,
-                            current_price, open_price, high_price, low_price, prev_close, price_change,
-                            price_change_pct,
-                            volume, volume_power, avg_volume_5, avg_volume_20, avg_volume_60,
-                            volume_ratio_5d, volume_ratio_20d,
-                            rsi, rsi_9, rsi_14,
-                            macd, macd_signal, macd_histogram,
-                            bb_upper, bb_middle, bb_lower, bb_position, bb_width,
-                            ma5, ma10, ma20, ma60, ma120,
-                            disparity_5d, disparity_10d, disparity_20d, disparity_60d, disparity_120d,
-                            momentum_5d, momentum_10d, momentum_20d, rate_of_change,
-                            volatility_5d, volatility_20d, atr,
-                            market_cap, sector, market_type, listing_date, foreign_ownership_pct,
-                            bid_ask_spread, bid_volume, ask_volume, bid_ask_ratio,
-                            hour_of_day, minute_of_hour, day_of_week, is_opening_hour, is_closing_hour,
-                            performance_1d, performance_3d, performance_1w, performance_1m,
-                            price_1h_later, price_4h_later, price_1d_later, price_1w_later, max_price_24h, min_price_24h,
-                            raw_data_json
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        datetime.fromtimestamp(data.get('timestamp', time.time())),  # 1
-                        data.get('stock_code', ''),                                 # 2
-                        data.get('stock_name', ''),                                 # 3
-                        data.get('strategy_type', ''),                              # 4
-                        data.get('signal_strength', 0.0),                           # 5
-                        data.get('signal_threshold', 0.0),                          # 6
-                        data.get('signal_passed', False),                           # 7
-                        data.get('signal_reason', ''),                              # 8
-                        data.get('current_price', 0),                               # 9
-                        data.get('open_price', 0),                                  # 10
-                        data.get('high_price', 0),                                  # 11
-                        data.get('low_price', 0),                                   # 12
-                        data.get('prev_close', 0),                                  # 13
-                        data.get('price_change', 0),                                # 14
-                        data.get('price_change_pct', 0.0),                          # 15
-                        data.get('volume', 0),                                      # 16
-                        data.get('volume_power', 0.0),                              # 17
-                        data.get('avg_volume_5', 0),                                # 18
-                        data.get('avg_volume_20', 0),                               # 19
-                        data.get('avg_volume_60', 0),                               # 20
-                        data.get('volume_ratio_5d', 0.0),                           # 21
-                        data.get('volume_ratio_20d', 0.0),                          # 22
-                        data.get('rsi', 50.0),                                      # 23
-                        data.get('rsi_9', 50.0),                                    # 24
-                        data.get('rsi_14', 50.0),                                   # 25
-                        data.get('macd', 0.0),                                      # 26
-                        data.get('macd_signal', 0.0),                               # 27
-                        data.get('macd_histogram', 0.0),                            # 28
-                        data.get('bb_upper', 0),                                    # 29
-                        data.get('bb_middle', 0),                                   # 30
-                        data.get('bb_lower', 0),                                    # 31
-                        data.get('bb_position', 0.5),                               # 32
-                        data.get('bb_width', 0.0),                                  # 33
-                        data.get('ma5', 0),                                         # 34
-                        data.get('ma10', 0),                                        # 35
-                        data.get('ma20', 0),                                        # 36
-                        data.get('ma60', 0),                                        # 37
-                        data.get('ma120', 0),                                       # 38
-                        data.get('disparity_5d', 100.0),                            # 39
-                        data.get('disparity_10d', 100.0),                           # 40
-                        data.get('disparity_20d', 100.0),                           # 41
-                        data.get('disparity_60d', 100.0),                           # 42
-                        data.get('disparity_120d', 100.0),                          # 43
-                        data.get('momentum_5d', 0.0),                               # 44
-                        data.get('momentum_10d', 0.0),                              # 45
-                        data.get('momentum_20d', 0.0),                              # 46
-                        data.get('rate_of_change', 0.0),                            # 47
-                        data.get('volatility_5d', 0.0),                             # 48
-                        data.get('volatility_20d', 0.0),                            # 49
-                        data.get('atr', 0.0),                                       # 50
-                        data.get('market_cap', 0),                                  # 51
-                        data.get('sector', ''),                                     # 52
-                        data.get('market_type', ''),                                # 53
-                        data.get('listing_date', ''),                               # 54
-                        data.get('foreign_ownership_pct', 0.0),                     # 55
-                        data.get('bid_ask_spread', 0.0),                            # 56
-                        data.get('bid_volume', 0),                                  # 57
-                        data.get('ask_volume', 0),                                  # 58
-                        data.get('bid_ask_ratio', 0.0),                             # 59
-                        data.get('hour_of_day', 0),                                 # 60
-                        data.get('minute_of_hour', 0),                              # 61
-                        data.get('day_of_week', 0),                                 # 62
-                        data.get('is_opening_hour', False),                         # 63
-                        data.get('is_closing_hour', False),                         # 64
-                        data.get('performance_1d', 0.0),                            # 65
-                        data.get('performance_3d', 0.0),                            # 66
-                        data.get('performance_1w', 0.0),                            # 67
-                        data.get('performance_1m', 0.0),                            # 68
-                        data.get('price_1h_later', 0),                              # 69
-                        data.get('price_4h_later', 0),                              # 70
-                        data.get('price_1d_later', 0),                              # 71
-                        data.get('price_1w_later', 0),                              # 72
-                        data.get('max_price_24h', 0),                               # 73
-                        data.get('min_price_24h', 0),                               # 74
-                        raw_data_json                                               # 75
-                    ))
-                
-                conn.commit()
-                self.stats['signals_logged'] += len(batch)
-                self.stats['db_writes'] += 1
-                
-                logger.debug(f"💾 신호 분석 배치 저장 완료: {len(batch)}개")
-                
-        except Exception as e:
-            logger.error(f"❌ 신호 분석 배치 저장 오류: {e}")
-            self.stats['errors'] += 1
+                if len(channel.items) >= self.max_queue_size:
+                    if channel.policy == BLOCK:
+                        channel.blocked += 1
+                        self._flush_requested = True   # max_queue_size < 배치 크기여도 쓰기 스레드가 비우도록
+                        self._has_data.notify()
+                        deadline = time.monotonic() + BLOCK_TIMEOUT
+                        while len(channel.items) >= self.max_queue_size and not self._closing:
+                            remaining = deadline - time.monotonic()
+                            if remaining <= 0 or not self._has_space.wait(remaining):
+                                break
+                        if len(channel.items) >= self.max_queue_size or self._closing:
+                            channel.dropped += 1
+                            self.stats['dropped'] += 1
+                            logger.warning(f"⚠️ {channel.label} 큐 가득참 - 데이터 무시: {data.get('stock_code', 'Unknown')}")
+                            return False
+                    else:
+                        channel.items.popleft()
+                        channel.dropped += 1
+                        self.stats['dropped'] += 1
+                        self._pending -= 1
+                        if channel.dropped % 1000 == 1:
+                            logger.warning(f"⚠️ {channel.label} 큐 가득참 - 오래된 데이터 폐기 (누적 {channel.dropped}건)")
+
+                channel.items.append(data)
+                self._pending += 1
+                if self._pending >= self._batch_limit:
+                    self._has_data.notify()
+            return True
 
-    def _save_buy_attempt_batch(self, batch: List[Dict]):
-        """📈 매수 시도 배치 저장"""
-        if not batch:
-            return
-            
-        try:
-            with sqlite3.connect(str(self.db_path), timeout=30.0) as conn:
-                cursor = conn.cursor()
-                
-                for data in batch:
-                    # JSON 직렬화 (datetime 객체 처리)
-                    signal_data_json = json.dumps(data.get('signal_data', {}), default=str)
-                    validation_checks = json.dumps(data.get('validation_checks', {}), default=str)
-                    
-                    cursor.execute("""
-                        INSERT INTO buy_attempts (
-                            timestamp, stock_code, stock_name, attempt_result, failure_reason,
-                            signal_strength, strategy_type, signal_data_json,
-                            buy_price, quantity, total_amount, validation_checks,
-                            market_condition, portfolio_status, available_cash
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        datetime.fromtimestamp(data.get('timestamp', time.time())),
-                        data.get('stock_code', ''),
-                        data.get('stock_name', ''),
-                        data.get('attempt_result', ''),
-                        data.get('failure_reason', ''),
-                        data.get('signal_strength', 0.0),
-                        data.get('strategy_type', ''),
-                        signal_data_json,
-                        data.get('buy_price', 0),
-                        data.get('quantity', 0),
-                        data.get('total_amount', 0),
-                        validation_checks,
-                        data.get('market_condition', ''),
-                        data.get('portfolio_status', ''),
-                        data.get('available_cash', 0)
-                    ))
-                
-                conn.commit()
-                self.stats['buy_attempts_logged'] += len(batch)
-                self.stats['db_writes'] += 1
-                
-                logger.debug(f"💾 매수 시도 배치 저장 완료: {len(batch)}개")
-                
         except Exception as e:
-            logger.error(f"❌ 매수 시도 배치 저장 오류: {e}")
+            logger.error(f"❌ 데이터 로깅 오류 ({table}): {e}")
             self.stats['errors'] += 1
+            return False
+
+    def _writer_loop(self):
+        """💾 쓰기 스레드 - 배치 크기 도달/플러시 주기/종료 요청 시 모든 채널 저장
+
+        종료 요청 후에도 채널이 빌 때까지 계속 저장한 뒤 끝남
+        """
+        last_flush = time.monotonic()
+
+        while True:
+            with self._lock:
+                while not self._closing and not self._flush_requested and self._pending < self._batch_limit:
+                    remaining = self.flush_interval - (time.monotonic() - last_flush)
+                    if remaining <= 0 and self._pending:
+                        break
+                    self._has_data.wait(remaining if remaining > 0 else self.flush_interval)
+
+                if self._closing and not self._pending:
+                    break
+
+                limit = self._batch_limit
+                batches = []
+                for channel in self._channels.values():
+                    take = min(len(channel.items), limit)
+                    if take:
+                        batches.append((channel, [channel.items.popleft() for _ in range(take)]))
+                        self._pending -= take
+                backlog = self._pending
+                self._flush_requested = False
+                self._has_space.notify_all()
+
+            for channel, batch in batches:
+                self._save_batch(channel.table, batch, channel.label)
+            last_flush = time.monotonic()
 
-    def _save_market_batch(self, batch: List[Dict]):
-        """🌍 시장 상태 배치 저장"""
+            # 🔧 적응형 배치 크기: 적체되면 키우고, 따라잡으면 줄임
+            if backlog > limit:
+                self._batch_limit = min(limit * 2, MAX_BATCH_SIZE)
+            elif backlog < limit // 4:
+                self._batch_limit = max(self.batch_size, limit // 2)
+
+    def _save_batch(self, table: str, batch: List[Dict], label: str):
+        """배치를 튜플 목록으로 변환해 영구 연결에서 executemany 한 번, 트랜잭션 한 번으로 저장 (쓰기 스레드 전용)"""
         if not batch:
             return
-            
+
+        fields, insert_sql, stat_key = _TABLES[table]
         try:
-            with sqlite3.connect(str(self.db_path), timeout=30.0) as conn:
-                cursor = conn.cursor()
-                
-                for data in batch:
-                    cursor.execute("""
-                        INSERT INTO market_snapshots (
-                            timestamp, kospi_value, kosdaq_value, kospi_change_pct, kosdaq_change_pct,
-                            kospi_volume, kosdaq_volume, rising_stocks, falling_stocks, unchanged_stocks,
-                            market_volatility, vix_korea, hour_of_day, is_opening, is_closing
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        datetime.fromtimestamp(data.get('timestamp', time.time())),
-                        data.get('kospi_value', 0.0),
-                        data.get('kosdaq_value', 0.0),
-                        data.get('kospi_change_pct', 0.0),
-                        data.get('kosdaq_change_pct', 0.0),
-                        data.get('kospi_volume', 0),
-                        data.get('kosdaq_volume', 0),
-                        data.get('rising_stocks', 0),
-                        data.get('falling_stocks', 0),
-                        data.get('unchanged_stocks', 0),
-                        data.get('market_volatility', 0.0),
-                        data.get('vix_korea', 0.0),
-                        data.get('hour_of_day', 0),
-                        data.get('is_opening', False),
-                        data.get('is_closing', False)
-                    ))
-                
-                conn.commit()
-                self.stats['market_states_logged'] += len(batch)
-                self.stats['db_writes'] += 1
-                
-                logger.debug(f"💾 시장 상태 배치 저장 완료: {len(batch)}개")
-                
+            rows = _build_rows(fields, batch)
+
+            start = time.perf_counter()
+            conn = self._conn
+            conn.execute("BEGIN")
+            try:
+                conn.executemany(insert_sql, rows)
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            self._write_seconds += time.perf_counter() - start
+
+            self.stats[stat_key] += len(rows)
+            self.stats['rows_written'] += len(rows)
+            self.stats['db_writes'] += 1
+
+            logger.debug(f"💾 {label} 배치 저장 완료: {len(rows)}개")
+
         except Exception as e:
-            logger.error(f"❌ 시장 상태 배치 저장 오류: {e}")
+            logger.error(f"❌ {label} 배치 저장 오류: {e}")
             self.stats['errors'] += 1
+            return
+
+        if self._parquet_sink is not None:
+            try:
+                self._parquet_sink.append(table, rows)
+            except Exception as e:
+                logger.error(f"❌ {label} Parquet 저장 오류: {e}")
+                self.stats['parquet_errors'] += 1
 
     def get_stats(self) -> Dict[str, Any]:
-        """📊 통계 정보 반환"""
+        """📊 통계 정보 반환 (처리량: 가동 이후 평균 / DB 쓰기 시간 기준)"""
+        with self._lock:
+            channels = {
+                table: {'queued': len(channel.items), 'dropped': channel.dropped,
+                        'blocked': channel.blocked, 'policy': channel.policy}
+                for table, channel in self._channels.items()
+            }
+            backlog = self._pending
+        uptime = max(time.time() - self._started_at, 1e-9)
         return {
             **self.stats,
-            'queue_sizes': {
-                'signal_queue': self.signal_queue.qsize(),
-                'buy_attempt_queue': self.buy_attempt_queue.qsize(),
-                'market_state_queue': self.market_state_queue.qsize()
-            },
+            'rows_per_sec': round(self.stats['rows_written'] / uptime, 2),
+            'insert_rows_per_sec': round(self.stats['rows_written'] / self._write_seconds, 1) if self._write_seconds else 0.0,
+            'queue_backlog': backlog,
+            'batch_limit': self._batch_limit,
+            'channels': channels,
+            'parquet_enabled': self._parquet_sink is not None,
             'is_running': self.is_running,
-            'worker_threads_alive': [t.is_alive() for t in self.worker_threads]
+            'writer_alive': self._writer_thread is not None and self._writer_thread.is_alive()
         }
 
-    def shutdown(self):
-        """시스템 종료"""
-        logger.info("🛑 비동기 데이터 로거 종료 시작...")
-        
+    def shutdown(self, timeout: float = 60.0):
+        """시스템 종료 - 새 기록을 막고 채널에 남은 데이터를 모두 저장한 뒤 연결 종료"""
+        with self._lock:
+            if self._closing:
+                return
+            self._closing = True
+            pending = self._pending
+            self._has_data.notify_all()
+            self._has_space.notify_all()
+
+        logger.info(f"🛑 비동기 데이터 로거 종료 시작... (남은 데이터 {pending}건 저장)")
+
+        if self._writer_thread is not None:
+            self._writer_thread.join(timeout)
+            if self._writer_thread.is_alive():
+                logger.error(f"❌ 데이터 로거 쓰기 스레드가 {timeout}초 안에 끝나지 않음 (남은 데이터 {self._pending}건)")
+                return
         self.is_running = False
-        
-        # 워커 스레드 종료 대기 (최대 30초)
-        for thread in self.worker_threads:
-            thread.join(timeout=30)
-            
-        # 남은 큐 데이터 강제 플러시
-        self._emergency_flush()
-        
-        logger.info("✅ 비동기 데이터 로거 종료 완료")
 
-    def _emergency_flush(self):
-        """비상 데이터 플러시"""
-        try:
-            # 모든 큐의 남은 데이터 처리
-            signal_batch = []
-            while not self.signal_queue.empty():
-                try:
-                    signal_batch.append(self.signal_queue.get_nowait())
-                except Empty:
-                    break
-            
-            buy_batch = []
-            while not self.buy_attempt_queue.empty():
-                try:
-                    buy_batch.append(self.buy_attempt_queue.get_nowait())
-                except Empty:
-                    break
-            
-            market_batch = []
-            while not self.market_state_queue.empty():
-                try:
-                    market_batch.append(self.market_state_queue.get_nowait())
-                except Empty:
-                    break
-            
-            # 배치 저장
-            if signal_batch:
-                self._save_signal_batch(signal_batch)
-            if buy_batch:
-                self._save_buy_attempt_batch(buy_batch)
-            if market_batch:
-                self._save_market_batch(market_batch)
-                
-            logger.info(f"🚨 비상 플러시 완료: 신호={len(signal_batch)}, 매수={len(buy_batch)}, 시장={len(market_batch)}")
-            
-        except Exception as e:
-            logger.error(f"❌ 비상 플러시 오류: {e}")
+        # 영구 연결 / Parquet 파일 닫기
+        if self._parquet_sink is not None:
+            self._parquet_sink.close()
+        self._conn.close()
+
+        logger.info("✅ 비동기 데이터 로거 종료 완료")
 
 
 # 🌐 글로벌 인스턴스 (싱글톤 패턴)
@@ -890,7 +833,9 @@ def get_async_logger() -> AsyncDataLogger:
     """비동기 데이터 로거 싱글톤 인스턴스 반환"""
     global _async_logger
     if _async_logger is None:
-        _async_logger = AsyncDataLogger()
+        from config.settings import ML_PARQUET_DIR
+        _async_logger = AsyncDataLogger(parquet_dir=ML_PARQUET_DIR)
+        atexit.register(_async_logger.shutdown)  # 프로세스 종료 시 남은 데이터 저장 보장
     return _async_logger
 
 
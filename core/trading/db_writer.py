@@ -0,0 +1,278 @@
+"""
+SQLite 단일 쓰기 스레드 + 읽기 전용 연결 풀
+
+- 쓰기: 전용 스레드 하나가 WAL 연결 하나를 계속 유지하고 명령 대기열을 처리
+  - 대기 중인 명령을 모아 한 트랜잭션으로 커밋 (group commit), 명령마다 SAVEPOINT로 격리해
+    한 명령의 오류가 같은 배치의 다른 명령을 되돌리지 않음
+  - 호출 스레드는 커밋 완료까지 기다린 뒤 명령의 반환값(lastrowid 등)을 받음
+- 읽기: query_only 연결 풀 (WAL 모드라 쓰기 트랜잭션 중에도 막히지 않음)
+- 대기열 투입 → 커밋 완료 지연시간 백분위 / 배치 크기 통계 제공
+"""
+import queue
+import sqlite3
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional
+
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+MAX_BATCH_COMMANDS = 64         # 트랜잭션 하나에 묶는 최대 명령 수
+BATCH_WINDOW = 0.0              # 첫 명령 이후 추가 명령을 기다리는 시간 (초, 0이면 이미 쌓인 것만)
+READ_POOL_SIZE = 4              # 읽기 전용 연결 수
+BUSY_TIMEOUT_MS = 30000
+LATENCY_SAMPLES = 2048          # 지연시간 백분위 계산용 최근 표본 수
+
+_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=10000",
+    f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS}",
+)
+
+_STOP = object()
+
+
+def _connect(db_path: str) -> sqlite3.Connection:
+    """PRAGMA가 적용된 autocommit 연결 생성 (트랜잭션은 직접 BEGIN/COMMIT)"""
+    conn = sqlite3.connect(db_path, timeout=BUSY_TIMEOUT_MS / 1000,
+                           check_same_thread=False, isolation_level=None)
+    for pragma in _PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+class _WriteCommand:
+    __slots__ = ('func', 'future', 'enqueued_at')
+
+    def __init__(self, func: Callable[[sqlite3.Connection], Any]):
+        self.func = func
+        self.future: Future = Future()
+        self.enqueued_at = time.perf_counter()
+
+
+class SQLiteWriter:
+    """전용 스레드에서 하나의 연결로 모든 쓰기를 직렬 실행"""
+
+    def __init__(self, db_path: str, max_batch: int = MAX_BATCH_COMMANDS,
+                 batch_window: float = BATCH_WINDOW, name: str = "sqlite-writer"):
+        self.db_path = db_path
+        self.max_batch = max_batch
+        self.batch_window = batch_window
+
+        self._queue: "queue.Queue" = queue.Queue()
+        self._latencies: Deque[float] = deque(maxlen=LATENCY_SAMPLES)
+        self._batch_sizes: Deque[int] = deque(maxlen=LATENCY_SAMPLES)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._closed = False
+        self._ready = threading.Event()
+        self._start_error: Optional[BaseException] = None
+
+        self.stats = {
+            'commands': 0,
+            'failed_commands': 0,
+            'transactions': 0,
+            'failed_transactions': 0,
+            'max_batch_size': 0,
+            'max_latency_ms': 0.0,
+        }
+
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        if self._start_error is not None:
+            raise self._start_error
+
+    # ========== 호출 측 API ==========
+
+    def submit(self, func: Callable[[sqlite3.Connection], Any]) -> Future:
+        """쓰기 명령 투입 - func(conn)은 쓰기 스레드에서 트랜잭션 안에서 실행됨"""
+        if self._closed:
+            raise RuntimeError("SQLiteWriter가 이미 종료됨")
+        command = _WriteCommand(func)
+        self._queue.put(command)
+        return command.future
+
+    def execute(self, func: Callable[[sqlite3.Connection], Any], timeout: Optional[float] = None) -> Any:
+        """쓰기 명령을 실행하고 커밋 완료까지 대기 (쓰기 스레드 안에서 호출되면 현재 트랜잭션에서 바로 실행)"""
+        if threading.current_thread() is self._thread:
+            return func(self._conn)
+        return self.submit(func).result(timeout)
+
+    def close(self, timeout: float = 10.0) -> None:
+        """남은 명령을 모두 커밋한 뒤 체크포인트하고 연결 종료"""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+
+    # ========== 쓰기 스레드 ==========
+
+    def _run(self) -> None:
+        try:
+            self._conn = _connect(self.db_path)
+        except BaseException as e:
+            self._start_error = e
+            self._ready.set()
+            return
+        self._ready.set()
+
+        stopping = False
+        while not stopping:
+            batch: List[_WriteCommand] = []
+            item = self._queue.get()
+            if item is _STOP:
+                break
+            batch.append(item)
+
+            deadline = time.perf_counter() + self.batch_window
+            while len(batch) < self.max_batch:
+                try:
+                    remaining = deadline - time.perf_counter()
+                    item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            self._commit_batch(batch)
+
+        try:
+            self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        except sqlite3.Error as e:
+            logger.warning(f"종료 시 WAL 체크포인트 실패: {e}")
+        self._conn.close()
+
+    def _commit_batch(self, batch: List[_WriteCommand]) -> None:
+        conn = self._conn
+        results = []
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            for command in batch:
+                conn.execute("SAVEPOINT cmd")
+                try:
+                    result = command.func(conn)
+                    conn.execute("RELEASE cmd")
+                    results.append((command, result, None))
+                except BaseException as e:
+                    conn.execute("ROLLBACK TO cmd")
+                    conn.execute("RELEASE cmd")
+                    results.append((command, None, e))
+            conn.execute("COMMIT")
+        except BaseException as e:
+            # BEGIN/COMMIT 자체 실패 - 배치 전체 실패 처리
+            if conn.in_transaction:
+                try:
+                    conn.execute("ROLLBACK")
+                except sqlite3.Error:
+                    pass
+            self.stats['failed_transactions'] += 1
+            self.stats['failed_commands'] += len(batch)
+            logger.error(f"쓰기 트랜잭션 실패 ({len(batch)}건): {e}")
+            for command in batch:
+                if not command.future.done():
+                    command.future.set_exception(e)
+            return
+
+        now = time.perf_counter()
+        self.stats['transactions'] += 1
+        self.stats['commands'] += len(batch)
+        self.stats['max_batch_size'] = max(self.stats['max_batch_size'], len(batch))
+        self._batch_sizes.append(len(batch))
+        for command, result, error in results:
+            latency = now - command.enqueued_at
+            self._latencies.append(latency)
+            if latency * 1000 > self.stats['max_latency_ms']:
+                self.stats['max_latency_ms'] = latency * 1000
+            if error is not None:
+                self.stats['failed_commands'] += 1
+                command.future.set_exception(error)
+            else:
+                command.future.set_result(result)
+
+    # ========== 통계 ==========
+
+    def get_stats(self) -> Dict[str, Any]:
+        latencies = sorted(self._latencies)
+        batch_sizes = list(self._batch_sizes)
+        result = {
+            **self.stats,
+            'queue_depth': self._queue.qsize(),
+        }
+        if batch_sizes:
+            result['avg_batch_size'] = sum(batch_sizes) / len(batch_sizes)
+        if latencies:
+            last = len(latencies) - 1
+            result['latency_ms'] = {
+                'avg': sum(latencies) / len(latencies) * 1000,
+                'p50': latencies[len(latencies) // 2] * 1000,
+                'p95': latencies[min(last, int(len(latencies) * 0.95))] * 1000,
+                'p99': latencies[min(last, int(len(latencies) * 0.99))] * 1000,
+            }
+        return result
+
+
+class SQLiteReadPool:
+    """읽기 전용(query_only) 연결 풀"""
+
+    def __init__(self, db_path: str, size: int = READ_POOL_SIZE):
+        self.db_path = db_path
+        self.size = size
+        self._idle: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def _open(self) -> sqlite3.Connection:
+        conn = _connect(self.db_path)
+        conn.execute("PRAGMA query_only=ON")
+        return conn
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """풀에서 연결 하나를 빌려 사용 (모두 사용 중이면 반납될 때까지 대기)"""
+        conn = None
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                if self._created < self.size:
+                    self._created += 1
+                    create = True
+                else:
+                    create = False
+            if create:
+                try:
+                    conn = self._open()
+                except BaseException:
+                    with self._lock:
+                        self._created -= 1
+                    raise
+            else:
+                conn = self._idle.get()
+
+        try:
+            yield conn
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+            if self._closed:
+                conn.close()
+            else:
+                self._idle.put(conn)
+
+    def close(self) -> None:
+        self._closed = True
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
@@ -0,0 +1,108 @@
+"""
+머신러닝 테이블용 Parquet 추가 전용(append-only) 싱크 (선택 사항, pyarrow 필요)
+
+- AsyncDataLogger가 SQLite에 쓴 배치를 같은 행 튜플 그대로 받아 열 단위로 변환 후 Parquet에 추가
+- 테이블별 디렉터리에 날짜+시작 시각 이름의 파일 하나를 열어 두고 row group 단위로 계속 추가
+  (날짜가 바뀌면 새 파일, close() 시 footer 기록)
+- 숫자 열은 float64, 논리 열은 bool, 문자열 열은 string, timestamp 열은 timestamp[us]로 저장
+"""
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from utils.logger import setup_logger
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+logger = setup_logger(__name__)
+
+
+def _to_float(value):
+    if value is None or value == '':
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_str(value):
+    return None if value is None else str(value)
+
+
+class MLParquetSink:
+    """테이블별 Parquet 파일에 배치를 추가하는 싱크"""
+
+    def __init__(self, base_dir: str):
+        if not PYARROW_AVAILABLE:
+            raise RuntimeError("pyarrow가 설치되지 않아 Parquet 싱크를 사용할 수 없음")
+        self.base_dir = Path(base_dir)
+        self.base_dir.mkdir(parents=True, exist_ok=True)
+        self._schemas: Dict[str, "pa.Schema"] = {}
+        self._converters: Dict[str, List] = {}
+        self._writers: Dict[str, Tuple[str, "pq.ParquetWriter"]] = {}
+        self.rows_written = 0
+
+    def register_table(self, table: str, columns: Sequence[Tuple[str, str]]) -> None:
+        """테이블 열 정의 등록 - columns: (열 이름, 'float'|'bool'|'str'|'timestamp')"""
+        types = {
+            'float': (pa.float64(), _to_float),
+            'bool': (pa.bool_(), lambda v: None if v is None else bool(v)),
+            'str': (pa.string(), _to_str),
+            'timestamp': (pa.timestamp('us'), lambda v: v),
+        }
+        self._schemas[table] = pa.schema([(name, types[kind][0]) for name, kind in columns])
+        self._converters[table] = [types[kind][1] for _, kind in columns]
+
+    def append(self, table: str, rows: List[tuple]) -> None:
+        """행 튜플 목록을 열 단위로 변환해 row group 하나로 추가"""
+        if not rows:
+            return
+        schema = self._schemas[table]
+        converters = self._converters[table]
+        arrays = [
+            pa.array([convert(v) for v in column], type=field.type)
+            for column, convert, field in zip(zip(*rows), converters, schema)
+        ]
+        self._writer_for(table).write_table(pa.Table.from_arrays(arrays, schema=schema))
+        self.rows_written += len(rows)
+
+    def _writer_for(self, table: str) -> "pq.ParquetWriter":
+        now = datetime.now()
+        day = now.strftime('%Y%m%d')
+        current = self._writers.get(table)
+        if current is not None and current[0] == day:
+            return current[1]
+        if current is not None:
+            current[1].close()
+
+        table_dir = self.base_dir / table
+        table_dir.mkdir(exist_ok=True)
+        path = table_dir / f"{day}_{now.strftime('%H%M%S')}.parquet"
+        writer = pq.ParquetWriter(str(path), self._schemas[table], compression='zstd')
+        self._writers[table] = (day, writer)
+        logger.info(f"📦 Parquet 싱크 파일 생성: {path}")
+        return writer
+
+    def close(self) -> None:
+        for _, writer in self._writers.values():
+            try:
+                writer.close()
+            except Exception as e:
+                logger.error(f"Parquet 파일 닫기 오류: {e}")
+        self._writers.clear()
+
+
+def create_parquet_sink(base_dir: Optional[str]) -> Optional[MLParquetSink]:
+    """설정된 경우에만 싱크 생성 (pyarrow 없으면 경고 후 비활성)"""
+    if not base_dir:
+        return None
+    if not PYARROW_AVAILABLE:
+        logger.warning("⚠️ ML_PARQUET_DIR이 설정됐지만 pyarrow가 없어 Parquet 싱크 비활성")
+        return None
+    return MLParquetSink(base_dir)
@@ -5,54 +5,44 @@
 import sqlite3
 import json
 import time
-import threading
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 from utils.logger import setup_logger
+from .db_writer import SQLiteWriter, SQLiteReadPool
 
 logger = setup_logger(__name__)
 
 class TradeDatabase:
-    """거래 기록 데이터베이스 관리자"""
+    """거래 기록 데이터베이스 관리자
+
+    쓰기(record_*/update_*)는 전용 쓰기 스레드의 WAL 연결 하나에서 묶음 커밋되고,
+    조회는 읽기 전용 연결 풀에서 실행됨 (db_writer 참고)
+    """
 
     def __init__(self, db_path: str = "data/trades.db"):
         """초기화"""
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(exist_ok=True)
 
-        # 🆕 데이터베이스 락 방지를 위한 설정
-        self._db_lock = threading.RLock()  # 재진입 가능한 락
-        self._connection_timeout = 30.0    # 연결 타임아웃 30초
-        self._retry_attempts = 3           # 재시도 횟수
-        self._retry_delay = 0.1            # 재시도 간격 100ms
-
         # 🆕 초기화 전 데이터베이스 상태 정리
         self._prepare_database()
 
+        # 🆕 단일 쓰기 스레드 + 읽기 전용 연결 풀
+        self._writer = SQLiteWriter(str(self.db_path), name="trade-db-writer")
+        self._read_pool = SQLiteReadPool(str(self.db_path))
+
         # 데이터베이스 초기화
         self._init_database()
         logger.info(f"거래 데이터베이스 초기화 완료: {self.db_path}")
 
     def _prepare_database(self):
-        """🆕 데이터베이스 초기화 전 준비 작업"""
-        try:
-            # WAL 파일들 정리 (락 해제)
-            wal_files = [
-                self.db_path.with_suffix('.db-wal'),
-                self.db_path.with_suffix('.db-shm'),
-                Path(str(self.db_path) + '-wal'),
-                Path(str(self.db_path) + '-shm')
-            ]
-
-            for wal_file in wal_files:
-                if wal_file.exists():
-                    try:
-                        wal_file.unlink()
-                        logger.info(f"WAL 파일 정리: {wal_file}")
-                    except Exception as e:
-                        logger.warning(f"WAL 파일 정리 실패: {wal_file} - {e}")
+        """🆕 데이터베이스 초기화 전 준비 작업
 
+        WAL/SHM 파일은 지우지 않음 - 체크포인트 안 된 커밋이 남아 있을 수 있고,
+        연결을 열 때 SQLite가 스스로 복구함
+        """
+        try:
             # 데이터베이스 파일이 존재하면 연결 테스트
             if self.db_path.exists():
                 try:
@@ -112,469 +102,410 @@ class TradeDatabase:
         except Exception as e:
             logger.error(f"데이터베이스 강제 락 해제 실패: {e}")
 
-    def _get_connection(self) -> sqlite3.Connection:
-        """🆕 안전한 데이터베이스 연결 생성"""
+    def close(self):
+        """🆕 대기 중인 쓰기를 모두 커밋하고 연결 종료"""
         try:
-            # 🆕 초기화 시에는 더 긴 타임아웃 적용
-            if hasattr(self, '_initializing'):
-                timeout = 60.0  # 초기화 시 60초
-            else:
-                timeout = self._connection_timeout
-
-            conn = sqlite3.connect(
-                str(self.db_path),
-                timeout=timeout,
-                check_same_thread=False,  # 멀티스레드 허용
-                isolation_level=None      # autocommit 모드
-            )
-
-            # 🆕 SQLite 성능 및 안정성 향상 설정
-            conn.execute("PRAGMA journal_mode=WAL")      # WAL 모드 (동시성 향상)
-            conn.execute("PRAGMA synchronous=NORMAL")    # 동기화 모드 완화
-            conn.execute("PRAGMA temp_store=MEMORY")     # 임시 저장소를 메모리에
-            conn.execute("PRAGMA cache_size=10000")      # 캐시 크기 증가
-            conn.execute("PRAGMA busy_timeout=30000")    # busy 타임아웃 30초
-
-            return conn
+            self._writer.close()
+            self._read_pool.close()
+            logger.info(f"거래 데이터베이스 종료: {self.db_path}")
         except Exception as e:
-            logger.error(f"데이터베이스 연결 생성 실패: {e}")
-            raise
-
-    def _execute_with_retry(self, func, *args, **kwargs):
-        """🆕 재시도 로직이 포함된 데이터베이스 실행"""
-        last_exception = None
+            logger.error(f"거래 데이터베이스 종료 오류: {e}")
 
-        for attempt in range(self._retry_attempts):
-            try:
-                with self._db_lock:  # 락 보호
-                    return func(*args, **kwargs)
-
-            except sqlite3.OperationalError as e:
-                last_exception = e
-                if "database is locked" in str(e).lower():
-                    if attempt < self._retry_attempts - 1:
-                        wait_time = self._retry_delay * (2 ** attempt)  # 지수 백오프
-                        logger.warning(f"데이터베이스 락 감지, {wait_time:.2f}초 후 재시도 ({attempt + 1}/{self._retry_attempts})")
-                        time.sleep(wait_time)
-                        continue
-                    else:
-                        logger.error(f"데이터베이스 락 해결 실패: 최대 재시도 횟수 초과")
-                else:
-                    # 다른 종류의 오류는 즉시 발생
-                    raise
-
-            except Exception as e:
-                # 비-락 관련 오류는 즉시 발생
-                logger.error(f"데이터베이스 실행 오류: {e}")
-                raise
-
-        # 모든 재시도 실패시 마지막 예외 발생
-        raise last_exception
+    def get_write_stats(self) -> Dict:
+        """🆕 쓰기 스레드 통계 (묶음 커밋 크기, 대기열→커밋 지연시간 p50/p95/p99)"""
+        return self._writer.get_stats()
 
     def _init_database(self):
         """데이터베이스 테이블 생성"""
-        def _create_tables():
-            # 🆕 초기화 중임을 표시
-            self._initializing = True
-
-            try:
-                with self._get_connection() as conn:
-                    cursor = conn.cursor()
-
-                    # 거래 기록 테이블
-                    cursor.execute("""
-                        CREATE TABLE IF NOT EXISTS trades (
-                            id INTEGER PRIMARY KEY AUTOINCREMENT,
-                            trade_type TEXT NOT NULL,           -- BUY/SELL
-                            stock_code TEXT NOT NULL,           -- 종목코드
-                            stock_name TEXT,                    -- 종목명
-                            quantity INTEGER NOT NULL,          -- 수량
-                            price INTEGER NOT NULL,             -- 가격
-                            total_amount INTEGER NOT NULL,      -- 총 거래금액
-                            strategy_type TEXT,                 -- 전략 타입
-                            timestamp DATETIME NOT NULL,        -- 거래 시간
-                            order_id TEXT,                      -- 주문번호
-                            status TEXT NOT NULL,               -- SUCCESS/FAILED
-                            error_message TEXT,                 -- 오류 메시지
-
-                            -- 🆕 캔들 패턴 상세 정보
-                            pattern_type TEXT,                  -- 사용된 패턴 (HAMMER/BULLISH_ENGULFING/BEARISH_ENGULFING)
-                            pattern_confidence REAL,           -- 패턴 신뢰도 (0.0-1.0)
-                            pattern_strength INTEGER,          -- 패턴 강도 (0-100)
+        def _create_tables(conn):
+            cursor = conn.cursor()
+
+            # 거래 기록 테이블
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS trades (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    trade_type TEXT NOT NULL,           -- BUY/SELL
+                    stock_code TEXT NOT NULL,           -- 종목코드
+                    stock_name TEXT,                    -- 종목명
+                    quantity INTEGER NOT NULL,          -- 수량
+                    price INTEGER NOT NULL,             -- 가격
+                    total_amount INTEGER NOT NULL,      -- 총 거래금액
+                    strategy_type TEXT,                 -- 전략 타입
+                    timestamp DATETIME NOT NULL,        -- 거래 시간
+                    order_id TEXT,                      -- 주문번호
+                    status TEXT NOT NULL,               -- SUCCESS/FAILED
+                    error_message TEXT,                 -- 오류 메시지
+
+                    -- 🆕 캔들 패턴 상세 정보
+                    pattern_type TEXT,                  -- 사용된 패턴 (HAMMER/BULLISH_ENGULFING/BEARISH_ENGULFING)
+                    pattern_confidence REAL,           -- 패턴 신뢰도 (0.0-1.0)
+                    pattern_strength INTEGER,          -- 패턴 강도 (0-100)
                             
-                            -- 🆕 기술적 지표 정보
-                            rsi_value REAL,                     -- RSI 값
-                            macd_value REAL,                    -- MACD 값
-                            volume_ratio REAL,                  -- 거래량 비율
+                    -- 🆕 기술적 지표 정보
+                    rsi_value REAL,                     -- RSI 값
+                    macd_value REAL,                    -- MACD 값
+                    volume_ratio REAL,                  -- 거래량 비율
                             
-                            -- 🆕 투자 정보
-                            investment_amount INTEGER,          -- 실제 투자금액
-                            investment_ratio REAL,              -- 포트폴리오 대비 투자 비율
-
-                            -- 매도시 수익 정보
-                            buy_price INTEGER,                  -- 매수가
-                            profit_loss INTEGER,                -- 손익
-                            profit_rate REAL,                   -- 수익률
-                            hold_days INTEGER,                  -- 보유일수
-
-                            -- 메타 정보
-                            created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                            updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
-                        )
-                    """)
-
-                    # 🆕 캔들 매수 후보 종목 테이블
-                    cursor.execute("""
-                        CREATE TABLE IF NOT EXISTS candle_candidates (
-                            id INTEGER PRIMARY KEY AUTOINCREMENT,
-                            stock_code TEXT NOT NULL,           -- 종목코드
-                            stock_name TEXT,                    -- 종목명
-                            detected_at DATETIME NOT NULL,      -- 감지 시간
-                            current_price INTEGER NOT NULL,     -- 감지 시점 가격
-
-                            -- 캔들 패턴 정보
-                            pattern_type TEXT NOT NULL,         -- 패턴 유형 (HAMMER, ENGULFING 등)
-                            pattern_strength REAL,              -- 패턴 강도 (0.0-1.0)
-                            signal_strength TEXT,               -- 신호 강도 (WEAK/MEDIUM/STRONG)
-
-                            -- 기술적 지표
-                            rsi_value REAL,                     -- RSI 값
-                            macd_value REAL,                    -- MACD 값
-                            volume_ratio REAL,                  -- 거래량 비율
-                            price_change_rate REAL,             -- 가격 변동률
-
-                            -- 매수 신호 정보
-                            entry_signal TEXT,                  -- 진입 신호 (BUY/STRONG_BUY)
-                            entry_reason TEXT,                  -- 진입 사유
-                            risk_score INTEGER,                 -- 위험도 점수 (0-100)
-
-                            -- 가격 관리
-                            target_price INTEGER,               -- 목표가
-                            stop_loss_price INTEGER,            -- 손절가
-                            trailing_stop_price INTEGER,        -- 추적손절가
-
-                            -- 상태 정보
-                            status TEXT DEFAULT 'WATCHING',     -- WATCHING/ENTERED/EXITED/EXPIRED
-                            executed_at DATETIME,               -- 실행 시간
-                            exit_reason TEXT,                   -- 청산 사유
-
-                            created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                            updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
-                        )
-                    """)
-
-                    # 🆕 캔들 거래 상세 기록 테이블
-                    cursor.execute("""
-                        CREATE TABLE IF NOT EXISTS candle_trades (
-                            id INTEGER PRIMARY KEY AUTOINCREMENT,
-                            candidate_id INTEGER,               -- candle_candidates 테이블 참조
-                            trade_type TEXT NOT NULL,           -- ENTRY/EXIT
-                            stock_code TEXT NOT NULL,           -- 종목코드
-                            stock_name TEXT,                    -- 종목명
-
-                            -- 거래 정보
-                            quantity INTEGER NOT NULL,          -- 수량
-                            price INTEGER NOT NULL,             -- 체결가
-                            total_amount INTEGER NOT NULL,      -- 총 거래금액
-                            order_id TEXT,                      -- 주문번호
-
-                            -- 매수/매도 이유 상세
-                            decision_reason TEXT NOT NULL,      -- 결정 사유
-                            pattern_matched TEXT,               -- 매칭된 패턴
-                            technical_signals TEXT,             -- 기술적 신호들 (JSON)
-                            market_condition TEXT,              -- 시장 상황
-
-                            -- 성과 정보 (매도시)
-                            entry_price INTEGER,                -- 진입가격
-                            profit_loss INTEGER,                -- 손익
-                            profit_rate REAL,                  -- 수익률
-                            hold_duration INTEGER,              -- 보유시간 (분)
-
-                            -- 리스크 관리
-                            stop_loss_triggered BOOLEAN DEFAULT 0,  -- 손절 실행 여부
-                            target_achieved BOOLEAN DEFAULT 0,      -- 목표가 달성 여부
-                            trailing_stop_triggered BOOLEAN DEFAULT 0, -- 추적손절 실행 여부
-
-                            -- 메타 정보
-                            timestamp DATETIME NOT NULL,
-                            created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-
-                            FOREIGN KEY (candidate_id) REFERENCES candle_candidates(id)
-                        )
-                    """)
-
-                    # 🆕 캔들 패턴 분석 결과 테이블
-                    cursor.execute("""
-                        CREATE TABLE IF NOT EXISTS candle_patterns (
-                            id INTEGER PRIMARY KEY AUTOINCREMENT,
-                            stock_code TEXT NOT NULL,           -- 종목코드
-                            analysis_time DATETIME NOT NULL,    -- 분석 시간
-
-                            -- 패턴 정보
-                            pattern_name TEXT NOT NULL,         -- 패턴명
-                            pattern_type TEXT NOT NULL,         -- 패턴 유형 (BULLISH/BEARISH)
-                            confidence_score REAL NOT NULL,     -- 신뢰도 (0.0-1.0)
-                            strength TEXT NOT NULL,             -- 강도 (WEAK/MEDIUM/STRONG)
-
-                            -- 캔들 데이터 (최근 5개)
-                            candle_data TEXT,                   -- JSON 형태의 캔들 데이터
-
-                            -- 기술적 분석 결과
-                            volume_analysis TEXT,               -- 거래량 분석 결과
-                            trend_analysis TEXT,                -- 추세 분석 결과
-                            support_resistance TEXT,            -- 지지/저항 분석
-
-                            -- 예측 정보
-                            predicted_direction TEXT,           -- 예상 방향 (UP/DOWN/SIDEWAYS)
-                            predicted_price_range TEXT,         -- 예상 가격 범위 (JSON)
-                            success_probability REAL,           -- 성공 확률
-
-                            created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-                        )
-                    """)
-
-                    # 🆕 시장 스캔 로그 테이블
-                    cursor.execute("""
-                        CREATE TABLE IF NOT EXISTS market_scans (
-                            id INTEGER PRIMARY KEY AUTOINCREMENT,
-                            scan_time DATETIME NOT NULL,        -- 스캔 시간
-                            market_type TEXT NOT NULL,          -- 시장 타입 (KOSPI/KOSDAQ/ALL)
-                            scan_duration INTEGER,              -- 스캔 소요시간 (초)
+                    -- 🆕 투자 정보
+                    investment_amount INTEGER,          -- 실제 투자금액
+                    investment_ratio REAL,              -- 포트폴리오 대비 투자 비율
+
+                    -- 매도시 수익 정보
+                    buy_price INTEGER,                  -- 매수가
+                    profit_loss INTEGER,                -- 손익
+                    profit_rate REAL,                   -- 수익률
+                    hold_days INTEGER,                  -- 보유일수
+
+                    -- 메타 정보
+                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+
+            # 🆕 캔들 매수 후보 종목 테이블
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS candle_candidates (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    stock_code TEXT NOT NULL,           -- 종목코드
+                    stock_name TEXT,                    -- 종목명
+                    detected_at DATETIME NOT NULL,      -- 감지 시간
+                    current_price INTEGER NOT NULL,     -- 감지 시점 가격
+
+                    -- 캔들 패턴 정보
+                    pattern_type TEXT NOT NULL,         -- 패턴 유형 (HAMMER, ENGULFING 등)
+                    pattern_strength REAL,              -- 패턴 강도 (0.0-1.0)
+                    signal_strength TEXT,               -- 신호 강도 (WEAK/MEDIUM/STRONG)
+
+                    -- 기술적 지표
+                    rsi_value REAL,                     -- RSI 값
+                    macd_value REAL,                    -- MACD 값
+                    volume_ratio REAL,                  -- 거래량 비율
+                    price_change_rate REAL,             -- 가격 변동률
+
+                    -- 매수 신호 정보
+                    entry_signal TEXT,                  -- 진입 신호 (BUY/STRONG_BUY)
+                    entry_reason TEXT,                  -- 진입 사유
+                    risk_score INTEGER,                 -- 위험도 점수 (0-100)
+
+                    -- 가격 관리
+                    target_price INTEGER,               -- 목표가
+                    stop_loss_price INTEGER,            -- 손절가
+                    trailing_stop_price INTEGER,        -- 추적손절가
+
+                    -- 상태 정보
+                    status TEXT DEFAULT 'WATCHING',     -- WATCHING/ENTERED/EXITED/EXPIRED
+                    executed_at DATETIME,               -- 실행 시간
+                    exit_reason TEXT,                   -- 청산 사유
+
+                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+
+            # 🆕 캔들 거래 상세 기록 테이블
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS candle_trades (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    candidate_id INTEGER,               -- candle_candidates 테이블 참조
+                    trade_type TEXT NOT NULL,           -- ENTRY/EXIT
+                    stock_code TEXT NOT NULL,           -- 종목코드
+                    stock_name TEXT,                    -- 종목명
+
+                    -- 거래 정보
+                    quantity INTEGER NOT NULL,          -- 수량
+                    price INTEGER NOT NULL,             -- 체결가
+                    total_amount INTEGER NOT NULL,      -- 총 거래금액
+                    order_id TEXT,                      -- 주문번호
+
+                    -- 매수/매도 이유 상세
+                    decision_reason TEXT NOT NULL,      -- 결정 사유
+                    pattern_matched TEXT,               -- 매칭된 패턴
+                    technical_signals TEXT,             -- 기술적 신호들 (JSON)
+                    market_condition TEXT,              -- 시장 상황
+
+                    -- 성과 정보 (매도시)
+                    entry_price INTEGER,                -- 진입가격
+                    profit_loss INTEGER,                -- 손익
+                    profit_rate REAL,                  -- 수익률
+                    hold_duration INTEGER,              -- 보유시간 (분)
+
+                    -- 리스크 관리
+                    stop_loss_triggered BOOLEAN DEFAULT 0,  -- 손절 실행 여부
+                    target_achieved BOOLEAN DEFAULT 0,      -- 목표가 달성 여부
+                    trailing_stop_triggered BOOLEAN DEFAULT 0, -- 추적손절 실행 여부
+
+                    -- 메타 정보
+                    timestamp DATETIME NOT NULL,
+                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+
+                    FOREIGN KEY (candidate_id) REFERENCES candle_candidates(id)
+                )
+            """)
+
+            # 🆕 캔들 패턴 분석 결과 테이블
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS candle_patterns (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    stock_code TEXT NOT NULL,           -- 종목코드
+                    analysis_time DATETIME NOT NULL,    -- 분석 시간
+
+                    -- 패턴 정보
+                    pattern_name TEXT NOT NULL,         -- 패턴명
+                    pattern_type TEXT NOT NULL,         -- 패턴 유형 (BULLISH/BEARISH)
+                    confidence_score REAL NOT NULL,     -- 신뢰도 (0.0-1.0)
+                    strength TEXT NOT NULL,             -- 강도 (WEAK/MEDIUM/STRONG)
+
+                    -- 캔들 데이터 (최근 5개)
+                    candle_data TEXT,                   -- JSON 형태의 캔들 데이터
+
+                    -- 기술적 분석 결과
+                    volume_analysis TEXT,               -- 거래량 분석 결과
+                    trend_analysis TEXT,                -- 추세 분석 결과
+                    support_resistance TEXT,            -- 지지/저항 분석
+
+                    -- 예측 정보
+                    predicted_direction TEXT,           -- 예상 방향 (UP/DOWN/SIDEWAYS)
+                    predicted_price_range TEXT,         -- 예상 가격 범위 (JSON)
+                    success_probability REAL,           -- 성공 확률
+
+                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
 
-                            -- 스캔 결과
-                            total_stocks_scanned INTEGER,       -- 스캔한 총 종목 수
-                            candidates_found INTEGER,           -- 발견된 후보 수
-                            patterns_detected INTEGER,          -- 감지된 패턴 수
+            # 🆕 시장 스캔 로그 테이블
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS market_scans (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    scan_time DATETIME NOT NULL,        -- 스캔 시간
+                    market_type TEXT NOT NULL,          -- 시장 타입 (KOSPI/KOSDAQ/ALL)
+                    scan_duration INTEGER,              -- 스캔 소요시간 (초)
 
-                            -- 시장 상황
-                            market_sentiment TEXT,              -- 시장 심리 (BULLISH/BEARISH/NEUTRAL)
-                            volatility_level TEXT,              -- 변동성 수준 (LOW/MEDIUM/HIGH)
+                    -- 스캔 결과
+                    total_stocks_scanned INTEGER,       -- 스캔한 총 종목 수
+                    candidates_found INTEGER,           -- 발견된 후보 수
+                    patterns_detected INTEGER,          -- 감지된 패턴 수
 
-                            -- 스캔 설정
-                            scan_config TEXT,                   -- 스캔 설정 (JSON)
+                    -- 시장 상황
+                    market_sentiment TEXT,              -- 시장 심리 (BULLISH/BEARISH/NEUTRAL)
+                    volatility_level TEXT,              -- 변동성 수준 (LOW/MEDIUM/HIGH)
 
-                            created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-                        )
-                    """)
+                    -- 스캔 설정
+                    scan_config TEXT,                   -- 스캔 설정 (JSON)
 
-                    # 🆕 기존 보유 종목 분석 테이블
-                    cursor.execute("""
-                        CREATE TABLE IF NOT EXISTS existing_holdings_analysis (
-                            id INTEGER PRIMARY KEY AUTOINCREMENT,
-                            stock_code TEXT NOT NULL,           -- 종목코드
-                            stock_name TEXT,                    -- 종목명
-                            analysis_time DATETIME NOT NULL,    -- 분석 시간
-
-                            -- 보유 정보
-                            quantity INTEGER NOT NULL,          -- 보유 수량
-                            avg_price INTEGER NOT NULL,         -- 평균 매수가
-                            current_price INTEGER NOT NULL,     -- 현재가
-
-                            -- 손익 정보
-                            total_value INTEGER NOT NULL,       -- 총 평가액
-                            profit_loss INTEGER NOT NULL,       -- 평가손익
-                            profit_rate REAL NOT NULL,          -- 수익률
-
-                            -- 분석 결과
-                            recommendation TEXT NOT NULL,       -- 추천 (STRONG_BUY/BUY/HOLD/SELL/STRONG_SELL)
-                            recommendation_reasons TEXT,        -- 추천 사유 (JSON 배열)
-                            risk_level TEXT,                    -- 위험도 (LOW/MEDIUM/HIGH)
-
-                            -- 캔들 패턴 분석
-                            current_pattern TEXT,               -- 현재 패턴
-                            pattern_strength REAL,              -- 패턴 강도
-                            technical_indicators TEXT,          -- 기술적 지표 (JSON)
-
-                            -- 액션 계획
-                            suggested_action TEXT,              -- 제안 액션 (HOLD/PARTIAL_SELL/FULL_SELL)
-                            target_sell_price INTEGER,          -- 목표 매도가
-                            stop_loss_price INTEGER,            -- 손절가
-
-                            created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-                        )
-                    """)
-
-                    # 일별 거래 요약 테이블
-                    cursor.execute("""
-                        CREATE TABLE IF NOT EXISTS daily_summary (
-                            id INTEGER PRIMARY KEY AUTOINCREMENT,
-                            trade_date DATE NOT NULL UNIQUE,
-                            total_trades INTEGER DEFAULT 0,
-                            buy_trades INTEGER DEFAULT 0,
-                            sell_trades INTEGER DEFAULT 0,
-                            total_profit_loss INTEGER DEFAULT 0,
-                            total_profit_rate REAL DEFAULT 0,
-                            winning_trades INTEGER DEFAULT 0,
-                            losing_trades INTEGER DEFAULT 0,
-                            largest_profit INTEGER DEFAULT 0,
-                            largest_loss INTEGER DEFAULT 0,
-                            created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                            updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
-                        )
-                    """)
-
-                    # 🆕 시간대별 종목 선정 기록 테이블
-                    cursor.execute("""
-                        CREATE TABLE IF NOT EXISTS selected_stocks (
-                            id INTEGER PRIMARY KEY AUTOINCREMENT,
-                            selection_date DATE NOT NULL,        -- 선정 날짜
-                            time_slot TEXT NOT NULL,             -- 시간대 (golden_time, morning_leaders, etc.)
-                            slot_start_time TIME,                -- 시간대 시작 시간
-                            slot_end_time TIME,                  -- 시간대 종료 시간
-
-                            stock_code TEXT NOT NULL,            -- 종목코드
-                            stock_name TEXT,                     -- 종목명
-                            strategy_type TEXT NOT NULL,         -- 전략 타입 (gap_trading, volume_breakout, etc.)
-                            score REAL NOT NULL,                 -- 종목 점수
-                            reason TEXT,                         -- 선정 이유
-                            rank_in_strategy INTEGER,            -- 전략 내 순위
-
-                            -- 선정 당시 시장 데이터
-                            current_price INTEGER,               -- 현재가
-                            change_rate REAL,                    -- 변화율 (%)
-                            volume INTEGER,                      -- 거래량
-                            volume_ratio REAL,                   -- 거래량 비율
-                            market_cap INTEGER,                  -- 시가총액
-
-                            -- 추가 지표 (전략별로 다름)
-                            gap_rate REAL,                       -- 갭 비율 (gap_trading)
-                            momentum_strength REAL,              -- 모멘텀 강도 (momentum)
-                            breakout_volume REAL,                -- 돌파 거래량 (volume_breakout)
-                            technical_signals TEXT,              -- 기술적 신호 (JSON)
-
-                            -- 활성화 및 결과
-                            is_activated BOOLEAN DEFAULT FALSE,  -- 실시간 모니터링 활성화 여부
-                            activation_success BOOLEAN DEFAULT FALSE, -- 활성화 성공 여부
-                            trade_executed BOOLEAN DEFAULT FALSE, -- 실제 거래 실행 여부
-                            trade_id INTEGER,                    -- 연결된 거래 ID
-
-                            -- 메타 정보
-                            created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                            notes TEXT,                          -- 기타 메모
-
-                            FOREIGN KEY (trade_id) REFERENCES trades(id)
-                        )
-                    """)
-
-                    # 시간대별 요약 테이블 (일별 통계용)
-                    cursor.execute("""
-                        CREATE TABLE IF NOT EXISTS time_slot_summary (
-                            id INTEGER PRIMARY KEY AUTOINCREMENT,
-                            summary_date DATE NOT NULL,
-                            time_slot TEXT NOT NULL,
-
-                            total_candidates INTEGER DEFAULT 0,  -- 총 후보 종목 수
-                            activated_stocks INTEGER DEFAULT 0,  -- 활성화된 종목 수
-                            traded_stocks INTEGER DEFAULT 0,     -- 실제 거래된 종목 수
-
-                            -- 전략별 통계
-                            gap_trading_count INTEGER DEFAULT 0,
-                            volume_breakout_count INTEGER DEFAULT 0,
-                            momentum_count INTEGER DEFAULT 0,
-
-                            -- 성과 통계
-                            total_trades INTEGER DEFAULT 0,
-                            successful_trades INTEGER DEFAULT 0,
-                            total_profit_loss INTEGER DEFAULT 0,
-                            avg_score REAL DEFAULT 0,
-
-                            created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                            updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-
-                            UNIQUE(summary_date, time_slot)
-                        )
-                    """)
-
-                    # 인덱스 생성
-                    cursor.execute("CREATE INDEX IF NOT EXISTS idx_trades_stock_code ON trades(stock_code)")
-                    cursor.execute("CREATE INDEX IF NOT EXISTS idx_trades_timestamp ON trades(timestamp)")
-                    cursor.execute("CREATE INDEX IF NOT EXISTS idx_trades_strategy ON trades(strategy_type)")
-                    cursor.execute("CREATE INDEX IF NOT EXISTS idx_trades_type ON trades(trade_type)")
-
-                    # 🆕 시간대별 종목 선정 인덱스
-                    cursor.execute("CREATE INDEX IF NOT EXISTS idx_selected_date_slot ON selected_stocks(selection_date, time_slot)")
-                    cursor.execute("CREATE INDEX IF NOT EXISTS idx_selected_stock_code ON selected_stocks(stock_code)")
-                    cursor.execute("CREATE INDEX IF NOT EXISTS idx_selected_strategy ON selected_stocks(strategy_type)")
-                    cursor.execute("CREATE INDEX IF NOT EXISTS idx_selected_score ON selected_stocks(score DESC)")
-                    cursor.execute("CREATE INDEX IF NOT EXISTS idx_time_slot_summary_date ON time_slot_summary(summary_date)")
-
-                    # 🆕 캔들 관련 인덱스
-                    cursor.execute("CREATE INDEX IF NOT EXISTS idx_candle_candidates_stock_code ON candle_candidates(stock_code)")
-                    cursor.execute("CREATE INDEX IF NOT EXISTS idx_candle_candidates_detected_at ON candle_candidates(detected_at)")
-                    cursor.execute("CREATE INDEX IF NOT EXISTS idx_candle_candidates_status ON candle_candidates(status)")
-                    cursor.execute("CREATE INDEX IF NOT EXISTS idx_candle_trades_stock_code ON candle_trades(stock_code)")
-                    cursor.execute("CREATE INDEX IF NOT EXISTS idx_candle_trades_timestamp ON candle_trades(timestamp)")
-                    cursor.execute("CREATE INDEX IF NOT EXISTS idx_candle_trades_candidate_id ON candle_trades(candidate_id)")
-                    cursor.execute("CREATE INDEX IF NOT EXISTS idx_candle_patterns_stock_code ON candle_patterns(stock_code)")
-                    cursor.execute("CREATE INDEX IF NOT EXISTS idx_candle_patterns_analysis_time ON candle_patterns(analysis_time)")
-                    cursor.execute("CREATE INDEX IF NOT EXISTS idx_market_scans_scan_time ON market_scans(scan_time)")
-                    cursor.execute("CREATE INDEX IF NOT EXISTS idx_existing_holdings_stock_code ON existing_holdings_analysis(stock_code)")
-                    cursor.execute("CREATE INDEX IF NOT EXISTS idx_existing_holdings_analysis_time ON existing_holdings_analysis(analysis_time)")
-
-                    conn.commit()
-                    logger.info("✅ 캔들 트레이딩 데이터베이스 테이블 생성 완료")
-
-            finally:
-                # 🆕 초기화 완료 표시
-                if hasattr(self, '_initializing'):
-                    delattr(self, '_initializing')
-
-        # 🆕 재시도 로직 적용
-        self._execute_with_retry(_create_tables)
+                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+
+            # 🆕 기존 보유 종목 분석 테이블
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS existing_holdings_analysis (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    stock_code TEXT NOT NULL,           -- 종목코드
+                    stock_name TEXT,                    -- 종목명
+                    analysis_time DATETIME NOT NULL,    -- 분석 시간
+
+                    -- 보유 정보
+                    quantity INTEGER NOT NULL,          -- 보유 수량
+                    avg_price INTEGER NOT NULL,         -- 평균 매수가
+                    current_price INTEGER NOT NULL,     -- 현재가
+
+                    -- 손익 정보
+                    total_value INTEGER NOT NULL,       -- 총 평가액
+                    profit_loss INTEGER NOT NULL,       -- 평가손익
+                    profit_rate REAL NOT NULL,          -- 수익률
+
+                    -- 분석 결과
+                    recommendation TEXT NOT NULL,       -- 추천 (STRONG_BUY/BUY/HOLD/SELL/STRONG_SELL)
+                    recommendation_reasons TEXT,        -- 추천 사유 (JSON 배열)
+                    risk_level TEXT,                    -- 위험도 (LOW/MEDIUM/HIGH)
+
+                    -- 캔들 패턴 분석
+                    current_pattern TEXT,               -- 현재 패턴
+                    pattern_strength REAL,              -- 패턴 강도
+                    technical_indicators TEXT,          -- 기술적 지표 (JSON)
+
+                    -- 액션 계획
+                    suggested_action TEXT,              -- 제안 액션 (HOLD/PARTIAL_SELL/FULL_SELL)
+                    target_sell_price INTEGER,          -- 목표 매도가
+                    stop_loss_price INTEGER,            -- 손절가
+
+                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+
+            # 일별 거래 요약 테이블
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS daily_summary (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    trade_date DATE NOT NULL UNIQUE,
+                    total_trades INTEGER DEFAULT 0,
+                    buy_trades INTEGER DEFAULT 0,
+                    sell_trades INTEGER DEFAULT 0,
+                    total_profit_loss INTEGER DEFAULT 0,
+                    total_profit_rate REAL DEFAULT 0,
+                    winning_trades INTEGER DEFAULT 0,
+                    losing_trades INTEGER DEFAULT 0,
+                    largest_profit INTEGER DEFAULT 0,
+                    largest_loss INTEGER DEFAULT 0,
+                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+
+            # 🆕 시간대별 종목 선정 기록 테이블
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS selected_stocks (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    selection_date DATE NOT NULL,        -- 선정 날짜
+                    time_slot TEXT NOT NULL,             -- 시간대 (golden_time, morning_leaders, etc.)
+                    slot_start_time TIME,                -- 시간대 시작 시간
+                    slot_end_time TIME,                  -- 시간대 종료 시간
+
+                    stock_code TEXT NOT NULL,            -- 종목코드
+                    stock_name TEXT,                     -- 종목명
+                    strategy_type TEXT NOT NULL,         -- 전략 타입 (gap_trading, volume_breakout, etc.)
+                    score REAL NOT NULL,                 -- 종목 점수
+                    reason TEXT,                         -- 선정 이유
+                    rank_in_strategy INTEGER,            -- 전략 내 순위
+
+                    -- 선정 당시 시장 데이터
+                    current_price INTEGER,               -- 현재가
+                    change_rate REAL,                    -- 변화율 (%)
+                    volume INTEGER,                      -- 거래량
+                    volume_ratio REAL,                   -- 거래량 비율
+                    market_cap INTEGER,                  -- 시가총액
+
+                    -- 추가 지표 (전략별로 다름)
+                    gap_rate REAL,                       -- 갭 비율 (gap_trading)
+                    momentum_strength REAL,              -- 모멘텀 강도 (momentum)
+                    breakout_volume REAL,                -- 돌파 거래량 (volume_breakout)
+                    technical_signals TEXT,              -- 기술적 신호 (JSON)
+
+                    -- 활성화 및 결과
+                    is_activated BOOLEAN DEFAULT FALSE,  -- 실시간 모니터링 활성화 여부
+                    activation_success BOOLEAN DEFAULT FALSE, -- 활성화 성공 여부
+                    trade_executed BOOLEAN DEFAULT FALSE, -- 실제 거래 실행 여부
+                    trade_id INTEGER,                    -- 연결된 거래 ID
+
+                    -- 메타 정보
+                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                    notes TEXT,                          -- 기타 메모
+
+                    FOREIGN KEY (trade_id) REFERENCES trades(id)
+                )
+            """)
+
+            # 시간대별 요약 테이블 (일별 통계용)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS time_slot_summary (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    summary_date DATE NOT NULL,
+                    time_slot TEXT NOT NULL,
+
+                    total_candidates INTEGER DEFAULT 0,  -- 총 후보 종목 수
+                    activated_stocks INTEGER DEFAULT 0,  -- 활성화된 종목 수
+                    traded_stocks INTEGER DEFAULT 0,     -- 실제 거래된 종목 수
+
+                    -- 전략별 통계
+                    gap_trading_count INTEGER DEFAULT 0,
+                    volume_breakout_count INTEGER DEFAULT 0,
+                    momentum_count INTEGER DEFAULT 0,
+
+                    -- 성과 통계
+                    total_trades INTEGER DEFAULT 0,
+                    successful_trades INTEGER DEFAULT 0,
+                    total_profit_loss INTEGER DEFAULT 0,
+                    avg_score REAL DEFAULT 0,
+
+                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+
+                    UNIQUE(summary_date, time_slot)
+                )
+            """)
+
+            # 인덱스 생성
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_trades_stock_code ON trades(stock_code)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_trades_timestamp ON trades(timestamp)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_trades_strategy ON trades(strategy_type)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_trades_type ON trades(trade_type)")
+
+            # 🆕 시간대별 종목 선정 인덱스
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_selected_date_slot ON selected_stocks(selection_date, time_slot)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_selected_stock_code ON selected_stocks(stock_code)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_selected_strategy ON selected_stocks(strategy_type)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_selected_score ON selected_stocks(score DESC)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_time_slot_summary_date ON time_slot_summary(summary_date)")
+
+            # 🆕 캔들 관련 인덱스
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_candle_candidates_stock_code ON candle_candidates(stock_code)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_candle_candidates_detected_at ON candle_candidates(detected_at)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_candle_candidates_status ON candle_candidates(status)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_candle_trades_stock_code ON candle_trades(stock_code)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_candle_trades_timestamp ON candle_trades(timestamp)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_candle_trades_candidate_id ON candle_trades(candidate_id)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_candle_patterns_stock_code ON candle_patterns(stock_code)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_candle_patterns_analysis_time ON candle_patterns(analysis_time)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_market_scans_scan_time ON market_scans(scan_time)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_existing_holdings_stock_code ON existing_holdings_analysis(stock_code)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_existing_holdings_analysis_time ON existing_holdings_analysis(analysis_time)")
+
+            logger.info("✅ 캔들 트레이딩 데이터베이스 테이블 생성 완료")
+
+        self._writer.execute(_create_tables)
 
     def record_buy_trade(self, stock_code: str, stock_name: str, quantity: int,
                         price: int, total_amount: int, strategy_type: str,
                         order_id: str = "", status: str = "SUCCESS",
                         error_message: str = "", **kwargs) -> int:
         """매수 거래 기록 - 패턴 정보 포함"""
-        def _record_buy():
-            with self._get_connection() as conn:
-                cursor = conn.cursor()
+        def _record_buy(conn):
+            cursor = conn.cursor()
 
-                # 🆕 패턴 정보 추출
-                pattern_type = kwargs.get('pattern_type', '')
-                pattern_confidence = kwargs.get('pattern_confidence', 0.0)
-                pattern_strength = kwargs.get('pattern_strength', 0)
+            # 🆕 패턴 정보 추출
+            pattern_type = kwargs.get('pattern_type', '')
+            pattern_confidence = kwargs.get('pattern_confidence', 0.0)
+            pattern_strength = kwargs.get('pattern_strength', 0)
                 
-                # 🆕 기술적 지표 정보 추출
-                rsi_value = kwargs.get('rsi_value', None)
-                macd_value = kwargs.get('macd_value', None)
-                volume_ratio = kwargs.get('volume_ratio', None)
+            # 🆕 기술적 지표 정보 추출
+            rsi_value = kwargs.get('rsi_value', None)
+            macd_value = kwargs.get('macd_value', None)
+            volume_ratio = kwargs.get('volume_ratio', None)
                 
-                # 🆕 투자 정보 추출
-                investment_amount = kwargs.get('investment_amount', total_amount)
-                investment_ratio = kwargs.get('investment_ratio', None)
-
-                cursor.execute("""
-                    INSERT INTO trades (
-                        trade_type, stock_code, stock_name, quantity, price,
-                        total_amount, strategy_type, timestamp, order_id,
-                        status, error_message,
-                        pattern_type, pattern_confidence, pattern_strength,
-                        rsi_value, macd_value, volume_ratio,
-                        investment_amount, investment_ratio
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    'BUY', stock_code, stock_name, quantity, price,
-                    total_amount, strategy_type, datetime.now(), order_id,
+            # 🆕 투자 정보 추출
+            investment_amount = kwargs.get('investment_amount', total_amount)
+            investment_ratio = kwargs.get('investment_ratio', None)
+
+            cursor.execute("""
+                INSERT INTO trades (
+                    trade_type, stock_code, stock_name, quantity, price,
+                    total_amount, strategy_type, timestamp, order_id,
                     status, error_message,
                     pattern_type, pattern_confidence, pattern_strength,
                     rsi_value, macd_value, volume_ratio,
                     investment_amount, investment_ratio
-                ))
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                'BUY', stock_code, stock_name, quantity, price,
+                total_amount, strategy_type, datetime.now(), order_id,
+                status, error_message,
+                pattern_type, pattern_confidence, pattern_strength,
+                rsi_value, macd_value, volume_ratio,
+                investment_amount, investment_ratio
+            ))
 
-                trade_id = cursor.lastrowid
+            trade_id = cursor.lastrowid
 
-                logger.info(f"💾 매수 기록 저장: {stock_code} {quantity}주 @{price:,}원 "
-                          f"패턴:{pattern_type} 신뢰도:{pattern_confidence:.2f} (ID: {trade_id})")
+            logger.info(f"💾 매수 기록 저장: {stock_code} {quantity}주 @{price:,}원 "
+                      f"패턴:{pattern_type} 신뢰도:{pattern_confidence:.2f} (ID: {trade_id})")
 
-                # 일별 요약 업데이트
-                self._update_daily_summary()
+            # 일별 요약 업데이트
+            self._update_daily_summary(conn)
 
-                return trade_id
+            return trade_id
 
         try:
-            return self._execute_with_retry(_record_buy)
+            return self._writer.execute(_record_buy)
         except Exception as e:
             logger.error(f"매수 기록 저장 오류: {e}")
             return -1
@@ -585,78 +516,103 @@ class TradeDatabase:
                          status: str = "SUCCESS", error_message: str = "",
                          **kwargs) -> int:
         """매도 거래 기록 - 패턴 정보 포함"""
-        def _record_sell():
-            with self._get_connection() as conn:
-                cursor = conn.cursor()
+        def _record_sell(conn):
+            cursor = conn.cursor()
 
-                # 매수 거래 정보 조회 (수익률 계산용)
-                buy_price = 0
-                holding_duration = 0
-
-                if buy_trade_id:
-                    cursor.execute("""
-                        SELECT price, timestamp FROM trades
-                        WHERE id = ? AND trade_type = 'BUY'
-                    """, (buy_trade_id,))
-
-                    buy_result = cursor.fetchone()
-                    if buy_result:
-                        buy_price = buy_result[0]
-                        buy_time = datetime.fromisoformat(buy_result[1])
-                        holding_duration = int((datetime.now() - buy_time).total_seconds() / 60)
-
-                # 손익 계산
-                profit_loss = (price - buy_price) * quantity if buy_price > 0 else 0
-                profit_rate = ((price - buy_price) / buy_price * 100) if buy_price > 0 else 0
-
-                # 🆕 패턴 정보 추출 (매도 시에는 매도 사유 패턴)
-                pattern_type = kwargs.get('pattern_type', '')
-                pattern_confidence = kwargs.get('pattern_confidence', 0.0)
-                pattern_strength = kwargs.get('pattern_strength', 0)
-                
-                # 🆕 기술적 지표 정보 추출
-                rsi_value = kwargs.get('rsi_value', None)
-                macd_value = kwargs.get('macd_value', None)
-                volume_ratio = kwargs.get('volume_ratio', None)
+            # 매수 거래 정보 조회 (수익률 계산용)
+            buy_price = 0
+            holding_duration = 0
 
+            if buy_trade_id:
                 cursor.execute("""
-                    INSERT INTO trades (
-                        trade_type, stock_code, stock_name, quantity, price,
-                        total_amount, strategy_type, timestamp, order_id,
-                        status, error_message, buy_price, profit_loss,
-                        profit_rate, hold_days,
-                        pattern_type, pattern_confidence, pattern_strength,
-                        rsi_value, macd_value, volume_ratio
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    'SELL', stock_code, stock_name, quantity, price,
-                    total_amount, strategy_type, datetime.now(), order_id,
+                    SELECT price, timestamp FROM trades
+                    WHERE id = ? AND trade_type = 'BUY'
+                """, (buy_trade_id,))
+
+                buy_result = cursor.fetchone()
+                if buy_result:
+                    buy_price = buy_result[0]
+                    buy_time = datetime.fromisoformat(buy_result[1])
+                    holding_duration = int((datetime.now() - buy_time).total_seconds() / 60)
+
+            # 손익 계산
+            profit_loss = (price - buy_price) * quantity if buy_price > 0 else 0
+            profit_rate = ((price - buy_price) / buy_price * 100) if buy_price > 0 else 0
+
+            # 🆕 패턴 정보 추출 (매도 시에는 매도 사유 패턴)
+            pattern_type = kwargs.get('pattern_type', '')
+            pattern_confidence = kwargs.get('pattern_confidence', 0.0)
+            pattern_strength = kwargs.get('pattern_strength', 0)
+                
+            # 🆕 기술적 지표 정보 추출
+            rsi_value = kwargs.get('rsi_value', None)
+            macd_value = kwargs.get('macd_value', None)
+            volume_ratio = kwargs.get('volume_ratio', None)
+
+            cursor.execute("""
+                INSERT INTO trades (
+                    trade_type, stock_code, stock_name, quantity, price,
+                    total_amount, strategy_type, timestamp, order_id,
                     status, error_message, buy_price, profit_loss,
-                    profit_rate, holding_duration,
+                    profit_rate, hold_days,
                     pattern_type, pattern_confidence, pattern_strength,
                     rsi_value, macd_value, volume_ratio
-                ))
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                'SELL', stock_code, stock_name, quantity, price,
+                total_amount, strategy_type, datetime.now(), order_id,
+                status, error_message, buy_price, profit_loss,
+                profit_rate, holding_duration,
+                pattern_type, pattern_confidence, pattern_strength,
+                rsi_value, macd_value, volume_ratio
+            ))
 
-                trade_id = cursor.lastrowid
+            trade_id = cursor.lastrowid
 
-                logger.info(f"💾 매도 기록 저장: {stock_code} {quantity}주 @{price:,}원 "
-                          f"(손익: {profit_loss:,}원, {profit_rate:.2f}%, 패턴:{pattern_type}, ID: {trade_id})")
+            logger.info(f"💾 매도 기록 저장: {stock_code} {quantity}주 @{price:,}원 "
+                      f"(손익: {profit_loss:,}원, {profit_rate:.2f}%, 패턴:{pattern_type}, ID: {trade_id})")
 
-                # 일별 요약 업데이트
-                self._update_daily_summary()
+            # 일별 요약 업데이트
+            self._update_daily_summary(conn)
 
-                return trade_id
+            return trade_id
 
         try:
-            return self._execute_with_retry(_record_sell)
+            return self._writer.execute(_record_sell)
         except Exception as e:
             logger.error(f"매도 기록 저장 오류: {e}")
             return -1
 
+    def update_trade_pattern_info(self, trade_id: int, pattern_info: Dict) -> bool:
+        """🆕 기존 매수 거래 레코드의 패턴/지표 정보 갱신"""
+        def _update_pattern(conn):
+            cursor = conn.cursor()
+            cursor.execute("""
+                UPDATE trades
+                SET pattern_type = ?,
+                    pattern_confidence = ?,
+                    pattern_strength = ?,
+                    rsi_value = ?,
+                    macd_value = ?,
+                    volume_ratio = ?
+                WHERE id = ? AND trade_type = 'BUY'
+            """, (
+                pattern_info['pattern_type'],
+                pattern_info['pattern_confidence'],
+                pattern_info['pattern_strength'],
+                pattern_info['rsi_value'],
+                pattern_info['macd_value'],
+                pattern_info['volume_ratio'],
+                trade_id
+            ))
+            return cursor.rowcount > 0
+
+        return self._writer.execute(_update_pattern)
+
     def get_open_positions(self) -> List[Dict]:
         """미결제 포지션 조회 (매수했지만 매도하지 않은 종목)"""
         try:
-            with self._get_connection() as conn:
+            with self._read_pool.connection() as conn:
                 cursor = conn.cursor()
 
                 cursor.execute("""
@@ -692,7 +648,7 @@ class TradeDatabase:
     def find_buy_trade_for_sell(self, stock_code: str, quantity: int) -> Optional[int]:
         """매도할 종목의 해당하는 매수 거래 ID 찾기 (FIFO 방식)"""
         try:
-            with self._get_connection() as conn:
+            with self._read_pool.connection() as conn:
                 cursor = conn.cursor()
 
                 # 해당 종목의 미결제 매수 거래를 시간순으로 조회
@@ -730,7 +686,7 @@ class TradeDatabase:
     def get_daily_summary(self, days: int = 7) -> List[Dict]:
         """최근 N일간 거래 요약"""
         try:
-            with self._get_connection() as conn:
+            with self._read_pool.connection() as conn:
                 cursor = conn.cursor()
 
                 end_date = datetime.now().date()
@@ -759,7 +715,7 @@ class TradeDatabase:
                          trade_type: str = None) -> List[Dict]:
         """거래 내역 조회"""
         try:
-            with self._get_connection() as conn:
+            with self._read_pool.connection() as conn:
                 cursor = conn.cursor()
 
                 # 조건 구성
@@ -803,7 +759,7 @@ class TradeDatabase:
     def get_performance_stats(self, days: int = 30) -> Dict:
         """거래 성과 통계"""
         try:
-            with self._get_connection() as conn:
+            with self._read_pool.connection() as conn:
                 cursor = conn.cursor()
 
                 end_date = datetime.now()
@@ -908,46 +864,43 @@ class TradeDatabase:
             logger.error(f"성과 통계 조회 오류: {e}")
             return {}
 
-    def _update_daily_summary(self):
-        """일별 요약 업데이트"""
+    def _update_daily_summary(self, conn):
+        """일별 요약 업데이트 (쓰기 스레드의 현재 트랜잭션에서 실행)"""
         try:
             today = datetime.now().date()
 
-            with self._get_connection() as conn:
-                cursor = conn.cursor()
-
-                # 오늘의 거래 통계 계산
-                cursor.execute("""
-                    SELECT
-                        COUNT(*) as total_trades,
-                        SUM(CASE WHEN trade_type = 'BUY' THEN 1 ELSE 0 END) as buy_trades,
-                        SUM(CASE WHEN trade_type = 'SELL' THEN 1 ELSE 0 END) as sell_trades,
-                        COALESCE(SUM(CASE WHEN trade_type = 'SELL' AND profit_loss IS NOT NULL THEN profit_loss ELSE 0 END), 0) as total_profit_loss,
-                        COALESCE(AVG(CASE WHEN trade_type = 'SELL' AND profit_rate IS NOT NULL THEN profit_rate END), 0) as avg_profit_rate,
-                        SUM(CASE WHEN trade_type = 'SELL' AND profit_loss > 0 THEN 1 ELSE 0 END) as winning_trades,
-                        SUM(CASE WHEN trade_type = 'SELL' AND profit_loss < 0 THEN 1 ELSE 0 END) as losing_trades,
-                        COALESCE(MAX(CASE WHEN trade_type = 'SELL' THEN profit_loss END), 0) as largest_profit,
-                        COALESCE(MIN(CASE WHEN trade_type = 'SELL' THEN profit_loss END), 0) as largest_loss
-                    FROM trades
-                    WHERE DATE(timestamp) = ? AND status = 'SUCCESS'
-                """, (today,))
-
-                stats = cursor.fetchone()
-
-                # UPSERT (존재하면 업데이트, 없으면 삽입)
-                cursor.execute("""
-                    INSERT OR REPLACE INTO daily_summary (
-                        trade_date, total_trades, buy_trades, sell_trades,
-                        total_profit_loss, total_profit_rate, winning_trades,
-                        losing_trades, largest_profit, largest_loss, updated_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    today, stats[0], stats[1], stats[2], stats[3],
-                    stats[4], stats[5], stats[6], stats[7], stats[8],
-                    datetime.now()
-                ))
-
-                conn.commit()
+            cursor = conn.cursor()
+
+            # 오늘의 거래 통계 계산
+            cursor.execute("""
+                SELECT
+                    COUNT(*) as total_trades,
+                    SUM(CASE WHEN trade_type = 'BUY' THEN 1 ELSE 0 END) as buy_trades,
+                    SUM(CASE WHEN trade_type = 'SELL' THEN 1 ELSE 0 END) as sell_trades,
+                    COALESCE(SUM(CASE WHEN trade_type = 'SELL' AND profit_loss IS NOT NULL THEN profit_loss ELSE 0 END), 0) as total_profit_loss,
+                    COALESCE(AVG(CASE WHEN trade_type = 'SELL' AND profit_rate IS NOT NULL THEN profit_rate END), 0) as avg_profit_rate,
+                    SUM(CASE WHEN trade_type = 'SELL' AND profit_loss > 0 THEN 1 ELSE 0 END) as winning_trades,
+                    SUM(CASE WHEN trade_type = 'SELL' AND profit_loss < 0 THEN 1 ELSE 0 END) as losing_trades,
+                    COALESCE(MAX(CASE WHEN trade_type = 'SELL' THEN profit_loss END), 0) as largest_profit,
+                    COALESCE(MIN(CASE WHEN trade_type = 'SELL' THEN profit_loss END), 0) as largest_loss
+                FROM trades
+                WHERE DATE(timestamp) = ? AND status = 'SUCCESS'
+            """, (today,))
+
+            stats = cursor.fetchone()
+
+            # UPSERT (존재하면 업데이트, 없으면 삽입)
+            cursor.execute("""
+                INSERT OR REPLACE INTO daily_summary (
+                    trade_date, total_trades, buy_trades, sell_trades,
+                    total_profit_loss, total_profit_rate, winning_trades,
+                    losing_trades, largest_profit, largest_loss, updated_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                today, stats[0], stats[1], stats[2], stats[3],
+                stats[4], stats[5], stats[6], stats[7], stats[8],
+                datetime.now()
+            ))
 
         except Exception as e:
             logger.error(f"일별 요약 업데이트 오류: {e}")
@@ -986,21 +939,21 @@ class TradeDatabase:
 
     def cleanup_old_trades(self, days: int = 90):
         """오래된 거래 기록 정리"""
-        try:
-            cutoff_date = datetime.now() - timedelta(days=days)
+        def _cleanup(conn):
+            cursor = conn.cursor()
 
-            with self._get_connection() as conn:
-                cursor = conn.cursor()
+            cursor.execute("""
+                DELETE FROM trades
+                WHERE timestamp < ? AND status != 'SUCCESS'
+            """, (cutoff_date,))
 
-                cursor.execute("""
-                    DELETE FROM trades
-                    WHERE timestamp < ? AND status != 'SUCCESS'
-                """, (cutoff_date,))
+            return cursor.rowcount
 
-                deleted_count = cursor.rowcount
-                conn.commit()
+        try:
+            cutoff_date = datetime.now() - timedelta(days=days)
 
-                logger.info(f"오래된 거래 기록 {deleted_count}개 정리 완료")
+            deleted_count = self._writer.execute(_cleanup)
+            logger.info(f"오래된 거래 기록 {deleted_count}개 정리 완료")
 
         except Exception as e:
             logger.error(f"거래 기록 정리 오류: {e}")
@@ -1008,7 +961,7 @@ class TradeDatabase:
     def get_database_stats(self) -> Dict:
         """데이터베이스 통계"""
         try:
-            with self._get_connection() as conn:
+            with self._read_pool.connection() as conn:
                 cursor = conn.cursor()
 
                 cursor.execute("SELECT COUNT(*) FROM trades")
@@ -1040,112 +993,109 @@ class TradeDatabase:
     def record_selected_stocks(self, time_slot: str, slot_start_time: str, slot_end_time: str,
                               stock_candidates: List[Dict]) -> List[int]:
         """시간대별 선정된 종목들을 기록"""
-        try:
-            with self._get_connection() as conn:
-                cursor = conn.cursor()
-                today = datetime.now().date()
-                recorded_ids = []
+        def _record_selected(conn):
+            cursor = conn.cursor()
+            today = datetime.now().date()
+            recorded_ids = []
 
-                for i, candidate in enumerate(stock_candidates):
-                    try:
-                        # 기술적 신호 JSON 직렬화
-                        technical_signals = json.dumps(candidate.get('technical_signals', {}))
-
-                        cursor.execute("""
-                            INSERT INTO selected_stocks (
-                                selection_date, time_slot, slot_start_time, slot_end_time,
-                                stock_code, stock_name, strategy_type, score, reason, rank_in_strategy,
-                                current_price, change_rate, volume, volume_ratio, market_cap,
-                                gap_rate, momentum_strength, breakout_volume, technical_signals,
-                                notes
-                            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        """, (
-                            today, time_slot, slot_start_time, slot_end_time,
-                            candidate.get('stock_code', ''),
-                            candidate.get('stock_name', ''),
-                            candidate.get('strategy_type', ''),
-                            candidate.get('score', 0.0),
-                            candidate.get('reason', ''),
-                            i + 1,  # rank_in_strategy
-                            candidate.get('current_price', 0),
-                            candidate.get('change_rate', 0.0),
-                            candidate.get('volume', 0),
-                            candidate.get('volume_ratio', 0.0),
-                            candidate.get('market_cap', 0),
-                            candidate.get('gap_rate', 0.0),
-                            candidate.get('momentum_strength', 0.0),
-                            candidate.get('breakout_volume', 0.0),
-                            technical_signals,
-                            candidate.get('notes', '')
-                        ))
-
-                        recorded_ids.append(cursor.lastrowid)
-
-                    except Exception as e:
-                        logger.error(f"종목 선정 기록 오류 ({candidate.get('stock_code', 'Unknown')}): {e}")
-                        continue
-
-                conn.commit()
-
-                logger.info(f"💾 {time_slot} 시간대 종목 선정 기록: {len(recorded_ids)}개 종목")
-
-                # 시간대별 요약 업데이트
-                self._update_time_slot_summary(today, time_slot)
-
-                return recorded_ids
+            for i, candidate in enumerate(stock_candidates):
+                try:
+                    # 기술적 신호 JSON 직렬화
+                    technical_signals = json.dumps(candidate.get('technical_signals', {}))
+
+                    cursor.execute("""
+                        INSERT INTO selected_stocks (
+                            selection_date, time_slot, slot_start_time, slot_end_time,
+                            stock_code, stock_name, strategy_type, score, reason, rank_in_strategy,
+                            current_price, change_rate, volume, volume_ratio, market_cap,
+                            gap_rate, momentum_strength, breakout_volume, technical_signals,
+                            notes
+                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """, (
+                        today, time_slot, slot_start_time, slot_end_time,
+                        candidate.get('stock_code', ''),
+                        candidate.get('stock_name', ''),
+                        candidate.get('strategy_type', ''),
+                        candidate.get('score', 0.0),
+                        candidate.get('reason', ''),
+                        i + 1,  # rank_in_strategy
+                        candidate.get('current_price', 0),
+                        candidate.get('change_rate', 0.0),
+                        candidate.get('volume', 0),
+                        candidate.get('volume_ratio', 0.0),
+                        candidate.get('market_cap', 0),
+                        candidate.get('gap_rate', 0.0),
+                        candidate.get('momentum_strength', 0.0),
+                        candidate.get('breakout_volume', 0.0),
+                        technical_signals,
+                        candidate.get('notes', '')
+                    ))
+
+                    recorded_ids.append(cursor.lastrowid)
 
+                except Exception as e:
+                    logger.error(f"종목 선정 기록 오류 ({candidate.get('stock_code', 'Unknown')}): {e}")
+                    continue
+
+            logger.info(f"💾 {time_slot} 시간대 종목 선정 기록: {len(recorded_ids)}개 종목")
+
+            # 시간대별 요약 업데이트
+            self._update_time_slot_summary(conn, today, time_slot)
+
+            return recorded_ids
+
+        try:
+            return self._writer.execute(_record_selected)
         except Exception as e:
             logger.error(f"시간대별 종목 선정 기록 오류: {e}")
             return []
 
     def update_stock_activation(self, stock_code: str, is_activated: bool, activation_success: bool = False):
         """종목 활성화 상태 업데이트"""
-        def _update_activation():
-            with self._get_connection() as conn:
-                cursor = conn.cursor()
-                today = datetime.now().date()
+        def _update_activation(conn):
+            cursor = conn.cursor()
+            today = datetime.now().date()
 
-                cursor.execute("""
-                    UPDATE selected_stocks
-                    SET is_activated = ?, activation_success = ?
-                    WHERE stock_code = ? AND selection_date = ?
-                """, (is_activated, activation_success, stock_code, today))
-
-                if cursor.rowcount > 0:
-                    logger.debug(f"종목 활성화 상태 업데이트: {stock_code} (활성화: {is_activated})")
-                    return True
-                else:
-                    logger.warning(f"종목 활성화 상태 업데이트 실패: {stock_code} (해당 종목 없음)")
-                    return False
+            cursor.execute("""
+                UPDATE selected_stocks
+                SET is_activated = ?, activation_success = ?
+                WHERE stock_code = ? AND selection_date = ?
+            """, (is_activated, activation_success, stock_code, today))
+
+            if cursor.rowcount > 0:
+                logger.debug(f"종목 활성화 상태 업데이트: {stock_code} (활성화: {is_activated})")
+                return True
+            else:
+                logger.warning(f"종목 활성화 상태 업데이트 실패: {stock_code} (해당 종목 없음)")
+                return False
 
         try:
-            return self._execute_with_retry(_update_activation)
+            return self._writer.execute(_update_activation)
         except Exception as e:
             logger.error(f"종목 활성화 상태 업데이트 오류: {e}")
             return False
 
     def link_trade_to_selected_stock(self, stock_code: str, trade_id: int):
         """거래와 선정된 종목 연결"""
-        def _link_trade():
-            with self._get_connection() as conn:
-                cursor = conn.cursor()
-                today = datetime.now().date()
+        def _link_trade(conn):
+            cursor = conn.cursor()
+            today = datetime.now().date()
 
-                cursor.execute("""
-                    UPDATE selected_stocks
-                    SET trade_executed = TRUE, trade_id = ?
-                    WHERE stock_code = ? AND selection_date = ?
-                """, (trade_id, stock_code, today))
-
-                if cursor.rowcount > 0:
-                    logger.info(f"거래 연결 완료: {stock_code} → 거래 ID {trade_id}")
-                    return True
-                else:
-                    logger.warning(f"거래 연결 실패: {stock_code} (해당 종목 없음)")
-                    return False
+            cursor.execute("""
+                UPDATE selected_stocks
+                SET trade_executed = TRUE, trade_id = ?
+                WHERE stock_code = ? AND selection_date = ?
+            """, (trade_id, stock_code, today))
+
+            if cursor.rowcount > 0:
+                logger.info(f"거래 연결 완료: {stock_code} → 거래 ID {trade_id}")
+                return True
+            else:
+                logger.warning(f"거래 연결 실패: {stock_code} (해당 종목 없음)")
+                return False
 
         try:
-            return self._execute_with_retry(_link_trade)
+            return self._writer.execute(_link_trade)
         except Exception as e:
             logger.error(f"거래 연결 오류: {e}")
             return False
@@ -1153,7 +1103,7 @@ class TradeDatabase:
     def get_selected_stocks_by_date(self, target_date: str = None, time_slot: str = None) -> List[Dict]:
         """날짜별/시간대별 선정된 종목 조회"""
         try:
-            with self._get_connection() as conn:
+            with self._read_pool.connection() as conn:
                 cursor = conn.cursor()
 
                 # 기본값: 오늘
@@ -1228,7 +1178,7 @@ class TradeDatabase:
     def get_time_slot_performance(self, days: int = 7) -> List[Dict]:
         """시간대별 성과 분석"""
         try:
-            with self._get_connection() as conn:
+            with self._read_pool.connection() as conn:
                 cursor = conn.cursor()
 
                 start_date = datetime.now() - timedelta(days=days)
@@ -1282,56 +1232,53 @@ class TradeDatabase:
             logger.error(f"시간대별 성과 분석 오류: {e}")
             return []
 
-    def _update_time_slot_summary(self, target_date: str, time_slot: str):
-        """시간대별 요약 통계 업데이트"""
+    def _update_time_slot_summary(self, conn, target_date: str, time_slot: str):
+        """시간대별 요약 통계 업데이트 (쓰기 스레드의 현재 트랜잭션에서 실행)"""
         try:
-            with self._get_connection() as conn:
-                cursor = conn.cursor()
-
-                # 해당 날짜/시간대의 통계 계산
-                cursor.execute("""
-                    SELECT
-                        COUNT(*) as total_candidates,
-                        SUM(CASE WHEN is_activated THEN 1 ELSE 0 END) as activated_stocks,
-                        SUM(CASE WHEN trade_executed THEN 1 ELSE 0 END) as traded_stocks,
-                        SUM(CASE WHEN strategy_type = 'gap_trading' THEN 1 ELSE 0 END) as gap_trading_count,
-                        SUM(CASE WHEN strategy_type = 'volume_breakout' THEN 1 ELSE 0 END) as volume_breakout_count,
-                        SUM(CASE WHEN strategy_type = 'momentum' THEN 1 ELSE 0 END) as momentum_count,
-                        AVG(score) as avg_score
-                    FROM selected_stocks
-                    WHERE selection_date = ? AND time_slot = ?
-                """, (target_date, time_slot))
-
-                stats = cursor.fetchone()
-
-                # 해당 시간대에서 실행된 거래의 성과
-                cursor.execute("""
-                    SELECT
-                        COUNT(*) as total_trades,
-                        SUM(CASE WHEN profit_loss > 0 THEN 1 ELSE 0 END) as successful_trades,
-                        COALESCE(SUM(profit_loss), 0) as total_profit_loss
-                    FROM selected_stocks s
-                    JOIN trades t ON s.trade_id = t.id
-                    WHERE s.selection_date = ? AND s.time_slot = ? AND t.trade_type = 'SELL'
-                """, (target_date, time_slot))
-
-                trade_stats = cursor.fetchone()
-
-                # UPSERT 실행
-                cursor.execute("""
-                    INSERT OR REPLACE INTO time_slot_summary (
-                        summary_date, time_slot, total_candidates, activated_stocks, traded_stocks,
-                        gap_trading_count, volume_breakout_count, momentum_count,
-                        total_trades, successful_trades, total_profit_loss, avg_score, updated_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    target_date, time_slot, stats[0], stats[1], stats[2],
-                    stats[3], stats[4], stats[5],
-                    trade_stats[0], trade_stats[1], trade_stats[2],
-                    round(stats[6] or 0, 2), datetime.now()
-                ))
-
-                conn.commit()
+            cursor = conn.cursor()
+
+            # 해당 날짜/시간대의 통계 계산
+            cursor.execute("""
+                SELECT
+                    COUNT(*) as total_candidates,
+                    SUM(CASE WHEN is_activated THEN 1 ELSE 0 END) as activated_stocks,
+                    SUM(CASE WHEN trade_executed THEN 1 ELSE 0 END) as traded_stocks,
+                    SUM(CASE WHEN strategy_type = 'gap_trading' THEN 1 ELSE 0 END) as gap_trading_count,
+                    SUM(CASE WHEN strategy_type = 'volume_breakout' THEN 1 ELSE 0 END) as volume_breakout_count,
+                    SUM(CASE WHEN strategy_type = 'momentum' THEN 1 ELSE 0 END) as momentum_count,
+                    AVG(score) as avg_score
+                FROM selected_stocks
+                WHERE selection_date = ? AND time_slot = ?
+            """, (target_date, time_slot))
+
+            stats = cursor.fetchone()
+
+            # 해당 시간대에서 실행된 거래의 성과
+            cursor.execute("""
+                SELECT
+                    COUNT(*) as total_trades,
+                    SUM(CASE WHEN profit_loss > 0 THEN 1 ELSE 0 END) as successful_trades,
+                    COALESCE(SUM(profit_loss), 0) as total_profit_loss
+                FROM selected_stocks s
+                JOIN trades t ON s.trade_id = t.id
+                WHERE s.selection_date = ? AND s.time_slot = ? AND t.trade_type = 'SELL'
+            """, (target_date, time_slot))
+
+            trade_stats = cursor.fetchone()
+
+            # UPSERT 실행
+            cursor.execute("""
+                INSERT OR REPLACE INTO time_slot_summary (
+                    summary_date, time_slot, total_candidates, activated_stocks, traded_stocks,
+                    gap_trading_count, volume_breakout_count, momentum_count,
+                    total_trades, successful_trades, total_profit_loss, avg_score, updated_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                target_date, time_slot, stats[0], stats[1], stats[2],
+                stats[3], stats[4], stats[5],
+                trade_stats[0], trade_stats[1], trade_stats[2],
+                round(stats[6] or 0, 2), datetime.now()
+            ))
 
         except Exception as e:
             logger.error(f"시간대별 요약 업데이트 오류: {e}")
@@ -1343,7 +1290,7 @@ class TradeDatabase:
 
             start_date = datetime.now() - timedelta(days=days)
 
-            with self._get_connection() as conn:
+            with self._read_pool.connection() as conn:
                 cursor = conn.cursor()
 
                 cursor.execute("""
@@ -1386,7 +1333,7 @@ class TradeDatabase:
     def check_existing_position_recorded(self, stock_code: str) -> bool:
         """해당 종목의 기존 보유 기록이 오늘 이미 있는지 확인"""
         try:
-            with self._get_connection() as conn:
+            with self._read_pool.connection() as conn:
                 cursor = conn.cursor()
                 today = datetime.now().date()
 
@@ -1444,7 +1391,7 @@ class TradeDatabase:
     def get_existing_positions(self) -> List[Dict]:
         """기존 보유 종목들 조회 (existing_holding 전략의 미결제 포지션)"""
         try:
-            with self._get_connection() as conn:
+            with self._read_pool.connection() as conn:
                 cursor = conn.cursor()
 
                 cursor.execute("""
@@ -1491,73 +1438,72 @@ class TradeDatabase:
                                target_price: int = None, stop_loss_price: int = None,
                                **technical_data) -> int:
         """🆕 캔들 매수 후보 종목 기록"""
-        def _record_candidate():
-            with self._get_connection() as conn:
-                cursor = conn.cursor()
+        def _record_candidate(conn):
+            cursor = conn.cursor()
+
+            # 중복 체크 (같은 종목의 최근 1시간 내 기록)
+            cursor.execute("""
+                SELECT id FROM candle_candidates
+                WHERE stock_code = ? AND status = 'WATCHING'
+                AND detected_at > datetime('now', '-1 hour')
+                ORDER BY detected_at DESC LIMIT 1
+            """, (stock_code,))
+
+            existing = cursor.fetchone()
+            if existing:
+                # 기존 기록 업데이트
+                # 🆕 한국시간 사용
+                from datetime import datetime, timezone, timedelta
+                korea_tz = timezone(timedelta(hours=9))
+                current_time_kr = datetime.now(korea_tz).strftime('%Y-%m-%d %H:%M:%S')
 
-                # 중복 체크 (같은 종목의 최근 1시간 내 기록)
                 cursor.execute("""
-                    SELECT id FROM candle_candidates
-                    WHERE stock_code = ? AND status = 'WATCHING'
-                    AND detected_at > datetime('now', '-1 hour')
-                    ORDER BY detected_at DESC LIMIT 1
-                """, (stock_code,))
-
-                existing = cursor.fetchone()
-                if existing:
-                    # 기존 기록 업데이트
-                    # 🆕 한국시간 사용
-                    from datetime import datetime, timezone, timedelta
-                    korea_tz = timezone(timedelta(hours=9))
-                    current_time_kr = datetime.now(korea_tz).strftime('%Y-%m-%d %H:%M:%S')
-
-                    cursor.execute("""
-                        UPDATE candle_candidates SET
-                            current_price = ?, pattern_strength = ?,
-                            entry_reason = ?, risk_score = ?,
-                            target_price = ?, stop_loss_price = ?,
-                            rsi_value = ?, macd_value = ?, volume_ratio = ?,
-                            price_change_rate = ?, updated_at = ?
-                        WHERE id = ?
-                    """, (
-                        current_price, pattern_strength, entry_reason, risk_score,
-                        target_price, stop_loss_price,
-                        technical_data.get('rsi_value'),
-                        technical_data.get('macd_value'),
-                        technical_data.get('volume_ratio'),
-                        technical_data.get('price_change_rate'),
-                        current_time_kr,
-                        existing[0]
-                    ))
-                    return existing[0]
-                else:
-                    # 새 기록 생성
-                    # 🆕 한국시간 사용
-                    from datetime import datetime, timezone, timedelta
-                    korea_tz = timezone(timedelta(hours=9))
-                    current_time_kr = datetime.now(korea_tz).strftime('%Y-%m-%d %H:%M:%S')
+                    UPDATE candle_candidates SET
+                        current_price = ?, pattern_strength = ?,
+                        entry_reason = ?, risk_score = ?,
+                        target_price = ?, stop_loss_price = ?,
+                        rsi_value = ?, macd_value = ?, volume_ratio = ?,
+                        price_change_rate = ?, updated_at = ?
+                    WHERE id = ?
+                """, (
+                    current_price, pattern_strength, entry_reason, risk_score,
+                    target_price, stop_loss_price,
+                    technical_data.get('rsi_value'),
+                    technical_data.get('macd_value'),
+                    technical_data.get('volume_ratio'),
+                    technical_data.get('price_change_rate'),
+                    current_time_kr,
+                    existing[0]
+                ))
+                return existing[0]
+            else:
+                # 새 기록 생성
+                # 🆕 한국시간 사용
+                from datetime import datetime, timezone, timedelta
+                korea_tz = timezone(timedelta(hours=9))
+                current_time_kr = datetime.now(korea_tz).strftime('%Y-%m-%d %H:%M:%S')
 
-                    cursor.execute("""
-                        INSERT INTO candle_candidates (
-                            stock_code, stock_name, detected_at, current_price,
-                            pattern_type, pattern_strength, signal_strength,
-                            entry_signal, entry_reason, risk_score,
-                            target_price, stop_loss_price,
-                            rsi_value, macd_value, volume_ratio, price_change_rate
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        stock_code, stock_name, current_time_kr, current_price,
+                cursor.execute("""
+                    INSERT INTO candle_candidates (
+                        stock_code, stock_name, detected_at, current_price,
                         pattern_type, pattern_strength, signal_strength,
-                        signal_strength, entry_reason, risk_score,
+                        entry_signal, entry_reason, risk_score,
                         target_price, stop_loss_price,
-                        technical_data.get('rsi_value'),
-                        technical_data.get('macd_value'),
-                        technical_data.get('volume_ratio'),
-                        technical_data.get('price_change_rate')
-                    ))
-                    return cursor.lastrowid
+                        rsi_value, macd_value, volume_ratio, price_change_rate
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, (
+                    stock_code, stock_name, current_time_kr, current_price,
+                    pattern_type, pattern_strength, signal_strength,
+                    signal_strength, entry_reason, risk_score,
+                    target_price, stop_loss_price,
+                    technical_data.get('rsi_value'),
+                    technical_data.get('macd_value'),
+                    technical_data.get('volume_ratio'),
+                    technical_data.get('price_change_rate')
+                ))
+                return cursor.lastrowid
 
-        return self._execute_with_retry(_record_candidate)
+        return self._writer.execute(_record_candidate)
 
     def record_candle_trade(self, candidate_id: int, trade_type: str,
                            stock_code: str, stock_name: str, quantity: int,
@@ -1565,153 +1511,150 @@ class TradeDatabase:
                            pattern_matched: str = None, order_id: str = None,
                            **additional_data) -> int:
         """🆕 캔들 거래 상세 기록"""
-        def _record_trade():
-            with self._get_connection() as conn:
-                cursor = conn.cursor()
-
-                # 🆕 기술적 신호 및 패턴 정보를 JSON으로 저장
-                technical_signals = json.dumps({
-                    # 기술적 지표
-                    'rsi': additional_data.get('rsi_value'),
-                    'macd': additional_data.get('macd_value'),
-                    'volume_ratio': additional_data.get('volume_ratio'),
-                    'support_level': additional_data.get('support_level'),
-                    'resistance_level': additional_data.get('resistance_level'),
+        def _record_trade(conn):
+            cursor = conn.cursor()
+
+            # 🆕 기술적 신호 및 패턴 정보를 JSON으로 저장
+            technical_signals = json.dumps({
+                # 기술적 지표
+                'rsi': additional_data.get('rsi_value'),
+                'macd': additional_data.get('macd_value'),
+                'volume_ratio': additional_data.get('volume_ratio'),
+                'support_level': additional_data.get('support_level'),
+                'resistance_level': additional_data.get('resistance_level'),
                     
-                    # 🆕 패턴 정보
-                    'pattern_strength': additional_data.get('pattern_strength'),
-                    'pattern_confidence': additional_data.get('pattern_confidence'),
+                # 🆕 패턴 정보
+                'pattern_strength': additional_data.get('pattern_strength'),
+                'pattern_confidence': additional_data.get('pattern_confidence'),
                     
-                    # 🆕 신호 정보
-                    'signal_strength': additional_data.get('signal_strength'),
-                    'entry_priority': additional_data.get('entry_priority'),
-                    'trade_signal': additional_data.get('trade_signal'),
+                # 🆕 신호 정보
+                'signal_strength': additional_data.get('signal_strength'),
+                'entry_priority': additional_data.get('entry_priority'),
+                'trade_signal': additional_data.get('trade_signal'),
                     
-                    # 🆕 추가 메타데이터
-                    'analysis_timestamp': datetime.now().isoformat(),
-                    'data_source': 'candle_trade_manager'
-                }, ensure_ascii=False)
-
-                # 🆕 한국시간 사용
-                from datetime import datetime, timezone, timedelta
-                korea_tz = timezone(timedelta(hours=9))
-                current_time_kr = datetime.now(korea_tz).strftime('%Y-%m-%d %H:%M:%S')
-
-                cursor.execute("""
-                    INSERT INTO candle_trades (
-                        candidate_id, trade_type, stock_code, stock_name,
-                        quantity, price, total_amount, order_id,
-                        decision_reason, pattern_matched, technical_signals,
-                        market_condition, timestamp,
-                        entry_price, profit_loss, profit_rate, hold_duration,
-                        stop_loss_triggered, target_achieved, trailing_stop_triggered
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
+                # 🆕 추가 메타데이터
+                'analysis_timestamp': datetime.now().isoformat(),
+                'data_source': 'candle_trade_manager'
+            }, ensure_ascii=False)
+
+            # 🆕 한국시간 사용
+            from datetime import datetime, timezone, timedelta
+            korea_tz = timezone(timedelta(hours=9))
+            current_time_kr = datetime.now(korea_tz).strftime('%Y-%m-%d %H:%M:%S')
+
+            cursor.execute("""
+                INSERT INTO candle_trades (
                     candidate_id, trade_type, stock_code, stock_name,
                     quantity, price, total_amount, order_id,
                     decision_reason, pattern_matched, technical_signals,
-                    additional_data.get('market_condition', 'NORMAL'),
-                    current_time_kr,
-                    additional_data.get('entry_price'),
-                    additional_data.get('profit_loss', 0),
-                    additional_data.get('profit_rate', 0.0),
-                    additional_data.get('hold_duration', 0),
-                    additional_data.get('stop_loss_triggered', False),
-                    additional_data.get('target_achieved', False),
-                    additional_data.get('trailing_stop_triggered', False)
-                ))
-
-                trade_id = cursor.lastrowid
-
-                # 후보 종목 상태 업데이트
-                if trade_type == 'ENTRY':
-                    cursor.execute("""
-                        UPDATE candle_candidates SET
-                            status = 'ENTERED', executed_at = ?,
-                            updated_at = ?
-                        WHERE id = ?
-                    """, (current_time_kr, current_time_kr, candidate_id))
-                elif trade_type == 'EXIT':
-                    cursor.execute("""
-                        UPDATE candle_candidates SET
-                            status = 'EXITED', exit_reason = ?,
-                            updated_at = ?
-                        WHERE id = ?
-                    """, (decision_reason, current_time_kr, candidate_id))
+                    market_condition, timestamp,
+                    entry_price, profit_loss, profit_rate, hold_duration,
+                    stop_loss_triggered, target_achieved, trailing_stop_triggered
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                candidate_id, trade_type, stock_code, stock_name,
+                quantity, price, total_amount, order_id,
+                decision_reason, pattern_matched, technical_signals,
+                additional_data.get('market_condition', 'NORMAL'),
+                current_time_kr,
+                additional_data.get('entry_price'),
+                additional_data.get('profit_loss', 0),
+                additional_data.get('profit_rate', 0.0),
+                additional_data.get('hold_duration', 0),
+                additional_data.get('stop_loss_triggered', False),
+                additional_data.get('target_achieved', False),
+                additional_data.get('trailing_stop_triggered', False)
+            ))
+
+            trade_id = cursor.lastrowid
+
+            # 후보 종목 상태 업데이트
+            if trade_type == 'ENTRY':
+                cursor.execute("""
+                    UPDATE candle_candidates SET
+                        status = 'ENTERED', executed_at = ?,
+                        updated_at = ?
+                    WHERE id = ?
+                """, (current_time_kr, current_time_kr, candidate_id))
+            elif trade_type == 'EXIT':
+                cursor.execute("""
+                    UPDATE candle_candidates SET
+                        status = 'EXITED', exit_reason = ?,
+                        updated_at = ?
+                    WHERE id = ?
+                """, (decision_reason, current_time_kr, candidate_id))
 
-                return trade_id
+            return trade_id
 
-        return self._execute_with_retry(_record_trade)
+        return self._writer.execute(_record_trade)
 
     def record_candle_pattern(self, stock_code: str, pattern_name: str,
                              pattern_type: str, confidence_score: float,
                              strength: str, candle_data: List[Dict],
                              **analysis_data) -> int:
         """🆕 캔들 패턴 분석 결과 기록"""
-        def _record_pattern():
-            with self._get_connection() as conn:
-                cursor = conn.cursor()
-
-                candle_data_json = json.dumps(candle_data, ensure_ascii=False)
-
-                # 🆕 한국시간 사용
-                from datetime import datetime, timezone, timedelta
-                korea_tz = timezone(timedelta(hours=9))
-                current_time_kr = datetime.now(korea_tz).strftime('%Y-%m-%d %H:%M:%S')
-
-                cursor.execute("""
-                    INSERT INTO candle_patterns (
-                        stock_code, analysis_time, pattern_name, pattern_type,
-                        confidence_score, strength, candle_data,
-                        volume_analysis, trend_analysis, support_resistance,
-                        predicted_direction, predicted_price_range, success_probability
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    stock_code, current_time_kr, pattern_name, pattern_type,
-                    confidence_score, strength, candle_data_json,
-                    analysis_data.get('volume_analysis'),
-                    analysis_data.get('trend_analysis'),
-                    analysis_data.get('support_resistance'),
-                    analysis_data.get('predicted_direction'),
-                    json.dumps(analysis_data.get('predicted_price_range', {}), ensure_ascii=False),
-                    analysis_data.get('success_probability', 0.5)
-                ))
-
-                return cursor.lastrowid
-
-        return self._execute_with_retry(_record_pattern)
+        def _record_pattern(conn):
+            cursor = conn.cursor()
+
+            candle_data_json = json.dumps(candle_data, ensure_ascii=False)
+
+            # 🆕 한국시간 사용
+            from datetime import datetime, timezone, timedelta
+            korea_tz = timezone(timedelta(hours=9))
+            current_time_kr = datetime.now(korea_tz).strftime('%Y-%m-%d %H:%M:%S')
+
+            cursor.execute("""
+                INSERT INTO candle_patterns (
+                    stock_code, analysis_time, pattern_name, pattern_type,
+                    confidence_score, strength, candle_data,
+                    volume_analysis, trend_analysis, support_resistance,
+                    predicted_direction, predicted_price_range, success_probability
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                stock_code, current_time_kr, pattern_name, pattern_type,
+                confidence_score, strength, candle_data_json,
+                analysis_data.get('volume_analysis'),
+                analysis_data.get('trend_analysis'),
+                analysis_data.get('support_resistance'),
+                analysis_data.get('predicted_direction'),
+                json.dumps(analysis_data.get('predicted_price_range', {}), ensure_ascii=False),
+                analysis_data.get('success_probability', 0.5)
+            ))
+
+            return cursor.lastrowid
+
+        return self._writer.execute(_record_pattern)
 
     def record_market_scan(self, market_type: str, scan_duration: int,
                           total_stocks_scanned: int, candidates_found: int,
                           patterns_detected: int, market_sentiment: str = 'NEUTRAL',
                           volatility_level: str = 'MEDIUM', scan_config: Dict = None) -> int:
         """🆕 시장 스캔 로그 기록"""
-        def _record_scan():
-            with self._get_connection() as conn:
-                cursor = conn.cursor()
+        def _record_scan(conn):
+            cursor = conn.cursor()
 
-                scan_config_json = json.dumps(scan_config or {}, ensure_ascii=False)
+            scan_config_json = json.dumps(scan_config or {}, ensure_ascii=False)
 
-                # 🆕 한국시간 사용
-                from datetime import datetime, timezone, timedelta
-                korea_tz = timezone(timedelta(hours=9))
-                current_time_kr = datetime.now(korea_tz).strftime('%Y-%m-%d %H:%M:%S')
+            # 🆕 한국시간 사용
+            from datetime import datetime, timezone, timedelta
+            korea_tz = timezone(timedelta(hours=9))
+            current_time_kr = datetime.now(korea_tz).strftime('%Y-%m-%d %H:%M:%S')
 
-                cursor.execute("""
-                    INSERT INTO market_scans (
-                        scan_time, market_type, scan_duration,
-                        total_stocks_scanned, candidates_found, patterns_detected,
-                        market_sentiment, volatility_level, scan_config
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    current_time_kr, market_type, scan_duration,
+            cursor.execute("""
+                INSERT INTO market_scans (
+                    scan_time, market_type, scan_duration,
                     total_stocks_scanned, candidates_found, patterns_detected,
-                    market_sentiment, volatility_level, scan_config_json
-                ))
+                    market_sentiment, volatility_level, scan_config
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                current_time_kr, market_type, scan_duration,
+                total_stocks_scanned, candidates_found, patterns_detected,
+                market_sentiment, volatility_level, scan_config_json
+            ))
 
-                return cursor.lastrowid
+            return cursor.lastrowid
 
-        return self._execute_with_retry(_record_scan)
+        return self._writer.execute(_record_scan)
 
     def record_existing_holdings_analysis(self, stock_code: str, stock_name: str,
                                          quantity: int, avg_price: int, current_price: int,
@@ -1719,48 +1662,47 @@ class TradeDatabase:
                                          recommendation: str, recommendation_reasons: List[str],
                                          risk_level: str = 'MEDIUM', **analysis_data) -> int:
         """🆕 기존 보유 종목 분석 결과 기록"""
-        def _record_analysis():
-            with self._get_connection() as conn:
-                cursor = conn.cursor()
+        def _record_analysis(conn):
+            cursor = conn.cursor()
 
-                reasons_json = json.dumps(recommendation_reasons, ensure_ascii=False)
-                technical_json = json.dumps(analysis_data.get('technical_indicators', {}), ensure_ascii=False)
+            reasons_json = json.dumps(recommendation_reasons, ensure_ascii=False)
+            technical_json = json.dumps(analysis_data.get('technical_indicators', {}), ensure_ascii=False)
 
-                # 🆕 한국시간 사용
-                from datetime import datetime, timezone, timedelta
-                korea_tz = timezone(timedelta(hours=9))
-                current_time_kr = datetime.now(korea_tz).strftime('%Y-%m-%d %H:%M:%S')
+            # 🆕 한국시간 사용
+            from datetime import datetime, timezone, timedelta
+            korea_tz = timezone(timedelta(hours=9))
+            current_time_kr = datetime.now(korea_tz).strftime('%Y-%m-%d %H:%M:%S')
 
-                cursor.execute("""
-                    INSERT INTO existing_holdings_analysis (
-                        stock_code, stock_name, analysis_time,
-                        quantity, avg_price, current_price,
-                        total_value, profit_loss, profit_rate,
-                        recommendation, recommendation_reasons, risk_level,
-                        current_pattern, pattern_strength, technical_indicators,
-                        suggested_action, target_sell_price, stop_loss_price
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    stock_code, stock_name, current_time_kr,
+            cursor.execute("""
+                INSERT INTO existing_holdings_analysis (
+                    stock_code, stock_name, analysis_time,
                     quantity, avg_price, current_price,
                     total_value, profit_loss, profit_rate,
-                    recommendation, reasons_json, risk_level,
-                    analysis_data.get('current_pattern'),
-                    analysis_data.get('pattern_strength', 0.0),
-                    technical_json,
-                    analysis_data.get('suggested_action', 'HOLD'),
-                    analysis_data.get('target_sell_price'),
-                    analysis_data.get('stop_loss_price')
-                ))
-
-                return cursor.lastrowid
-
-        return self._execute_with_retry(_record_analysis)
+                    recommendation, recommendation_reasons, risk_level,
+                    current_pattern, pattern_strength, technical_indicators,
+                    suggested_action, target_sell_price, stop_loss_price
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                stock_code, stock_name, current_time_kr,
+                quantity, avg_price, current_price,
+                total_value, profit_loss, profit_rate,
+                recommendation, reasons_json, risk_level,
+                analysis_data.get('current_pattern'),
+                analysis_data.get('pattern_strength', 0.0),
+                technical_json,
+                analysis_data.get('suggested_action', 'HOLD'),
+                analysis_data.get('target_sell_price'),
+                analysis_data.get('stop_loss_price')
+            ))
+
+            return cursor.lastrowid
+
+        return self._writer.execute(_record_analysis)
 
     def get_candle_candidates(self, status: str = None, days: int = 7) -> List[Dict]:
         """🆕 캔들 매수 후보 종목 조회"""
         def _get_candidates():
-            with self._get_connection() as conn:
+            with self._read_pool.connection() as conn:
                 cursor = conn.cursor()
 
                 query = """
@@ -1795,13 +1737,13 @@ class TradeDatabase:
                     for row in rows
                 ]
 
-        return self._execute_with_retry(_get_candidates)
+        return _get_candidates()
 
     def get_candle_trades(self, stock_code: str = None, days: int = 30,
                          trade_type: str = None) -> List[Dict]:
         """🆕 캔들 거래 기록 조회"""
         def _get_trades():
-            with self._get_connection() as conn:
+            with self._read_pool.connection() as conn:
                 cursor = conn.cursor()
 
                 query = """
@@ -1844,12 +1786,12 @@ class TradeDatabase:
                     for row in rows
                 ]
 
-        return self._execute_with_retry(_get_trades)
+        return _get_trades()
 
     def get_candle_performance_stats(self, days: int = 30) -> Dict:
         """🆕 캔들 트레이딩 성과 통계"""
         def _get_stats():
-            with self._get_connection() as conn:
+            with self._read_pool.connection() as conn:
                 cursor = conn.cursor()
 
                 # 거래 통계
@@ -1906,12 +1848,12 @@ class TradeDatabase:
                     ]
                 }
 
-        return self._execute_with_retry(_get_stats)
+        return _get_stats()
 
     def find_candidate_by_stock_code(self, stock_code: str, status: str = 'WATCHING') -> Optional[Dict]:
         """🆕 종목코드로 후보 검색"""
         def _find_candidate():
-            with self._get_connection() as conn:
+            with self._read_pool.connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
                     SELECT id, stock_code, stock_name, pattern_type, entry_reason,
@@ -1931,22 +1873,21 @@ class TradeDatabase:
                     }
                 return None
 
-        return self._execute_with_retry(_find_candidate)
+        return _find_candidate()
 
     def update_candidate_status(self, candidate_id: int, status: str,
                               exit_reason: str = None) -> bool:
         """🆕 후보 상태 업데이트"""
-        def _update_status():
-            with self._get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    UPDATE candle_candidates SET
-                        status = ?, exit_reason = ?, updated_at = CURRENT_TIMESTAMP
-                    WHERE id = ?
-                """, (status, exit_reason, candidate_id))
-                return cursor.rowcount > 0
+        def _update_status(conn):
+            cursor = conn.cursor()
+            cursor.execute("""
+                UPDATE candle_candidates SET
+                    status = ?, exit_reason = ?, updated_at = CURRENT_TIMESTAMP
+                WHERE id = ?
+            """, (status, exit_reason, candidate_id))
+            return cursor.rowcount > 0
 
-        return self._execute_with_retry(_update_status)
+        return self._writer.execute(_update_status)
 
     def save_candle_trade_enhanced(self, candidate, trade_type: str,
                                  executed_price: float, executed_quantity: int, order_no: str,
@@ -2077,4 +2018,4 @@ class TradeDatabase:
                 logger.error(f"❌ 상세 오류:\n{traceback.format_exc()}")
                 return 0
 
-        return self._execute_with_retry(_save_enhanced_trade)
+        return _save_enhanced_trade()
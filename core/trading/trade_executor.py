@@ -15,6 +15,29 @@ from collections import defaultdict
 logger = setup_logger(__name__)
 
 
+def adjust_to_tick_size(price: int) -> int:
+    """호가 단위로 가격 조정 (내림) - 주문가 계산과 백테스트 체결가에서 공용"""
+    try:
+        # 한국 주식 호가 단위
+        if price < 1000:
+            return price  # 1원 단위
+        elif price < 5000:
+            return (price // 5) * 5  # 5원 단위
+        elif price < 10000:
+            return (price // 10) * 10  # 10원 단위
+        elif price < 50000:
+            return (price // 50) * 50  # 50원 단위
+        elif price < 100000:
+            return (price // 100) * 100  # 100원 단위
+        elif price < 500000:
+            return (price // 500) * 500  # 500원 단위
+        else:
+            return (price // 1000) * 1000  # 1000원 단위
+    except Exception as e:
+        logger.error(f"호가 단위 조정 오류: {e}")
+        return price
+
+
 @dataclass
 class TradeResult:
     """거래 실행 결과"""
@@ -546,25 +569,7 @@ class TradeExecutor:
 
     def _adjust_to_tick_size(self, price: int) -> int:
         """호가 단위로 가격 조정"""
-        try:
-            # 한국 주식 호가 단위
-            if price < 1000:
-                return price  # 1원 단위
-            elif price < 5000:
-                return (price // 5) * 5  # 5원 단위
-            elif price < 10000:
-                return (price // 10) * 10  # 10원 단위
-            elif price < 50000:
-                return (price // 50) * 50  # 50원 단위
-            elif price < 100000:
-                return (price // 100) * 100  # 100원 단위
-            elif price < 500000:
-                return (price // 500) * 500  # 500원 단위
-            else:
-                return (price // 1000) * 1000  # 1000원 단위
-        except Exception as e:
-            logger.error(f"호가 단위 조정 오류: {e}")
-            return price
+        return adjust_to_tick_size(price)
 
     def _get_actual_holding_quantity(self, stock_code: str) -> int:
         """간소화된 실제 보유 수량 확인"""
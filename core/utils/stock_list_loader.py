@@ -2,38 +2,28 @@
 """
 주식 종목 리스트 로더 유틸리티
 """
-import pandas as pd
-import warnings
 from typing import List, Optional
 from utils.logger import setup_logger
-
-# openpyxl 스타일 경고 숨기기
-warnings.filterwarnings('ignore', category=UserWarning, module='openpyxl')
+from .stock_master import get_stock_master, DEFAULT_EXCEL_PATH
 
 logger = setup_logger(__name__)
 
-def load_kospi_stocks(excel_path: str = "data_0737_20250613.xlsx") -> List[str]:
+def load_kospi_stocks(excel_path: str = DEFAULT_EXCEL_PATH, min_listed_shares: int = 0) -> List[str]:
     """
     엑셀 파일에서 KOSPI 종목 리스트를 로드 (우선주 제외)
     
     Args:
         excel_path: 엑셀 파일 경로
+        min_listed_shares: 최소 상장주식수 (0이면 제한 없음)
         
     Returns:
         KOSPI 종목 단축코드 리스트 (우선주 제외)
     """
     try:
-        # 엑셀 파일 읽기
-        df = pd.read_excel(excel_path)
-        
-        # KOSPI 종목만 필터링
-        kospi_df = df[df['시장구분'] == 'KOSPI'].copy()
-        
-        # 🚀 우선주 제거 (종목명에 '(우)' 포함된 종목 제외)
-        kospi_df = kospi_df[~kospi_df['한글 종목명'].str.contains(r'\(우\)', na=False)]
-        
-        # 단축코드 추출 (문자열로 변환하여 일관성 확보)
-        stock_codes = kospi_df['단축코드'].astype(str).tolist()
+        # 🚀 종목 마스터 캐시에서 벡터 필터링 (엑셀은 파일 변경 시에만 다시 읽음)
+        stock_codes = get_stock_master(excel_path).filter_codes(
+            market='KOSPI', exclude_preferred=True, min_listed_shares=min_listed_shares
+        )
         
         # 6자리가 아닌 종목코드 필터링 (안전성 확보)
         valid_codes = [code for code in stock_codes if len(code) == 6 and code.isdigit()]
@@ -50,9 +40,9 @@ def load_kospi_stocks(excel_path: str = "data_0737_20250613.xlsx") -> List[str]:
         logger.error(f"❌ KOSPI 종목 로드 실패: {e}")
         return []
 
-def get_stock_info_from_excel(stock_code: str, excel_path: str = "data_0737_20250613.xlsx") -> Optional[dict]:
+def get_stock_info_from_excel(stock_code: str, excel_path: str = DEFAULT_EXCEL_PATH) -> Optional[dict]:
     """
-    특정 종목의 기본 정보를 엑셀에서 조회
+    특정 종목의 기본 정보를 조회 (종목 마스터 캐시에서 O(1) 조회)
     
     Args:
         stock_code: 종목 단축코드
@@ -62,25 +52,7 @@ def get_stock_info_from_excel(stock_code: str, excel_path: str = "data_0737_2025
         종목 정보 딕셔너리 (종목명, 상장주식수 등)
     """
     try:
-        df = pd.read_excel(excel_path)
-        
-        # 해당 종목코드 조회
-        stock_info = df[df['단축코드'].astype(str) == str(stock_code)]
-        
-        if stock_info.empty:
-            return None
-            
-        info = stock_info.iloc[0]
-        
-        return {
-            'stock_code': str(info['단축코드']),
-            'stock_name': info['한글 종목명'],
-            'stock_name_short': info['한글 종목약명'],
-            'market_type': info['시장구분'],
-            'listing_date': info['상장일'],
-            'listed_shares': info['상장주식수'] if pd.notna(info['상장주식수']) else 0,
-            'face_value': info['액면가'] if pd.notna(info['액면가']) else 0
-        }
+        return get_stock_master(excel_path).get(stock_code)
         
     except Exception as e:
         logger.error(f"❌ 종목 정보 조회 실패 {stock_code}: {e}")
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+종목 마스터 (엑셀 종목 리스트를 1회 로드 후 컬럼형 캐시로 보관)
+
+- 최초 로드 시 엑셀을 읽어 NumPy 컬럼 배열로 변환하고 data/cache 아래에 pickle로 저장
+- 캐시는 엑셀 파일의 mtime/size가 같을 때만 재사용 (엑셀 교체 시 자동 재생성)
+- 종목코드 → 행 인덱스 dict로 O(1) 조회, 시장/우선주/상장주식수 조건은 벡터 마스크로 일괄 필터
+"""
+import os
+import pickle
+import threading
+import warnings
+from pathlib import Path
+from typing import Dict, List, Optional, Any
+
+import numpy as np
+import pandas as pd
+
+from utils.logger import setup_logger
+
+# openpyxl 스타일 경고 숨기기
+warnings.filterwarnings('ignore', category=UserWarning, module='openpyxl')
+
+logger = setup_logger(__name__)
+
+DEFAULT_EXCEL_PATH = "data_0737_20250613.xlsx"
+CACHE_DIR = Path(__file__).parent.parent.parent / "data" / "cache"
+CACHE_VERSION = 1
+
+# 엑셀 컬럼 → 내부 컬럼명
+_COLUMN_MAP = {
+    '단축코드': 'stock_code',
+    '한글 종목명': 'stock_name',
+    '한글 종목약명': 'stock_name_short',
+    '시장구분': 'market_type',
+    '상장일': 'listing_date',
+    '주식종류': 'stock_kind',
+}
+
+
+class StockMaster:
+    """종목 마스터 (컬럼형 NumPy 배열 + 종목코드 인덱스)"""
+
+    def __init__(self, columns: Dict[str, np.ndarray], source_key: tuple):
+        self._columns = columns
+        self.source_key = source_key
+        self._index: Dict[str, int] = {code: i for i, code in enumerate(columns['stock_code'])}
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, stock_code: str) -> bool:
+        return str(stock_code) in self._index
+
+    # ========== 로드 ==========
+
+    @classmethod
+    def load(cls, excel_path: str = DEFAULT_EXCEL_PATH) -> "StockMaster":
+        """캐시가 유효하면 캐시에서, 아니면 엑셀에서 로드 후 캐시 저장"""
+        stat = os.stat(excel_path)
+        source_key = (CACHE_VERSION, os.path.abspath(excel_path), stat.st_mtime_ns, stat.st_size)
+        cache_path = CACHE_DIR / f"stock_master_{Path(excel_path).stem}.pkl"
+
+        columns = cls._read_cache(cache_path, source_key)
+        if columns is None:
+            columns = cls._read_excel(excel_path)
+            cls._write_cache(cache_path, source_key, columns)
+            logger.info(f"✅ 종목 마스터 엑셀 로드: {len(columns['stock_code'])}개 종목 (캐시 생성)")
+        else:
+            logger.debug(f"📦 종목 마스터 캐시 로드: {len(columns['stock_code'])}개 종목")
+
+        return cls(columns, source_key)
+
+    @staticmethod
+    def _read_excel(excel_path: str) -> Dict[str, np.ndarray]:
+        df = pd.read_excel(excel_path, dtype={'단축코드': str})
+
+        columns = {
+            name: df[col].fillna('').astype(str).str.strip().to_numpy(dtype=object)
+            for col, name in _COLUMN_MAP.items()
+        }
+        columns['listed_shares'] = pd.to_numeric(df['상장주식수'], errors='coerce').fillna(0).astype(np.int64).to_numpy()
+        # '무액면' 등 숫자가 아닌 값은 0
+        columns['face_value'] = pd.to_numeric(df['액면가'], errors='coerce').fillna(0).astype(np.float64).to_numpy()
+
+        # 우선주: 주식종류(구형/신형우선주) 또는 종목명에 '우선주'/'(우)' 포함
+        kind_preferred = df['주식종류'].astype(str).str.contains('우선주', na=False)
+        name_preferred = df['한글 종목명'].astype(str).str.contains(r'우선주|\(우\)', na=False)
+        columns['is_preferred'] = (kind_preferred | name_preferred).to_numpy(dtype=bool)
+
+        return columns
+
+    @staticmethod
+    def _read_cache(cache_path: Path, source_key: tuple) -> Optional[Dict[str, np.ndarray]]:
+        try:
+            with open(cache_path, 'rb') as f:
+                cached = pickle.load(f)
+            if cached.get('source_key') == source_key:
+                return cached['columns']
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"⚠️ 종목 마스터 캐시 읽기 실패 (재생성): {e}")
+        return None
+
+    @staticmethod
+    def _write_cache(cache_path: Path, source_key: tuple, columns: Dict[str, np.ndarray]) -> None:
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix('.tmp')
+            with open(tmp_path, 'wb') as f:
+                pickle.dump({'source_key': source_key, 'columns': columns}, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            logger.warning(f"⚠️ 종목 마스터 캐시 저장 실패: {e}")
+
+    # ========== 조회 ==========
+
+    def get(self, stock_code: str) -> Optional[Dict[str, Any]]:
+        """종목 기본 정보 (get_stock_info_from_excel과 같은 형태)"""
+        i = self._index.get(str(stock_code))
+        if i is None:
+            return None
+
+        c = self._columns
+        return {
+            'stock_code': c['stock_code'][i],
+            'stock_name': c['stock_name'][i],
+            'stock_name_short': c['stock_name_short'][i],
+            'market_type': c['market_type'][i],
+            'listing_date': c['listing_date'][i],
+            'listed_shares': int(c['listed_shares'][i]),
+            'face_value': float(c['face_value'][i])
+        }
+
+    def get_listed_shares(self, stock_code: str) -> int:
+        i = self._index.get(str(stock_code))
+        return int(self._columns['listed_shares'][i]) if i is not None else 0
+
+    def column(self, name: str) -> np.ndarray:
+        """컬럼 배열 (읽기 전용으로 사용)"""
+        return self._columns[name]
+
+    def filter_mask(self, market: Optional[str] = None, exclude_preferred: bool = False,
+                    min_listed_shares: int = 0, max_listed_shares: Optional[int] = None) -> np.ndarray:
+        """조건에 맞는 행의 불리언 마스크"""
+        c = self._columns
+        mask = np.ones(len(c['stock_code']), dtype=bool)
+
+        if market is not None:
+            mask &= c['market_type'] == market
+        if exclude_preferred:
+            mask &= ~c['is_preferred']
+        if min_listed_shares > 0:
+            mask &= c['listed_shares'] >= min_listed_shares
+        if max_listed_shares is not None:
+            mask &= c['listed_shares'] <= max_listed_shares
+
+        return mask
+
+    def filter_codes(self, market: Optional[str] = None, exclude_preferred: bool = False,
+                     min_listed_shares: int = 0, max_listed_shares: Optional[int] = None) -> List[str]:
+        """조건에 맞는 종목코드 리스트 (엑셀 행 순서 유지)"""
+        mask = self.filter_mask(market, exclude_preferred, min_listed_shares, max_listed_shares)
+        return self._columns['stock_code'][mask].tolist()
+
+
+# 전역 종목 마스터 (엑셀 경로별, 파일 변경 시 자동 재로드)
+_masters: Dict[str, StockMaster] = {}
+_masters_lock = threading.Lock()
+
+
+def get_stock_master(excel_path: str = DEFAULT_EXCEL_PATH) -> StockMaster:
+    """종목 마스터 반환 (최초 1회 로드, 이후 엑셀 mtime 변경 시에만 재로드)"""
+    stat = os.stat(excel_path)
+    key = os.path.abspath(excel_path)
+
+    master = _masters.get(key)
+    if master is not None and master.source_key[2:] == (stat.st_mtime_ns, stat.st_size):
+        return master
+
+    with _masters_lock:
+        master = _masters.get(key)
+        if master is None or master.source_key[2:] != (stat.st_mtime_ns, stat.st_size):
+            master = StockMaster.load(excel_path)
+            _masters[key] = master
+        return master
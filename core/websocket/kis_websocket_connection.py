@@ -7,10 +7,12 @@ import json
 import threading
 import time
 import websockets
-import requests
 from typing import Optional, Any, Dict
 from utils.logger import setup_logger
+from config.settings import KIS_WS_URL
 from ..api import kis_auth as kis
+from ..api.kis_http_pool import get_http_pool
+from .kis_websocket_reconnect import get_cached_approval_key, cache_approval_key, invalidate_approval_key
 
 logger = setup_logger(__name__)
 
@@ -18,9 +20,12 @@ logger = setup_logger(__name__)
 class KISWebSocketConnection:
     """KIS 웹소켓 연결 관리 전담 클래스"""
 
-    def __init__(self):
-        # 연결 정보 (실전투자용 고정)
-        self.ws_url = 'ws://ops.koreainvestment.com:21000'
+    def __init__(self, app_key: Optional[str] = None, app_secret: Optional[str] = None, name: str = 'main'):
+        # 연결 정보 (실전투자용 고정, 연결 풀에서는 연결마다 별도 앱키로 승인키 발급)
+        self.ws_url = KIS_WS_URL
+        self.name = name
+        self.app_key = app_key
+        self.app_secret = app_secret
         self.approval_key: Optional[str] = None
         self.websocket: Optional[Any] = None
 
@@ -55,30 +60,41 @@ class KISWebSocketConnection:
                 logger.debug("✅ 기존 승인키 재사용")
                 return self.approval_key
 
-            # 새로운 승인키 발급
+            # 같은 앱키로 발급받은 승인키가 캐시에 있으면 재사용 (재연결 시 발급 REST 생략)
+            app_key = self.app_key or kis.get_app_key()
+            cached = get_cached_approval_key(app_key)
+            if cached:
+                logger.debug(f"✅ 캐시된 승인키 재사용 [{self.name}]")
+                self.approval_key = cached
+                return cached
+
+            # 새로운 승인키 발급 (별도 앱키가 없으면 기본 앱키 사용)
+            app_secret = self.app_secret or kis.get_app_secret()
             url = f"{kis.get_base_url()}/oauth2/Approval"
             headers = {
                 "content-type": "application/json; charset=utf-8",
-                "authorization": f"Bearer {kis.get_access_token()}",
-                "appkey": kis.get_app_key(),
-                "appsecret": kis.get_app_secret(),
+                "appkey": app_key,
+                "appsecret": app_secret,
                 "tr_id": "CTRP6548R",
                 "custtype": "P"
             }
+            if not self.app_key:
+                headers["authorization"] = f"Bearer {kis.get_access_token()}"
 
             body = {
                 "grant_type": "client_credentials",
-                "appkey": kis.get_app_key(),
-                "secretkey": kis.get_app_secret()
+                "appkey": app_key,
+                "secretkey": app_secret
             }
 
-            response = requests.post(url, headers=headers, json=body, timeout=10)
+            response = get_http_pool().post(url, headers=headers, json=body, timeout=10)
 
             if response.status_code == 200:
                 data = response.json()
                 self.approval_key = data.get('approval_key')
                 if self.approval_key:
-                    logger.info(f"✅ 웹소켓 승인키 발급 성공: {self.approval_key[:20]}...")
+                    cache_approval_key(app_key, self.approval_key)
+                    logger.info(f"✅ 웹소켓 승인키 발급 성공 [{self.name}]: {self.approval_key[:20]}...")
                 else:
                     logger.error("❌ 승인키 발급 응답에 approval_key가 없음")
                     return None
@@ -91,6 +107,12 @@ class KISWebSocketConnection:
             logger.error(f"❌ 승인키 발급 오류: {e}")
             return None
 
+    def invalidate_approval_key(self) -> None:
+        """승인키 폐기 (연속 연결 실패 시 다음 연결에서 재발급)"""
+        self.approval_key = None
+        invalidate_approval_key(self.app_key or kis.get_app_key())
+        logger.info(f"🔑 승인키 무효화 [{self.name}] - 다음 연결 시 재발급")
+
     async def connect(self) -> bool:
         """웹소켓 연결"""
         try:
@@ -98,7 +120,7 @@ class KISWebSocketConnection:
                 logger.debug("이미 웹소켓에 연결되어 있습니다")
                 return True
 
-            logger.info("🔗 웹소켓 연결 시도...")
+            logger.info(f"🔗 웹소켓 연결 시도 [{self.name}]...")
             self.stats['connection_attempts'] += 1
 
             # 승인키 발급
@@ -117,7 +139,7 @@ class KISWebSocketConnection:
 
             self.is_connected = True
             self.stats['successful_connections'] += 1
-            logger.info("✅ 웹소켓 연결 성공")
+            logger.info(f"✅ 웹소켓 연결 성공 [{self.name}]")
             return True
 
         except Exception as e:
@@ -237,6 +259,7 @@ class KISWebSocketConnection:
     def get_status(self) -> Dict:
         """연결 상태 조회"""
         return {
+            'name': self.name,
             'is_connected': self.is_connected,
             'is_running': self.is_running,
             'connection_attempts': self.connection_attempts,
@@ -2,9 +2,12 @@
 """
 KIS 웹소켓 데이터 파싱 전담 클래스
 """
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 from utils.logger import setup_logger
+from .kis_websocket_fast_parser import (
+    ContractRecord, OrderbookRecord, parse_contract_frame, parse_orderbook_frame
+)
 
 # AES 복호화 (체결통보용)
 try:
@@ -38,6 +41,32 @@ class KISWebSocketDataParser:
         self.aes_iv = aes_iv
         logger.info("체결통보 암호화 키 설정 완료")
 
+    def parse_contract_records(self, data: str) -> List[ContractRecord]:
+        """실시간 체결 프레임의 모든 레코드 (지연 변환 레코드, 실시간 처리 경로용)"""
+        try:
+            records = parse_contract_frame(data)
+            if not records:
+                logger.warning(f"⚠️ 체결 데이터 필드 부족: {data.count('^') + 1 if data else 0}개")
+            self.stats['data_processed'] += len(records)
+            return records
+        except Exception as e:
+            self.stats['errors'] += 1
+            logger.error(f"❌ 체결 데이터 파싱 오류: {e}")
+            return []
+
+    def parse_bid_ask_records(self, data: str) -> List[OrderbookRecord]:
+        """실시간 호가 프레임의 모든 레코드 (지연 변환 레코드, 실시간 처리 경로용)"""
+        try:
+            records = parse_orderbook_frame(data)
+            if not records:
+                logger.warning(f"⚠️ 호가 데이터 필드 부족: {data.count('^') + 1 if data else 0}개")
+            self.stats['data_processed'] += len(records)
+            return records
+        except Exception as e:
+            self.stats['errors'] += 1
+            logger.error(f"❌ 호가 데이터 파싱 오류: {e}")
+            return []
+
     def parse_contract_data(self, data: str) -> Dict:
         """실시간 체결 데이터 파싱 - 🎯 KIS 공식 문서 H0STCNT0 기준"""
         
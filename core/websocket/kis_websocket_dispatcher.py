@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+KIS 웹소켓 콜백 디스패처 - 수신 루프와 전략 콜백 분리
+
+- 수신 루프는 파싱/O(1) 상태 갱신 후 submit()만 호출하고 바로 다음 프레임을 읽음
+- 종목별 제한 크기 대기열: 체결/호가는 같은 종류의 대기 중인 틱을 최신 틱으로 교체(latest-price-wins),
+  가득 차면 가장 오래된 항목을 버림 (체결통보는 교체하지 않음)
+- 워커 태스크가 종목 단위로 순서대로 처리 (같은 종목의 콜백은 동시에 실행되지 않음)
+- 동기 콜백(패턴 재분석, DB 기록, REST 호출 등)은 스레드 풀에서 실행해 이벤트 루프를 막지 않음
+- 대기열 깊이 / 교체·버림 건수 / 수신→콜백 완료 지연시간 통계 제공
+"""
+import asyncio
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Deque, Dict, List, Optional, TYPE_CHECKING
+
+from utils.logger import setup_logger
+
+if TYPE_CHECKING:
+    from .kis_websocket_subscription_manager import KISWebSocketSubscriptionManager
+
+logger = setup_logger(__name__)
+
+DISPATCH_WORKERS = 4            # 워커 태스크 수 (= 동시에 처리되는 종목 수)
+CALLBACK_THREADS = 4            # 동기 콜백 실행 스레드 수
+MAX_PENDING_PER_KEY = 32        # 종목별 대기열 최대 크기
+LATENCY_SAMPLES = 2048          # 지연시간 백분위 계산용 최근 표본 수
+COALESCE_TYPES = frozenset({'stock_price', 'stock_orderbook'})  # 최신 값만 의미 있는 데이터
+
+
+class _PendingQueue:
+    """종목 하나의 대기열 (항목: [data_type, data, 수신 시각])"""
+
+    __slots__ = ('items', 'latest', 'scheduled')
+
+    def __init__(self, maxlen: int):
+        self.items: Deque[list] = deque(maxlen=maxlen)
+        self.latest: Dict[str, list] = {}   # 교체 가능한 종류별 대기 중인 항목
+        self.scheduled = False              # 워커 대기열에 올라가 있는지
+
+
+class KISWebSocketCallbackDispatcher:
+    """웹소켓 데이터 콜백 비동기 디스패처 (웹소켓 이벤트 루프 위에서 동작)"""
+
+    def __init__(self, subscription_manager: "KISWebSocketSubscriptionManager",
+                 workers: int = DISPATCH_WORKERS, callback_threads: int = CALLBACK_THREADS,
+                 max_pending: int = MAX_PENDING_PER_KEY):
+        self.subscription_manager = subscription_manager
+        self.workers = workers
+        self.callback_threads = callback_threads
+        self.max_pending = max_pending
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._ready: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._queues: Dict[str, _PendingQueue] = {}
+        self._pending = 0
+        self._latencies: Deque[float] = deque(maxlen=LATENCY_SAMPLES)
+
+        self.stats = {
+            'submitted': 0,
+            'dispatched': 0,
+            'coalesced': 0,
+            'dropped': 0,
+            'callback_errors': 0,
+            'max_queue_depth': 0,
+            'max_latency_ms': 0.0,
+        }
+
+    # ========== 수명 주기 ==========
+
+    def _start(self, loop: asyncio.AbstractEventLoop) -> None:
+        """현재 이벤트 루프에서 워커 시작 (재연결로 루프가 바뀌면 이전 대기열은 폐기)"""
+        if self._pending:
+            self.stats['dropped'] += self._pending
+            logger.warning(f"⚠️ 이벤트 루프 교체 - 미처리 콜백 {self._pending}건 폐기")
+        self._cancel_workers()
+        self._queues.clear()
+        self._pending = 0
+
+        self._loop = loop
+        self._ready = asyncio.Queue()
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.callback_threads,
+                                                thread_name_prefix="WSCallback")
+        self._tasks = [loop.create_task(self._worker()) for _ in range(self.workers)]
+        logger.info(f"✅ 웹소켓 콜백 디스패처 시작 (워커 {self.workers}개, 스레드 {self.callback_threads}개)")
+
+    def _cancel_workers(self) -> None:
+        for task in self._tasks:
+            if not task.done():
+                task.cancel()
+        self._tasks = []
+
+    def shutdown(self) -> None:
+        """워커/스레드 풀 종료 (미처리 콜백은 버림, 루프가 돌고 있으면 워커가 끝난 뒤 정리)"""
+        loop = self._loop
+        try:
+            if loop and not loop.is_closed() and loop.is_running():
+                asyncio.run_coroutine_threadsafe(self._stop(), loop)
+                return
+        except RuntimeError:
+            pass
+        self._cancel_workers()
+        self._close()
+
+    async def _stop(self) -> None:
+        """워커를 취소하고 끝날 때까지 기다린 뒤 스레드 풀/루프 참조 정리 (디스패처 루프에서 실행)"""
+        tasks = self._tasks
+        self._cancel_workers()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        if not self._tasks:   # 기다리는 동안 새 제출로 다시 시작했으면 유지
+            self._close()
+
+    def _close(self) -> None:
+        if self._executor:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        self._loop = None
+
+    # ========== 제출 (수신 루프) ==========
+
+    def submit(self, data_type: str, data: Any, received_at: Optional[float] = None) -> None:
+        """콜백 실행 예약 - 수신 루프에서 호출, 블로킹 없음"""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop or not self._tasks:
+            self._start(loop)
+
+        key = data.get('stock_code') or data_type
+        queue = self._queues.get(key)
+        if queue is None:
+            queue = self._queues[key] = _PendingQueue(self.max_pending)
+
+        now = received_at or time.perf_counter()
+        self.stats['submitted'] += 1
+
+        coalescable = data_type in COALESCE_TYPES
+        pending = queue.latest.get(data_type) if coalescable else None
+        if pending is not None:
+            # 아직 처리되지 않은 같은 종류의 틱은 최신 틱으로 교체
+            pending[1] = data
+            pending[2] = now
+            self.stats['coalesced'] += 1
+            return
+
+        if len(queue.items) == queue.items.maxlen:
+            dropped = queue.items.popleft()
+            if queue.latest.get(dropped[0]) is dropped:
+                del queue.latest[dropped[0]]
+            self._pending -= 1
+            self.stats['dropped'] += 1
+
+        item = [data_type, data, now]
+        queue.items.append(item)
+        if coalescable:
+            queue.latest[data_type] = item
+        self._pending += 1
+        if self._pending > self.stats['max_queue_depth']:
+            self.stats['max_queue_depth'] = self._pending
+
+        if not queue.scheduled:
+            queue.scheduled = True
+            self._ready.put_nowait(key)
+
+    # ========== 처리 (워커) ==========
+
+    async def _worker(self) -> None:
+        while True:
+            key = await self._ready.get()
+            queue = self._queues.get(key)
+            if queue is None or not queue.items:
+                if queue is not None:
+                    queue.scheduled = False
+                continue
+
+            data_type, data, received_at = item = queue.items.popleft()
+            if queue.latest.get(data_type) is item:
+                del queue.latest[data_type]
+            self._pending -= 1
+
+            try:
+                await self._dispatch(data_type, data)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.stats['callback_errors'] += 1
+                logger.error(f"콜백 디스패치 오류 ({data_type}): {e}")
+
+            latency = time.perf_counter() - received_at
+            self._latencies.append(latency)
+            self.stats['dispatched'] += 1
+            if latency * 1000 > self.stats['max_latency_ms']:
+                self.stats['max_latency_ms'] = latency * 1000
+
+            # 같은 종목의 남은 항목은 다시 대기열 뒤로 (종목 간 공정성 + 종목 내 순서 보장)
+            if queue.items:
+                self._ready.put_nowait(key)
+            else:
+                queue.scheduled = False
+
+    async def _dispatch(self, data_type: str, data: Any) -> None:
+        """글로벌/종목별 콜백 실행 (비동기 콜백은 루프에서, 동기 콜백은 스레드 풀에서 일괄 실행)"""
+        calls = [(callback, (data_type, data))
+                 for callback in self.subscription_manager.get_global_callbacks(data_type)]
+        stock_code = data.get('stock_code')
+        if stock_code:
+            calls.extend((callback, (data_type, stock_code, data))
+                         for callback in self.subscription_manager.get_callbacks_for_stock(stock_code))
+        if not calls:
+            return
+
+        sync_calls = []
+        for callback, args in calls:
+            if asyncio.iscoroutinefunction(callback):
+                try:
+                    await callback(*args)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    self._on_callback_error(args, e)
+            else:
+                sync_calls.append((callback, args))
+
+        if sync_calls:
+            await asyncio.get_running_loop().run_in_executor(self._executor, self._run_sync_callbacks, sync_calls)
+
+    def _run_sync_callbacks(self, sync_calls: List[tuple]) -> None:
+        for callback, args in sync_calls:
+            try:
+                callback(*args)
+            except Exception as e:
+                self._on_callback_error(args, e)
+
+    def _on_callback_error(self, args: tuple, error: Exception) -> None:
+        self.stats['callback_errors'] += 1
+        if len(args) == 3:
+            logger.error(f"종목별 콜백 실행 오류 ({args[1]}): {error}")
+        else:
+            logger.error(f"글로벌 콜백 실행 오류 ({args[0]}): {error}")
+
+    # ========== 통계 ==========
+
+    def get_stats(self) -> Dict[str, Any]:
+        latencies = sorted(self._latencies)
+        result = {
+            **self.stats,
+            'queue_depth': self._pending,
+            'pending_keys': sum(1 for queue in list(self._queues.values()) if queue.items),
+            'workers': len(self._tasks),
+        }
+        if latencies:
+            result['latency_ms'] = {
+                'avg': sum(latencies) / len(latencies) * 1000,
+                'p50': latencies[len(latencies) // 2] * 1000,
+                'p99': latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000,
+            }
+        return result
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+KIS 웹소켓 실시간 프레임 고속 파서 (H0STCNT0 체결 / H0STASP0 호가)
+
+- 다건 프레임(데이터건수 > 1)의 모든 레코드를 처리 (기존 파서는 마지막 레코드만 사용)
+- 프레임당 '^' 분리 1회, 레코드는 분리된 리스트와 시작 위치만 참조 (레코드별 슬라이스/딕셔너리 생성 없음)
+- 필드 변환은 접근 시점에만 수행 (전략이 쓰는 몇 개 필드만 변환)
+- 레코드는 __slots__ 기반 읽기 전용 Mapping이라 기존 dict 소비 코드(get, [], in, dict())와 호환
+"""
+from collections.abc import Mapping
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+CONTRACT_FIELD_COUNT = 46   # H0STCNT0 레코드당 필드 수
+ORDERBOOK_FIELD_COUNT = 59  # H0STASP0 레코드당 필드 수 (단건 프레임은 57개 이상이면 허용)
+ORDERBOOK_MIN_FIELDS = 57
+
+
+def _int(value: str) -> int:
+    """정수 변환 (소수점 포함 문자열 허용, 빈 값/오류는 0)"""
+    try:
+        return int(value)
+    except ValueError:
+        try:
+            return int(float(value))
+        except ValueError:
+            return 0
+
+
+def _float(value: str) -> float:
+    try:
+        return float(value)
+    except ValueError:
+        return 0.0
+
+
+def _str(value: str) -> str:
+    return value
+
+
+# 체결 필드: 이름 → (레코드 내 위치, 변환 함수) - KIS 공식 문서 H0STCNT0 순서
+_CONTRACT_FIELDS: Dict[str, Tuple[int, Any]] = {
+    'stock_code': (0, _str), 'contract_time': (1, _str), 'current_price': (2, _int),
+    'change_sign': (3, _str), 'change_amount': (4, _int), 'change_rate': (5, _float),
+    'weighted_avg_price': (6, _int), 'open_price': (7, _int), 'high_price': (8, _int),
+    'low_price': (9, _int), 'ask_price1': (10, _int), 'bid_price1': (11, _int),
+    'contract_volume': (12, _int), 'acc_volume': (13, _int), 'acc_trade_amount': (14, _int),
+    'sell_contract_count': (15, _int), 'buy_contract_count': (16, _int),
+    'net_buy_contract_count': (17, _int), 'contract_strength': (18, _float),
+    'total_sell_qty': (19, _int), 'total_buy_qty': (20, _int), 'contract_type': (21, _str),
+    'buy_ratio': (22, _float), 'volume_change_rate': (23, _float), 'open_time': (24, _str),
+    'open_vs_current_sign': (25, _str), 'open_vs_current': (26, _int), 'high_time': (27, _str),
+    'high_vs_current_sign': (28, _str), 'high_vs_current': (29, _int), 'low_time': (30, _str),
+    'low_vs_current_sign': (31, _str), 'low_vs_current': (32, _int), 'business_date': (33, _str),
+    'market_operation_code': (34, _str), 'trading_halt': (35, _str), 'ask_qty1': (36, _int),
+    'bid_qty1': (37, _int), 'total_ask_qty': (38, _int), 'total_bid_qty': (39, _int),
+    'volume_turnover_rate': (40, _float), 'prev_same_time_volume': (41, _int),
+    'prev_same_time_volume_rate': (42, _float), 'hour_cls_code': (43, _str),
+    'market_closing_code': (44, _str), 'vi_standard_price': (45, _int),
+}
+
+# 호가 필드 - KIS 공식 문서 H0STASP0 순서
+_ORDERBOOK_FIELDS: Dict[str, Tuple[int, Any]] = {
+    'stock_code': (0, _str), 'business_hour': (1, _str), 'hour_cls_code': (2, _str),
+    **{f'ask_price{i}': (2 + i, _int) for i in range(1, 11)},
+    **{f'bid_price{i}': (12 + i, _int) for i in range(1, 11)},
+    **{f'ask_qty{i}': (22 + i, _int) for i in range(1, 11)},
+    **{f'bid_qty{i}': (32 + i, _int) for i in range(1, 11)},
+    'total_ask_qty': (43, _int), 'total_bid_qty': (44, _int),
+    'overtime_total_ask_qty': (45, _int), 'overtime_total_bid_qty': (46, _int),
+    'expected_price': (47, _int), 'expected_qty': (48, _int), 'expected_volume': (49, _int),
+    'expected_change': (50, _int), 'expected_change_sign': (51, _str),
+    'expected_change_rate': (52, _float), 'acc_volume': (53, _int),
+    'total_ask_change': (54, _int), 'total_bid_change': (55, _int),
+    'overtime_ask_change': (56, _int), 'overtime_bid_change': (57, _int),
+}
+
+
+class _LazyRecord(Mapping):
+    """분리된 필드 리스트 위의 지연 변환 레코드 (읽기 전용 Mapping)"""
+
+    __slots__ = ('_parts', '_base', '_width', 'timestamp', 'total_data_count')
+
+    _FIELDS: Dict[str, Tuple[int, Any]] = {}
+    _DERIVED: Tuple[str, ...] = ()
+    _META: Dict[str, Any] = {}
+
+    def __init__(self, parts: List[str], base: int, width: int, timestamp: datetime, total: int):
+        self._parts = parts
+        self._base = base
+        self._width = width
+        self.timestamp = timestamp
+        self.total_data_count = total
+
+    def _raw(self, index: int) -> str:
+        return self._parts[self._base + index] if index < self._width else ''
+
+    def _derived(self, key: str) -> Any:
+        raise KeyError(key)
+
+    def __getitem__(self, key: str) -> Any:
+        field = self._FIELDS.get(key)
+        if field is not None:
+            return field[1](self._raw(field[0]))
+        if key in self._META:
+            return self._META[key]
+        if key == 'timestamp':
+            return self.timestamp
+        if key == 'total_data_count':
+            return self.total_data_count
+        return self._derived(key)
+
+    def __iter__(self):
+        yield from self._FIELDS
+        yield from self._META
+        yield 'timestamp'
+        yield 'total_data_count'
+        yield from self._DERIVED
+
+    def __len__(self) -> int:
+        return len(self._FIELDS) + len(self._META) + 2 + len(self._DERIVED)
+
+    def __contains__(self, key) -> bool:
+        return (key in self._FIELDS or key in self._META or key in self._DERIVED
+                or key in ('timestamp', 'total_data_count'))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """모든 필드를 변환한 dict (기존 파서 결과와 같은 키, dict(record)보다 빠른 일괄 변환)"""
+        parts, base, width = self._parts, self._base, self._width
+        result = {name: convert(parts[base + index] if index < width else '')
+                  for name, (index, convert) in self._FIELDS.items()}
+        result.update(self._META)
+        result['timestamp'] = self.timestamp
+        result['total_data_count'] = self.total_data_count
+        for key in self._DERIVED:
+            result[key] = self._derived(key)
+        return result
+
+    @property
+    def stock_code(self) -> str:
+        return self._parts[self._base]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.stock_code})"
+
+
+class ContractRecord(_LazyRecord):
+    """H0STCNT0 체결 레코드"""
+
+    __slots__ = ()
+
+    _FIELDS = _CONTRACT_FIELDS
+    _META = {'source': 'websocket', 'type': 'contract'}
+    _DERIVED = ('is_market_time', 'is_trading_halt', 'market_pressure', 'price_momentum', 'volume_activity')
+
+    def _derived(self, key: str) -> Any:
+        if key == 'is_market_time':
+            return self._raw(43) == '0'                     # 0: 장중, A: 장후예상, B: 장전예상
+        if key == 'is_trading_halt':
+            return self._raw(35) == 'Y'
+        if key == 'market_pressure':
+            contract_type = self._raw(21)
+            return 'BUY' if contract_type == '1' else 'SELL' if contract_type == '5' else 'NEUTRAL'
+        if key == 'price_momentum':
+            sign = self._raw(3)
+            return 'UP' if sign in ('1', '2') else 'DOWN' if sign in ('4', '5') else 'FLAT'
+        if key == 'volume_activity':
+            rate = _float(self._raw(23))
+            return 'HIGH' if rate > 150.0 else 'LOW' if rate < 50.0 else 'NORMAL'
+        raise KeyError(key)
+
+    # 자주 쓰는 필드는 속성으로도 제공
+    @property
+    def current_price(self) -> int:
+        return _int(self._parts[self._base + 2])
+
+    @property
+    def contract_time(self) -> str:
+        return self._parts[self._base + 1]
+
+    @property
+    def contract_volume(self) -> int:
+        return _int(self._parts[self._base + 12])
+
+    @property
+    def acc_volume(self) -> int:
+        return _int(self._parts[self._base + 13])
+
+
+class OrderbookRecord(_LazyRecord):
+    """H0STASP0 호가 레코드"""
+
+    __slots__ = ()
+
+    _FIELDS = _ORDERBOOK_FIELDS
+    _META = {'source': 'websocket', 'type': 'bid_ask'}
+    _DERIVED = ('is_market_time', 'bid_ask_spread', 'bid_ask_ratio', 'market_pressure')
+
+    def _derived(self, key: str) -> Any:
+        if key == 'is_market_time':
+            return self._raw(2) == '0'
+        if key == 'bid_ask_spread':
+            ask, bid = self._raw(3), self._raw(13)
+            return (_int(ask) - _int(bid)) if ask and bid else 0
+        total_ask, total_bid = self._raw(43), self._raw(44)
+        if key == 'bid_ask_ratio':
+            return (_int(total_bid) / max(_int(total_ask), 1)) if total_ask and total_bid else 0.0
+        if key == 'market_pressure':
+            if _int(total_bid) > _int(total_ask):
+                return 'BUY'
+            return 'SELL' if total_ask and total_bid else 'NEUTRAL'
+        raise KeyError(key)
+
+    def levels(self, depth: int = 10) -> Dict[str, List[int]]:
+        """호가 단계별 가격/잔량 (1호가부터)"""
+        raw = self._parts
+        base = self._base
+        return {
+            'ask_prices': [_int(raw[base + 3 + i]) for i in range(depth)],
+            'bid_prices': [_int(raw[base + 13 + i]) for i in range(depth)],
+            'ask_qtys': [_int(raw[base + 23 + i]) for i in range(depth)],
+            'bid_qtys': [_int(raw[base + 33 + i]) for i in range(depth)],
+        }
+
+
+def parse_contract_frame(payload: str, timestamp: Optional[datetime] = None) -> List[ContractRecord]:
+    """체결 프레임의 모든 레코드 (필드가 부족하면 빈 리스트)"""
+    parts = payload.split('^')
+    total = len(parts) // CONTRACT_FIELD_COUNT
+    if total == 0:
+        return []
+    timestamp = timestamp or datetime.now()
+    return [ContractRecord(parts, i * CONTRACT_FIELD_COUNT, CONTRACT_FIELD_COUNT, timestamp, total)
+            for i in range(total)]
+
+
+def parse_orderbook_frame(payload: str, timestamp: Optional[datetime] = None) -> List[OrderbookRecord]:
+    """호가 프레임의 모든 레코드 (단건 프레임은 57개 필드부터 허용)"""
+    parts = payload.split('^')
+    if len(parts) < ORDERBOOK_MIN_FIELDS:
+        return []
+    timestamp = timestamp or datetime.now()
+    total = max(len(parts) // ORDERBOOK_FIELD_COUNT, 1)
+    if total == 1:
+        return [OrderbookRecord(parts, 0, len(parts), timestamp, 1)]
+    return [OrderbookRecord(parts, i * ORDERBOOK_FIELD_COUNT, ORDERBOOK_FIELD_COUNT, timestamp, total)
+            for i in range(total)]
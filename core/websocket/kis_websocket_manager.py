@@ -7,12 +7,15 @@ import time
 from typing import Dict, List, Optional, Callable, Any
 from utils.logger import setup_logger
 from datetime import datetime
+from config.settings import WS_EXTRA_APP_KEYS
 
 # 분리된 컴포넌트들
 from .kis_websocket_connection import KISWebSocketConnection
 from .kis_websocket_data_parser import KISWebSocketDataParser
 from .kis_websocket_subscription_manager import KISWebSocketSubscriptionManager
 from .kis_websocket_message_handler import KISWebSocketMessageHandler, KIS_WSReq
+from .kis_websocket_pool import KISWebSocketConnectionPool, KISWebSocketSession, STOCKS_PER_SESSION
+from .kis_websocket_reconnect import ReconnectState, ReconnectTracker, is_market_hours
 
 logger = setup_logger(__name__)
 
@@ -22,17 +25,46 @@ class KISWebSocketManager:
     KIS 웹소켓 매니저 (Facade 패턴)
     """
 
-    def __init__(self):
-        """초기화 - 🎯 안전성과 명확성 개선"""
+    def __init__(self, extra_app_keys: Optional[List[tuple]] = None):
+        """
+        초기화 - 🎯 안전성과 명확성 개선
+
+        Args:
+            extra_app_keys: 연결 풀 추가 세션용 [(앱키, 시크릿)] (None이면 KIS_WS_EXTRA_APP_KEYS 설정 사용,
+                            비어 있으면 기존 단일 연결 모드)
+        """
+        if extra_app_keys is None:
+            extra_app_keys = WS_EXTRA_APP_KEYS
+
         # 분리된 컴포넌트들 초기화
         self.connection = KISWebSocketConnection()
         self.data_parser = KISWebSocketDataParser()
-        self.subscription_manager = KISWebSocketSubscriptionManager()
+        self.subscription_manager = KISWebSocketSubscriptionManager(
+            max_stocks=STOCKS_PER_SESSION * (1 + len(extra_app_keys))
+        )
         self.message_handler = KISWebSocketMessageHandler(
             self.data_parser,
             self.subscription_manager
         )
 
+        # 🔀 연결 풀 모드 (추가 앱키가 있을 때만 - 기본 연결이 첫 세션)
+        self.pool: Optional[KISWebSocketConnectionPool] = None
+        if extra_app_keys:
+            connections = [self.connection] + [
+                KISWebSocketConnection(app_key, app_secret, name=f"pool-{index}")
+                for index, (app_key, app_secret) in enumerate(extra_app_keys, start=1)
+            ]
+            self.pool = KISWebSocketConnectionPool(connections, self.message_handler)
+            for session in self.pool.sessions:
+                session.on_resubscribed = self._on_session_resubscribed
+            logger.info(f"🔀 웹소켓 연결 풀 모드: {len(connections)}개 세션, 최대 {self.subscription_manager.MAX_STOCKS}종목")
+        self._pool_shutdown: Optional[asyncio.Event] = None
+
+        # 🔁 재연결 상태 기계 (단일 연결 모드, 연결 풀은 세션마다 자체 기록)
+        self.reconnector = ReconnectTracker('main')
+        self._reconnect_wake: Optional[asyncio.Event] = None
+        self._backfill_tasks: set = set()
+
         # 🎯 간소화된 백그라운드 작업 관리
         self._message_loop_task: Optional[asyncio.Task] = None
         self._event_loop: Optional[asyncio.AbstractEventLoop] = None
@@ -57,7 +89,9 @@ class KISWebSocketManager:
 
     @property
     def is_connected(self) -> bool:
-        """연결 상태 (기존 인터페이스 유지)"""
+        """연결 상태 (기존 인터페이스 유지, 연결 풀 모드는 세션 하나라도 연결되어 있으면 True)"""
+        if self.pool is not None:
+            return self.pool.is_connected
         return self.connection.is_connected
 
     @property
@@ -219,6 +253,10 @@ class KISWebSocketManager:
                         except Exception as e:
                             logger.debug(f"작업 취소 중 오류: {e}")
 
+                    # 루프에 바인딩된 비동기 REST 세션 정리 (공백 보충용)
+                    from ..api.kis_async_client import close_async_client
+                    self._event_loop.run_until_complete(close_async_client())
+
                     # 루프 종료
                     if not self._event_loop.is_closed():
                         self._event_loop.close()
@@ -227,23 +265,33 @@ class KISWebSocketManager:
 
     async def _websocket_main_loop(self):
         """🆕 개선된 웹소켓 메인 루프 - 이벤트 루프 안전성 강화"""
+        if self.pool is not None:
+            await self._pool_main_loop()
+            return
+
         try:
-            # 연결
-            if not await self.connection.connect():
-                logger.error("초기 웹소켓 연결 실패")
-                return
+            self._reconnect_wake = asyncio.Event()
 
-            self.connection.is_running = True
-            logger.info("✅ 웹소켓 메인 루프 시작")
+            # 연결 (실패해도 스레드를 끝내지 않고 재연결 상태 기계로 계속 시도)
+            if await self.connection.connect():
+                self.connection.is_running = True
+                self.reconnector.on_connected()
 
-            # 🆕 계좌 체결통보 구독 (프로그램 시작시 자동)
-            await self._subscribe_account_notices()
+                # 🆕 계좌 체결통보 구독 + 스레드 재시작 전 구독 목록 복원
+                await self._resubscribe_all()
+            else:
+                logger.error("초기 웹소켓 연결 실패 - 재연결 대기")
+                self.reconnector.on_disconnect('초기 연결 실패')
+                if not await self._reconnect_with_backoff():
+                    return
+
+            logger.info("✅ 웹소켓 메인 루프 시작")
 
             # 🆕 메시지 루프 - 안전한 예외 처리
             consecutive_errors = 0
             max_consecutive_errors = 5
 
-            while self.connection.is_running and not self._shutdown_event.is_set():
+            while not self._shutdown_event.is_set():
                 try:
                     # 🆕 현재 루프 상태 확인
                     current_loop = asyncio.get_running_loop()
@@ -252,13 +300,10 @@ class KISWebSocketManager:
                         break
 
                     # 연결 상태 확인
-                    if not self.connection.check_actual_connection_status():
-                        logger.warning("웹소켓 연결 끊어짐 - 재연결 시도")
-
-                        # 🆕 안전한 재연결
-                        if not await self._safe_reconnect():
-                            await asyncio.sleep(5)
-                            continue
+                    if not self.connection.is_connected or not self.connection.check_actual_connection_status():
+                        self.reconnector.on_disconnect('연결 끊어짐')
+                        if not await self._reconnect_with_backoff():
+                            break
 
                     # 🆕 안전한 메시지 수신
                     try:
@@ -270,6 +315,8 @@ class KISWebSocketManager:
                         if message:
                             self.stats['total_messages'] += 1
                             consecutive_errors = 0  # 성공시 오류 카운터 리셋
+                            if message[0] in ('0', '1'):
+                                self.reconnector.on_tick()
 
                             # 메시지 처리
                             result = await self.message_handler.process_message(message)
@@ -281,6 +328,11 @@ class KISWebSocketManager:
 
                     except asyncio.TimeoutError:
                         logger.debug("메시지 수신 타임아웃 (정상)")
+                        # 연결은 살아 있는데 장중 체결이 끊긴 공백 → 재연결
+                        if self.reconnector.is_silent(self.subscription_manager.get_subscription_count()):
+                            self.reconnector.on_disconnect('장중 무수신')
+                            if not await self._reconnect_with_backoff():
+                                break
                         continue
                     except asyncio.CancelledError:
                         logger.info("메시지 수신이 취소되었습니다")
@@ -292,7 +344,8 @@ class KISWebSocketManager:
                         # 🆕 연속 오류가 많으면 재연결
                         if consecutive_errors >= max_consecutive_errors:
                             logger.error(f"연속 오류 {max_consecutive_errors}회 발생 - 재연결 시도")
-                            if not await self._safe_reconnect():
+                            self.reconnector.on_disconnect(f"연속 수신 오류 {consecutive_errors}회")
+                            if not await self._reconnect_with_backoff():
                                 logger.error("재연결 실패 - 메인 루프 종료")
                                 break
                             consecutive_errors = 0
@@ -350,32 +403,173 @@ class KISWebSocketManager:
 
             logger.info("🛑 웹소켓 메인 루프 종료")
 
-    async def _safe_reconnect(self) -> bool:
-        """🎯 간소화된 안전한 재연결"""
+    async def _pool_main_loop(self):
+        """연결 풀 메인 루프 - 세션별 수신/재연결은 풀이 담당, 종료 신호만 전달"""
         try:
-            logger.info("🔄 웹소켓 재연결 시도...")
+            self._pool_shutdown = asyncio.Event()
+            if not await self.pool.connect_all():
+                logger.warning("초기 연결 풀 연결 실패 - 세션별 재연결 시도")
+
+            self.connection.is_running = True
+            await self._subscribe_account_notices()
+
+            # 이미 구독 목록에 있는 종목은 세션에 배정 (재시작 시)
+            for stock_code in self.subscription_manager.get_subscribed_stocks():
+                await self.pool.subscribe(stock_code)
+
+            run_task = asyncio.ensure_future(self.pool.run(self._pool_shutdown))
+            while not self._shutdown_event.is_set() and not run_task.done():
+                await asyncio.sleep(1)
+
+            self._pool_shutdown.set()
+            await run_task
+
+        except asyncio.CancelledError:
+            logger.info("연결 풀 메인 루프가 취소되었습니다")
+        except Exception as e:
+            logger.error(f"연결 풀 메인 루프 오류: {e}")
+        finally:
+            self.connection.is_running = False
+            logger.info("🛑 연결 풀 메인 루프 종료")
+
+    async def _send_stock_subscription(self, stock_code: str, tr_type: str) -> None:
+        """종목 체결/호가 등록(1)·해지(2) 전송 - 연결 풀 모드면 배정된 세션으로"""
+        if self.pool is not None:
+            if tr_type == '1':
+                if not await self.pool.subscribe(stock_code):
+                    raise RuntimeError("연결 풀 구독 한계 도달")
+            else:
+                await self.pool.unsubscribe(stock_code)
+            return
+
+        # 체결가
+        contract_msg = self.connection.build_message(
+            KIS_WSReq.CONTRACT.value, stock_code, tr_type
+        )
+        await self.connection.send_message(contract_msg)
+
+        # 호가
+        bid_ask_msg = self.connection.build_message(
+            KIS_WSReq.BID_ASK.value, stock_code, tr_type
+        )
+        await self.connection.send_message(bid_ask_msg)
+
+    async def _reconnect_with_backoff(self) -> bool:
+        """
+        재연결 상태 기계 - jitter 대기 → 연결(캐시된 승인키) → 일괄 재구독 → 공백 구간 REST 보충
+
+        request_reconnect()로 깨우면 남은 대기를 건너뜀, 종료 신호가 오면 False
+        """
+        tracker = self.reconnector
+        while not self._shutdown_event.is_set():
+            delay = tracker.backoff.next_delay()
+            tracker.transition(ReconnectState.BACKOFF)
+            logger.info(f"🔄 웹소켓 재연결 대기 {delay:.1f}초 (시도 {tracker.backoff.attempt}회)")
+            await self._wait_reconnect_wake(delay)
+            if self._shutdown_event.is_set():
+                break
+
+            tracker.transition(ReconnectState.CONNECTING)
             self.stats['reconnect_count'] += 1
+            try:
+                await self.connection.disconnect()
+                if await self.connection.connect():
+                    self.connection.is_running = True
+                    count = await self._resubscribe_all()
+                    tracker.on_resubscribed(count)
+                    logger.info(f"✅ 웹소켓 재연결 성공: {count}종목 재구독 "
+                                f"(끊김 후 {tracker.stats['last_connect_seconds']:.2f}초)")
+                    self._schedule_backfill(self.subscription_manager.get_subscribed_stocks(), tracker)
+                    return True
+            except Exception as e:
+                logger.error(f"❌ 재연결 과정 오류: {e}")
+                self.stats['last_error'] = str(e)
 
-            # 🔧 기존 연결 정리
-            await self.connection.disconnect()
-            await asyncio.sleep(2)  # 안전한 대기
+            if tracker.on_attempt_failed():
+                self.connection.invalidate_approval_key()
+            logger.error("❌ 웹소켓 재연결 실패")
 
-            # 🔧 새로운 연결
-            success = await self.connection.connect()
-            if success:
-                logger.info("✅ 웹소켓 재연결 성공")
-                # 🎯 계좌 체결통보 재구독
-                await self._subscribe_account_notices()
+        tracker.transition(ReconnectState.CLOSED)
+        return False
+
+    async def _wait_reconnect_wake(self, delay: float) -> None:
+        """재연결 대기 (request_reconnect 호출 시 즉시 깨어남)"""
+        if self._reconnect_wake is None:
+            await asyncio.sleep(delay)
+            return
+        try:
+            await asyncio.wait_for(self._reconnect_wake.wait(), timeout=delay)
+        except asyncio.TimeoutError:
+            pass
+        self._reconnect_wake.clear()
+
+    async def _resubscribe_all(self) -> int:
+        """계좌 체결통보 + 구독 목록 전체 등록 메시지를 응답 대기 없이 연속 전송 (재구독 종목 수 반환)"""
+        await self._subscribe_account_notices()
+        stocks = self.subscription_manager.get_subscribed_stocks()
+        for stock_code in stocks:
+            await self._send_stock_subscription(stock_code, '1')
+        return len(stocks)
+
+    def _wake_reconnect(self) -> None:
+        """재연결 대기 깨우기 (스레드 안전)"""
+        loop = self._event_loop
+        if self._reconnect_wake is not None and loop is not None and loop.is_running():
+            loop.call_soon_threadsafe(self._reconnect_wake.set)
+
+    def request_reconnect(self, reason: str = '외부 요청') -> bool:
+        """
+        재연결 요청 (논블로킹) - 다른 스레드에서 호출
+
+        실행 중인 재연결 대기를 깨우고, 웹소켓 스레드가 없으면 시작만 하고 바로 반환
+        """
+        try:
+            loop = self._event_loop
+            if self._websocket_thread and self._websocket_thread.is_alive() and loop and loop.is_running():
+                logger.info(f"🔔 웹소켓 재연결 요청: {reason}")
+                self._wake_reconnect()
                 return True
-            else:
-                logger.error("❌ 웹소켓 재연결 실패")
-                return False
+
+            logger.info(f"🚀 웹소켓 스레드 시작 요청: {reason}")
+            self.start_message_loop()
+            return True
 
         except Exception as e:
-            logger.error(f"❌ 재연결 과정 오류: {e}")
-            self.stats['last_error'] = str(e)
+            logger.error(f"재연결 요청 오류: {e}")
             return False
 
+    def _on_session_resubscribed(self, session: KISWebSocketSession, stocks: List[str]) -> None:
+        """연결 풀 세션 재연결 완료 - 기본 세션이면 체결통보 재구독, 샤드 공백 구간 REST 보충"""
+        if session is self.pool.primary:
+            asyncio.ensure_future(self._subscribe_account_notices())
+        if stocks:
+            self._schedule_backfill(stocks, session.tracker)
+
+    def _schedule_backfill(self, stock_codes: List[str], tracker: ReconnectTracker) -> None:
+        """공백 구간 REST 보충 예약 (웹소켓 이벤트 루프에서 실행, 장중에만)"""
+        if not stock_codes or not is_market_hours():
+            return
+        task = asyncio.ensure_future(self._backfill_gap(list(stock_codes), tracker))
+        self._backfill_tasks.add(task)
+        task.add_done_callback(self._backfill_tasks.discard)
+
+    async def _backfill_gap(self, stock_codes: List[str], tracker: ReconnectTracker) -> None:
+        """끊긴 동안 놓친 시세를 REST 일괄 조회로 받아 실시간 콜백 경로로 전달"""
+        try:
+            from ..data.bulk_quote_service import get_bulk_quote_service, ENTRY_FIELDS
+
+            # 재연결 직후라 시세만 필요 - 순위 스냅샷 갱신(순위 API 3회)을 기다리지 않음
+            quotes = await get_bulk_quote_service().fetch(stock_codes, ENTRY_FIELDS, use_websocket=False,
+                                                          refresh_ranking=False)
+            for quote in quotes.values():
+                await self.message_handler.publish('stock_price', _backfill_record(quote))
+
+            tracker.stats['backfilled'] += len(quotes)
+            logger.info(f"🩹 웹소켓 공백 REST 보충 [{tracker.name}]: {len(quotes)}/{len(stock_codes)}종목")
+
+        except Exception as e:
+            logger.error(f"공백 구간 REST 보충 오류: {e}")
+
     # ==========================================
     # 구독 관리 메서드들 (기존 인터페이스 유지)
     # ==========================================
@@ -398,18 +592,8 @@ class KISWebSocketManager:
                 #logger.warning(f"❌ 구독 불가 - 한계 도달: {current_count}/{max_count} (종목: {stock_code})")
                 return False
 
-            # 새로운 구독 시도
-            # 체결가 구독
-            contract_msg = self.connection.build_message(
-                KIS_WSReq.CONTRACT.value, stock_code, '1'
-            )
-            await self.connection.send_message(contract_msg)
-
-            # 호가 구독
-            bid_ask_msg = self.connection.build_message(
-                KIS_WSReq.BID_ASK.value, stock_code, '1'
-            )
-            await self.connection.send_message(bid_ask_msg)
+            # 새로운 구독 시도 (체결가 + 호가)
+            await self._send_stock_subscription(stock_code, '1')
 
             # 구독 등록
             if self.subscription_manager.add_subscription(stock_code):
@@ -444,8 +628,8 @@ class KISWebSocketManager:
             logger.debug(f"🔄 동기 방식 종목 구독 시도: {stock_code}")
 
             # 웹소켓 연결 상태 확인
-            if not self.connection.is_connected:
-                logger.error(f"웹소켓 연결 상태 불량: connected={self.connection.is_connected}")
+            if not self.is_connected:
+                logger.error(f"웹소켓 연결 상태 불량: connected={self.is_connected}")
                 return False
 
             # 구독 가능 여부 확인
@@ -548,17 +732,8 @@ class KISWebSocketManager:
     async def unsubscribe_stock(self, stock_code: str) -> bool:
         """종목 구독 해제 (기존 인터페이스)"""
         try:
-            # 체결가 구독 해제
-            contract_msg = self.connection.build_message(
-                KIS_WSReq.CONTRACT.value, stock_code, '2'
-            )
-            await self.connection.send_message(contract_msg)
-
-            # 호가 구독 해제
-            bid_ask_msg = self.connection.build_message(
-                KIS_WSReq.BID_ASK.value, stock_code, '2'
-            )
-            await self.connection.send_message(bid_ask_msg)
+            # 체결가 + 호가 구독 해제
+            await self._send_stock_subscription(stock_code, '2')
 
             # 구독 제거
             self.subscription_manager.remove_subscription(stock_code)
@@ -570,6 +745,28 @@ class KISWebSocketManager:
             logger.error(f"종목 구독 해제 실패 ({stock_code}): {e}")
             return False
 
+    def unsubscribe_stock_sync(self, stock_code: str) -> bool:
+        """종목 구독 해제 (동기 방식 - 다른 스레드에서 슬롯 교체 시 사용)"""
+        try:
+            if not self.subscription_manager.is_subscribed(stock_code):
+                return True
+
+            if self.is_connected and self._event_loop and self._event_loop.is_running():
+                future = asyncio.run_coroutine_threadsafe(
+                    self.unsubscribe_stock(stock_code),
+                    self._event_loop
+                )
+                return future.result(timeout=10)
+
+            # 연결이 없으면 구독 매니저에서만 제거 (재연결 시 재구독 대상에서 제외)
+            self.subscription_manager.remove_subscription(stock_code)
+            logger.info(f"⚠️ 연결 없음 - 구독 목록에서만 해제: {stock_code}")
+            return True
+
+        except Exception as e:
+            logger.error(f"동기 구독 해제 오류 ({stock_code}): {e}")
+            return False
+
     def add_stock_callback(self, stock_code: str, callback: Callable):
         """종목별 콜백 추가 (기존 인터페이스)"""
         self.subscription_manager.add_stock_callback(stock_code, callback)
@@ -630,6 +827,8 @@ class KISWebSocketManager:
             'subscriptions': subscription_status,
             'message_handler': handler_stats,
             'data_parser': parser_stats,
+            'pool': self.pool.get_status() if self.pool is not None else None,
+            'reconnect': self.reconnector.get_stats(),
             'total_stats': self.stats.copy(),
             'uptime': time.time() - self.stats['start_time']
         }
@@ -711,16 +910,8 @@ class KISWebSocketManager:
             return False
 
     def reconnect(self) -> bool:
-        """웹소켓 재연결 (동기 방식)"""
-        try:
-            if hasattr(self, 'connection') and hasattr(self.connection, 'connect'):
-                return self.connection.connect()
-            else:
-                # 백업: 직접 연결 시도
-                return self.connect()
-        except Exception as e:
-            logger.error(f"웹소켓 재연결 오류: {e}")
-            return False
+        """웹소켓 재연결 (논블로킹 - 재연결 상태 기계에 요청만 전달)"""
+        return self.request_reconnect('재연결 요청')
 
     def connect(self) -> bool:
         """웹소켓 연결 (기본 동기 방식)"""
@@ -797,8 +988,9 @@ class KISWebSocketManager:
         try:
             logger.info("웹소켓 매니저 정리 시작...")
 
-            # 종료 신호 설정
+            # 종료 신호 설정 (재연결 대기 중이면 깨움)
             self._shutdown_event.set()
+            self._wake_reconnect()
 
             # 웹소켓 연결 해제
             await self.connection.disconnect()
@@ -806,6 +998,14 @@ class KISWebSocketManager:
             # 구독 정리
             self.subscription_manager.clear_all_subscriptions()
 
+            # 콜백 디스패처 정리
+            if self.message_handler.dispatcher is not None:
+                self.message_handler.dispatcher.shutdown()
+
+            # 기록 중인 원본 프레임 저장
+            if self.message_handler.recorder is not None:
+                self.message_handler.recorder.close()
+
             # 스레드 종료 대기
             if self._websocket_thread and self._websocket_thread.is_alive():
                 self._websocket_thread.join(timeout=5)
@@ -820,8 +1020,9 @@ class KISWebSocketManager:
         try:
             logger.info("웹소켓 매니저 동기식 정리 시작...")
 
-            # 종료 신호
+            # 종료 신호 (재연결 대기 중이면 깨움)
             self._shutdown_event.set()
+            self._wake_reconnect()
 
             # 🔧 안전한 연결 정리 (이벤트 루프 충돌 방지)
             try:
@@ -855,6 +1056,14 @@ class KISWebSocketManager:
             # 구독 정리
             self.subscription_manager.clear_all_subscriptions()
 
+            # 콜백 디스패처 정리
+            if self.message_handler.dispatcher is not None:
+                self.message_handler.dispatcher.shutdown()
+
+            # 기록 중인 원본 프레임 저장
+            if self.message_handler.recorder is not None:
+                self.message_handler.recorder.close()
+
             # 스레드 정리
             if self._websocket_thread and self._websocket_thread.is_alive():
                 self._websocket_thread.join(timeout=3)
@@ -899,3 +1108,22 @@ class KISWebSocketManager:
         except Exception as e:
             logger.error(f"계좌 체결통보 구독 실패: {e}")
             return False
+
+
+def _backfill_record(quote) -> Dict[str, Any]:
+    """REST 현재가(StockQuote) → 실시간 체결 콜백과 같은 키의 보충 레코드"""
+    return {
+        'type': 'backfill',
+        'source': 'rest_backfill',
+        'stock_code': quote.stock_code,
+        'current_price': int(quote.current_price),
+        'open_price': int(quote.open_price),
+        'high_price': int(quote.high_price),
+        'low_price': int(quote.low_price),
+        'change_amount': int(quote.prev_diff),
+        'change_rate': quote.change_rate,
+        'acc_volume': quote.volume,
+        'volume': quote.volume,
+        'acc_trade_amount': quote.trading_value,
+        'timestamp': datetime.now()
+    }
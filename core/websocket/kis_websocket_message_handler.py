@@ -4,10 +4,15 @@ KIS 웹소켓 메시지 처리 전담 클래스
 """
 import asyncio
 import json
+import time
 from typing import Dict, Callable, TYPE_CHECKING, Optional
 from datetime import datetime
 from enum import Enum
 from utils.logger import setup_logger
+from config.settings import WS_RECORD_FRAMES, WS_RECORD_DIR
+from ..data.intraday_bars import get_intraday_bar_aggregator
+from .kis_websocket_dispatcher import KISWebSocketCallbackDispatcher
+from .kis_websocket_recorder import KISWebSocketFrameRecorder
 
 if TYPE_CHECKING:
     from .kis_websocket_data_parser import KISWebSocketDataParser
@@ -47,6 +52,19 @@ class KISWebSocketMessageHandler:
         # 🎯 CandleTradeManager 설정 - _all_stocks 상태 업데이트용
         self.candle_trade_manager = None
 
+        # 📊 체결 틱 → 분봉/당일 일봉 집계기
+        self.bar_aggregator = get_intraday_bar_aggregator()
+
+        # 🚀 콜백은 수신 루프 밖에서 실행 (None이면 기존처럼 수신 루프에서 직접 실행)
+        self.dispatcher: Optional[KISWebSocketCallbackDispatcher] = KISWebSocketCallbackDispatcher(subscription_manager)
+        self._received_at: Optional[float] = None
+
+        # 💾 원본 프레임 기록기 (WS_RECORD_FRAMES=true일 때만)
+        self.recorder: Optional[KISWebSocketFrameRecorder] = None
+        if WS_RECORD_FRAMES:
+            self.recorder = KISWebSocketFrameRecorder(WS_RECORD_DIR)
+            logger.info(f"💾 웹소켓 원본 프레임 기록 활성화: {WS_RECORD_DIR}")
+
         # 통계
         self.stats = {
             'messages_received': 0,
@@ -91,29 +109,23 @@ class KISWebSocketMessageHandler:
 
                 # 🔍 암호화 여부 확인
                 is_encrypted = encryption_flag == '1'
+                payload = self.data_parser.decrypt_notice_data(raw_data) if is_encrypted else raw_data
+                if not payload:
+                    logger.warning("❌ 체결 데이터 복호화 실패")
+                    return
 
-                if is_encrypted:
-                    # 암호화된 경우 복호화 필요
-                    decrypted_data = self.data_parser.decrypt_notice_data(raw_data)
-                    if decrypted_data:
-                        parsed_data = self.data_parser.parse_contract_data(decrypted_data)
-                        #logger.debug(f"🔓 체결 데이터 복호화 성공: {len(decrypted_data)}자")
-                    else:
-                        logger.warning("❌ 체결 데이터 복호화 실패")
-                        parsed_data = None
-                else:
-                    # 암호화되지 않은 경우 직접 파싱
-                    parsed_data = self.data_parser.parse_contract_data(raw_data)
-
-                if parsed_data:
-                    stock_code = parsed_data['stock_code']
-                    total_records = parsed_data.get('total_data_count', 1)
-                    #logger.info(f"✅ 체결 데이터 파싱 성공: {stock_code} "
-                    #           f"(암호화: {'예' if is_encrypted else '아니오'}, "
-                    #           f"처리건수: {total_records}건)")
-                    await self._execute_callbacks(DataType.STOCK_PRICE.value, parsed_data)
-                else:
+                # 🚀 다건 프레임의 모든 체결 레코드 처리 (필드는 접근 시점에 변환)
+                records = self.data_parser.parse_contract_records(payload)
+                if not records:
                     logger.warning("❌ 체결 데이터 파싱 실패")
+                    return
+
+                for record in records:
+                    try:
+                        self.bar_aggregator.on_contract(record)
+                    except Exception as e:
+                        logger.debug(f"분봉 집계 오류: {record.stock_code} - {e}")
+                    await self._execute_callbacks(DataType.STOCK_PRICE.value, record)
 
             elif tr_id == KIS_WSReq.BID_ASK.value:
                 # 실시간 호가
@@ -121,27 +133,18 @@ class KISWebSocketMessageHandler:
 
                 # 🔍 암호화 여부 확인
                 is_encrypted = encryption_flag == '1'
+                payload = self.data_parser.decrypt_notice_data(raw_data) if is_encrypted else raw_data
+                if not payload:
+                    logger.warning("❌ 호가 데이터 복호화 실패")
+                    return
 
-                if is_encrypted:
-                    # 암호화된 경우 복호화 필요
-                    decrypted_data = self.data_parser.decrypt_notice_data(raw_data)
-                    if decrypted_data:
-                        parsed_data = self.data_parser.parse_bid_ask_data(decrypted_data)
-                        #logger.debug(f"🔓 호가 데이터 복호화 성공: {len(decrypted_data)}자")
-                    else:
-                        logger.warning("❌ 호가 데이터 복호화 실패")
-                        parsed_data = None
-                else:
-                    # 암호화되지 않은 경우 직접 파싱
-                    parsed_data = self.data_parser.parse_bid_ask_data(raw_data)
-
-                if parsed_data:
-                    stock_code = parsed_data['stock_code']
-                    #logger.info(f"✅ 호가 데이터 파싱 성공: {stock_code} "
-                    #           f"(암호화: {'예' if is_encrypted else '아니오'})")
-                    await self._execute_callbacks(DataType.STOCK_ORDERBOOK.value, parsed_data)
-                else:
+                records = self.data_parser.parse_bid_ask_records(payload)
+                if not records:
                     logger.warning("❌ 호가 데이터 파싱 실패")
+                    return
+
+                for record in records:
+                    await self._execute_callbacks(DataType.STOCK_ORDERBOOK.value, record)
 
             elif tr_id in [KIS_WSReq.NOTICE.value]:
                 # 체결통보 (실전투자는 NOTICE만 사용)
@@ -237,6 +240,9 @@ class KISWebSocketMessageHandler:
         try:
             self.stats['messages_received'] += 1
             self.stats['last_message_time'] = datetime.now()
+            self._received_at = time.perf_counter()
+            if self.recorder is not None:
+                self.recorder.record(message)
 
             # 디버그: 수신된 메시지 로그
             #logger.info(f"📨 웹소켓 메시지 수신 (길이: {len(message)}, 첫 문자: '{message[0] if message else 'None'}')")
@@ -255,8 +261,23 @@ class KISWebSocketMessageHandler:
             logger.error(f"메시지 처리 오류: {e}")
             self.stats['errors'] += 1
 
+    async def publish(self, data_type: str, data: Dict):
+        """웹소켓 밖에서 얻은 데이터(재연결 공백 REST 보충 등)를 실시간 데이터와 같은 콜백 경로로 전달"""
+        self._received_at = time.perf_counter()
+        await self._execute_callbacks(data_type, data)
+
     async def _execute_callbacks(self, data_type: str, data: Dict):
-        """콜백 함수들 실행 - 🆕 data_type 정보 전달"""
+        """콜백 함수들 실행 - 디스패처가 있으면 예약만 하고 바로 반환"""
+        if self.dispatcher is not None:
+            try:
+                self.dispatcher.submit(data_type, data, self._received_at)
+            except Exception as e:
+                logger.error(f"콜백 디스패치 예약 오류 ({data_type}): {e}")
+            return
+        await self._invoke_callbacks(data_type, data)
+
+    async def _invoke_callbacks(self, data_type: str, data: Dict):
+        """콜백 함수들 직접 실행 - 🆕 data_type 정보 전달"""
         try:
             # 글로벌 콜백 실행
             global_callbacks = self.subscription_manager.get_global_callbacks(data_type)
@@ -287,7 +308,12 @@ class KISWebSocketMessageHandler:
 
     def get_stats(self) -> Dict:
         """메시지 처리 통계 반환"""
-        return self.stats.copy()
+        stats = self.stats.copy()
+        if self.dispatcher is not None:
+            stats['dispatch'] = self.dispatcher.get_stats()
+        if self.recorder is not None:
+            stats['recorder'] = self.recorder.get_stats()
+        return stats
 
     async def _handle_execution_notice_direct(self, decrypted_data: str):
         """🔔 체결통보 직접 처리 - CandleTradeManager 연동 강화 (개선된 버전)"""
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+KIS 웹소켓 연결 풀 - 여러 앱키(승인키) 세션으로 연결당 19종목 한도 확장
+
+- 세션마다 별도 KISWebSocketConnection(승인키)과 자기 구독 샤드를 가짐
+- 신규 구독은 연결된 세션 중 가장 적게 쓰는 세션에 배정 (종목 → 세션 고정)
+- 모든 세션의 수신 프레임을 하나의 대기열로 합쳐 메시지 핸들러 한 곳에서 처리
+  (PINGPONG은 받은 세션으로 응답)
+- 재연결은 세션별로 독립 수행 - 끊긴 세션만 다시 연결(jitter 대기) 후 자기 샤드 일괄 재구독, 나머지 세션은 계속 수신
+"""
+import asyncio
+import time
+from typing import Callable, Dict, List, Optional, Set, TYPE_CHECKING
+
+from utils.logger import setup_logger
+from .kis_websocket_connection import KISWebSocketConnection
+from .kis_websocket_reconnect import ReconnectState, ReconnectTracker
+
+if TYPE_CHECKING:
+    from .kis_websocket_message_handler import KISWebSocketMessageHandler
+
+logger = setup_logger(__name__)
+
+STOCKS_PER_SESSION = 19         # 연결당 종목 한도 (체결 + 호가 = 38/41 스트림)
+STREAM_TR_IDS = ('H0STCNT0', 'H0STASP0')  # 종목당 구독 스트림 (체결, 호가)
+RECEIVE_TIMEOUT = 30            # 수신 대기 타임아웃 (초, 정상적인 무수신)
+DISPATCH_QUEUE_SIZE = 10000     # 합쳐진 수신 대기열 크기
+
+
+class KISWebSocketSession:
+    """연결 풀 안의 웹소켓 세션 하나 (연결 + 구독 샤드 + 독립 재연결)"""
+
+    def __init__(self, index: int, connection: KISWebSocketConnection, max_stocks: int = STOCKS_PER_SESSION):
+        self.index = index
+        self.connection = connection
+        self.max_stocks = max_stocks
+        self.stocks: Set[str] = set()
+        self.tracker = ReconnectTracker(connection.name)
+        # 재구독 완료 후 호출 (세션, 재구독 종목) - 공백 구간 REST 보충용
+        self.on_resubscribed: Optional[Callable[["KISWebSocketSession", List[str]], None]] = None
+
+        self.stats = {
+            'messages': 0,
+            'last_message_time': None
+        }
+
+    @property
+    def name(self) -> str:
+        return self.connection.name
+
+    @property
+    def is_connected(self) -> bool:
+        return self.connection.is_connected
+
+    def has_capacity(self) -> bool:
+        return len(self.stocks) < self.max_stocks
+
+    async def _send_stock(self, stock_code: str, tr_type: str) -> bool:
+        """종목 스트림(체결/호가) 등록·해지 메시지 전송"""
+        success = True
+        for tr_id in STREAM_TR_IDS:
+            message = self.connection.build_message(tr_id, stock_code, tr_type)
+            success = await self.connection.send_message(message) and success
+        return success
+
+    async def subscribe(self, stock_code: str) -> bool:
+        """종목 구독 (연결이 끊겨 있으면 샤드에만 등록 - 재연결 시 구독)"""
+        self.stocks.add(stock_code)
+        if not self.connection.is_connected:
+            return True
+        return await self._send_stock(stock_code, '1')
+
+    async def unsubscribe(self, stock_code: str) -> bool:
+        """종목 구독 해제"""
+        self.stocks.discard(stock_code)
+        if not self.connection.is_connected:
+            return True
+        return await self._send_stock(stock_code, '2')
+
+    async def resubscribe_all(self) -> int:
+        """샤드 전체 등록 메시지를 응답 대기 없이 연속 전송 (재구독 종목 수 반환)"""
+        stocks = list(self.stocks)
+        for stock_code in stocks:
+            await self._send_stock(stock_code, '1')
+        return len(stocks)
+
+    async def _reconnect(self, shutdown: asyncio.Event) -> bool:
+        """끊긴 세션 재연결 (jitter 대기) 후 자기 샤드 재구독"""
+        while not shutdown.is_set():
+            self.tracker.transition(ReconnectState.CONNECTING)
+            await self.connection.disconnect()
+            if await self.connection.connect():
+                self.connection.is_running = True
+                count = await self.resubscribe_all()
+                self.tracker.on_resubscribed(count)
+                logger.info(f"✅ 세션 재연결 [{self.name}]: {count}종목 재구독 "
+                            f"(끊김 후 {self.tracker.stats['last_connect_seconds']:.2f}초)")
+                if self.on_resubscribed is not None:
+                    self.on_resubscribed(self, sorted(self.stocks))
+                return True
+
+            if self.tracker.on_attempt_failed():
+                self.connection.invalidate_approval_key()
+            delay = self.tracker.backoff.next_delay()
+            self.tracker.transition(ReconnectState.BACKOFF)
+            logger.warning(f"⚠️ 세션 재연결 실패 [{self.name}] - {delay:.1f}초 후 재시도")
+            try:
+                await asyncio.wait_for(shutdown.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+        return False
+
+    async def run(self, queue: asyncio.Queue, shutdown: asyncio.Event) -> None:
+        """수신 루프 - 받은 프레임을 (세션, 프레임)으로 합쳐진 대기열에 넣음"""
+        if self.connection.is_connected:
+            self.tracker.on_connected()
+        while not shutdown.is_set():
+            try:
+                if not self.connection.is_connected:
+                    self.tracker.on_disconnect('연결 종료')
+                    if not await self._reconnect(shutdown):
+                        break
+                    continue
+
+                try:
+                    message = await asyncio.wait_for(self.connection.receive_message(), timeout=RECEIVE_TIMEOUT)
+                except asyncio.TimeoutError:
+                    if self.tracker.is_silent(len(self.stocks)):
+                        self.tracker.on_disconnect('장중 무수신')
+                        await self.connection.disconnect()
+                    continue
+
+                if message:
+                    self.stats['messages'] += 1
+                    self.stats['last_message_time'] = time.time()
+                    if message[0] in ('0', '1'):
+                        self.tracker.on_tick()
+                    await queue.put((self, message))
+
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"세션 수신 오류 [{self.name}]: {e}")
+                await asyncio.sleep(1)
+
+    def get_status(self) -> Dict:
+        return {
+            'name': self.name,
+            'is_connected': self.is_connected,
+            'stocks': len(self.stocks),
+            'max_stocks': self.max_stocks,
+            'stats': self.stats.copy(),
+            'reconnect': self.tracker.get_stats()
+        }
+
+
+class KISWebSocketConnectionPool:
+    """여러 웹소켓 세션에 종목 구독을 나눠 담고 수신 스트림을 하나로 합치는 연결 풀"""
+
+    def __init__(self, connections: List[KISWebSocketConnection],
+                 message_handler: "KISWebSocketMessageHandler",
+                 stocks_per_session: int = STOCKS_PER_SESSION):
+        self.sessions = [KISWebSocketSession(index, connection, stocks_per_session)
+                         for index, connection in enumerate(connections)]
+        self.message_handler = message_handler
+        self._assignments: Dict[str, KISWebSocketSession] = {}
+        self._queue: Optional[asyncio.Queue] = None
+
+        self.stats = {
+            'dispatched': 0,
+            'pingpong': 0,
+            'max_queue_depth': 0
+        }
+
+    @property
+    def primary(self) -> KISWebSocketSession:
+        """기본 세션 (계좌 체결통보 구독용)"""
+        return self.sessions[0]
+
+    @property
+    def capacity(self) -> int:
+        return sum(session.max_stocks for session in self.sessions)
+
+    @property
+    def is_connected(self) -> bool:
+        return any(session.is_connected for session in self.sessions)
+
+    def session_for(self, stock_code: str) -> Optional[KISWebSocketSession]:
+        return self._assignments.get(stock_code)
+
+    def _assign(self, stock_code: str) -> Optional[KISWebSocketSession]:
+        """연결된 세션 우선, 구독 수가 가장 적은 세션에 배정"""
+        candidates = [session for session in self.sessions if session.has_capacity()]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda session: (not session.is_connected, len(session.stocks), session.index))
+
+    async def connect_all(self) -> int:
+        """모든 세션 동시 연결 (연결된 세션 수 반환)"""
+        results = await asyncio.gather(*(session.connection.connect() for session in self.sessions),
+                                       return_exceptions=True)
+        for session in self.sessions:
+            session.connection.is_running = True
+        connected = sum(1 for result in results if result is True)
+        logger.info(f"🔗 웹소켓 연결 풀: {connected}/{len(self.sessions)}개 세션 연결")
+        return connected
+
+    async def subscribe(self, stock_code: str) -> bool:
+        """종목 구독 (이미 배정된 종목은 그 세션 유지)"""
+        session = self._assignments.get(stock_code)
+        if session is not None:
+            return True
+
+        session = self._assign(stock_code)
+        if session is None:
+            logger.warning(f"❌ 연결 풀 구독 한계 도달: {len(self._assignments)}/{self.capacity} ({stock_code})")
+            return False
+
+        self._assignments[stock_code] = session
+        if not await session.subscribe(stock_code):
+            logger.warning(f"⚠️ 구독 메시지 전송 실패 [{session.name}] {stock_code} - 재연결 시 재구독")
+        logger.debug(f"📡 {stock_code} → 세션 [{session.name}] ({len(session.stocks)}/{session.max_stocks})")
+        return True
+
+    async def unsubscribe(self, stock_code: str) -> bool:
+        session = self._assignments.pop(stock_code, None)
+        if session is None:
+            return True
+        return await session.unsubscribe(stock_code)
+
+    async def _dispatch_loop(self, shutdown: asyncio.Event) -> None:
+        """합쳐진 대기열을 메시지 핸들러 한 곳에서 순서대로 처리"""
+        while not shutdown.is_set():
+            try:
+                session, message = await asyncio.wait_for(self._queue.get(), timeout=1)
+            except asyncio.TimeoutError:
+                continue
+
+            depth = self._queue.qsize()
+            if depth > self.stats['max_queue_depth']:
+                self.stats['max_queue_depth'] = depth
+
+            try:
+                result = await self.message_handler.process_message(message)
+                self.stats['dispatched'] += 1
+                if result and result[0] == 'PINGPONG':
+                    await session.connection.send_pong(result[1])
+                    self.stats['pingpong'] += 1
+            except Exception as e:
+                logger.error(f"연결 풀 메시지 처리 오류 [{session.name}]: {e}")
+
+    async def run(self, shutdown: asyncio.Event) -> None:
+        """세션별 수신 루프 + 단일 처리 루프 실행 (shutdown 설정 시 종료)"""
+        self._queue = asyncio.Queue(maxsize=DISPATCH_QUEUE_SIZE)
+        tasks = [asyncio.ensure_future(session.run(self._queue, shutdown)) for session in self.sessions]
+        tasks.append(asyncio.ensure_future(self._dispatch_loop(shutdown)))
+        try:
+            await shutdown.wait()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            for session in self.sessions:
+                await session.connection.disconnect()
+
+    def get_subscription_map(self) -> Dict[str, List[str]]:
+        """세션별 구독 종목"""
+        return {session.name: sorted(session.stocks) for session in self.sessions}
+
+    def get_status(self) -> Dict:
+        return {
+            'sessions': [session.get_status() for session in self.sessions],
+            'connected_sessions': sum(1 for session in self.sessions if session.is_connected),
+            'subscribed': len(self._assignments),
+            'capacity': self.capacity,
+            'stats': self.stats.copy()
+        }
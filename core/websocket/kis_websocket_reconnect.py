@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+KIS 웹소켓 재연결 상태 기계
+
+- 상태: CONNECTED → DISCONNECTED → BACKOFF → CONNECTING → RESUBSCRIBING → (첫 틱) CONNECTED
+- 재연결 대기: 지수 증가 + full jitter (여러 세션/프로세스가 동시에 몰리지 않게)
+- 승인키 캐시: 앱키별로 발급 시각과 함께 보관, 유효 시간 안에는 재연결해도 재발급 없음
+  (연속 실패 시에만 무효화 후 재발급)
+- 공백 감지: 끊긴 시각부터 재구독 후 첫 체결 틱까지를 공백으로 기록,
+  연결은 살아 있는데 장중 체결이 끊긴 무수신 상태도 끊김으로 판단
+- 지표: 재연결 → 첫 틱 지연, 공백 길이, 재구독/보충 종목 수
+"""
+import random
+import time
+from collections import deque
+from datetime import datetime
+from enum import Enum
+from typing import Any, Deque, Dict, Optional, Tuple
+
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+BACKOFF_BASE = 0.5              # 첫 재연결 대기 상한 (초)
+BACKOFF_CAP = 30.0              # 재연결 대기 최대 (초)
+BACKOFF_FLOOR = 0.1             # 재연결 대기 최소 (초)
+APPROVAL_KEY_TTL = 20 * 3600    # 승인키 재사용 시간 (초, KIS 유효기간 24시간보다 짧게)
+APPROVAL_KEY_MAX_FAILURES = 3   # 연속 연결 실패 시 승인키 무효화 기준
+SILENCE_SECONDS = 60.0          # 장중 구독 종목이 있는데 이 시간 동안 체결이 없으면 무수신 공백으로 판단
+LATENCY_SAMPLES = 100           # 재연결 → 첫 틱 지연 표본 수
+
+# 앱키 → (승인키, 발급 시각)
+_approval_key_cache: Dict[str, Tuple[str, float]] = {}
+
+
+def get_cached_approval_key(app_key: str) -> Optional[str]:
+    """유효 시간 안의 캐시된 승인키 (없으면 None)"""
+    entry = _approval_key_cache.get(app_key)
+    if entry is None:
+        return None
+    approval_key, issued_at = entry
+    if time.time() - issued_at > APPROVAL_KEY_TTL:
+        _approval_key_cache.pop(app_key, None)
+        return None
+    return approval_key
+
+
+def cache_approval_key(app_key: str, approval_key: str) -> None:
+    _approval_key_cache[app_key] = (approval_key, time.time())
+
+
+def invalidate_approval_key(app_key: str) -> None:
+    _approval_key_cache.pop(app_key, None)
+
+
+def is_market_hours(now: Optional[datetime] = None) -> bool:
+    """정규장 시간 여부 (평일 09:00~15:30)"""
+    now = now or datetime.now()
+    if now.weekday() >= 5:
+        return False
+    return (9, 0) <= (now.hour, now.minute) <= (15, 30)
+
+
+class ReconnectState(Enum):
+    """재연결 상태"""
+    CONNECTED = "connected"
+    DISCONNECTED = "disconnected"
+    BACKOFF = "backoff"
+    CONNECTING = "connecting"
+    RESUBSCRIBING = "resubscribing"
+    CLOSED = "closed"
+
+
+class ReconnectBackoff:
+    """지수 증가 + full jitter 재연결 대기 (대기 = U(floor, min(cap, base·2^시도)))"""
+
+    def __init__(self, base: float = BACKOFF_BASE, cap: float = BACKOFF_CAP, floor: float = BACKOFF_FLOOR):
+        self.base = base
+        self.cap = cap
+        self.floor = floor
+        self.attempt = 0
+
+    def next_delay(self) -> float:
+        ceiling = min(self.cap, self.base * (2 ** self.attempt))
+        self.attempt += 1
+        return random.uniform(self.floor, max(ceiling, self.floor))
+
+    def reset(self) -> None:
+        self.attempt = 0
+
+
+class ReconnectTracker:
+    """연결 하나의 재연결 상태/공백/지연 기록"""
+
+    def __init__(self, name: str = 'main'):
+        self.name = name
+        self.state = ReconnectState.DISCONNECTED
+        self.backoff = ReconnectBackoff()
+        self.consecutive_failures = 0
+
+        self.disconnected_at: Optional[float] = None    # 공백 시작 (monotonic)
+        self.reconnected_at: Optional[float] = None     # 재구독 완료 (monotonic)
+        self.last_tick_at: Optional[float] = None       # 마지막 체결 틱 (monotonic)
+        self._awaiting_first_tick = False
+        self._latencies: Deque[float] = deque(maxlen=LATENCY_SAMPLES)
+
+        self.stats = {
+            'disconnects': 0,
+            'reconnects': 0,
+            'failed_attempts': 0,
+            'silence_gaps': 0,
+            'approval_key_refreshes': 0,
+            'resubscribed': 0,
+            'backfilled': 0,
+            'last_disconnect_reason': None,
+            'last_gap_seconds': None,
+            'last_connect_seconds': None,
+            'last_first_tick_seconds': None,
+        }
+
+    def transition(self, state: ReconnectState) -> None:
+        if state != self.state:
+            logger.debug(f"🔁 웹소켓 상태 [{self.name}]: {self.state.value} → {state.value}")
+            self.state = state
+
+    # ========== 이벤트 ==========
+
+    def on_connected(self) -> None:
+        """최초 연결 (공백 없음)"""
+        self.transition(ReconnectState.CONNECTED)
+        self.backoff.reset()
+        self.consecutive_failures = 0
+
+    def on_disconnect(self, reason: str) -> None:
+        """끊김 감지 - 이미 공백 중이면 시작 시각 유지"""
+        if self.disconnected_at is None:
+            self.disconnected_at = time.monotonic()
+            self.stats['disconnects'] += 1
+            self.stats['last_disconnect_reason'] = reason
+            logger.warning(f"⚠️ 웹소켓 끊김 감지 [{self.name}]: {reason}")
+        self._awaiting_first_tick = False
+        self.transition(ReconnectState.DISCONNECTED)
+
+    def on_attempt_failed(self) -> bool:
+        """재연결 시도 실패 - 승인키를 새로 받아야 하면 True"""
+        self.consecutive_failures += 1
+        self.stats['failed_attempts'] += 1
+        if self.consecutive_failures % APPROVAL_KEY_MAX_FAILURES == 0:
+            self.stats['approval_key_refreshes'] += 1
+            return True
+        return False
+
+    def on_resubscribed(self, count: int) -> None:
+        """재연결 + 일괄 재구독 완료 - 첫 틱 대기 시작"""
+        now = time.monotonic()
+        self.reconnected_at = now
+        self.consecutive_failures = 0
+        self.backoff.reset()
+        self.stats['reconnects'] += 1
+        self.stats['resubscribed'] += count
+        if self.disconnected_at is not None:
+            self.stats['last_connect_seconds'] = now - self.disconnected_at
+        self._awaiting_first_tick = True
+        self.transition(ReconnectState.RESUBSCRIBING)
+
+    def on_tick(self) -> None:
+        """실시간 체결/호가 프레임 수신 (수신 루프마다 호출 - 가볍게 유지)"""
+        now = time.monotonic()
+        self.last_tick_at = now
+        if not self._awaiting_first_tick:
+            return
+
+        self._awaiting_first_tick = False
+        if self.disconnected_at is not None:
+            gap = now - self.disconnected_at
+            self._latencies.append(gap)
+            self.stats['last_gap_seconds'] = gap
+            self.stats['last_first_tick_seconds'] = now - (self.reconnected_at or now)
+            logger.info(f"📶 첫 틱 수신 [{self.name}]: 끊김 후 {gap:.2f}초 (재구독 후 {self.stats['last_first_tick_seconds']:.2f}초)")
+        self.disconnected_at = None
+        self.transition(ReconnectState.CONNECTED)
+
+    def is_silent(self, subscribed_count: int, now: Optional[float] = None) -> bool:
+        """장중 구독 종목이 있는데 체결이 SILENCE_SECONDS 이상 없는 무수신 공백인지"""
+        if self.state != ReconnectState.CONNECTED or subscribed_count == 0 or self.last_tick_at is None:
+            return False
+        now = time.monotonic() if now is None else now
+        if now - self.last_tick_at < SILENCE_SECONDS or not is_market_hours():
+            return False
+        self.stats['silence_gaps'] += 1
+        return True
+
+    def outage_seconds(self) -> float:
+        if self.disconnected_at is None:
+            return 0.0
+        return time.monotonic() - self.disconnected_at
+
+    def get_stats(self) -> Dict[str, Any]:
+        latencies = sorted(self._latencies)
+        result = {'state': self.state.value, **self.stats}
+        if latencies:
+            result['first_tick_latency'] = {
+                'p50': latencies[len(latencies) // 2],
+                'max': latencies[-1],
+                'samples': len(latencies),
+            }
+        return result
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+KIS 웹소켓 원본 프레임 기록기 / 재생용 리더
+
+- 수신한 원본 메시지를 수신 시각(ns)과 함께 일자별 파일(YYYYMMDD.wsf)에 추가 기록
+- 수신 루프에서는 메모리 버퍼에 붙이기만 하고, 압축(zlib)과 파일 쓰기는 기록 스레드에서 블록 단위로 수행
+- 파일 구조: 파일 헤더 + [블록 헤더(압축 길이, 원본 길이, 프레임 수, 첫 수신 시각) + zlib 블록]...
+  블록 헤더만 읽어 mmap 위에서 색인/탐색이 가능하고, 블록 단위로 풀어 순서대로 재생
+- 블록 내부 프레임: [수신 시각 ns(int64), 길이(uint32), UTF-8 원본]
+"""
+import mmap
+import os
+import queue
+import struct
+import threading
+import time
+import zlib
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from utils.logger import setup_logger
+from utils.korean_time import KST
+
+logger = setup_logger(__name__)
+
+FILE_MAGIC = b'KISWSF01'
+BLOCK_MAGIC = b'BLK1'
+_BLOCK_HEADER = struct.Struct('<4sIIIq')     # 매직, 압축 길이, 원본 길이, 프레임 수, 첫 수신 시각(ns)
+_FRAME_HEADER = struct.Struct('<qI')         # 수신 시각(ns), 원본 길이
+
+DEFAULT_RECORD_DIR = Path('data/ws_frames')
+BLOCK_BYTES = 256 * 1024        # 블록 원본 크기 기준 (이 크기를 넘으면 압축/기록)
+FLUSH_SECONDS = 2.0             # 프레임이 적어도 이 간격마다 기록
+COMPRESS_LEVEL = 1              # 수신 속도를 따라가도록 빠른 압축
+
+
+def _next_midnight_ns(received_ns: int) -> Tuple[str, int]:
+    """수신 시각이 속한 KST 일자와 다음 자정(ns)"""
+    day = datetime.fromtimestamp(received_ns / 1e9, KST)
+    midnight = (day + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+    return day.strftime('%Y%m%d'), int(midnight.timestamp() * 1e9)
+
+
+class KISWebSocketFrameRecorder:
+    """원본 프레임 일자별 기록기 (record()는 수신 루프에서 호출, 블로킹 I/O 없음)"""
+
+    def __init__(self, directory: Path = DEFAULT_RECORD_DIR, block_bytes: int = BLOCK_BYTES,
+                 flush_seconds: float = FLUSH_SECONDS):
+        self.directory = Path(directory)
+        self.block_bytes = block_bytes
+        self.flush_seconds = flush_seconds
+
+        self._buffer: List[bytes] = []
+        self._buffer_bytes = 0
+        self._buffer_count = 0
+        self._buffer_first_ns = 0
+        self._buffer_day: Optional[str] = None
+        self._day_end_ns = 0
+        self._last_cut = time.monotonic()
+
+        self._blocks: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._writer: Optional[threading.Thread] = None
+        self._lock = threading.Lock()   # 버퍼 교체 (수신 스레드 ↔ close 호출 스레드)
+        self._closed = False
+
+        self.stats = {
+            'frames': 0,
+            'raw_bytes': 0,
+            'written_bytes': 0,
+            'blocks': 0,
+            'write_errors': 0,
+        }
+
+    # ========== 기록 (수신 루프) ==========
+
+    def record(self, message: str, received_ns: Optional[int] = None) -> None:
+        if self._closed:
+            return
+        received_ns = received_ns or time.time_ns()
+        payload = message.encode('utf-8')
+
+        with self._lock:
+            if received_ns >= self._day_end_ns:
+                # 날짜가 바뀌면 이전 일자 블록을 먼저 내보냄
+                self._cut_block()
+                self._buffer_day, self._day_end_ns = _next_midnight_ns(received_ns)
+
+            if not self._buffer:
+                self._buffer_first_ns = received_ns
+            self._buffer.append(_FRAME_HEADER.pack(received_ns, len(payload)))
+            self._buffer.append(payload)
+            self._buffer_bytes += _FRAME_HEADER.size + len(payload)
+            self._buffer_count += 1
+            self.stats['frames'] += 1
+            self.stats['raw_bytes'] += len(payload)
+
+            if (self._buffer_bytes >= self.block_bytes
+                    or time.monotonic() - self._last_cut >= self.flush_seconds):
+                self._cut_block()
+
+    def _cut_block(self) -> None:
+        """현재 버퍼를 기록 스레드로 넘김 (self._lock 보유 상태에서 호출)"""
+        self._last_cut = time.monotonic()
+        if not self._buffer:
+            return
+        self._blocks.put((self._buffer_day, self._buffer_first_ns, self._buffer_count, self._buffer))
+        self._buffer = []
+        self._buffer_bytes = 0
+        self._buffer_count = 0
+        self._ensure_writer()
+
+    def _ensure_writer(self) -> None:
+        if self._writer is None or not self._writer.is_alive():
+            self._writer = threading.Thread(target=self._write_loop, name="WSFrameRecorder", daemon=True)
+            self._writer.start()
+
+    # ========== 기록 스레드 ==========
+
+    def _write_loop(self) -> None:
+        while True:
+            block = self._blocks.get()
+            if block is None:
+                return
+            day, first_ns, count, chunks = block
+            try:
+                raw = b''.join(chunks)
+                compressed = zlib.compress(raw, COMPRESS_LEVEL)
+                path = self.path_for(day)
+                new_file = not path.exists()
+                with open(path, 'ab') as f:
+                    if new_file:
+                        f.write(FILE_MAGIC)
+                    f.write(_BLOCK_HEADER.pack(BLOCK_MAGIC, len(compressed), len(raw), count, first_ns))
+                    f.write(compressed)
+                self.stats['written_bytes'] += _BLOCK_HEADER.size + len(compressed)
+                self.stats['blocks'] += 1
+            except Exception as e:
+                self.stats['write_errors'] += 1
+                logger.error(f"❌ 웹소켓 프레임 기록 오류 ({day}): {e}")
+
+    def path_for(self, day: str) -> Path:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        return self.directory / f"{day}.wsf"
+
+    # ========== 정리 ==========
+
+    def flush(self) -> None:
+        """버퍼에 남은 프레임을 기록 스레드로 넘김"""
+        with self._lock:
+            self._cut_block()
+
+    def close(self, timeout: float = 5.0) -> None:
+        """남은 프레임 기록 후 기록 스레드 종료"""
+        if self._closed:
+            return
+        self.flush()
+        self._closed = True
+        if self._writer is not None and self._writer.is_alive():
+            self._blocks.put(None)
+            self._writer.join(timeout=timeout)
+        logger.info(f"💾 웹소켓 프레임 기록 종료: {self.stats['frames']:,}건, "
+                    f"{self.stats['raw_bytes'] / 1e6:.1f}MB → {self.stats['written_bytes'] / 1e6:.1f}MB")
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, 'pending_blocks': self._blocks.qsize()}
+
+
+class WebSocketFrameReader:
+    """기록 파일 리더 (mmap으로 블록 헤더 색인, 블록 단위로 풀어서 순서대로 재생)"""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._file = open(self.path, 'rb')
+        size = os.fstat(self._file.fileno()).st_size
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b''
+        if size and self._map[:len(FILE_MAGIC)] != FILE_MAGIC:
+            self.close()
+            raise ValueError(f"웹소켓 프레임 기록 파일이 아닙니다: {self.path}")
+        self.blocks = self._index()
+
+    def _index(self) -> List[Tuple[int, int, int, int]]:
+        """블록 색인 [(데이터 위치, 압축 길이, 프레임 수, 첫 수신 시각)] - 잘린 마지막 블록은 제외"""
+        blocks = []
+        offset = len(FILE_MAGIC)
+        end = len(self._map)
+        while offset + _BLOCK_HEADER.size <= end:
+            magic, comp_len, _, count, first_ns = _BLOCK_HEADER.unpack_from(self._map, offset)
+            data_offset = offset + _BLOCK_HEADER.size
+            if magic != BLOCK_MAGIC or data_offset + comp_len > end:
+                logger.warning(f"⚠️ 손상되거나 기록 중인 블록에서 색인 중단: {self.path} @ {offset}")
+                break
+            blocks.append((data_offset, comp_len, count, first_ns))
+            offset = data_offset + comp_len
+        return blocks
+
+    def __len__(self) -> int:
+        return sum(block[2] for block in self.blocks)
+
+    def __iter__(self) -> Iterator[Tuple[int, str]]:
+        return self.iter_frames()
+
+    def iter_frames(self, start_ns: int = 0) -> Iterator[Tuple[int, str]]:
+        """(수신 시각 ns, 원본 메시지) 순서대로, start_ns 이전 블록은 풀지 않고 건너뜀"""
+        for index, (data_offset, comp_len, count, first_ns) in enumerate(self.blocks):
+            next_first = self.blocks[index + 1][3] if index + 1 < len(self.blocks) else None
+            if next_first is not None and next_first <= start_ns:
+                continue
+            raw = zlib.decompress(self._map[data_offset:data_offset + comp_len])
+            position = 0
+            for _ in range(count):
+                received_ns, length = _FRAME_HEADER.unpack_from(raw, position)
+                position += _FRAME_HEADER.size
+                if received_ns >= start_ns:
+                    yield received_ns, raw[position:position + length].decode('utf-8')
+                position += length
+
+    def close(self) -> None:
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self) -> "WebSocketFrameReader":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
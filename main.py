@@ -245,6 +245,9 @@ class StockBot:
                     logger.error(f"캔들 트레이딩 시스템 오류: {e}")
                 finally:
                     if 'loop' in locals():
+                        # 루프에 바인딩된 비동기 REST 세션 정리
+                        from core.api.kis_async_client import close_async_client
+                        loop.run_until_complete(close_async_client())
                         loop.close()
 
             # 별도 스레드에서 실행
@@ -314,6 +317,9 @@ class StockBot:
         except Exception as e:
             logger.error(f"❌ 관리자 정리 오류: {e}")
 
+        # 거래 DB 정리 (대기 중인 쓰기 커밋)
+        self.trade_db.close()
+
         self._print_final_stats()
         logger.info("🛑 StockBot 종료 완료")
 
@@ -599,23 +605,8 @@ class StockBot:
                     logger.warning("❌ 웹소켓이 연결되지 않았습니다")
                     logger.info("💡 백그라운드에서 자동 연결이 시도됩니다")
 
-                    # 🆕 비동기 연결 시도 (별도 스레드에서 안전하게)
-                    def async_reconnect():
-                        try:
-                            if hasattr(self.websocket_manager, 'start'):
-                                self.websocket_manager.start()
-                                logger.info("🔄 웹소켓 재연결 백그라운드 시도 완료")
-                        except Exception as e:
-                            logger.debug(f"백그라운드 재연결 시도 중 오류: {e}")
-
-                    # 별도 스레드에서 연결 시도 (메인 스레드 블로킹 방지)
-                    import threading
-                    reconnect_thread = threading.Thread(
-                        target=async_reconnect,
-                        name="WebSocketReconnect",
-                        daemon=True
-                    )
-                    reconnect_thread.start()
+                    # 🆕 재연결 요청만 전달 (재연결/재구독은 웹소켓 스레드의 상태 기계가 수행 - 블로킹 없음)
+                    self.websocket_manager.request_reconnect('상태 점검')
 
             else:
                 logger.warning("⚠️ 웹소켓 매니저가 초기화되지 않았습니다")
@@ -0,0 +1,131 @@
+"""
+CandleTradeCandidate 메모리 벤치마크
+변경 전 __dict__ 기반 dataclass와 __slots__ 기반 dataclass로 후보 종목을 만들어
+객체 메모리(tracemalloc), 생성 시간, deepcopy 시간을 비교
+
+사용법:
+    python tools/benchmark_candidate_memory.py --candidates 1000 --repeat 5
+"""
+import os
+import sys
+import gc
+import copy
+import time
+import argparse
+import tracemalloc
+from dataclasses import dataclass, field, fields
+from datetime import datetime
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.strategy.candle_trade_candidate import (
+    CandleTradeCandidate, CandlePatternInfo, EntryConditions, RiskManagement, PerformanceTracking,
+    PatternType, TradeSignal, CandleStatus
+)
+
+
+def _dict_based(cls):
+    """슬롯 dataclass와 같은 필드를 가진 __dict__ 기반 dataclass (변경 전 구조)"""
+    namespace = {
+        '__annotations__': {f.name: f.type for f in fields(cls)},
+        '__module__': __name__,
+        '__qualname__': cls.__qualname__,
+    }
+    for f in fields(cls):
+        namespace[f.name] = field(default=f.default, default_factory=f.default_factory)
+    return dataclass(type(cls.__name__, (), namespace))
+
+
+_LEGACY = SimpleNamespace(
+    candidate=_dict_based(CandleTradeCandidate),
+    pattern=_dict_based(CandlePatternInfo),
+    conditions=_dict_based(EntryConditions),
+    risk=_dict_based(RiskManagement),
+    performance=_dict_based(PerformanceTracking),
+)
+
+_SLOTTED = SimpleNamespace(
+    candidate=CandleTradeCandidate,
+    pattern=CandlePatternInfo,
+    conditions=EntryConditions,
+    risk=RiskManagement,
+    performance=PerformanceTracking,
+)
+
+
+def _build(classes: SimpleNamespace, i: int):
+    """스캔 직후 관찰 종목과 비슷한 내용의 후보 하나 생성"""
+    price = 10000.0 + i
+    patterns = [
+        classes.pattern(PatternType.HAMMER, 0.82, 75, 0, TradeSignal.BUY, 1.03, 0.98, 24,
+                        {'body_ratio': 0.21}, 1, 'hammer'),
+        classes.pattern(PatternType.BULLISH_ENGULFING, 0.71, 64, 1, TradeSignal.BUY, 1.02, 0.98, 24,
+                        {}, 2, 'engulfing'),
+    ]
+    candidate = classes.candidate(
+        stock_code=f"{i:06d}", stock_name=f"종목{i}", current_price=price, market_type='KOSPI',
+        detected_patterns=patterns, primary_pattern=patterns[0], pattern_score=72,
+        trade_signal=TradeSignal.BUY, signal_strength=70,
+        entry_conditions=classes.conditions(True, True, True, True, False, True, True,
+                                            [], ['거래량 충족', 'RSI 과매도'], {'rsi': 32.5}),
+        entry_priority=65,
+        risk_management=classes.risk(5.0, 500000, price * 0.98, price * 1.03, 1.5, 24, 40),
+        status=CandleStatus.WATCHING,
+        performance=classes.performance(),
+        metadata={'strategy_source': 'premarket', 'detected_time': datetime.now().isoformat()},
+    )
+    candidate._rsi_value = 32.5
+    candidate._volume_ratio = 1.8
+    candidate._macd_value = 0.12
+    candidate._last_buy_decision = 'buy'
+    return candidate
+
+
+def _run(label: str, classes: SimpleNamespace, count: int, repeat: int):
+    # 생성 시간은 GC/실행 순서 영향을 줄이려고 repeat회 중 최솟값
+    build_time = float('inf')
+    for _ in range(repeat):
+        candidates = None
+        gc.collect()
+        start = time.perf_counter()
+        candidates = [_build(classes, i) for i in range(count)]
+        build_time = min(build_time, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    copy.deepcopy(candidates)
+    copy_time = time.perf_counter() - start
+    del candidates
+
+    # 메모리는 시간 측정과 분리해 tracemalloc으로 측정 (추적 오버헤드가 시간에 섞이지 않도록)
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    kept = [_build(classes, i) for i in range(count)]   # 스냅샷 시점까지 살아 있어야 함
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    del kept
+
+    print(f"{label:<14} {size / 1024:9.1f} KiB  (후보당 {size / count:7.0f} B)  "
+          f"생성 {build_time * 1000:7.1f}ms (후보당 {build_time / count * 1e6:5.1f}µs)  "
+          f"deepcopy {copy_time * 1000:7.1f}ms")
+    return size, build_time, copy_time
+
+
+def main():
+    parser = argparse.ArgumentParser(description='CandleTradeCandidate 메모리 벤치마크')
+    parser.add_argument('--candidates', type=int, default=1000, help='생성할 후보 종목 수')
+    parser.add_argument('--repeat', type=int, default=5, help='생성 시간 측정 반복 수 (최솟값 사용)')
+    args = parser.parse_args()
+
+    print(f"📊 후보 {args.candidates}개 (패턴 2개, 메타데이터 2개 키, 런타임 속성 4개)")
+    baseline, baseline_build, baseline_copy = _run('__dict__ 기반', _LEGACY, args.candidates, args.repeat)
+    slotted, slotted_build, slotted_copy = _run('__slots__ 기반', _SLOTTED, args.candidates, args.repeat)
+    print(f"⚡ 메모리 절감: {(1 - slotted / baseline) * 100:.1f}% ({baseline / slotted:.2f}x), "
+          f"deepcopy {baseline_copy / slotted_copy:.2f}x")
+    print(f"🐢 생성 비용: 후보당 {(slotted_build - baseline_build) / args.candidates * 1e6:+.1f}µs "
+          f"({slotted_build / baseline_build:.2f}x, 인덱스 필드 5개 속성 통지 포함)")
+
+
+if __name__ == '__main__':
+    main()
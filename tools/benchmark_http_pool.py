@@ -0,0 +1,117 @@
+"""
+HTTP 연결 풀 벤치마크
+로컬 스텁 HTTPS 서버를 대상으로 요청마다 새 연결(requests.get)과
+keep-alive 세션 풀(KISHttpSessionPool)의 처리 시간 및 핸드셰이크 횟수를 비교
+
+사용법:
+    python tools/benchmark_http_pool.py --requests 300 --threads 4
+"""
+import os
+import sys
+import ssl
+import json
+import time
+import argparse
+import tempfile
+import threading
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+import urllib3
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.api.kis_http_pool import KISHttpSessionPool
+
+urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """KIS 시세 응답 형태를 흉내내는 스텁 핸들러 (keep-alive 지원)"""
+    protocol_version = 'HTTP/1.1'
+    handshakes = 0
+    _lock = threading.Lock()
+
+    def setup(self):
+        with _StubHandler._lock:
+            _StubHandler.handshakes += 1
+        super().setup()
+
+    def do_GET(self):
+        body = json.dumps({
+            'rt_cd': '0', 'msg_cd': 'MCA00000', 'msg1': '정상처리 되었습니다.',
+            'output': {'stck_prpr': '70000', 'prdy_ctrt': '1.23', 'acml_vol': '123456'}
+        }).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _create_self_signed_cert(work_dir: str):
+    """openssl로 자체 서명 인증서 생성"""
+    cert_path = os.path.join(work_dir, 'stub_cert.pem')
+    key_path = os.path.join(work_dir, 'stub_key.pem')
+    subprocess.run(
+        ['openssl', 'req', '-x509', '-newkey', 'rsa:2048', '-nodes', '-days', '1',
+         '-subj', '/CN=localhost', '-keyout', key_path, '-out', cert_path],
+        check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    return cert_path, key_path
+
+
+def _start_stub_server(cert_path: str, key_path: str) -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _StubHandler)
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(cert_path, key_path)
+    server.socket = context.wrap_socket(server.socket, server_side=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _run(label: str, fetch, url: str, total: int, threads: int) -> float:
+    _StubHandler.handshakes = 0
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(lambda _: fetch(url), range(total)))
+    elapsed = time.perf_counter() - start
+    print(f"{label:<18} {elapsed:8.3f}s  {total / elapsed:9.1f} req/s  "
+          f"handshakes={_StubHandler.handshakes}")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='KIS HTTP 연결 풀 벤치마크')
+    parser.add_argument('--requests', type=int, default=300, help='총 요청 수')
+    parser.add_argument('--threads', type=int, default=4, help='동시 호출 스레드 수')
+    parser.add_argument('--pool-size', type=int, default=20, help='호스트당 최대 유지 연결 수')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        cert_path, key_path = _create_self_signed_cert(work_dir)
+        server = _start_stub_server(cert_path, key_path)
+        url = f"https://127.0.0.1:{server.server_address[1]}/uapi/domestic-stock/v1/quotations/inquire-price"
+
+        print(f"📊 요청 {args.requests}건, 스레드 {args.threads}개, 풀 크기 {args.pool_size}")
+
+        baseline = _run('requests.get', lambda u: requests.get(u, verify=False, timeout=10),
+                        url, args.requests, args.threads)
+
+        pool = KISHttpSessionPool(pool_maxsize=args.pool_size, verify=False)
+        pooled = _run('KISHttpSessionPool', pool.get, url, args.requests, args.threads)
+
+        print(f"⚡ 속도 향상: {baseline / pooled:.2f}x")
+        print(f"📈 풀 통계: {json.dumps(pool.get_stats()['hosts'], ensure_ascii=False)}")
+
+        pool.close()
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+"""
+프로세스 풀 스크리닝 벤치마크
+합성 일봉 행렬로 장전 스캔의 CPU 단계(거래량/가격 위치 필터 + 패턴 점수)를
+단일 프로세스(MarketScanner._score_screening_target)와 ParallelScreener 워커 수별로 비교하고 결과 일치 여부 확인
+
+사용법:
+    python tools/benchmark_parallel_screening.py --symbols 900 --workers 1 2 4 8
+    python tools/benchmark_parallel_screening.py --symbols 3000 --all-targets     # 패턴 없는 종목도 채점
+"""
+import os
+import sys
+import time
+import asyncio
+import argparse
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.backtest import load_strategy_config
+from core.strategy.market_scanner import MarketScanner
+from core.strategy.parallel_screening import ParallelScreener, SharedOHLCVMatrix, _ScreeningHost
+
+
+def _synthetic_matrix(symbols: int, days: int, seed: int) -> dict:
+    """get_daily_matrix 형식 합성 일봉 (최신일이 0번 열, 일부 종목은 봉 수 부족 → 뒤쪽 NaN)"""
+    rng = np.random.default_rng(seed)
+    shape = (symbols, days)
+    close = 10000 * np.exp(np.cumsum(rng.normal(-0.003, 0.025, shape), axis=1))[:, ::-1]
+    open_ = close * np.exp(rng.normal(0, 0.015, shape))
+    high = np.maximum(open_, close) * (1 + np.abs(rng.normal(0, 0.01, shape)))
+    low = np.minimum(open_, close) * (1 - np.abs(rng.normal(0, 0.025, shape)))
+    volume = rng.integers(20_000, 2_000_000, shape).astype(np.float64)
+    lengths = np.where(rng.random(symbols) < 0.05, rng.integers(5, days, symbols), days)
+
+    matrix = {'codes': [f"{k:06d}" for k in range(symbols)], 'lengths': lengths}
+    for name, values in (('open', open_), ('high', high), ('low', low), ('close', close), ('volume', volume)):
+        values = np.round(values)
+        values[np.arange(days)[None, :] >= lengths[:, None]] = np.nan
+        matrix[name] = values
+    return matrix
+
+
+def main():
+    parser = argparse.ArgumentParser(description='프로세스 풀 스크리닝 벤치마크')
+    parser.add_argument('--symbols', type=int, default=900, help='종목 수')
+    parser.add_argument('--days', type=int, default=30, help='종목당 봉 수')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4], help='비교할 워커 수')
+    parser.add_argument('--shard-size', type=int, default=50, help='워커 작업 1개당 종목 수')
+    parser.add_argument('--all-targets', action='store_true', help='패턴이 없는 종목도 CPU 단계 대상에 포함')
+    parser.add_argument('--seed', type=int, default=0, help='난수 시드')
+    args = parser.parse_args()
+
+    # 종목별 info/debug 로그가 측정을 왜곡하지 않도록
+    from loguru import logger
+    logger.remove()
+    logger.add(sys.stderr, level='WARNING')
+
+    config = load_strategy_config()
+    matrix = _synthetic_matrix(args.symbols, args.days, args.seed)
+    scanner = MarketScanner(_ScreeningHost(config))
+    patterns = scanner.batch_pattern_engine.analyze_matrix(matrix)
+    rng = np.random.default_rng(args.seed + 1)
+    targets = [(code, float(matrix['close'][row, 0]) * (1 + rng.normal(0, 0.01)), patterns[code])
+               for row, code in enumerate(matrix['codes'])
+               if args.all_targets or patterns[code]]
+    print(f"🧪 {args.symbols}개 종목 × {args.days}일, CPU 단계 대상 {len(targets)}개 (CPU {os.cpu_count()}개)")
+
+    # 단일 프로세스 기준 (같은 공유 메모리 행렬의 DataFrame 사용)
+    shared = SharedOHLCVMatrix.create(matrix)
+    try:
+        start = time.perf_counter()
+        expected = {}
+        for code, price, found in targets:
+            scored = scanner._score_screening_target(code, price, shared.frame(shared.row(code)), found)
+            if scored is not None:
+                expected[code] = scored[1]
+        baseline = time.perf_counter() - start
+    finally:
+        shared.close()
+    print(f"  단일 프로세스     {baseline * 1000:9.1f}ms  통과 {len(expected)}개")
+
+    for workers in args.workers:
+        screener = ParallelScreener(config, workers=workers, shard_size=args.shard_size)
+        start = time.perf_counter()
+        result = asyncio.run(screener.screen(matrix, targets))
+        elapsed = time.perf_counter() - start
+        got = {code: score for code, _, score in result}
+        mismatches = sum(1 for code in set(expected) | set(got)
+                         if code not in got or code not in expected or abs(got[code] - expected[code]) > 1e-9)
+        print(f"  워커 {workers:2d}개         {elapsed * 1000:9.1f}ms  통과 {len(got)}개  "
+              f"배율 {baseline / elapsed:4.2f}x  불일치 {mismatches}개 (풀 시작 포함)")
+
+
+if __name__ == '__main__':
+    main()
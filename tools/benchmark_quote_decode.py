@@ -0,0 +1,110 @@
+"""
+현재가 응답 디코딩 벤치마크
+inquire-price 응답 한 건을 받아 소비 코드가 현재가/시가/거래량을 꺼낼 때까지의 호출당 비용을 비교
+
+- 변경 전: 응답마다 namedtuple 클래스 생성(헤더/바디) → 한 행 DataFrame → iloc[0].get() + float()/int()
+- 변경 후: ResponseFields(dict 속성 뷰) → StockQuote(슬롯, 숫자 필드 1회 변환) → 속성 읽기
+
+사용법:
+    python tools/benchmark_quote_decode.py --calls 20000
+"""
+import os
+import sys
+import json
+import time
+import argparse
+from collections import namedtuple
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.api.kis_records import ResponseFields, decode_quote
+
+
+def _sample_output() -> dict:
+    """실제 inquire-price output과 같은 필드 구성 (값은 문자열)"""
+    output = {
+        'iscd_stat_cls_code': '55', 'marg_rate': '20.00', 'rprs_mrkt_kor_name': 'KOSPI200',
+        'bstp_kor_isnm': '전기.전자', 'temp_stop_yn': 'N', 'oprc_rang_cont_yn': 'N',
+        'clpr_rang_cont_yn': 'N', 'crdt_able_yn': 'Y', 'grmn_rate_cls_code': '40',
+        'elw_pblc_yn': 'Y', 'stck_prpr': '71500', 'prdy_vrss': '800', 'prdy_vrss_sign': '2',
+        'prdy_ctrt': '1.13', 'acml_tr_pbmn': '893422145500', 'acml_vol': '12498327',
+        'prdy_vrss_vol_rate': '87.45', 'stck_oprc': '70900', 'stck_hgpr': '71800', 'stck_lwpr': '70700',
+        'stck_mxpr': '91900', 'stck_llam': '49500', 'stck_sdpr': '70700', 'wghn_avrg_stck_prc': '71484.68',
+        'hts_frgn_ehrt': '55.21', 'frgn_ntby_qty': '-235812', 'pgtr_ntby_qty': '412234',
+        'pvt_scnd_dmrs_prc': '72433', 'pvt_frst_dmrs_prc': '71766', 'pvt_pont_val': '71133',
+        'pvt_frst_dmsp_prc': '70466', 'pvt_scnd_dmsp_prc': '69833', 'dmrs_val': '71450',
+        'dmsp_val': '70150', 'cpfn': '7780', 'rstc_wdth_prc': '21200', 'stck_fcam': '100',
+        'stck_sspr': '55440', 'aspr_unit': '100', 'hts_deal_qty_unit_val': '1', 'lstn_stcn': '5969782550',
+        'hts_avls': '4268394', 'per': '14.23', 'pbr': '1.35', 'stac_month': '12', 'vol_tnrt': '0.21',
+        'eps': '5025.00', 'bps': '52980.00', 'd250_hgpr': '88800', 'd250_hgpr_date': '20240711',
+        'd250_hgpr_vrss_prpr_rate': '-19.48', 'd250_lwpr': '49900', 'd250_lwpr_date': '20241114',
+        'd250_lwpr_vrss_prpr_rate': '43.29', 'stck_dryy_hgpr': '72300', 'dryy_hgpr_vrss_prpr_rate': '-1.11',
+        'dryy_hgpr_date': '20250610', 'stck_dryy_lwpr': '51100', 'dryy_lwpr_vrss_prpr_rate': '39.92',
+        'dryy_lwpr_date': '20250102', 'w52_hgpr': '88800', 'w52_hgpr_vrss_prpr_ctrt': '-19.48',
+        'w52_hgpr_date': '20240711', 'w52_lwpr': '49900', 'w52_lwpr_vrss_prpr_ctrt': '43.29',
+        'w52_lwpr_date': '20241114', 'whol_loan_rmnd_rate': '0.12', 'ssts_yn': 'Y',
+        'stck_shrn_iscd': '005930', 'fcam_cnnm': '100', 'cpfn_cnnm': '7,780 억', 'frgn_hldn_qty': '3295998163',
+        'vi_cls_code': 'N', 'ovtm_vi_cls_code': 'N', 'last_ssts_cntg_qty': '98231', 'invt_caful_yn': 'N',
+        'mrkt_warn_cls_code': '00', 'short_over_yn': 'N', 'sltr_yn': 'N',
+    }
+    return {'output': output, 'rt_cd': '0', 'msg_cd': 'MCA00000', 'msg1': '정상처리 되었습니다.'}
+
+
+_HEADERS = {
+    'Content-Type': 'application/json; charset=utf-8', 'tr_id': 'FHKST01010100', 'tr_cont': '',
+    'gt_uid': '0000000000000000000000000000000', 'Date': 'Mon, 16 Jun 2025 01:23:45 GMT',
+}
+
+
+def _legacy(text: str):
+    """변경 전 경로"""
+    fld = {x: v for x, v in _HEADERS.items() if x.islower()}
+    header = namedtuple('header', fld.keys())(**fld)
+    body_data = json.loads(text)
+    body = namedtuple('body', body_data.keys())(**body_data)
+    current_data = pd.DataFrame(getattr(body, 'output', []), index=[0])
+    current_price = float(current_data.iloc[0].get('stck_prpr', 0))
+    today_open = float(current_data.iloc[0].get('stck_oprc', 0))
+    volume = int(current_data.iloc[0].get('acml_vol', 0))
+    return header, current_price, today_open, volume
+
+
+def _records(text: str):
+    """변경 후 경로"""
+    header = ResponseFields({x: v for x, v in _HEADERS.items() if x.islower()})
+    body = ResponseFields(json.loads(text))
+    quote = decode_quote('005930', getattr(body, 'output', None))
+    return header, quote.current_price, quote.open_price, quote.volume
+
+
+def _measure(func, text: str, calls: int) -> float:
+    func(text)
+    start = time.perf_counter()
+    for _ in range(calls):
+        func(text)
+    return (time.perf_counter() - start) / calls
+
+
+def main():
+    parser = argparse.ArgumentParser(description='현재가 응답 디코딩 벤치마크')
+    parser.add_argument('--calls', type=int, default=20000, help='측정 호출 수')
+    args = parser.parse_args()
+
+    text = json.dumps(_sample_output(), ensure_ascii=False)
+    assert _legacy(text)[1:] == _records(text)[1:]
+
+    json_only = _measure(json.loads, text, args.calls)
+    legacy = _measure(_legacy, text, args.calls)
+    records = _measure(_records, text, args.calls)
+
+    print(f"📊 inquire-price 응답 {len(text):,}바이트, 필드 {len(_sample_output()['output'])}개, {args.calls:,}회")
+    print(f"JSON 파싱만      {json_only * 1e6:8.1f}µs/호출")
+    print(f"변경 전          {legacy * 1e6:8.1f}µs/호출  (디코딩 {(legacy - json_only) * 1e6:8.1f}µs)")
+    print(f"변경 후          {records * 1e6:8.1f}µs/호출  (디코딩 {(records - json_only) * 1e6:8.1f}µs)")
+    print(f"⚡ 호출당 {legacy / records:.1f}x, 디코딩 오버헤드 {(legacy - json_only) / max(records - json_only, 1e-9):.0f}x 감소")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+"""
+거래 DB 쓰기 벤치마크
+여러 스레드가 동시에 record_candle_pattern을 호출할 때
+호출마다 연결을 새로 열고 PRAGMA 적용 후 락 안에서 커밋하던 방식과
+단일 쓰기 스레드 묶음 커밋(TradeDatabase)의 처리량 및 지연시간을 비교
+
+사용법:
+    python tools/benchmark_trade_db_writes.py --writes 2000 --threads 8
+"""
+import os
+import sys
+import json
+import time
+import sqlite3
+import argparse
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.trading.trade_database import TradeDatabase
+
+_CANDLES = [{'open': 70000, 'high': 71000, 'low': 69500, 'close': 70800, 'volume': 123456}] * 5
+
+
+def _legacy_writer(db_path: str):
+    """호출마다 연결 생성 + PRAGMA 5개 + 프로세스 전역 락 (변경 전 방식)"""
+    lock = threading.RLock()
+
+    def _write(i: int) -> int:
+        with lock:
+            conn = sqlite3.connect(db_path, timeout=30.0, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA cache_size=10000")
+            conn.execute("PRAGMA busy_timeout=30000")
+            cursor = conn.execute("""
+                INSERT INTO candle_patterns (stock_code, analysis_time, pattern_name, pattern_type,
+                                             confidence_score, strength, candle_data)
+                VALUES (?, datetime('now'), ?, ?, ?, ?, ?)
+            """, (f"{i % 1000:06d}", 'hammer', 'BULLISH', 0.8, 'STRONG', json.dumps(_CANDLES)))
+            conn.close()
+            return cursor.lastrowid
+
+    return _write
+
+
+def _run(label: str, write, total: int, threads: int) -> float:
+    latencies = []
+
+    def _timed(i: int):
+        start = time.perf_counter()
+        write(i)
+        latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(_timed, range(total)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2] * 1000
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000
+    print(f"{label:<16} {elapsed:8.3f}s  {total / elapsed:9.1f} writes/s  "
+          f"호출 지연 p50 {p50:.2f}ms / p99 {p99:.2f}ms")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='거래 DB 쓰기 벤치마크')
+    parser.add_argument('--writes', type=int, default=2000, help='총 기록 수')
+    parser.add_argument('--threads', type=int, default=8, help='동시 호출 스레드 수')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        print(f"📊 기록 {args.writes}건, 스레드 {args.threads}개")
+
+        legacy_path = os.path.join(work_dir, 'legacy.db')
+        TradeDatabase(legacy_path).close()
+        baseline = _run('연결-per-호출', _legacy_writer(legacy_path), args.writes, args.threads)
+
+        db = TradeDatabase(os.path.join(work_dir, 'writer.db'))
+        writer = _run('단일 쓰기 스레드', lambda i: db.record_candle_pattern(
+            f"{i % 1000:06d}", 'hammer', 'BULLISH', 0.8, 'STRONG', _CANDLES), args.writes, args.threads)
+
+        stats = db.get_write_stats()
+        print(f"⚡ 속도 향상: {baseline / writer:.2f}x")
+        print(f"📈 쓰기 통계: 트랜잭션 {stats['transactions']}회, 평균 배치 {stats.get('avg_batch_size', 0):.1f}건, "
+              f"커밋 지연 {json.dumps({k: round(v, 2) for k, v in stats.get('latency_ms', {}).items()})}")
+        db.close()
+
+
+if __name__ == '__main__':
+    main()
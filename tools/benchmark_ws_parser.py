@@ -0,0 +1,159 @@
+"""
+웹소켓 실시간 프레임 파서 벤치마크
+기존 파서(KISWebSocketDataParser.parse_contract_data / parse_bid_ask_data)와
+고속 파서(kis_websocket_fast_parser)의 결과 일치 여부 및 초당 처리 틱 수를 비교
+
+사용법:
+    python tools/benchmark_ws_parser.py --frames 20000 --records 4
+"""
+import os
+import sys
+import time
+import argparse
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from loguru import logger as _loguru
+
+from core.websocket.kis_websocket_data_parser import KISWebSocketDataParser
+from core.websocket.kis_websocket_fast_parser import (
+    parse_contract_frame, parse_orderbook_frame, CONTRACT_FIELD_COUNT, ORDERBOOK_FIELD_COUNT
+)
+
+# 비교에서 제외할 키 (생성 시각, 고속 파서에만 있는 건수)
+_SKIP_KEYS = ('timestamp', 'total_data_count')
+
+
+# ========== 합성 프레임 ==========
+
+def _contract_record(rng, code: str, second: int) -> list:
+    price = int(rng.integers(5000, 90000))
+    fields = [str(int(v)) for v in rng.integers(0, 100000, CONTRACT_FIELD_COUNT)]
+    fields[0] = code
+    fields[1] = f"{9 + second // 3600:02d}{second // 60 % 60:02d}{second % 60:02d}"
+    fields[2] = str(price)
+    fields[3] = str(rng.choice(['1', '2', '3', '4', '5']))
+    fields[5] = f"{rng.normal(0, 2):.2f}"
+    fields[18] = f"{rng.uniform(50, 150):.2f}"
+    fields[21] = str(rng.choice(['1', '5']))
+    fields[22] = f"{rng.uniform(0, 100):.2f}"
+    fields[23] = f"{rng.uniform(0, 300):.2f}"
+    fields[33] = '20260105'
+    fields[35] = 'N'
+    fields[43] = '0'
+    fields[45] = '' if second % 5 == 0 else str(price)   # 빈 값 경로
+    return fields
+
+
+def _orderbook_record(rng, code: str, second: int) -> list:
+    fields = [str(int(v)) for v in rng.integers(0, 100000, ORDERBOOK_FIELD_COUNT)]
+    fields[0] = code
+    fields[1] = f"{9 + second // 3600:02d}{second // 60 % 60:02d}{second % 60:02d}"
+    fields[2] = '0'
+    fields[51] = '2'
+    fields[52] = f"{rng.normal(0, 2):.2f}"
+    return fields
+
+
+def _synthetic_frames(make_record, frames: int, records: int, seed: int) -> list:
+    """다건 프레임 payload 목록 ('^' 구분, 레코드 records개씩)"""
+    rng = np.random.default_rng(seed)
+    codes = [f"{code:06d}" for code in rng.integers(0, 999999, 50)]
+    payloads = []
+    for i in range(frames):
+        fields = []
+        for r in range(records):
+            fields.extend(make_record(rng, codes[(i + r) % len(codes)], (i + r) % 20000))
+        payloads.append('^'.join(fields))
+    return payloads
+
+
+# ========== 벤치마크 ==========
+
+def _check_parity(name: str, payloads: list, legacy_fn, fast_fn) -> bool:
+    """기존 체결 파서는 마지막 레코드만 반환하므로 고속 파서의 마지막 레코드와 비교"""
+    for payload in payloads[:500]:
+        expected = legacy_fn(payload)
+        record = fast_fn(payload)[-1]
+        actual = record.to_dict()
+        if actual != dict(record):
+            print(f"❌ {name} to_dict/Mapping 결과 불일치")
+            return False
+        for key in _SKIP_KEYS:
+            expected.pop(key, None)
+            actual.pop(key, None)
+        if expected != actual:
+            diff = {key: (expected.get(key), actual.get(key)) for key in set(expected) | set(actual)
+                    if expected.get(key) != actual.get(key)}
+            print(f"❌ {name} 결과 불일치: {diff}")
+            return False
+    print(f"✅ {name} 결과 일치")
+    return True
+
+
+def _measure(label: str, payloads: list, fn, ticks: int, baseline: float = None) -> float:
+    start = time.perf_counter()
+    for payload in payloads:
+        fn(payload)
+    elapsed = time.perf_counter() - start
+    rate = ticks / elapsed
+    speedup = f"  ({rate / baseline:.1f}x)" if baseline else ''
+    print(f"  {label:<26} {elapsed * 1000:9.1f}ms  {rate:12,.0f} ticks/s{speedup}")
+    return rate
+
+
+def _bench(name: str, payloads: list, records: int, legacy_fn, fast_fn, hot_keys) -> None:
+    ticks = len(payloads) * records
+    print(f"📊 {name}: 프레임 {len(payloads):,}개 × {records}건 = {ticks:,}틱")
+
+    def legacy_all(payload):
+        # 기존 파서로 모든 레코드를 처리하려면 레코드마다 잘라서 다시 파싱해야 함
+        parts = payload.split('^')
+        width = len(parts) // records
+        return [legacy_fn('^'.join(parts[i * width:(i + 1) * width])) for i in range(records)]
+
+    def fast_hot(payload):
+        return [[record[key] for key in hot_keys] for record in fast_fn(payload)]
+
+    def fast_full(payload):
+        return [record.to_dict() for record in fast_fn(payload)]
+
+    base = _measure('기존 파서 (마지막 1건)', payloads, legacy_fn, len(payloads))
+    base_all = _measure('기존 파서 (전 레코드)', payloads, legacy_all, ticks)
+    _measure('고속 파서 (분리만)', payloads, fast_fn, ticks, base_all)
+    _measure(f'고속 파서 (필드 {len(hot_keys)}개)', payloads, fast_hot, ticks, base_all)
+    _measure('고속 파서 (to_dict 전체)', payloads, fast_full, ticks, base_all)
+    print(f"  기존 파서 실제 처리량(마지막 1건만 반영): {base:,.0f} ticks/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='웹소켓 실시간 프레임 파서 벤치마크')
+    parser.add_argument('--frames', type=int, default=20000, help='프레임 수')
+    parser.add_argument('--records', type=int, default=4, help='프레임당 레코드 수')
+    parser.add_argument('--seed', type=int, default=0, help='난수 시드')
+    args = parser.parse_args()
+
+    _loguru.remove()   # 파서 내부 debug 로그가 측정에 섞이지 않도록
+    legacy = KISWebSocketDataParser()
+
+    contract_frames = _synthetic_frames(_contract_record, args.frames, args.records, args.seed)
+    orderbook_frames = _synthetic_frames(_orderbook_record, args.frames, args.records, args.seed)
+
+    ok = _check_parity('체결', contract_frames, legacy.parse_contract_data, parse_contract_frame)
+    # 기존 호가 파서는 다건 프레임의 첫 레코드를 읽으므로 단건 프레임으로 비교
+    single_orderbook = ['^'.join(payload.split('^')[-ORDERBOOK_FIELD_COUNT:]) for payload in orderbook_frames[:500]]
+    ok &= _check_parity('호가', single_orderbook, legacy.parse_bid_ask_data, parse_orderbook_frame)
+
+    _bench('체결 H0STCNT0', contract_frames, args.records, legacy.parse_contract_data, parse_contract_frame,
+           ('stock_code', 'current_price', 'contract_time', 'acc_volume'))
+    _bench('호가 H0STASP0', orderbook_frames, args.records, legacy.parse_bid_ask_data, parse_orderbook_frame,
+           ('stock_code', 'ask_price1', 'bid_price1', 'total_ask_qty', 'total_bid_qty'))
+
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
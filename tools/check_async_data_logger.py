@@ -0,0 +1,92 @@
+"""
+비동기 데이터 로거 점검 - 임시 DB에 기록을 몰아넣어 채널 정책(BLOCK/DROP_OLDEST)과 플러시가 기대와 같은지 확인
+
+- BLOCK 채널(매수 시도)이 가득 차면 배치 크기에 못 미쳐도 쓰기 스레드가 바로 비움 (max_queue_size < batch_size)
+- DROP_OLDEST 채널(신호 분석)은 호출자를 막지 않고 오래된 기록만 버림
+- 종료 시 남은 기록을 모두 저장
+
+사용법:
+    python tools/check_async_data_logger.py      # 실패 시 종료 코드 1
+"""
+import os
+import sys
+import time
+import sqlite3
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.trading.async_data_logger import AsyncDataLogger, BLOCK_TIMEOUT
+
+
+def _attempt(i: int) -> dict:
+    return {'stock_code': f'{i:06d}', 'attempt_result': 'FAILED', 'failure_reason': 'check',
+            'signal_data': [], 'validation_checks': {}}
+
+
+def _signal(i: int) -> dict:
+    return {'stock_code': f'{i:06d}', 'strategy_type': 'check', 'signal_strength': 0.5,
+            'signal_threshold': 0.6, 'signal_passed': False, 'current_price': 1000}
+
+
+def _count(db_path: str, table: str) -> int:
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+def check_full_block_channel_flushes(directory: str) -> bool:
+    db_path = os.path.join(directory, 'block.db')
+    data_logger = AsyncDataLogger(db_path=db_path, max_queue_size=50)   # 배치 크기(100)보다 작은 채널
+    total = 120
+    slowest = 0.0
+    for i in range(total):
+        start = time.perf_counter()
+        data_logger.log_buy_attempt(_attempt(i))
+        slowest = max(slowest, time.perf_counter() - start)
+    stats = data_logger.get_stats()['channels']['buy_attempts']
+    data_logger.shutdown()
+    written = _count(db_path, 'buy_attempts')
+    print(f"   매수 시도 {written}/{total}건 저장, blocked {stats['blocked']}, dropped {stats['dropped']}, "
+          f"최장 대기 {slowest * 1000:.0f}ms")
+    return written == total and stats['dropped'] == 0 and slowest < BLOCK_TIMEOUT
+
+
+def check_drop_oldest_never_blocks(directory: str) -> bool:
+    db_path = os.path.join(directory, 'drop.db')
+    data_logger = AsyncDataLogger(db_path=db_path, max_queue_size=50)
+    start = time.perf_counter()
+    for i in range(200):
+        data_logger.log_signal_analysis(_signal(i))
+    elapsed = time.perf_counter() - start
+    data_logger.shutdown()
+    written = _count(db_path, 'signal_analysis')
+    print(f"   신호 분석 {written}/200건 저장, {elapsed * 1000:.0f}ms")
+    return elapsed < BLOCK_TIMEOUT and 50 <= written <= 200
+
+
+def check_shutdown_drains(directory: str) -> bool:
+    db_path = os.path.join(directory, 'drain.db')
+    data_logger = AsyncDataLogger(db_path=db_path)
+    for i in range(30):                    # 배치 크기 미만 - 플러시 주기(30초) 전에 종료
+        data_logger.log_buy_attempt(_attempt(i))
+    data_logger.shutdown()
+    return _count(db_path, 'buy_attempts') == 30
+
+
+def main():
+    from loguru import logger as _loguru
+    _loguru.remove()   # 로거 초기화/종료 로그가 점검 결과에 섞이지 않도록
+    _loguru.add(sys.stderr, level='ERROR')
+
+    checks = [check_full_block_channel_flushes, check_drop_oldest_never_blocks, check_shutdown_drains]
+    failed = 0
+    with tempfile.TemporaryDirectory() as directory:
+        for check in checks:
+            passed = check(directory)
+            failed += not passed
+            print(f"{'✅' if passed else '❌'} {check.__name__}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
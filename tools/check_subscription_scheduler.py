@@ -0,0 +1,80 @@
+"""
+실시간 구독 스케줄러 점검 - 고정 종목 배정/히스테리시스 시나리오를 재생해 계획이 기대와 같은지 확인
+
+- 새로 고정된(보유/주문) 저가치 종목은 가치 상위 밖이어도, 최소 유지 시간 안이어도 즉시 실시간 배정
+- 빈 슬롯은 고정 종목부터 채움, 고정 종목은 용량이 줄어도 해제되지 않음
+- 가치 차이가 히스테리시스 기준보다 작으면 교체하지 않음
+
+사용법:
+    python tools/check_subscription_scheduler.py      # 실패 시 종료 코드 1
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.data.subscription_scheduler import SubscriptionScheduler
+
+
+def _apply(scheduler: SubscriptionScheduler, plan, now: float) -> None:
+    to_subscribe, to_unsubscribe = plan
+    for code in to_unsubscribe:
+        scheduler.mark_unsubscribed(code)
+    for code in to_subscribe:
+        scheduler.mark_subscribed(code, at=now)
+
+
+def _filled(values, capacity: int = 3, now: float = 1000.0) -> SubscriptionScheduler:
+    """가치 상위 capacity개가 now 시각에 구독된 스케줄러"""
+    scheduler = SubscriptionScheduler(capacity=capacity)
+    for code, value in values.items():
+        scheduler.set_value(code, value)
+    _apply(scheduler, scheduler.rebalance(now=now), now)
+    return scheduler
+
+
+def check_pinned_low_value_gets_slot() -> bool:
+    scheduler = _filled({'A': 500, 'B': 400, 'C': 300, 'D': 200})
+    scheduler.set_value('P', 1, pinned=True)
+    to_subscribe, to_unsubscribe = scheduler.rebalance(now=1001.0)   # 최소 유지 시간 안
+    _apply(scheduler, (to_subscribe, to_unsubscribe), 1001.0)
+    stable = scheduler.rebalance(now=5000.0)
+    return to_subscribe == ['P'] and to_unsubscribe == ['C'] and stable == ([], [])
+
+
+def check_pinned_fill_free_slots_first() -> bool:
+    scheduler = SubscriptionScheduler(capacity=2)
+    for code, value in {'A': 500, 'B': 400, 'C': 300}.items():
+        scheduler.set_value(code, value)
+    scheduler.set_value('P', 1, pinned=True)
+    to_subscribe, _ = scheduler.rebalance(now=1.0)
+    return to_subscribe == ['P', 'A']
+
+
+def check_pinned_survive_capacity_shrink() -> bool:
+    scheduler = _filled({'A': 500, 'B': 400})
+    scheduler.set_value('P', 1, pinned=True)
+    _apply(scheduler, scheduler.rebalance(now=1001.0), 1001.0)
+    _, to_unsubscribe = scheduler.rebalance(capacity=1, now=5000.0)
+    return 'P' not in to_unsubscribe and set(to_unsubscribe) == {'A', 'B'}
+
+
+def check_hysteresis_holds() -> bool:
+    scheduler = _filled({'A': 500, 'B': 400, 'C': 300, 'D': 200})
+    scheduler.set_value('D', 320)                  # C보다 높지만 20% + 10점 기준 미달
+    return scheduler.rebalance(now=5000.0) == ([], [])
+
+
+def main():
+    checks = [check_pinned_low_value_gets_slot, check_pinned_fill_free_slots_first,
+              check_pinned_survive_capacity_shrink, check_hysteresis_holds]
+    failed = 0
+    for check in checks:
+        passed = check()
+        failed += not passed
+        print(f"{'✅' if passed else '❌'} {check.__name__}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,265 @@
+"""
+KIS 형식 웹소켓 스텁 서버 - 연결 풀/재연결을 실제 서버 없이 로컬에서 확인
+
+- 등록/해지 JSON 요청에 KIS와 같은 형식의 응답(SUBSCRIBE SUCCESS / MAX SUBSCRIBE OVER) 전송
+- 연결당 등록 스트림 41개 한도 (체결 + 호가 → 20종목)
+- 등록된 체결(H0STCNT0) 종목마다 '0|H0STCNT0|001|...' 체결 프레임 주기 전송, PINGPONG 주기 전송
+- --selftest: 서버를 띄우고 세션 N개의 연결 풀로 종목을 구독해 틱 수신, 세션 하나를 강제로 끊어
+  그 세션만 재연결/재구독되는지 확인
+- --selftest-reconnect: 단일 연결 KISWebSocketManager를 끊어 재연결 상태 기계의 일괄 재구독과
+  끊김 → 첫 틱 지연을 반복 측정
+
+사용법:
+    python tools/kis_ws_stub_server.py --port 21000              # 서버만 실행 (KIS_WS_URL=ws://127.0.0.1:21000)
+    python tools/kis_ws_stub_server.py --selftest --sessions 3 --symbols 50
+    python tools/kis_ws_stub_server.py --selftest-reconnect --symbols 19 --drops 5
+"""
+import os
+import sys
+import json
+import time
+import random
+import asyncio
+import argparse
+from collections import Counter
+from datetime import datetime
+from typing import Dict, List, Set, Tuple
+
+import websockets
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.websocket.kis_websocket_fast_parser import CONTRACT_FIELD_COUNT
+
+MAX_STREAMS_PER_CONNECTION = 41
+
+
+def _response(tr_id: str, tr_key: str, rt_cd: str, msg_cd: str, msg: str) -> str:
+    return json.dumps({
+        'header': {'tr_id': tr_id, 'tr_key': tr_key, 'encrypt': 'N'},
+        'body': {'rt_cd': rt_cd, 'msg_cd': msg_cd, 'msg1': msg}
+    })
+
+
+class StubKISServer:
+    """KIS 실시간 시세 웹소켓 흉내 (승인키 검증 없음)"""
+
+    def __init__(self, tick_interval: float = 0.2, pingpong_interval: float = 10.0):
+        self.tick_interval = tick_interval
+        self.pingpong_interval = pingpong_interval
+        self.connections: List[object] = []
+        self.streams: Dict[object, Set[Tuple[str, str]]] = {}
+        self.prices: Dict[str, float] = {}
+        self.volumes: Counter = Counter()
+        self.stats = Counter()
+        self._server = None
+
+    async def start(self, host: str, port: int) -> int:
+        self._server = await websockets.serve(self._handle, host, port)
+        return self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def drop(self, index: int) -> None:
+        """index번째로 접속한 연결을 강제로 끊음 (재연결 확인용)"""
+        if index < len(self.connections):
+            self.stats['dropped'] += 1
+            await self.connections[index].close()
+
+    def _contract_frame(self, stock_code: str) -> str:
+        price = self.prices.setdefault(stock_code, float(random.randint(5000, 90000)))
+        price = max(100.0, round(price * (1 + random.gauss(0, 0.0008))))
+        self.prices[stock_code] = price
+        volume = random.randint(1, 500)
+        self.volumes[stock_code] += volume
+        record = [''] * CONTRACT_FIELD_COUNT
+        record[0], record[1], record[2], record[3] = stock_code, datetime.now().strftime('%H%M%S'), str(int(price)), '2'
+        record[7] = record[8] = record[9] = str(int(price))
+        record[12], record[13] = str(volume), str(self.volumes[stock_code])
+        record[14] = str(int(self.volumes[stock_code] * price))
+        record[21], record[33], record[35], record[43] = '1', datetime.now().strftime('%Y%m%d'), 'N', '0'
+        return f"0|H0STCNT0|001|{'^'.join(record)}"
+
+    async def _ticker(self, websocket) -> None:
+        last_ping = time.time()
+        while True:
+            await asyncio.sleep(self.tick_interval)
+            for tr_id, tr_key in list(self.streams.get(websocket, ())):
+                if tr_id == 'H0STCNT0':
+                    await websocket.send(self._contract_frame(tr_key))
+                    self.stats['ticks'] += 1
+            if time.time() - last_ping >= self.pingpong_interval:
+                last_ping = time.time()
+                await websocket.send(json.dumps({'header': {'tr_id': 'PINGPONG',
+                                                            'datetime': datetime.now().strftime('%Y%m%d%H%M%S')}}))
+
+    async def _handle(self, websocket, *args) -> None:
+        self.connections.append(websocket)
+        self.streams[websocket] = set()
+        self.stats['connections'] += 1
+        ticker = asyncio.ensure_future(self._ticker(websocket))
+        try:
+            async for message in websocket:
+                request = json.loads(message)
+                header, body = request.get('header', {}), request.get('body', {}).get('input', {})
+                if header.get('tr_id') == 'PINGPONG':
+                    self.stats['pongs'] += 1
+                    continue
+
+                tr_id, tr_key = body.get('tr_id', ''), body.get('tr_key', '')
+                streams = self.streams[websocket]
+                if header.get('tr_type') == '1':
+                    if (tr_id, tr_key) in streams:
+                        await websocket.send(_response(tr_id, tr_key, '1', 'OPSP0002', 'ALREADY IN SUBSCRIBE'))
+                    elif len(streams) >= MAX_STREAMS_PER_CONNECTION:
+                        self.stats['rejected'] += 1
+                        await websocket.send(_response(tr_id, tr_key, '1', 'OPSP0008', 'MAX SUBSCRIBE OVER'))
+                    else:
+                        streams.add((tr_id, tr_key))
+                        self.stats['subscribed'] += 1
+                        await websocket.send(_response(tr_id, tr_key, '0', 'OPSP0000', 'SUBSCRIBE SUCCESS'))
+                else:
+                    streams.discard((tr_id, tr_key))
+                    await websocket.send(_response(tr_id, tr_key, '0', 'OPSP0001', 'UNSUBSCRIBE SUCCESS'))
+        except websockets.exceptions.ConnectionClosed:
+            pass
+        finally:
+            ticker.cancel()
+            self.streams.pop(websocket, None)
+
+
+async def selftest(sessions: int, symbols: int, seconds: float) -> bool:
+    """연결 풀 → 스텁 서버: 샤딩, 합쳐진 수신, 세션 단독 재연결 확인"""
+    from core.websocket.kis_websocket_connection import KISWebSocketConnection
+    from core.websocket.kis_websocket_data_parser import KISWebSocketDataParser
+    from core.websocket.kis_websocket_subscription_manager import KISWebSocketSubscriptionManager
+    from core.websocket.kis_websocket_message_handler import KISWebSocketMessageHandler
+    from core.websocket.kis_websocket_pool import KISWebSocketConnectionPool
+
+    server = StubKISServer(pingpong_interval=2.0)
+    port = await server.start('127.0.0.1', 0)
+
+    subscription_manager = KISWebSocketSubscriptionManager()
+    handler = KISWebSocketMessageHandler(KISWebSocketDataParser(), subscription_manager)
+    ticks: Counter = Counter()
+    subscription_manager.add_global_callback('stock_price', lambda data_type, data: ticks.update([data['stock_code']]))
+
+    connections = []
+    for index in range(sessions):
+        connection = KISWebSocketConnection(name=f"stub-{index}")
+        connection.ws_url = f"ws://127.0.0.1:{port}"
+        connection.approval_key = f"stub-approval-{index}"   # 승인키 발급(REST) 생략
+        connections.append(connection)
+    pool = KISWebSocketConnectionPool(connections, handler)
+
+    shutdown = asyncio.Event()
+    await pool.connect_all()
+    codes = [f"{code:06d}" for code in random.sample(range(1, 999999), symbols)]
+    accepted = [code for code in codes if await pool.subscribe(code)]
+    run_task = asyncio.ensure_future(pool.run(shutdown))
+
+    await asyncio.sleep(seconds / 2)
+    before_drop = Counter(ticks)
+    dropped = pool.sessions[-1]
+    await server.drop(sessions - 1)
+    await asyncio.sleep(seconds / 2)
+
+    shutdown.set()
+    await run_task
+    await server.stop()
+    if handler.dispatcher is not None:
+        handler.dispatcher.shutdown()
+
+    after_drop = ticks - before_drop
+    missing = [code for code in accepted if ticks[code] == 0]
+    resumed = [code for code in dropped.stocks if after_drop[code] > 0]
+    print(f"📊 세션 {sessions}개, 요청 {symbols}종목 → 구독 {len(accepted)}종목 (한도 {pool.capacity})")
+    print(f"📡 세션별 배정: {[len(stocks) for stocks in pool.get_subscription_map().values()]}")
+    print(f"📈 수신 틱 {sum(ticks.values()):,}건, 틱 없는 종목 {len(missing)}개, 서버 거부 {server.stats['rejected']}건")
+    print(f"🔄 끊긴 세션 [{dropped.name}] 재연결 {dropped.tracker.stats['reconnects']}회, "
+          f"재구독 후 틱 수신 {len(resumed)}/{len(dropped.stocks)}종목, 서버 접속 {server.stats['connections']}회")
+    print(f"🏓 PINGPONG 응답 {pool.stats['pingpong']}건, 최대 대기열 {pool.stats['max_queue_depth']}")
+
+    ok = (not missing and server.stats['rejected'] == 0 and dropped.tracker.stats['reconnects'] >= 1
+          and len(resumed) == len(dropped.stocks))
+    print("✅ 통과" if ok else "❌ 실패")
+    return ok
+
+
+async def selftest_reconnect(symbols: int, drops: int) -> bool:
+    """단일 연결 매니저 → 스텁 서버: 끊김마다 재연결 + 일괄 재구독 후 모든 종목 틱 재개, 첫 틱 지연 측정"""
+    from core.websocket.kis_websocket_manager import KISWebSocketManager
+
+    server = StubKISServer(tick_interval=0.05)
+    port = await server.start('127.0.0.1', 0)
+
+    manager = KISWebSocketManager(extra_app_keys=[])
+    manager.connection.ws_url = f"ws://127.0.0.1:{port}"
+    manager.connection.approval_key = 'stub-approval'   # 승인키 발급(REST) 생략
+    ticks: Counter = Counter()
+    manager.add_global_callback('stock_price', lambda data_type, data: ticks.update([data['stock_code']]))
+
+    loop = asyncio.get_running_loop()
+    manager.start_message_loop()
+    codes = [f"{code:06d}" for code in random.sample(range(1, 999999), symbols)]
+    while not manager.is_connected:
+        await asyncio.sleep(0.05)
+    accepted = [code for code in codes if await loop.run_in_executor(None, manager.subscribe_stock_sync, code)]
+
+    resumed_all = True
+    for _ in range(drops):
+        await asyncio.sleep(1.0)
+        await server.drop(len(server.connections) - 1)
+        before = Counter(ticks)
+        await asyncio.sleep(2.0)
+        resumed_all = resumed_all and all(ticks[code] > before[code] for code in accepted)
+
+    stats = manager.reconnector.get_stats()
+    await loop.run_in_executor(None, manager.safe_cleanup)
+    await server.stop()
+
+    latency = stats.get('first_tick_latency', {})
+    print(f"📊 단일 연결 {len(accepted)}종목, 강제 끊김 {drops}회 → 재연결 {stats['reconnects']}회, "
+          f"재구독 {stats['resubscribed']}종목, 서버 접속 {server.stats['connections']}회")
+    print(f"📶 끊김 → 첫 틱 지연: p50 {latency.get('p50', 0) * 1000:.0f}ms / max {latency.get('max', 0) * 1000:.0f}ms "
+          f"(재구독 후 첫 틱 {(stats['last_first_tick_seconds'] or 0) * 1000:.0f}ms)")
+    ok = stats['reconnects'] == drops and resumed_all and server.stats['rejected'] == 0
+    print("✅ 통과" if ok else "❌ 실패")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description='KIS 형식 웹소켓 스텁 서버')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=21000)
+    parser.add_argument('--tick-interval', type=float, default=0.2, help='종목별 체결 프레임 간격 (초)')
+    parser.add_argument('--selftest', action='store_true', help='연결 풀 자체 점검 실행')
+    parser.add_argument('--selftest-reconnect', action='store_true', help='단일 연결 재연결 자체 점검 실행')
+    parser.add_argument('--drops', type=int, default=5, help='재연결 점검 강제 끊김 횟수')
+    parser.add_argument('--sessions', type=int, default=3)
+    parser.add_argument('--symbols', type=int, default=50)
+    parser.add_argument('--seconds', type=float, default=6.0)
+    args = parser.parse_args()
+
+    if args.selftest:
+        sys.exit(0 if asyncio.run(selftest(args.sessions, args.symbols, args.seconds)) else 1)
+    if args.selftest_reconnect:
+        sys.exit(0 if asyncio.run(selftest_reconnect(min(args.symbols, 19), args.drops)) else 1)
+
+    async def serve():
+        server = StubKISServer(args.tick_interval)
+        port = await server.start(args.host, args.port)
+        print(f"🧪 KIS 스텁 웹소켓 서버: ws://{args.host}:{port} (Ctrl+C 종료)")
+        await asyncio.Future()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
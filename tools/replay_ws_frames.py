@@ -0,0 +1,389 @@
+"""
+웹소켓 기록 재생기 - 기록된 원본 프레임을 파서 → 메시지 핸들러 → (선택) CandleTradeManager로 다시 흘려보내
+처리량/지연시간을 측정
+
+- 속도: --speed 1 (실시간), N (N배속), 0 (최대 속도)
+- 콜백 실행: --dispatch inline (기본, 프레임 순서대로 실행 → 결정적 재생) / queued (운영과 같은 디스패처 경로)
+- --strategy: REST 시세/주문 API를 재생 중인 틱 기반 스텁으로 바꿔 CandleTradeManager의 신호 평가/매수/매도 루프를
+  기록 시각 기준 --eval-interval초마다 실행 (주문은 즉시 가상 체결, 거래 DB는 임시 파일)
+  ※ 장 시간 판단 등 datetime.now()를 쓰는 로직은 재생 시각이 아닌 실제 시각 기준으로 동작
+- --synthesize N: 기록 파일이 없을 때 종목 N개의 합성 체결 프레임으로 기록 파일 생성
+
+사용법:
+    python tools/replay_ws_frames.py data/ws_frames/20250613.wsf --speed 0
+    python tools/replay_ws_frames.py 20250613 --speed 10 --dispatch queued --strategy
+    python tools/replay_ws_frames.py --synthesize 20 --frames 50000 --output /tmp/synthetic.wsf
+"""
+import os
+import sys
+import time
+import asyncio
+import argparse
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from loguru import logger as _loguru
+
+from config.settings import WS_RECORD_DIR
+from core.websocket.kis_websocket_data_parser import KISWebSocketDataParser
+from core.websocket.kis_websocket_subscription_manager import KISWebSocketSubscriptionManager
+from core.websocket.kis_websocket_message_handler import KISWebSocketMessageHandler, DataType
+from core.websocket.kis_websocket_recorder import KISWebSocketFrameRecorder, WebSocketFrameReader
+from core.websocket.kis_websocket_fast_parser import CONTRACT_FIELD_COUNT
+from core.analysis.streaming_indicators import get_streaming_indicators
+from core.data.intraday_bars import get_intraday_bar_aggregator
+from core.api.kis_records import StockQuote
+
+
+# ========== 재생 중인 틱 기반 REST/주문 스텁 ==========
+
+class ReplayMarket:
+    """재생 중 마지막 체결 틱 (스텁 시세 API의 데이터 소스)"""
+
+    def __init__(self):
+        self.last_tick: Dict[str, Dict] = {}
+        self.unstubbed_calls = 0
+
+    def on_tick(self, data_type: str, data) -> None:
+        self.last_tick[data['stock_code']] = data
+
+    def price_quote(self, stock_code: str) -> Optional[StockQuote]:
+        """주식현재가 시세(inquire-price output) 형식"""
+        tick = self.last_tick.get(stock_code)
+        if tick is None:
+            return None
+        return StockQuote(stock_code, {
+            'stck_shrn_iscd': stock_code,
+            'stck_prpr': str(tick.get('current_price', 0)),
+            'stck_oprc': str(tick.get('open_price', 0)),
+            'stck_hgpr': str(tick.get('high_price', 0)),
+            'stck_lwpr': str(tick.get('low_price', 0)),
+            'acml_vol': str(tick.get('acc_volume', 0)),
+            'acml_tr_pbmn': str(tick.get('acc_trade_amount', 0)),
+            'prdy_vrss': str(tick.get('change_amount', 0)),
+            'prdy_vrss_sign': tick.get('change_sign', '3'),
+            'prdy_ctrt': str(tick.get('change_rate', 0.0)),
+        })
+
+    def install(self) -> None:
+        """시세/계좌/주문 조회 API를 스텁으로 교체 (그 외 REST 호출은 전송 계층에서 차단하고 집계)"""
+        from core.api import kis_auth, kis_market_api, kis_order_api
+
+        market = self
+
+        def quote(div_code: str = "J", itm_no: str = "", *args, **kwargs):
+            return market.price_quote(itm_no)
+
+        async def quote_async(div_code: str = "J", itm_no: str = "", *args, **kwargs):
+            return market.price_quote(itm_no)
+
+        def price(div_code: str = "J", itm_no: str = "", *args, **kwargs):
+            result = market.price_quote(itm_no)
+            return result.to_frame() if result is not None else None
+
+        async def price_async(div_code: str = "J", itm_no: str = "", *args, **kwargs):
+            return price(div_code, itm_no)
+
+        def blocked(*args, **kwargs):
+            market.unstubbed_calls += 1
+            return None
+
+        async def blocked_async(*args, **kwargs):
+            market.unstubbed_calls += 1
+            return None
+
+        kis_market_api.get_quote = quote
+        kis_market_api.get_quote_async = quote_async
+        kis_market_api.get_inquire_price = price
+        kis_market_api.get_inquire_price_async = price_async
+        kis_market_api.get_account_balance = lambda *args, **kwargs: {'holdings': [], 'total_value': 0}
+        kis_market_api.get_existing_holdings = lambda *args, **kwargs: []
+        kis_market_api._url_fetch_async = blocked_async
+        kis_auth._url_fetch = blocked
+        kis_order_api.get_inquire_daily_ccld_lst = lambda *args, **kwargs: None
+        kis_order_api.get_inquire_psbl_rvsecncl_lst = lambda *args, **kwargs: None
+
+
+class PaperTradeExecutor:
+    """주문을 마지막 체결가로 즉시 가상 체결 (체결 통보는 드라이버가 CandleTradeManager에 전달)"""
+
+    def __init__(self, market: ReplayMarket, trade_db):
+        self.market = market
+        self.trade_db = trade_db
+        self.execution_manager = None
+        self._cached_open_price = 0
+        self.fills: List[Dict] = []
+        self.pending_fills: List[Dict] = []
+        self._order_seq = 0
+
+    def _execute(self, signal: Dict, order_type: str):
+        from core.trading.trade_executor import TradeResult
+
+        stock_code = signal.get('stock_code', '')
+        tick = self.market.last_tick.get(stock_code)
+        price = int(tick.get('current_price', 0)) if tick else int(signal.get('price', 0) or 0)
+        quantity = int(signal.get('quantity', 0) or 0)
+        if price <= 0 or quantity <= 0:
+            return TradeResult(False, stock_code, order_type, quantity, price, 0, error_message='가격/수량 없음')
+
+        self._order_seq += 1
+        order_no = f"REPLAY{self._order_seq:06d}"
+        fill = {
+            'stock_code': stock_code,
+            'order_type': order_type.lower(),
+            'executed_quantity': quantity,
+            'executed_price': price,
+            'order_no': order_no,
+            'parsed_success': True,
+        }
+        self.pending_fills.append(fill)
+        self.fills.append(fill)
+        return TradeResult(True, stock_code, order_type, quantity, price, price * quantity,
+                           order_no=order_no, is_pending=True)
+
+    def execute_buy_signal(self, signal: Dict):
+        return self._execute(signal, 'BUY')
+
+    def execute_sell_signal(self, signal: Dict):
+        return self._execute(signal, 'SELL')
+
+
+class _StubAPIManager:
+    def get_account_balance(self, *args, **kwargs):
+        return {'holdings': [], 'total_value': 0}
+
+    def cancel_order(self, *args, **kwargs):
+        return {'status': 'success', 'message': 'replay'}
+
+
+class _StubWebSocketManager:
+    def __init__(self, handler: KISWebSocketMessageHandler):
+        self.message_handler = handler
+
+    async def subscribe_stock(self, stock_code: str, callback=None) -> bool:
+        if callback:
+            self.message_handler.subscription_manager.add_stock_callback(stock_code, callback)
+        return True
+
+    async def unsubscribe_stock(self, stock_code: str) -> bool:
+        return True
+
+
+class StrategyDriver:
+    """CandleTradeManager 평가 루프를 기록 시각 기준으로 실행"""
+
+    def __init__(self, handler: KISWebSocketMessageHandler, market: ReplayMarket, eval_interval: float):
+        from core.trading.trade_database import TradeDatabase
+        from core.strategy.candle_trade_manager import CandleTradeManager
+
+        self.market = market
+        self.eval_interval_ns = int(eval_interval * 1e9)
+        self._next_eval_ns: Optional[int] = None
+        self._tmpdir = tempfile.TemporaryDirectory(prefix='stockbot_replay_')
+        self.executor = PaperTradeExecutor(market, TradeDatabase(os.path.join(self._tmpdir.name, 'trades.db')))
+        self.manager = CandleTradeManager(_StubAPIManager(), None, self.executor, _StubWebSocketManager(handler))
+        handler.set_candle_trade_manager(self.manager)
+        self.eval_times: List[float] = []
+
+    def _ensure_candidates(self) -> None:
+        from core.strategy.candle_trade_candidate import CandleTradeCandidate, CandleStatus
+
+        stocks = self.manager.stock_manager
+        for stock_code, tick in self.market.last_tick.items():
+            if stock_code not in stocks._all_stocks:
+                stocks.add_candidate(CandleTradeCandidate(
+                    stock_code=stock_code, stock_name=stock_code,
+                    current_price=float(tick.get('current_price', 0)),
+                    market_type="KOSPI", status=CandleStatus.WATCHING,
+                ), strategy_source='replay')
+
+    async def on_clock(self, received_ns: int) -> None:
+        if self._next_eval_ns is None:
+            self._next_eval_ns = received_ns + self.eval_interval_ns
+            return
+        if received_ns < self._next_eval_ns:
+            return
+        self._next_eval_ns = received_ns + self.eval_interval_ns
+        await self.evaluate()
+
+    async def evaluate(self) -> None:
+        start = time.perf_counter()
+        self._ensure_candidates()
+        await self.manager._periodic_signal_evaluation()
+        await self.manager.buy_evaluator.evaluate_entry_opportunities()
+        await self.manager.sell_manager.manage_existing_positions()
+        # 가상 체결 통보 전달
+        fills, self.executor.pending_fills = self.executor.pending_fills, []
+        for fill in fills:
+            await self.manager.handle_execution_confirmation(fill)
+        self.eval_times.append(time.perf_counter() - start)
+
+    def close(self) -> None:
+        self.executor.trade_db.close()
+        self._tmpdir.cleanup()
+
+
+# ========== 합성 기록 ==========
+
+def synthesize_recording(path: Path, symbols: int, frames: int, records: int, seed: int) -> Path:
+    """랜덤워크 체결 프레임 기록 파일 생성 (09:00부터 초당 약 20프레임)"""
+    rng = np.random.default_rng(seed)
+    codes = [f"{code:06d}" for code in rng.choice(999999, symbols, replace=False)]
+    prices = rng.integers(5000, 90000, symbols).astype(float)
+    acc_volume = np.zeros(symbols, dtype=np.int64)
+    opens, highs, lows = prices.copy(), prices.copy(), prices.copy()
+
+    day_start_ns = int(pd.Timestamp('2026-01-05 09:00:00', tz='Asia/Seoul').value)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.exists():
+        path.unlink()
+    recorder = KISWebSocketFrameRecorder(path.parent)
+    recorder.path_for = lambda day: path
+
+    received_ns = day_start_ns
+    for _ in range(frames):
+        received_ns += int(rng.exponential(50e6))
+        seconds = (received_ns - day_start_ns) // 1_000_000_000
+        hhmmss = f"{9 + seconds // 3600:02d}{seconds // 60 % 60:02d}{seconds % 60:02d}"
+        fields = []
+        for index in rng.integers(0, symbols, records):
+            prices[index] = max(100.0, round(prices[index] * (1 + rng.normal(0, 0.0008))))
+            highs[index], lows[index] = max(highs[index], prices[index]), min(lows[index], prices[index])
+            volume = int(rng.integers(1, 500))
+            acc_volume[index] += volume
+            record = [''] * CONTRACT_FIELD_COUNT
+            record[0], record[1], record[2] = codes[index], hhmmss, str(int(prices[index]))
+            record[3], record[7], record[8], record[9] = '2', str(int(opens[index])), str(int(highs[index])), str(int(lows[index]))
+            record[12], record[13] = str(volume), str(int(acc_volume[index]))
+            record[14] = str(int(acc_volume[index] * prices[index]))
+            record[21], record[33], record[35], record[43] = rng.choice(['1', '5']), '20260105', 'N', '0'
+            fields.extend(record)
+        recorder.record(f"0|H0STCNT0|{records:03d}|{'^'.join(fields)}", received_ns)
+    recorder.close()
+    return path
+
+
+# ========== 재생 ==========
+
+def _resolve_path(value: str) -> Path:
+    path = Path(value)
+    if path.exists():
+        return path
+    return Path(WS_RECORD_DIR) / f"{value}.wsf"
+
+
+def _percentiles(samples: List[float]) -> str:
+    if not samples:
+        return '-'
+    values = np.asarray(samples) * 1e6
+    return (f"avg {values.mean():.1f}µs / p50 {np.percentile(values, 50):.1f}µs / "
+            f"p99 {np.percentile(values, 99):.1f}µs / max {values.max():.1f}µs")
+
+
+async def replay(path: Path, speed: float, dispatch: str, strategy: bool, eval_interval: float) -> None:
+    handler = KISWebSocketMessageHandler(KISWebSocketDataParser(), KISWebSocketSubscriptionManager())
+    handler.recorder = None
+    if dispatch == 'inline':
+        handler.dispatcher = None
+
+    market = ReplayMarket()
+    indicators = get_streaming_indicators()
+    subscriptions = handler.subscription_manager
+    subscriptions.add_global_callback(DataType.STOCK_PRICE.value, market.on_tick)
+    subscriptions.add_global_callback(
+        DataType.STOCK_PRICE.value, lambda data_type, data: indicators.on_price_update(data['stock_code'], data))
+
+    driver = None
+    if strategy:
+        market.install()
+        driver = StrategyDriver(handler, market, eval_interval)
+
+    frame_times: List[float] = []
+    with WebSocketFrameReader(path) as reader:
+        total = len(reader)
+        print(f"📂 {path} - 프레임 {total:,}건, 블록 {len(reader.blocks):,}개")
+        first_ns = None
+        wall_start = time.perf_counter()
+        for received_ns, message in reader:
+            if first_ns is None:
+                first_ns = received_ns
+            if speed > 0:
+                delay = (received_ns - first_ns) / 1e9 / speed - (time.perf_counter() - wall_start)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+            start = time.perf_counter()
+            await handler.process_message(message)
+            frame_times.append(time.perf_counter() - start)
+
+            if driver is not None:
+                await driver.on_clock(received_ns)
+            if handler.dispatcher is not None:
+                await asyncio.sleep(0)   # 실제 수신 루프처럼 워커에 실행 기회 제공
+
+        if handler.dispatcher is not None:
+            while handler.dispatcher.get_stats()['queue_depth'] > 0:
+                await asyncio.sleep(0.01)
+        if driver is not None:
+            await driver.evaluate()
+        elapsed = time.perf_counter() - wall_start
+
+    parser_stats = handler.data_parser.get_stats()
+    ticks = parser_stats.get('data_processed', 0)
+    print(f"⏱️ 재생 {elapsed:.2f}s (속도 {'최대' if speed <= 0 else f'{speed:g}x'}, 콜백 {dispatch})")
+    print(f"  프레임 {total / elapsed:,.0f}/s, 틱 {ticks:,}건 → {ticks / elapsed:,.0f} ticks/s")
+    print(f"  프레임 처리 시간: {_percentiles(frame_times)}")
+    if handler.dispatcher is not None:
+        stats = handler.dispatcher.get_stats()
+        latency = stats.get('latency_ms', {})
+        print(f"  디스패치: 실행 {stats['dispatched']:,} / 교체 {stats['coalesced']:,} / 버림 {stats['dropped']:,}, "
+              f"지연 p50 {latency.get('p50', 0):.2f}ms p99 {latency.get('p99', 0):.2f}ms")
+    print(f"  분봉 집계: {get_intraday_bar_aggregator().get_stats()}")
+    print(f"  스트리밍 지표: {indicators.get_stats()}")
+    if driver is not None:
+        print(f"  전략 평가 {len(driver.eval_times)}회: {_percentiles(driver.eval_times)}")
+        print(f"  가상 체결 {len(driver.executor.fills)}건, 차단된 REST 호출 {market.unstubbed_calls}건")
+        driver.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='웹소켓 기록 재생기')
+    parser.add_argument('recording', nargs='?', help='기록 파일 경로 또는 일자(YYYYMMDD)')
+    parser.add_argument('--speed', type=float, default=0, help='재생 배속 (1=실시간, 0=최대 속도)')
+    parser.add_argument('--dispatch', choices=('inline', 'queued'), default='inline', help='콜백 실행 방식')
+    parser.add_argument('--strategy', action='store_true', help='CandleTradeManager 평가 루프 포함')
+    parser.add_argument('--eval-interval', type=float, default=20.0, help='전략 평가 간격 (기록 시각 기준 초)')
+    parser.add_argument('--synthesize', type=int, default=0, help='합성 기록 생성 종목 수')
+    parser.add_argument('--frames', type=int, default=20000, help='합성 프레임 수')
+    parser.add_argument('--records', type=int, default=2, help='합성 프레임당 체결 건수')
+    parser.add_argument('--output', default=os.path.join(tempfile.gettempdir(), 'stockbot_synthetic.wsf'),
+                        help='합성 기록 파일 경로')
+    parser.add_argument('--seed', type=int, default=0, help='난수 시드')
+    parser.add_argument('--verbose', action='store_true', help='재생 중 로그 출력')
+    args = parser.parse_args()
+
+    if not args.verbose:
+        _loguru.remove()
+
+    if args.synthesize:
+        path = synthesize_recording(Path(args.output), args.synthesize, args.frames, args.records, args.seed)
+        print(f"🧪 합성 기록 생성: {path}")
+    elif args.recording:
+        path = _resolve_path(args.recording)
+    else:
+        parser.error('기록 파일 또는 --synthesize 필요')
+
+    if not path.exists():
+        parser.error(f'기록 파일 없음: {path}')
+
+    asyncio.run(replay(path, args.speed, args.dispatch, args.strategy, args.eval_interval))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,133 @@
+"""
+캔들 전략 백테스트 실행
+로컬 일봉 저장소(data/ohlcv.db)의 과거 일봉으로 실제 전략 클래스를 재생하고 거래 결과를 요약
+
+사용법:
+    python tools/run_backtest.py --start 20230101 --end 20251231 --workers 8
+    python tools/run_backtest.py --codes 005930 000660 --trades-csv data/backtest_trades.csv
+    python tools/run_backtest.py --synthetic 200 --days 750      # 저장소 없이 합성 일봉으로 실행
+    python tools/run_backtest.py --selftest                       # 합성 일봉 40종목 × 300일에서 거래가 나오는지 확인
+"""
+import os
+import sys
+import json
+import time
+import argparse
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.backtest import BacktestSettings, CandleBacktester
+
+
+def synthetic_histories(symbols: int, days: int, seed: int) -> dict:
+    """합성 일봉 (로그 랜덤워크 + 일중 변동, 오래된 날짜부터 / 주말 제외)"""
+    rng = np.random.default_rng(seed)
+    dates = []
+    day = np.datetime64('2020-01-02')
+    while len(dates) < days:
+        if np.is_busday(day):
+            dates.append(str(day).replace('-', ''))
+        day += 1
+    dates = np.array(dates, dtype=object)
+
+    histories = {}
+    for index in range(symbols):
+        start = rng.uniform(3000, 150000)
+        close = start * np.exp(np.cumsum(rng.normal(0, 0.022, days)))
+        open_ = close * np.exp(rng.normal(0, 0.012, days))
+        high = np.maximum(open_, close) * (1 + np.abs(rng.normal(0, 0.012, days)))
+        low = np.minimum(open_, close) * (1 - np.abs(rng.normal(0, 0.012, days)))
+        volume = rng.integers(50_000, 3_000_000, days)
+        histories[f"{index:06d}"] = {
+            'date': dates,
+            'open': np.round(open_),
+            'high': np.round(high),
+            'low': np.round(low),
+            'close': np.round(close),
+            'volume': volume.astype(np.int64),
+            'trading_value': (volume * close).astype(np.int64),
+        }
+    return histories
+
+
+def selftest(backtester: CandleBacktester, seed: int) -> bool:
+    """합성 일봉으로 재생해 후보 → 매수 판단 → 거래까지 이어지는지 확인 (매수 판단 경로가 깨지면 거래 0건)"""
+    result = backtester.run(synthetic_histories(40, 300, seed))
+    summary = result.summary()
+    checks = {
+        'candidates': summary.get('candidates', 0) > 0,
+        'buy_decisions': summary.get('buy_decisions', 0) > 0,
+        'trades': summary.get('trades', 0) > 0,
+    }
+    for name, passed in checks.items():
+        print(f"{'✅' if passed else '❌'} {name}: {summary.get(name, 0)}")
+    return all(checks.values())
+
+
+def main():
+    parser = argparse.ArgumentParser(description='캔들 전략 백테스트')
+    parser.add_argument('--codes', nargs='*', help='종목코드 (생략 시 KOSPI 전체)')
+    parser.add_argument('--min-listed-shares', type=int, default=10_000_000, help='최소 상장주식수')
+    parser.add_argument('--start', help='진입 시작일 (YYYYMMDD)')
+    parser.add_argument('--end', help='종료일 (YYYYMMDD)')
+    parser.add_argument('--workers', type=int, default=None, help='워커 프로세스 수 (1이면 현재 프로세스)')
+    parser.add_argument('--chunk-size', type=int, default=20, help='워커 1회 처리 종목 수')
+    parser.add_argument('--investment', type=int, default=500_000, help='종목당 투자금')
+    parser.add_argument('--commission', type=float, default=0.00015, help='수수료율')
+    parser.add_argument('--tax', type=float, default=0.0018, help='매도 거래세율')
+    parser.add_argument('--slippage', type=float, default=0.001, help='체결 슬리피지')
+    parser.add_argument('--synthetic', type=int, default=0, help='합성 일봉 종목 수 (저장소 대신 사용)')
+    parser.add_argument('--days', type=int, default=750, help='합성 일봉 거래일 수')
+    parser.add_argument('--seed', type=int, default=0, help='난수 시드')
+    parser.add_argument('--trades-csv', help='거래 목록 CSV 저장 경로')
+    parser.add_argument('--log-level', default='WARNING', help='워커 로그 레벨')
+    parser.add_argument('--selftest', action='store_true', help='합성 일봉 회귀 확인 (거래 0건이면 실패)')
+    args = parser.parse_args()
+
+    from loguru import logger as _loguru
+    _loguru.remove()   # 종목별 보유 지속 로그가 출력/측정에 섞이지 않도록
+    _loguru.add(sys.stderr, level=args.log_level)
+
+    settings = BacktestSettings(
+        investment_amount=args.investment,
+        commission_rate=args.commission,
+        sell_tax_rate=args.tax,
+        slippage=args.slippage,
+        seed=args.seed,
+    )
+    backtester = CandleBacktester(settings, workers=args.workers, chunk_size=args.chunk_size,
+                                  log_level=args.log_level)
+
+    if args.selftest:
+        sys.exit(0 if selftest(backtester, args.seed) else 1)
+
+    start = time.perf_counter()
+    if args.synthetic:
+        histories = synthetic_histories(args.synthetic, args.days, args.seed)
+        print(f"🧪 합성 일봉: {len(histories)}개 종목 × {args.days}일")
+        result = backtester.run(histories)
+    else:
+        from core.utils.stock_list_loader import load_kospi_stocks
+        codes = args.codes or load_kospi_stocks(min_listed_shares=args.min_listed_shares)
+        print(f"🧪 저장소 일봉: {len(codes)}개 종목 ({args.start or '처음'} ~ {args.end or '마지막'})")
+        result = backtester.run_store(codes, start_date=args.start, end_date=args.end)
+    elapsed = time.perf_counter() - start
+
+    summary = result.summary()
+    by_pattern = summary.pop('by_pattern', {})
+    print(json.dumps(summary, ensure_ascii=False, indent=2, default=float))
+    for pattern, entry in sorted(by_pattern.items()):
+        win_rate = entry['wins'] / entry['trades'] * 100 if entry['trades'] else 0.0
+        print(f"  {pattern:<20} 거래 {entry['trades']:5d}건  승률 {win_rate:5.1f}%  순손익 {entry['net_pnl']:>14,}원")
+    bars = summary.get('bars', 0)
+    print(f"⏱️ 총 {elapsed:.1f}초 ({bars / elapsed:,.0f} 봉/초)" if elapsed > 0 else "")
+
+    if args.trades_csv and result.trades:
+        result.to_frame().to_csv(args.trades_csv, index=False, encoding='utf-8-sig')
+        print(f"💾 거래 목록 저장: {args.trades_csv}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,122 @@
+"""
+캔들 전략 설정 파라미터 탐색 실행
+일봉을 memmap 보관소(data/backtest_archive)로 한 번 저장한 뒤 설정 변형들을 프로세스 풀로 백테스트하고
+결과를 data/backtest_sweeps.db 에 순위(손익/낙폭/승률)와 함께 저장
+
+사용법:
+    python tools/run_parameter_sweep.py --method grid --steps 3 \\
+        --param thresholds.hammer_lower_shadow_min=0.35:0.55 --param min_pattern_score=0.2,0.3,0.4
+    python tools/run_parameter_sweep.py --method bayesian --trials 40 --workers 8 \\
+        --param pattern_targets.hammer.target=1.0:3.0 --param pattern_targets.hammer.stop=1.0:3.0
+    python tools/run_parameter_sweep.py --synthetic 100 --days 500 --method random --trials 12 \\
+        --param thresholds.engulfing_ratio_min=1.0:1.5
+    python tools/run_parameter_sweep.py --show 3 --order-by max_drawdown     # 저장된 탐색 결과 조회
+"""
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.backtest import BacktestSettings, PriceArchive, ParameterSweep, SweepParameter, SweepResultStore
+from core.backtest.price_archive import DEFAULT_ARCHIVE_DIR
+
+
+def build_archive(args) -> PriceArchive:
+    """보관소 준비 (--rebuild가 없고 이미 있으면 재사용)"""
+    directory = args.archive_dir
+    if args.synthetic:
+        from tools.run_backtest import synthetic_histories
+        histories = synthetic_histories(args.synthetic, args.days, args.seed)
+        print(f"🧪 합성 일봉: {len(histories)}개 종목 × {args.days}일")
+        return PriceArchive.build(histories, directory)
+
+    if not args.rebuild and os.path.exists(os.path.join(directory, 'index.json')):
+        return PriceArchive.open(directory)
+
+    from core.data.ohlcv_store import get_ohlcv_store
+    from core.utils.stock_list_loader import load_kospi_stocks
+    codes = args.codes or load_kospi_stocks(min_listed_shares=args.min_listed_shares)
+    histories = get_ohlcv_store().get_daily_history(codes, end_date=args.end)
+    print(f"🧪 저장소 일봉: {len(histories)}개 종목 (~{args.end or '마지막'})")
+    return PriceArchive.build(histories, directory)
+
+
+def print_top(store: SweepResultStore, run_id: int, order_by: str, limit: int) -> None:
+    frame = store.top(run_id, order_by=order_by, limit=limit)
+    if frame.empty:
+        print(f"⚠️ run {run_id} 결과 없음")
+        return
+    print(f"\n🏆 run {run_id} 상위 {len(frame)}개 ({order_by} 기준)")
+    for row in frame.itertuples():
+        print(f"  #{row.trial_id:<4} 손익순위 {row.pnl_rank:<3} 낙폭순위 {row.drawdown_rank:<3} 승률순위 {row.hit_rank:<3} "
+              f"거래 {row.trades:5d}건  승률 {row.win_rate:5.1f}%  순손익 {row.net_pnl:>12,}원  "
+              f"최대낙폭 {row.max_drawdown:>11,}원  {row.params}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='캔들 전략 파라미터 탐색')
+    parser.add_argument('--param', action='append', default=[],
+                        help='탐색 파라미터 (이름=low:high 또는 이름=a,b,c, 여러 번 지정)')
+    parser.add_argument('--method', choices=['grid', 'random', 'bayesian'], default='grid', help='탐색 방식')
+    parser.add_argument('--steps', type=int, default=3, help='그리드: 범위 파라미터 분할 수')
+    parser.add_argument('--trials', type=int, default=20, help='랜덤/베이지안: 평가할 설정 수')
+    parser.add_argument('--objective', choices=['net_pnl', 'win_rate', 'pnl_to_drawdown'], default='net_pnl',
+                        help='베이지안 탐색 최대화 목표')
+    parser.add_argument('--codes', nargs='*', help='종목코드 (생략 시 KOSPI 전체)')
+    parser.add_argument('--min-listed-shares', type=int, default=10_000_000, help='최소 상장주식수')
+    parser.add_argument('--start', help='진입 시작일 (YYYYMMDD)')
+    parser.add_argument('--end', help='종료일 (YYYYMMDD)')
+    parser.add_argument('--archive-dir', default=str(DEFAULT_ARCHIVE_DIR), help='memmap 보관소 경로')
+    parser.add_argument('--rebuild', action='store_true', help='보관소를 저장소에서 다시 생성')
+    parser.add_argument('--workers', type=int, default=max(1, (os.cpu_count() or 2) - 1), help='워커 프로세스 수')
+    parser.add_argument('--chunk-size', type=int, default=20, help='작업 1개당 종목 수')
+    parser.add_argument('--synthetic', type=int, default=0, help='합성 일봉 종목 수 (저장소 대신 사용)')
+    parser.add_argument('--days', type=int, default=750, help='합성 일봉 거래일 수')
+    parser.add_argument('--seed', type=int, default=0, help='난수 시드')
+    parser.add_argument('--top', type=int, default=10, help='출력할 상위 설정 수')
+    parser.add_argument('--order-by', choices=['net_pnl', 'max_drawdown', 'win_rate', 'score'], default='net_pnl',
+                        help='상위 설정 정렬 기준')
+    parser.add_argument('--show', type=int, help='탐색 없이 저장된 run 결과만 조회')
+    parser.add_argument('--log-level', default='WARNING', help='로그 레벨')
+    args = parser.parse_args()
+
+    from loguru import logger as _loguru
+    _loguru.remove()   # 종목별 재생 로그가 출력에 섞이지 않도록
+    _loguru.add(sys.stderr, level=args.log_level)
+
+    store = SweepResultStore()
+    if args.show is not None:
+        print_top(store, args.show, args.order_by, args.top)
+        return
+
+    if not args.param:
+        parser.error('--param 을 하나 이상 지정하세요')
+    parameters = [SweepParameter.parse(spec) for spec in args.param]
+
+    archive = build_archive(args)
+    settings = BacktestSettings(start_date=args.start, seed=args.seed)
+    sweep = ParameterSweep(archive, parameters, base_settings=settings, workers=args.workers,
+                           chunk_size=args.chunk_size, objective=args.objective, store=store,
+                           log_level=args.log_level)
+
+    start = time.perf_counter()
+    if args.method == 'grid':
+        report = sweep.grid(steps=args.steps)
+    elif args.method == 'random':
+        report = sweep.random(args.trials, seed=args.seed)
+    else:
+        report = sweep.bayesian(args.trials, seed=args.seed)
+    elapsed = time.perf_counter() - start
+
+    print(f"⏱️ {len(report.trials)}개 설정 × {len(archive)}개 종목 ({archive.bar_count:,}봉): {elapsed:.1f}초")
+    print_top(store, report.run_id, args.order_by, args.top)
+    print(f"\n💾 결과: {store.db_path} (run_id={report.run_id}, 뷰 sweep_trial_ranks)")
+    if not report.has_trades():
+        print(f"❌ {len(report.trials)}개 설정 모두 거래 0건 - 순위 무의미 (종목/기간 또는 매수 판단 경로 확인)")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+"""
+로컬 일봉 저장소 일괄 동기화
+KOSPI 유니버스 전체에 대해 저장소에 없는 날짜만 API로 보충 (장 시작 전 1회 실행 권장)
+
+사용법:
+    python tools/sync_ohlcv_store.py --min-listed-shares 10000000
+    python tools/sync_ohlcv_store.py --codes 005930 000660
+"""
+import os
+import sys
+import time
+import json
+import asyncio
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.api import kis_auth as kis
+from core.api.kis_async_client import close_async_client
+from core.api.kis_rate_limiter import api_priority, RateLimitPriority
+from core.data.ohlcv_store import get_ohlcv_store, DEFAULT_HISTORY_DAYS
+from core.utils.stock_list_loader import load_kospi_stocks
+
+
+async def _sync(codes, history_days: int) -> dict:
+    store = get_ohlcv_store()
+    try:
+        with api_priority(RateLimitPriority.LOW):
+            return await store.sync_many_async(codes, history_days)
+    finally:
+        await close_async_client()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='로컬 일봉 저장소 일괄 동기화')
+    parser.add_argument('--codes', nargs='*', help='동기화할 종목코드 (생략 시 KOSPI 전체)')
+    parser.add_argument('--min-listed-shares', type=int, default=0, help='최소 상장주식수')
+    parser.add_argument('--history-days', type=int, default=DEFAULT_HISTORY_DAYS, help='최초 적재 기간(달력일)')
+    args = parser.parse_args()
+
+    if not kis.auth():
+        print("❌ KIS 인증 실패")
+        sys.exit(1)
+
+    codes = args.codes or load_kospi_stocks(min_listed_shares=args.min_listed_shares)
+    store = get_ohlcv_store()
+    targets = [code for code in codes if store.needs_sync(code)]
+    print(f"📦 대상 {len(codes)}개 종목 중 보충 필요 {len(targets)}개")
+
+    start = time.perf_counter()
+    results = asyncio.run(_sync(targets, args.history_days))
+    elapsed = time.perf_counter() - start
+
+    failed = [code for code, ok in results.items() if not ok]
+    print(f"✅ 동기화 완료: {len(results) - len(failed)}개 성공, {len(failed)}개 실패 ({elapsed:.1f}초)")
+    if failed:
+        print(f"⚠️ 실패 종목: {', '.join(failed[:20])}{' ...' if len(failed) > 20 else ''}")
+    print(f"📈 저장소 통계: {json.dumps(store.get_stats(), ensure_ascii=False)}")
+
+
+if __name__ == '__main__':
+    main()